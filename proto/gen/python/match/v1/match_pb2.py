@@ -2,7 +2,7 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # NO CHECKED-IN PROTOBUF GENCODE
 # source: match/v1/match.proto
-# Protobuf Python Version: 6.31.1
+# Protobuf Python Version: 7.35.1
 """Generated protocol buffer code."""
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
@@ -11,8 +11,8 @@ from google.protobuf import symbol_database as _symbol_database
 from google.protobuf.internal import builder as _builder
 _runtime_version.ValidateProtobufRuntimeVersion(
     _runtime_version.Domain.PUBLIC,
-    6,
-    31,
+    7,
+    35,
     1,
     '',
     'match/v1/match.proto'
@@ -23,10 +23,10 @@ _sym_db = _symbol_database.Default()
 
 
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
-from .common.v1 import common_pb2 as common_dot_v1_dot_common__pb2
+from common.v1 import common_pb2 as common_dot_v1_dot_common__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14match/v1/match.proto\x12\x10hirehub.match.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x16\x63ommon/v1/common.proto\"\xee\x03\n\x05Match\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0e\n\x06job_id\x18\x02 \x01(\t\x12\x11\n\tresume_id\x18\x03 \x01(\t\x12\x0f\n\x07user_id\x18\x04 \x01(\t\x12\x15\n\roverall_score\x18\x05 \x01(\x01\x12\x13\n\x0bskill_score\x18\x06 \x01(\x01\x12\x18\n\x10\x65xperience_score\x18\x07 \x01(\x01\x12\x15\n\rculture_score\x18\x08 \x01(\x01\x12\x39\n\x0fscore_breakdown\x18\t \x01(\x0b\x32 .hirehub.match.v1.ScoreBreakdown\x12\x14\n\x0c\x61i_reasoning\x18\n \x01(\t\x12\x16\n\x0eis_recommended\x18\x0b \x01(\x08\x12-\n\x06status\x18\x0c \x01(\x0e\x32\x1d.hirehub.match.v1.MatchStatus\x12.\n\ncreated_at\x18\r \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0e \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\tjob_title\x18\x0f \x01(\t\x12\x14\n\x0c\x63ompany_name\x18\x10 \x01(\t\x12\x14\n\x0cresume_title\x18\x11 \x01(\t\x12\x11\n\tuser_name\x18\x12 \x01(\t\"\xb5\x02\n\x0eScoreBreakdown\x12\x33\n\rskill_matches\x18\x01 \x03(\x0b\x32\x1c.hirehub.match.v1.SkillMatch\x12\x16\n\x0eskill_coverage\x18\x02 \x01(\x01\x12!\n\x19required_experience_years\x18\x03 \x01(\x05\x12\"\n\x1a\x63\x61ndidate_experience_years\x18\x04 \x01(\x05\x12$\n\x1c\x65xperience_meets_requirement\x18\x05 \x01(\x08\x12\x16\n\x0elocation_score\x18\x06 \x01(\x01\x12\x18\n\x10salary_fit_score\x18\x07 \x01(\x01\x12\x16\n\x0ejob_type_score\x18\x08 \x01(\x01\x12\x11\n\tstrengths\x18\t \x03(\t\x12\x0c\n\x04gaps\x18\n \x03(\t\"w\n\nSkillMatch\x12\x12\n\nskill_name\x18\x01 \x01(\t\x12\x10\n\x08required\x18\x02 \x01(\x08\x12\x0f\n\x07matched\x18\x03 \x01(\x08\x12\x19\n\x11proficiency_score\x18\x04 \x01(\x01\x12\x17\n\x0f\x63\x61ndidate_years\x18\x05 \x01(\x05\"\xba\x01\n\rMatchFeedback\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08match_id\x18\x02 \x01(\t\x12\x35\n\rfeedback_type\x18\x03 \x01(\x0e\x32\x1e.hirehub.match.v1.FeedbackType\x12\x13\n\x0b\x66\x65\x65\x64\x62\x61\x63k_by\x18\x04 \x01(\t\x12\x0f\n\x07\x63omment\x18\x05 \x01(\t\x12.\n\ncreated_at\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"H\n\x12\x43reateMatchRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x11\n\tresume_id\x18\x02 \x01(\t\x12\x0f\n\x07user_id\x18\x03 \x01(\t\"=\n\x13\x43reateMatchResponse\x12&\n\x05match\x18\x01 \x01(\x0b\x32\x17.hirehub.match.v1.Match\"\x1d\n\x0fGetMatchRequest\x12\n\n\x02id\x18\x01 \x01(\t\":\n\x10GetMatchResponse\x12&\n\x05match\x18\x01 \x01(\x0b\x32\x17.hirehub.match.v1.Match\" \n\x12\x44\x65leteMatchRequest\x12\n\n\x02id\x18\x01 \x01(\t\"&\n\x13\x44\x65leteMatchResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\xa8\x03\n\x12ListMatchesRequest\x12\x38\n\npagination\x18\x01 \x01(\x0b\x32$.hirehub.common.v1.PaginationRequest\x12\x13\n\x06job_id\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x16\n\tresume_id\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07user_id\x18\x04 \x01(\tH\x02\x88\x01\x01\x12=\n\x13overall_score_range\x18\x05 \x01(\x0b\x32\x1b.hirehub.common.v1.IntRangeH\x03\x88\x01\x01\x12\x1b\n\x0eis_recommended\x18\x06 \x01(\x08H\x04\x88\x01\x01\x12\x32\n\x06status\x18\x07 \x01(\x0e\x32\x1d.hirehub.match.v1.MatchStatusH\x05\x88\x01\x01\x12*\n\x04sort\x18\x08 \x01(\x0b\x32\x1c.hirehub.common.v1.SortOrderB\t\n\x07_job_idB\x0c\n\n_resume_idB\n\n\x08_user_idB\x16\n\x14_overall_score_rangeB\x11\n\x0f_is_recommendedB\t\n\x07_status\"z\n\x13ListMatchesResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\x12\x39\n\npagination\x18\x02 \x01(\x0b\x32%.hirehub.common.v1.PaginationResponse\"\xce\x01\n\x16GetMatchesByJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x38\n\npagination\x18\x02 \x01(\x0b\x32$.hirehub.common.v1.PaginationRequest\x12\x16\n\tmin_score\x18\x03 \x01(\x01H\x00\x88\x01\x01\x12\x18\n\x10only_recommended\x18\x04 \x01(\x08\x12*\n\x04sort\x18\x05 \x01(\x0b\x32\x1c.hirehub.common.v1.SortOrderB\x0c\n\n_min_score\"~\n\x17GetMatchesByJobResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\x12\x39\n\npagination\x18\x02 \x01(\x0b\x32%.hirehub.common.v1.PaginationResponse\"\xd0\x01\n\x17GetMatchesByUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x38\n\npagination\x18\x02 \x01(\x0b\x32$.hirehub.common.v1.PaginationRequest\x12\x16\n\tmin_score\x18\x03 \x01(\x01H\x00\x88\x01\x01\x12\x18\n\x10only_recommended\x18\x04 \x01(\x08\x12*\n\x04sort\x18\x05 \x01(\x0b\x32\x1c.hirehub.common.v1.SortOrderB\x0c\n\n_min_score\"\x7f\n\x18GetMatchesByUserResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\x12\x39\n\npagination\x18\x02 \x01(\x0b\x32%.hirehub.common.v1.PaginationResponse\"\xd4\x01\n\x19GetMatchesByResumeRequest\x12\x11\n\tresume_id\x18\x01 \x01(\t\x12\x38\n\npagination\x18\x02 \x01(\x0b\x32$.hirehub.common.v1.PaginationRequest\x12\x16\n\tmin_score\x18\x03 \x01(\x01H\x00\x88\x01\x01\x12\x18\n\x10only_recommended\x18\x04 \x01(\x08\x12*\n\x04sort\x18\x05 \x01(\x0b\x32\x1c.hirehub.common.v1.SortOrderB\x0c\n\n_min_score\"\x81\x01\n\x1aGetMatchesByResumeResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\x12\x39\n\npagination\x18\x02 \x01(\x0b\x32%.hirehub.common.v1.PaginationResponse\"f\n\x15\x43\x61lculateMatchRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x11\n\tresume_id\x18\x02 \x01(\t\x12\x0f\n\x07user_id\x18\x03 \x01(\t\x12\x19\n\x11\x66orce_recalculate\x18\x04 \x01(\x08\"T\n\x16\x43\x61lculateMatchResponse\x12&\n\x05match\x18\x01 \x01(\x0b\x32\x17.hirehub.match.v1.Match\x12\x12\n\nwas_cached\x18\x02 \x01(\x08\"]\n\x1c\x42\x61tchCalculateMatchesRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x12\n\nresume_ids\x18\x02 \x03(\t\x12\x19\n\x11\x66orce_recalculate\x18\x03 \x01(\x08\"y\n\x1d\x42\x61tchCalculateMatchesResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\x12.\n\x06result\x18\x02 \x01(\x0b\x32\x1e.hirehub.common.v1.BatchResult\"v\n\x1d\x43\x61lculateMatchesForJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x1b\n\x13min_score_threshold\x18\x03 \x01(\x01\x12\x19\n\x11\x66orce_recalculate\x18\x04 \x01(\x08\"|\n\x1e\x43\x61lculateMatchesForJobResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\x12\x17\n\x0ftotal_processed\x18\x02 \x01(\x05\x12\x17\n\x0ftotal_qualified\x18\x03 \x01(\x05\"\x8b\x01\n\x1e\x43\x61lculateMatchesForUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x11\n\tresume_id\x18\x02 \x01(\t\x12\r\n\x05limit\x18\x03 \x01(\x05\x12\x1b\n\x13min_score_threshold\x18\x04 \x01(\x01\x12\x19\n\x11\x66orce_recalculate\x18\x05 \x01(\x08\"}\n\x1f\x43\x61lculateMatchesForUserResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\x12\x17\n\x0ftotal_processed\x18\x02 \x01(\x05\x12\x17\n\x0ftotal_qualified\x18\x03 \x01(\x05\"N\n\x1aGetTopMatchesForJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\r\n\x05top_n\x18\x02 \x01(\x05\x12\x11\n\tmin_score\x18\x03 \x01(\x01\"G\n\x1bGetTopMatchesForJobResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\"U\n GetRecommendedJobsForUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x11\n\tresume_id\x18\x02 \x01(\t\x12\r\n\x05limit\x18\x03 \x01(\x05\"M\n!GetRecommendedJobsForUserResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\"\x8b\x01\n\x1a\x43reateMatchFeedbackRequest\x12\x10\n\x08match_id\x18\x01 \x01(\t\x12\x35\n\rfeedback_type\x18\x02 \x01(\x0e\x32\x1e.hirehub.match.v1.FeedbackType\x12\x13\n\x0b\x66\x65\x65\x64\x62\x61\x63k_by\x18\x03 \x01(\t\x12\x0f\n\x07\x63omment\x18\x04 \x01(\t\"P\n\x1b\x43reateMatchFeedbackResponse\x12\x31\n\x08\x66\x65\x65\x64\x62\x61\x63k\x18\x01 \x01(\x0b\x32\x1f.hirehub.match.v1.MatchFeedback\"%\n\x17GetMatchFeedbackRequest\x12\n\n\x02id\x18\x01 \x01(\t\"M\n\x18GetMatchFeedbackResponse\x12\x31\n\x08\x66\x65\x65\x64\x62\x61\x63k\x18\x01 \x01(\x0b\x32\x1f.hirehub.match.v1.MatchFeedback\"\xf1\x01\n\x19ListMatchFeedbacksRequest\x12\x38\n\npagination\x18\x01 \x01(\x0b\x32$.hirehub.common.v1.PaginationRequest\x12\x15\n\x08match_id\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x66\x65\x65\x64\x62\x61\x63k_by\x18\x03 \x01(\tH\x01\x88\x01\x01\x12:\n\rfeedback_type\x18\x04 \x01(\x0e\x32\x1e.hirehub.match.v1.FeedbackTypeH\x02\x88\x01\x01\x42\x0b\n\t_match_idB\x0e\n\x0c_feedback_byB\x10\n\x0e_feedback_type\"\x8b\x01\n\x1aListMatchFeedbacksResponse\x12\x32\n\tfeedbacks\x18\x01 \x03(\x0b\x32\x1f.hirehub.match.v1.MatchFeedback\x12\x39\n\npagination\x18\x02 \x01(\x0b\x32%.hirehub.common.v1.PaginationResponse\"-\n\x19GetFeedbackByMatchRequest\x12\x10\n\x08match_id\x18\x01 \x01(\t\"P\n\x1aGetFeedbackByMatchResponse\x12\x32\n\tfeedbacks\x18\x01 \x03(\x0b\x32\x1f.hirehub.match.v1.MatchFeedback\"\xc6\x01\n\x14GetMatchStatsRequest\x12\x13\n\x06job_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07user_id\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x17\n\ncompany_id\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x35\n\ndate_range\x18\x04 \x01(\x0b\x32\x1c.hirehub.common.v1.DateRangeH\x03\x88\x01\x01\x42\t\n\x07_job_idB\n\n\x08_user_idB\r\n\x0b_company_idB\r\n\x0b_date_range\"\xfb\x03\n\x15GetMatchStatsResponse\x12\x15\n\rtotal_matches\x18\x01 \x01(\x03\x12\x1d\n\x15\x61verage_overall_score\x18\x02 \x01(\x01\x12\x1b\n\x13\x61verage_skill_score\x18\x03 \x01(\x01\x12 \n\x18\x61verage_experience_score\x18\x04 \x01(\x01\x12\x1d\n\x15\x61verage_culture_score\x18\x05 \x01(\x01\x12\x19\n\x11recommended_count\x18\x06 \x01(\x03\x12Z\n\x12score_distribution\x18\x07 \x03(\x0b\x32>.hirehub.match.v1.GetMatchStatsResponse.ScoreDistributionEntry\x12`\n\x15\x66\x65\x65\x64\x62\x61\x63k_distribution\x18\x08 \x03(\x0b\x32\x41.hirehub.match.v1.GetMatchStatsResponse.FeedbackDistributionEntry\x1a\x38\n\x16ScoreDistributionEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\x1a;\n\x19\x46\x65\x65\x64\x62\x61\x63kDistributionEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\",\n\x1aGetMatchingInsightsRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\x92\x01\n\x1bGetMatchingInsightsResponse\x12\x1e\n\x16most_common_skill_gaps\x18\x01 \x03(\t\x12\x1b\n\x13most_matched_skills\x18\x02 \x03(\t\x12\x1e\n\x16\x61verage_experience_gap\x18\x03 \x01(\x01\x12\x16\n\x0erecommendation\x18\x04 \x01(\t*\xcd\x01\n\x0c\x46\x65\x65\x64\x62\x61\x63kType\x12\x1d\n\x19\x46\x45\x45\x44\x42\x41\x43K_TYPE_UNSPECIFIED\x10\x00\x12\x1a\n\x16\x46\x45\x45\x44\x42\x41\x43K_TYPE_POSITIVE\x10\x01\x12\x1a\n\x16\x46\x45\x45\x44\x42\x41\x43K_TYPE_NEGATIVE\x10\x02\x12\x17\n\x13\x46\x45\x45\x44\x42\x41\x43K_TYPE_HIRED\x10\x03\x12\x19\n\x15\x46\x45\x45\x44\x42\x41\x43K_TYPE_NOT_FIT\x10\x04\x12\x19\n\x15\x46\x45\x45\x44\x42\x41\x43K_TYPE_APPLIED\x10\x05\x12\x17\n\x13\x46\x45\x45\x44\x42\x41\x43K_TYPE_SAVED\x10\x06*\x97\x01\n\x0bMatchStatus\x12\x1c\n\x18MATCH_STATUS_UNSPECIFIED\x10\x00\x12\x18\n\x14MATCH_STATUS_PENDING\x10\x01\x12\x1b\n\x17MATCH_STATUS_PROCESSING\x10\x02\x12\x1a\n\x16MATCH_STATUS_COMPLETED\x10\x03\x12\x17\n\x13MATCH_STATUS_FAILED\x10\x04\x32\xa7\x10\n\x0cMatchService\x12Z\n\x0b\x43reateMatch\x12$.hirehub.match.v1.CreateMatchRequest\x1a%.hirehub.match.v1.CreateMatchResponse\x12Q\n\x08GetMatch\x12!.hirehub.match.v1.GetMatchRequest\x1a\".hirehub.match.v1.GetMatchResponse\x12Z\n\x0b\x44\x65leteMatch\x12$.hirehub.match.v1.DeleteMatchRequest\x1a%.hirehub.match.v1.DeleteMatchResponse\x12Z\n\x0bListMatches\x12$.hirehub.match.v1.ListMatchesRequest\x1a%.hirehub.match.v1.ListMatchesResponse\x12\x66\n\x0fGetMatchesByJob\x12(.hirehub.match.v1.GetMatchesByJobRequest\x1a).hirehub.match.v1.GetMatchesByJobResponse\x12i\n\x10GetMatchesByUser\x12).hirehub.match.v1.GetMatchesByUserRequest\x1a*.hirehub.match.v1.GetMatchesByUserResponse\x12o\n\x12GetMatchesByResume\x12+.hirehub.match.v1.GetMatchesByResumeRequest\x1a,.hirehub.match.v1.GetMatchesByResumeResponse\x12\x63\n\x0e\x43\x61lculateMatch\x12\'.hirehub.match.v1.CalculateMatchRequest\x1a(.hirehub.match.v1.CalculateMatchResponse\x12x\n\x15\x42\x61tchCalculateMatches\x12..hirehub.match.v1.BatchCalculateMatchesRequest\x1a/.hirehub.match.v1.BatchCalculateMatchesResponse\x12{\n\x16\x43\x61lculateMatchesForJob\x12/.hirehub.match.v1.CalculateMatchesForJobRequest\x1a\x30.hirehub.match.v1.CalculateMatchesForJobResponse\x12~\n\x17\x43\x61lculateMatchesForUser\x12\x30.hirehub.match.v1.CalculateMatchesForUserRequest\x1a\x31.hirehub.match.v1.CalculateMatchesForUserResponse\x12r\n\x13GetTopMatchesForJob\x12,.hirehub.match.v1.GetTopMatchesForJobRequest\x1a-.hirehub.match.v1.GetTopMatchesForJobResponse\x12\x84\x01\n\x19GetRecommendedJobsForUser\x12\x32.hirehub.match.v1.GetRecommendedJobsForUserRequest\x1a\x33.hirehub.match.v1.GetRecommendedJobsForUserResponse\x12r\n\x13\x43reateMatchFeedback\x12,.hirehub.match.v1.CreateMatchFeedbackRequest\x1a-.hirehub.match.v1.CreateMatchFeedbackResponse\x12i\n\x10GetMatchFeedback\x12).hirehub.match.v1.GetMatchFeedbackRequest\x1a*.hirehub.match.v1.GetMatchFeedbackResponse\x12o\n\x12ListMatchFeedbacks\x12+.hirehub.match.v1.ListMatchFeedbacksRequest\x1a,.hirehub.match.v1.ListMatchFeedbacksResponse\x12o\n\x12GetFeedbackByMatch\x12+.hirehub.match.v1.GetFeedbackByMatchRequest\x1a,.hirehub.match.v1.GetFeedbackByMatchResponse\x12`\n\rGetMatchStats\x12&.hirehub.match.v1.GetMatchStatsRequest\x1a\'.hirehub.match.v1.GetMatchStatsResponse\x12r\n\x13GetMatchingInsights\x12,.hirehub.match.v1.GetMatchingInsightsRequest\x1a-.hirehub.match.v1.GetMatchingInsightsResponseBI\n\x1a\x63om.hirehub.proto.match.v1P\x01Z)github.com/hirehub/proto/match/v1;matchv1b\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14match/v1/match.proto\x12\x10hirehub.match.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x16\x63ommon/v1/common.proto\"\xee\x03\n\x05Match\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0e\n\x06job_id\x18\x02 \x01(\t\x12\x11\n\tresume_id\x18\x03 \x01(\t\x12\x0f\n\x07user_id\x18\x04 \x01(\t\x12\x15\n\roverall_score\x18\x05 \x01(\x01\x12\x13\n\x0bskill_score\x18\x06 \x01(\x01\x12\x18\n\x10\x65xperience_score\x18\x07 \x01(\x01\x12\x15\n\rculture_score\x18\x08 \x01(\x01\x12\x39\n\x0fscore_breakdown\x18\t \x01(\x0b\x32 .hirehub.match.v1.ScoreBreakdown\x12\x14\n\x0c\x61i_reasoning\x18\n \x01(\t\x12\x16\n\x0eis_recommended\x18\x0b \x01(\x08\x12-\n\x06status\x18\x0c \x01(\x0e\x32\x1d.hirehub.match.v1.MatchStatus\x12.\n\ncreated_at\x18\r \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0e \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\tjob_title\x18\x0f \x01(\t\x12\x14\n\x0c\x63ompany_name\x18\x10 \x01(\t\x12\x14\n\x0cresume_title\x18\x11 \x01(\t\x12\x11\n\tuser_name\x18\x12 \x01(\t\"\xb5\x02\n\x0eScoreBreakdown\x12\x33\n\rskill_matches\x18\x01 \x03(\x0b\x32\x1c.hirehub.match.v1.SkillMatch\x12\x16\n\x0eskill_coverage\x18\x02 \x01(\x01\x12!\n\x19required_experience_years\x18\x03 \x01(\x05\x12\"\n\x1a\x63\x61ndidate_experience_years\x18\x04 \x01(\x05\x12$\n\x1c\x65xperience_meets_requirement\x18\x05 \x01(\x08\x12\x16\n\x0elocation_score\x18\x06 \x01(\x01\x12\x18\n\x10salary_fit_score\x18\x07 \x01(\x01\x12\x16\n\x0ejob_type_score\x18\x08 \x01(\x01\x12\x11\n\tstrengths\x18\t \x03(\t\x12\x0c\n\x04gaps\x18\n \x03(\t\"w\n\nSkillMatch\x12\x12\n\nskill_name\x18\x01 \x01(\t\x12\x10\n\x08required\x18\x02 \x01(\x08\x12\x0f\n\x07matched\x18\x03 \x01(\x08\x12\x19\n\x11proficiency_score\x18\x04 \x01(\x01\x12\x17\n\x0f\x63\x61ndidate_years\x18\x05 \x01(\x05\"\xba\x01\n\rMatchFeedback\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08match_id\x18\x02 \x01(\t\x12\x35\n\rfeedback_type\x18\x03 \x01(\x0e\x32\x1e.hirehub.match.v1.FeedbackType\x12\x13\n\x0b\x66\x65\x65\x64\x62\x61\x63k_by\x18\x04 \x01(\t\x12\x0f\n\x07\x63omment\x18\x05 \x01(\t\x12.\n\ncreated_at\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"H\n\x12\x43reateMatchRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x11\n\tresume_id\x18\x02 \x01(\t\x12\x0f\n\x07user_id\x18\x03 \x01(\t\"=\n\x13\x43reateMatchResponse\x12&\n\x05match\x18\x01 \x01(\x0b\x32\x17.hirehub.match.v1.Match\"\x1d\n\x0fGetMatchRequest\x12\n\n\x02id\x18\x01 \x01(\t\":\n\x10GetMatchResponse\x12&\n\x05match\x18\x01 \x01(\x0b\x32\x17.hirehub.match.v1.Match\"\xb6\x02\n\x12UpdateMatchRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x1a\n\roverall_score\x18\x02 \x01(\x01H\x00\x88\x01\x01\x12\x18\n\x0bskill_score\x18\x03 \x01(\x01H\x01\x88\x01\x01\x12\x1d\n\x10\x65xperience_score\x18\x04 \x01(\x01H\x02\x88\x01\x01\x12\x1a\n\rculture_score\x18\x05 \x01(\x01H\x03\x88\x01\x01\x12\x19\n\x0c\x61i_reasoning\x18\x06 \x01(\tH\x04\x88\x01\x01\x12\x1b\n\x0eis_recommended\x18\x07 \x01(\x08H\x05\x88\x01\x01\x42\x10\n\x0e_overall_scoreB\x0e\n\x0c_skill_scoreB\x13\n\x11_experience_scoreB\x10\n\x0e_culture_scoreB\x0f\n\r_ai_reasoningB\x11\n\x0f_is_recommended\"=\n\x13UpdateMatchResponse\x12&\n\x05match\x18\x01 \x01(\x0b\x32\x17.hirehub.match.v1.Match\" \n\x12\x44\x65leteMatchRequest\x12\n\n\x02id\x18\x01 \x01(\t\"&\n\x13\x44\x65leteMatchResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\xa8\x03\n\x12ListMatchesRequest\x12\x38\n\npagination\x18\x01 \x01(\x0b\x32$.hirehub.common.v1.PaginationRequest\x12\x13\n\x06job_id\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x16\n\tresume_id\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07user_id\x18\x04 \x01(\tH\x02\x88\x01\x01\x12=\n\x13overall_score_range\x18\x05 \x01(\x0b\x32\x1b.hirehub.common.v1.IntRangeH\x03\x88\x01\x01\x12\x1b\n\x0eis_recommended\x18\x06 \x01(\x08H\x04\x88\x01\x01\x12\x32\n\x06status\x18\x07 \x01(\x0e\x32\x1d.hirehub.match.v1.MatchStatusH\x05\x88\x01\x01\x12*\n\x04sort\x18\x08 \x01(\x0b\x32\x1c.hirehub.common.v1.SortOrderB\t\n\x07_job_idB\x0c\n\n_resume_idB\n\n\x08_user_idB\x16\n\x14_overall_score_rangeB\x11\n\x0f_is_recommendedB\t\n\x07_status\"z\n\x13ListMatchesResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\x12\x39\n\npagination\x18\x02 \x01(\x0b\x32%.hirehub.common.v1.PaginationResponse\"\xce\x01\n\x16GetMatchesByJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x38\n\npagination\x18\x02 \x01(\x0b\x32$.hirehub.common.v1.PaginationRequest\x12\x16\n\tmin_score\x18\x03 \x01(\x01H\x00\x88\x01\x01\x12\x18\n\x10only_recommended\x18\x04 \x01(\x08\x12*\n\x04sort\x18\x05 \x01(\x0b\x32\x1c.hirehub.common.v1.SortOrderB\x0c\n\n_min_score\"~\n\x17GetMatchesByJobResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\x12\x39\n\npagination\x18\x02 \x01(\x0b\x32%.hirehub.common.v1.PaginationResponse\"\xd0\x01\n\x17GetMatchesByUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x38\n\npagination\x18\x02 \x01(\x0b\x32$.hirehub.common.v1.PaginationRequest\x12\x16\n\tmin_score\x18\x03 \x01(\x01H\x00\x88\x01\x01\x12\x18\n\x10only_recommended\x18\x04 \x01(\x08\x12*\n\x04sort\x18\x05 \x01(\x0b\x32\x1c.hirehub.common.v1.SortOrderB\x0c\n\n_min_score\"\x7f\n\x18GetMatchesByUserResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\x12\x39\n\npagination\x18\x02 \x01(\x0b\x32%.hirehub.common.v1.PaginationResponse\"\xd4\x01\n\x19GetMatchesByResumeRequest\x12\x11\n\tresume_id\x18\x01 \x01(\t\x12\x38\n\npagination\x18\x02 \x01(\x0b\x32$.hirehub.common.v1.PaginationRequest\x12\x16\n\tmin_score\x18\x03 \x01(\x01H\x00\x88\x01\x01\x12\x18\n\x10only_recommended\x18\x04 \x01(\x08\x12*\n\x04sort\x18\x05 \x01(\x0b\x32\x1c.hirehub.common.v1.SortOrderB\x0c\n\n_min_score\"\x81\x01\n\x1aGetMatchesByResumeResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\x12\x39\n\npagination\x18\x02 \x01(\x0b\x32%.hirehub.common.v1.PaginationResponse\"f\n\x15\x43\x61lculateMatchRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x11\n\tresume_id\x18\x02 \x01(\t\x12\x0f\n\x07user_id\x18\x03 \x01(\t\x12\x19\n\x11\x66orce_recalculate\x18\x04 \x01(\x08\"T\n\x16\x43\x61lculateMatchResponse\x12&\n\x05match\x18\x01 \x01(\x0b\x32\x17.hirehub.match.v1.Match\x12\x12\n\nwas_cached\x18\x02 \x01(\x08\"\xdc\x01\n\x1c\x42\x61tchCalculateMatchesRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x12\n\nresume_ids\x18\x02 \x03(\t\x12\x19\n\x11\x66orce_recalculate\x18\x03 \x01(\x08\x12M\n\x08user_ids\x18\x04 \x03(\x0b\x32;.hirehub.match.v1.BatchCalculateMatchesRequest.UserIdsEntry\x1a.\n\x0cUserIdsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"y\n\x1d\x42\x61tchCalculateMatchesResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\x12.\n\x06result\x18\x02 \x01(\x0b\x32\x1e.hirehub.common.v1.BatchResult\"y\n\x19\x42\x61tchCalculateMatchResult\x12\x11\n\tresume_id\x18\x01 \x01(\t\x12&\n\x05match\x18\x02 \x01(\x0b\x32\x17.hirehub.match.v1.Match\x12\x12\n\nwas_cached\x18\x03 \x01(\x08\x12\r\n\x05\x65rror\x18\x04 \x01(\t\"v\n\x1d\x43\x61lculateMatchesForJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x1b\n\x13min_score_threshold\x18\x03 \x01(\x01\x12\x19\n\x11\x66orce_recalculate\x18\x04 \x01(\x08\"\x92\x01\n\x1e\x43\x61lculateMatchesForJobResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\x12\x17\n\x0ftotal_processed\x18\x02 \x01(\x05\x12\x17\n\x0ftotal_qualified\x18\x03 \x01(\x05\x12\x14\n\x0ctotal_queued\x18\x04 \x01(\x05\"\x8b\x01\n\x1e\x43\x61lculateMatchesForUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x11\n\tresume_id\x18\x02 \x01(\t\x12\r\n\x05limit\x18\x03 \x01(\x05\x12\x1b\n\x13min_score_threshold\x18\x04 \x01(\x01\x12\x19\n\x11\x66orce_recalculate\x18\x05 \x01(\x08\"\x93\x01\n\x1f\x43\x61lculateMatchesForUserResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\x12\x17\n\x0ftotal_processed\x18\x02 \x01(\x05\x12\x17\n\x0ftotal_qualified\x18\x03 \x01(\x05\x12\x14\n\x0ctotal_queued\x18\x04 \x01(\x05\"N\n\x1aGetTopMatchesForJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\r\n\x05top_n\x18\x02 \x01(\x05\x12\x11\n\tmin_score\x18\x03 \x01(\x01\"G\n\x1bGetTopMatchesForJobResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\"U\n GetRecommendedJobsForUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x11\n\tresume_id\x18\x02 \x01(\t\x12\r\n\x05limit\x18\x03 \x01(\x05\"M\n!GetRecommendedJobsForUserResponse\x12(\n\x07matches\x18\x01 \x03(\x0b\x32\x17.hirehub.match.v1.Match\"\x8b\x01\n\x1a\x43reateMatchFeedbackRequest\x12\x10\n\x08match_id\x18\x01 \x01(\t\x12\x35\n\rfeedback_type\x18\x02 \x01(\x0e\x32\x1e.hirehub.match.v1.FeedbackType\x12\x13\n\x0b\x66\x65\x65\x64\x62\x61\x63k_by\x18\x03 \x01(\t\x12\x0f\n\x07\x63omment\x18\x04 \x01(\t\"P\n\x1b\x43reateMatchFeedbackResponse\x12\x31\n\x08\x66\x65\x65\x64\x62\x61\x63k\x18\x01 \x01(\x0b\x32\x1f.hirehub.match.v1.MatchFeedback\"%\n\x17GetMatchFeedbackRequest\x12\n\n\x02id\x18\x01 \x01(\t\"M\n\x18GetMatchFeedbackResponse\x12\x31\n\x08\x66\x65\x65\x64\x62\x61\x63k\x18\x01 \x01(\x0b\x32\x1f.hirehub.match.v1.MatchFeedback\"\xf1\x01\n\x19ListMatchFeedbacksRequest\x12\x38\n\npagination\x18\x01 \x01(\x0b\x32$.hirehub.common.v1.PaginationRequest\x12\x15\n\x08match_id\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x66\x65\x65\x64\x62\x61\x63k_by\x18\x03 \x01(\tH\x01\x88\x01\x01\x12:\n\rfeedback_type\x18\x04 \x01(\x0e\x32\x1e.hirehub.match.v1.FeedbackTypeH\x02\x88\x01\x01\x42\x0b\n\t_match_idB\x0e\n\x0c_feedback_byB\x10\n\x0e_feedback_type\"\x8b\x01\n\x1aListMatchFeedbacksResponse\x12\x32\n\tfeedbacks\x18\x01 \x03(\x0b\x32\x1f.hirehub.match.v1.MatchFeedback\x12\x39\n\npagination\x18\x02 \x01(\x0b\x32%.hirehub.common.v1.PaginationResponse\"-\n\x19GetFeedbackByMatchRequest\x12\x10\n\x08match_id\x18\x01 \x01(\t\"P\n\x1aGetFeedbackByMatchResponse\x12\x32\n\tfeedbacks\x18\x01 \x03(\x0b\x32\x1f.hirehub.match.v1.MatchFeedback\"\xc6\x01\n\x14GetMatchStatsRequest\x12\x13\n\x06job_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07user_id\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x17\n\ncompany_id\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x35\n\ndate_range\x18\x04 \x01(\x0b\x32\x1c.hirehub.common.v1.DateRangeH\x03\x88\x01\x01\x42\t\n\x07_job_idB\n\n\x08_user_idB\r\n\x0b_company_idB\r\n\x0b_date_range\"\xfb\x03\n\x15GetMatchStatsResponse\x12\x15\n\rtotal_matches\x18\x01 \x01(\x03\x12\x1d\n\x15\x61verage_overall_score\x18\x02 \x01(\x01\x12\x1b\n\x13\x61verage_skill_score\x18\x03 \x01(\x01\x12 \n\x18\x61verage_experience_score\x18\x04 \x01(\x01\x12\x1d\n\x15\x61verage_culture_score\x18\x05 \x01(\x01\x12\x19\n\x11recommended_count\x18\x06 \x01(\x03\x12Z\n\x12score_distribution\x18\x07 \x03(\x0b\x32>.hirehub.match.v1.GetMatchStatsResponse.ScoreDistributionEntry\x12`\n\x15\x66\x65\x65\x64\x62\x61\x63k_distribution\x18\x08 \x03(\x0b\x32\x41.hirehub.match.v1.GetMatchStatsResponse.FeedbackDistributionEntry\x1a\x38\n\x16ScoreDistributionEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\x1a;\n\x19\x46\x65\x65\x64\x62\x61\x63kDistributionEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\",\n\x1aGetMatchingInsightsRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\x92\x01\n\x1bGetMatchingInsightsResponse\x12\x1e\n\x16most_common_skill_gaps\x18\x01 \x03(\t\x12\x1b\n\x13most_matched_skills\x18\x02 \x03(\t\x12\x1e\n\x16\x61verage_experience_gap\x18\x03 \x01(\x01\x12\x16\n\x0erecommendation\x18\x04 \x01(\t*\x89\x02\n\x0c\x46\x65\x65\x64\x62\x61\x63kType\x12\x1d\n\x19\x46\x45\x45\x44\x42\x41\x43K_TYPE_UNSPECIFIED\x10\x00\x12\x1a\n\x16\x46\x45\x45\x44\x42\x41\x43K_TYPE_POSITIVE\x10\x01\x12\x1a\n\x16\x46\x45\x45\x44\x42\x41\x43K_TYPE_NEGATIVE\x10\x02\x12\x17\n\x13\x46\x45\x45\x44\x42\x41\x43K_TYPE_HIRED\x10\x03\x12\x19\n\x15\x46\x45\x45\x44\x42\x41\x43K_TYPE_NOT_FIT\x10\x04\x12\x19\n\x15\x46\x45\x45\x44\x42\x41\x43K_TYPE_APPLIED\x10\x05\x12\x17\n\x13\x46\x45\x45\x44\x42\x41\x43K_TYPE_SAVED\x10\x06\x12\x1a\n\x16\x46\x45\x45\x44\x42\x41\x43K_TYPE_REJECTED\x10\x07\x12\x1e\n\x1a\x46\x45\x45\x44\x42\x41\x43K_TYPE_INTERVIEWING\x10\x08*\x97\x01\n\x0bMatchStatus\x12\x1c\n\x18MATCH_STATUS_UNSPECIFIED\x10\x00\x12\x18\n\x14MATCH_STATUS_PENDING\x10\x01\x12\x1b\n\x17MATCH_STATUS_PROCESSING\x10\x02\x12\x1a\n\x16MATCH_STATUS_COMPLETED\x10\x03\x12\x17\n\x13MATCH_STATUS_FAILED\x10\x04\x32\xe4\x12\n\x0cMatchService\x12Z\n\x0b\x43reateMatch\x12$.hirehub.match.v1.CreateMatchRequest\x1a%.hirehub.match.v1.CreateMatchResponse\x12Q\n\x08GetMatch\x12!.hirehub.match.v1.GetMatchRequest\x1a\".hirehub.match.v1.GetMatchResponse\x12Z\n\x0bUpdateMatch\x12$.hirehub.match.v1.UpdateMatchRequest\x1a%.hirehub.match.v1.UpdateMatchResponse\x12Z\n\x0b\x44\x65leteMatch\x12$.hirehub.match.v1.DeleteMatchRequest\x1a%.hirehub.match.v1.DeleteMatchResponse\x12Z\n\x0bListMatches\x12$.hirehub.match.v1.ListMatchesRequest\x1a%.hirehub.match.v1.ListMatchesResponse\x12\x66\n\x0fGetMatchesByJob\x12(.hirehub.match.v1.GetMatchesByJobRequest\x1a).hirehub.match.v1.GetMatchesByJobResponse\x12i\n\x10GetMatchesByUser\x12).hirehub.match.v1.GetMatchesByUserRequest\x1a*.hirehub.match.v1.GetMatchesByUserResponse\x12o\n\x12GetMatchesByResume\x12+.hirehub.match.v1.GetMatchesByResumeRequest\x1a,.hirehub.match.v1.GetMatchesByResumeResponse\x12\x63\n\x0e\x43\x61lculateMatch\x12\'.hirehub.match.v1.CalculateMatchRequest\x1a(.hirehub.match.v1.CalculateMatchResponse\x12x\n\x15\x42\x61tchCalculateMatches\x12..hirehub.match.v1.BatchCalculateMatchesRequest\x1a/.hirehub.match.v1.BatchCalculateMatchesResponse\x12{\n\x16\x43\x61lculateMatchesForJob\x12/.hirehub.match.v1.CalculateMatchesForJobRequest\x1a\x30.hirehub.match.v1.CalculateMatchesForJobResponse\x12~\n\x17\x43\x61lculateMatchesForUser\x12\x30.hirehub.match.v1.CalculateMatchesForUserRequest\x1a\x31.hirehub.match.v1.CalculateMatchesForUserResponse\x12r\n\x13GetTopMatchesForJob\x12,.hirehub.match.v1.GetTopMatchesForJobRequest\x1a-.hirehub.match.v1.GetTopMatchesForJobResponse\x12\x84\x01\n\x19GetRecommendedJobsForUser\x12\x32.hirehub.match.v1.GetRecommendedJobsForUserRequest\x1a\x33.hirehub.match.v1.GetRecommendedJobsForUserResponse\x12|\n\x1bStreamBatchCalculateMatches\x12..hirehub.match.v1.BatchCalculateMatchesRequest\x1a+.hirehub.match.v1.BatchCalculateMatchResult0\x01\x12\x61\n\x16StreamTopMatchesForJob\x12,.hirehub.match.v1.GetTopMatchesForJobRequest\x1a\x17.hirehub.match.v1.Match0\x01\x12r\n\x13\x43reateMatchFeedback\x12,.hirehub.match.v1.CreateMatchFeedbackRequest\x1a-.hirehub.match.v1.CreateMatchFeedbackResponse\x12i\n\x10GetMatchFeedback\x12).hirehub.match.v1.GetMatchFeedbackRequest\x1a*.hirehub.match.v1.GetMatchFeedbackResponse\x12o\n\x12ListMatchFeedbacks\x12+.hirehub.match.v1.ListMatchFeedbacksRequest\x1a,.hirehub.match.v1.ListMatchFeedbacksResponse\x12o\n\x12GetFeedbackByMatch\x12+.hirehub.match.v1.GetFeedbackByMatchRequest\x1a,.hirehub.match.v1.GetFeedbackByMatchResponse\x12`\n\rGetMatchStats\x12&.hirehub.match.v1.GetMatchStatsRequest\x1a\'.hirehub.match.v1.GetMatchStatsResponse\x12r\n\x13GetMatchingInsights\x12,.hirehub.match.v1.GetMatchingInsightsRequest\x1a-.hirehub.match.v1.GetMatchingInsightsResponseBI\n\x1a\x63om.hirehub.proto.match.v1P\x01Z)github.com/hirehub/proto/match/v1;matchv1b\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -34,14 +34,16 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'match.v1.match_pb2', _globa
 if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'\n\032com.hirehub.proto.match.v1P\001Z)github.com/hirehub/proto/match/v1;matchv1'
+  _globals['_BATCHCALCULATEMATCHESREQUEST_USERIDSENTRY']._loaded_options = None
+  _globals['_BATCHCALCULATEMATCHESREQUEST_USERIDSENTRY']._serialized_options = b'8\001'
   _globals['_GETMATCHSTATSRESPONSE_SCOREDISTRIBUTIONENTRY']._loaded_options = None
   _globals['_GETMATCHSTATSRESPONSE_SCOREDISTRIBUTIONENTRY']._serialized_options = b'8\001'
   _globals['_GETMATCHSTATSRESPONSE_FEEDBACKDISTRIBUTIONENTRY']._loaded_options = None
   _globals['_GETMATCHSTATSRESPONSE_FEEDBACKDISTRIBUTIONENTRY']._serialized_options = b'8\001'
-  _globals['_FEEDBACKTYPE']._serialized_start=6101
-  _globals['_FEEDBACKTYPE']._serialized_end=6306
-  _globals['_MATCHSTATUS']._serialized_start=6309
-  _globals['_MATCHSTATUS']._serialized_end=6460
+  _globals['_FEEDBACKTYPE']._serialized_start=6774
+  _globals['_FEEDBACKTYPE']._serialized_end=7039
+  _globals['_MATCHSTATUS']._serialized_start=7042
+  _globals['_MATCHSTATUS']._serialized_end=7193
   _globals['_MATCH']._serialized_start=100
   _globals['_MATCH']._serialized_end=594
   _globals['_SCOREBREAKDOWN']._serialized_start=597
@@ -58,78 +60,86 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GETMATCHREQUEST']._serialized_end=1384
   _globals['_GETMATCHRESPONSE']._serialized_start=1386
   _globals['_GETMATCHRESPONSE']._serialized_end=1444
-  _globals['_DELETEMATCHREQUEST']._serialized_start=1446
-  _globals['_DELETEMATCHREQUEST']._serialized_end=1478
-  _globals['_DELETEMATCHRESPONSE']._serialized_start=1480
-  _globals['_DELETEMATCHRESPONSE']._serialized_end=1518
-  _globals['_LISTMATCHESREQUEST']._serialized_start=1521
-  _globals['_LISTMATCHESREQUEST']._serialized_end=1945
-  _globals['_LISTMATCHESRESPONSE']._serialized_start=1947
-  _globals['_LISTMATCHESRESPONSE']._serialized_end=2069
-  _globals['_GETMATCHESBYJOBREQUEST']._serialized_start=2072
-  _globals['_GETMATCHESBYJOBREQUEST']._serialized_end=2278
-  _globals['_GETMATCHESBYJOBRESPONSE']._serialized_start=2280
-  _globals['_GETMATCHESBYJOBRESPONSE']._serialized_end=2406
-  _globals['_GETMATCHESBYUSERREQUEST']._serialized_start=2409
-  _globals['_GETMATCHESBYUSERREQUEST']._serialized_end=2617
-  _globals['_GETMATCHESBYUSERRESPONSE']._serialized_start=2619
-  _globals['_GETMATCHESBYUSERRESPONSE']._serialized_end=2746
-  _globals['_GETMATCHESBYRESUMEREQUEST']._serialized_start=2749
-  _globals['_GETMATCHESBYRESUMEREQUEST']._serialized_end=2961
-  _globals['_GETMATCHESBYRESUMERESPONSE']._serialized_start=2964
-  _globals['_GETMATCHESBYRESUMERESPONSE']._serialized_end=3093
-  _globals['_CALCULATEMATCHREQUEST']._serialized_start=3095
-  _globals['_CALCULATEMATCHREQUEST']._serialized_end=3197
-  _globals['_CALCULATEMATCHRESPONSE']._serialized_start=3199
-  _globals['_CALCULATEMATCHRESPONSE']._serialized_end=3283
-  _globals['_BATCHCALCULATEMATCHESREQUEST']._serialized_start=3285
-  _globals['_BATCHCALCULATEMATCHESREQUEST']._serialized_end=3378
-  _globals['_BATCHCALCULATEMATCHESRESPONSE']._serialized_start=3380
-  _globals['_BATCHCALCULATEMATCHESRESPONSE']._serialized_end=3501
-  _globals['_CALCULATEMATCHESFORJOBREQUEST']._serialized_start=3503
-  _globals['_CALCULATEMATCHESFORJOBREQUEST']._serialized_end=3621
-  _globals['_CALCULATEMATCHESFORJOBRESPONSE']._serialized_start=3623
-  _globals['_CALCULATEMATCHESFORJOBRESPONSE']._serialized_end=3747
-  _globals['_CALCULATEMATCHESFORUSERREQUEST']._serialized_start=3750
-  _globals['_CALCULATEMATCHESFORUSERREQUEST']._serialized_end=3889
-  _globals['_CALCULATEMATCHESFORUSERRESPONSE']._serialized_start=3891
-  _globals['_CALCULATEMATCHESFORUSERRESPONSE']._serialized_end=4016
-  _globals['_GETTOPMATCHESFORJOBREQUEST']._serialized_start=4018
-  _globals['_GETTOPMATCHESFORJOBREQUEST']._serialized_end=4096
-  _globals['_GETTOPMATCHESFORJOBRESPONSE']._serialized_start=4098
-  _globals['_GETTOPMATCHESFORJOBRESPONSE']._serialized_end=4169
-  _globals['_GETRECOMMENDEDJOBSFORUSERREQUEST']._serialized_start=4171
-  _globals['_GETRECOMMENDEDJOBSFORUSERREQUEST']._serialized_end=4256
-  _globals['_GETRECOMMENDEDJOBSFORUSERRESPONSE']._serialized_start=4258
-  _globals['_GETRECOMMENDEDJOBSFORUSERRESPONSE']._serialized_end=4335
-  _globals['_CREATEMATCHFEEDBACKREQUEST']._serialized_start=4338
-  _globals['_CREATEMATCHFEEDBACKREQUEST']._serialized_end=4477
-  _globals['_CREATEMATCHFEEDBACKRESPONSE']._serialized_start=4479
-  _globals['_CREATEMATCHFEEDBACKRESPONSE']._serialized_end=4559
-  _globals['_GETMATCHFEEDBACKREQUEST']._serialized_start=4561
-  _globals['_GETMATCHFEEDBACKREQUEST']._serialized_end=4598
-  _globals['_GETMATCHFEEDBACKRESPONSE']._serialized_start=4600
-  _globals['_GETMATCHFEEDBACKRESPONSE']._serialized_end=4677
-  _globals['_LISTMATCHFEEDBACKSREQUEST']._serialized_start=4680
-  _globals['_LISTMATCHFEEDBACKSREQUEST']._serialized_end=4921
-  _globals['_LISTMATCHFEEDBACKSRESPONSE']._serialized_start=4924
-  _globals['_LISTMATCHFEEDBACKSRESPONSE']._serialized_end=5063
-  _globals['_GETFEEDBACKBYMATCHREQUEST']._serialized_start=5065
-  _globals['_GETFEEDBACKBYMATCHREQUEST']._serialized_end=5110
-  _globals['_GETFEEDBACKBYMATCHRESPONSE']._serialized_start=5112
-  _globals['_GETFEEDBACKBYMATCHRESPONSE']._serialized_end=5192
-  _globals['_GETMATCHSTATSREQUEST']._serialized_start=5195
-  _globals['_GETMATCHSTATSREQUEST']._serialized_end=5393
-  _globals['_GETMATCHSTATSRESPONSE']._serialized_start=5396
-  _globals['_GETMATCHSTATSRESPONSE']._serialized_end=5903
-  _globals['_GETMATCHSTATSRESPONSE_SCOREDISTRIBUTIONENTRY']._serialized_start=5786
-  _globals['_GETMATCHSTATSRESPONSE_SCOREDISTRIBUTIONENTRY']._serialized_end=5842
-  _globals['_GETMATCHSTATSRESPONSE_FEEDBACKDISTRIBUTIONENTRY']._serialized_start=5844
-  _globals['_GETMATCHSTATSRESPONSE_FEEDBACKDISTRIBUTIONENTRY']._serialized_end=5903
-  _globals['_GETMATCHINGINSIGHTSREQUEST']._serialized_start=5905
-  _globals['_GETMATCHINGINSIGHTSREQUEST']._serialized_end=5949
-  _globals['_GETMATCHINGINSIGHTSRESPONSE']._serialized_start=5952
-  _globals['_GETMATCHINGINSIGHTSRESPONSE']._serialized_end=6098
-  _globals['_MATCHSERVICE']._serialized_start=6463
-  _globals['_MATCHSERVICE']._serialized_end=8550
+  _globals['_UPDATEMATCHREQUEST']._serialized_start=1447
+  _globals['_UPDATEMATCHREQUEST']._serialized_end=1757
+  _globals['_UPDATEMATCHRESPONSE']._serialized_start=1759
+  _globals['_UPDATEMATCHRESPONSE']._serialized_end=1820
+  _globals['_DELETEMATCHREQUEST']._serialized_start=1822
+  _globals['_DELETEMATCHREQUEST']._serialized_end=1854
+  _globals['_DELETEMATCHRESPONSE']._serialized_start=1856
+  _globals['_DELETEMATCHRESPONSE']._serialized_end=1894
+  _globals['_LISTMATCHESREQUEST']._serialized_start=1897
+  _globals['_LISTMATCHESREQUEST']._serialized_end=2321
+  _globals['_LISTMATCHESRESPONSE']._serialized_start=2323
+  _globals['_LISTMATCHESRESPONSE']._serialized_end=2445
+  _globals['_GETMATCHESBYJOBREQUEST']._serialized_start=2448
+  _globals['_GETMATCHESBYJOBREQUEST']._serialized_end=2654
+  _globals['_GETMATCHESBYJOBRESPONSE']._serialized_start=2656
+  _globals['_GETMATCHESBYJOBRESPONSE']._serialized_end=2782
+  _globals['_GETMATCHESBYUSERREQUEST']._serialized_start=2785
+  _globals['_GETMATCHESBYUSERREQUEST']._serialized_end=2993
+  _globals['_GETMATCHESBYUSERRESPONSE']._serialized_start=2995
+  _globals['_GETMATCHESBYUSERRESPONSE']._serialized_end=3122
+  _globals['_GETMATCHESBYRESUMEREQUEST']._serialized_start=3125
+  _globals['_GETMATCHESBYRESUMEREQUEST']._serialized_end=3337
+  _globals['_GETMATCHESBYRESUMERESPONSE']._serialized_start=3340
+  _globals['_GETMATCHESBYRESUMERESPONSE']._serialized_end=3469
+  _globals['_CALCULATEMATCHREQUEST']._serialized_start=3471
+  _globals['_CALCULATEMATCHREQUEST']._serialized_end=3573
+  _globals['_CALCULATEMATCHRESPONSE']._serialized_start=3575
+  _globals['_CALCULATEMATCHRESPONSE']._serialized_end=3659
+  _globals['_BATCHCALCULATEMATCHESREQUEST']._serialized_start=3662
+  _globals['_BATCHCALCULATEMATCHESREQUEST']._serialized_end=3882
+  _globals['_BATCHCALCULATEMATCHESREQUEST_USERIDSENTRY']._serialized_start=3836
+  _globals['_BATCHCALCULATEMATCHESREQUEST_USERIDSENTRY']._serialized_end=3882
+  _globals['_BATCHCALCULATEMATCHESRESPONSE']._serialized_start=3884
+  _globals['_BATCHCALCULATEMATCHESRESPONSE']._serialized_end=4005
+  _globals['_BATCHCALCULATEMATCHRESULT']._serialized_start=4007
+  _globals['_BATCHCALCULATEMATCHRESULT']._serialized_end=4128
+  _globals['_CALCULATEMATCHESFORJOBREQUEST']._serialized_start=4130
+  _globals['_CALCULATEMATCHESFORJOBREQUEST']._serialized_end=4248
+  _globals['_CALCULATEMATCHESFORJOBRESPONSE']._serialized_start=4251
+  _globals['_CALCULATEMATCHESFORJOBRESPONSE']._serialized_end=4397
+  _globals['_CALCULATEMATCHESFORUSERREQUEST']._serialized_start=4400
+  _globals['_CALCULATEMATCHESFORUSERREQUEST']._serialized_end=4539
+  _globals['_CALCULATEMATCHESFORUSERRESPONSE']._serialized_start=4542
+  _globals['_CALCULATEMATCHESFORUSERRESPONSE']._serialized_end=4689
+  _globals['_GETTOPMATCHESFORJOBREQUEST']._serialized_start=4691
+  _globals['_GETTOPMATCHESFORJOBREQUEST']._serialized_end=4769
+  _globals['_GETTOPMATCHESFORJOBRESPONSE']._serialized_start=4771
+  _globals['_GETTOPMATCHESFORJOBRESPONSE']._serialized_end=4842
+  _globals['_GETRECOMMENDEDJOBSFORUSERREQUEST']._serialized_start=4844
+  _globals['_GETRECOMMENDEDJOBSFORUSERREQUEST']._serialized_end=4929
+  _globals['_GETRECOMMENDEDJOBSFORUSERRESPONSE']._serialized_start=4931
+  _globals['_GETRECOMMENDEDJOBSFORUSERRESPONSE']._serialized_end=5008
+  _globals['_CREATEMATCHFEEDBACKREQUEST']._serialized_start=5011
+  _globals['_CREATEMATCHFEEDBACKREQUEST']._serialized_end=5150
+  _globals['_CREATEMATCHFEEDBACKRESPONSE']._serialized_start=5152
+  _globals['_CREATEMATCHFEEDBACKRESPONSE']._serialized_end=5232
+  _globals['_GETMATCHFEEDBACKREQUEST']._serialized_start=5234
+  _globals['_GETMATCHFEEDBACKREQUEST']._serialized_end=5271
+  _globals['_GETMATCHFEEDBACKRESPONSE']._serialized_start=5273
+  _globals['_GETMATCHFEEDBACKRESPONSE']._serialized_end=5350
+  _globals['_LISTMATCHFEEDBACKSREQUEST']._serialized_start=5353
+  _globals['_LISTMATCHFEEDBACKSREQUEST']._serialized_end=5594
+  _globals['_LISTMATCHFEEDBACKSRESPONSE']._serialized_start=5597
+  _globals['_LISTMATCHFEEDBACKSRESPONSE']._serialized_end=5736
+  _globals['_GETFEEDBACKBYMATCHREQUEST']._serialized_start=5738
+  _globals['_GETFEEDBACKBYMATCHREQUEST']._serialized_end=5783
+  _globals['_GETFEEDBACKBYMATCHRESPONSE']._serialized_start=5785
+  _globals['_GETFEEDBACKBYMATCHRESPONSE']._serialized_end=5865
+  _globals['_GETMATCHSTATSREQUEST']._serialized_start=5868
+  _globals['_GETMATCHSTATSREQUEST']._serialized_end=6066
+  _globals['_GETMATCHSTATSRESPONSE']._serialized_start=6069
+  _globals['_GETMATCHSTATSRESPONSE']._serialized_end=6576
+  _globals['_GETMATCHSTATSRESPONSE_SCOREDISTRIBUTIONENTRY']._serialized_start=6459
+  _globals['_GETMATCHSTATSRESPONSE_SCOREDISTRIBUTIONENTRY']._serialized_end=6515
+  _globals['_GETMATCHSTATSRESPONSE_FEEDBACKDISTRIBUTIONENTRY']._serialized_start=6517
+  _globals['_GETMATCHSTATSRESPONSE_FEEDBACKDISTRIBUTIONENTRY']._serialized_end=6576
+  _globals['_GETMATCHINGINSIGHTSREQUEST']._serialized_start=6578
+  _globals['_GETMATCHINGINSIGHTSREQUEST']._serialized_end=6622
+  _globals['_GETMATCHINGINSIGHTSRESPONSE']._serialized_start=6625
+  _globals['_GETMATCHINGINSIGHTSRESPONSE']._serialized_end=6771
+  _globals['_MATCHSERVICE']._serialized_start=7196
+  _globals['_MATCHSERVICE']._serialized_end=9600
 # @@protoc_insertion_point(module_scope)
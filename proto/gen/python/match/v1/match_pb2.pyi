@@ -20,6 +20,8 @@ class FeedbackType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
     FEEDBACK_TYPE_NOT_FIT: _ClassVar[FeedbackType]
     FEEDBACK_TYPE_APPLIED: _ClassVar[FeedbackType]
     FEEDBACK_TYPE_SAVED: _ClassVar[FeedbackType]
+    FEEDBACK_TYPE_REJECTED: _ClassVar[FeedbackType]
+    FEEDBACK_TYPE_INTERVIEWING: _ClassVar[FeedbackType]
 
 class MatchStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
     __slots__ = ()
@@ -35,6 +37,8 @@ FEEDBACK_TYPE_HIRED: FeedbackType
 FEEDBACK_TYPE_NOT_FIT: FeedbackType
 FEEDBACK_TYPE_APPLIED: FeedbackType
 FEEDBACK_TYPE_SAVED: FeedbackType
+FEEDBACK_TYPE_REJECTED: FeedbackType
+FEEDBACK_TYPE_INTERVIEWING: FeedbackType
 MATCH_STATUS_UNSPECIFIED: MatchStatus
 MATCH_STATUS_PENDING: MatchStatus
 MATCH_STATUS_PROCESSING: MatchStatus
@@ -79,7 +83,7 @@ class Match(_message.Message):
     company_name: str
     resume_title: str
     user_name: str
-    def __init__(self, id: _Optional[str] = ..., job_id: _Optional[str] = ..., resume_id: _Optional[str] = ..., user_id: _Optional[str] = ..., overall_score: _Optional[float] = ..., skill_score: _Optional[float] = ..., experience_score: _Optional[float] = ..., culture_score: _Optional[float] = ..., score_breakdown: _Optional[_Union[ScoreBreakdown, _Mapping]] = ..., ai_reasoning: _Optional[str] = ..., is_recommended: bool = ..., status: _Optional[_Union[MatchStatus, str]] = ..., created_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., updated_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., job_title: _Optional[str] = ..., company_name: _Optional[str] = ..., resume_title: _Optional[str] = ..., user_name: _Optional[str] = ...) -> None: ...
+    def __init__(self, id: _Optional[str] = ..., job_id: _Optional[str] = ..., resume_id: _Optional[str] = ..., user_id: _Optional[str] = ..., overall_score: _Optional[float] = ..., skill_score: _Optional[float] = ..., experience_score: _Optional[float] = ..., culture_score: _Optional[float] = ..., score_breakdown: _Optional[_Union[ScoreBreakdown, _Mapping]] = ..., ai_reasoning: _Optional[str] = ..., is_recommended: _Optional[bool] = ..., status: _Optional[_Union[MatchStatus, str]] = ..., created_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., updated_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., job_title: _Optional[str] = ..., company_name: _Optional[str] = ..., resume_title: _Optional[str] = ..., user_name: _Optional[str] = ...) -> None: ...
 
 class ScoreBreakdown(_message.Message):
     __slots__ = ("skill_matches", "skill_coverage", "required_experience_years", "candidate_experience_years", "experience_meets_requirement", "location_score", "salary_fit_score", "job_type_score", "strengths", "gaps")
@@ -103,7 +107,7 @@ class ScoreBreakdown(_message.Message):
     job_type_score: float
     strengths: _containers.RepeatedScalarFieldContainer[str]
     gaps: _containers.RepeatedScalarFieldContainer[str]
-    def __init__(self, skill_matches: _Optional[_Iterable[_Union[SkillMatch, _Mapping]]] = ..., skill_coverage: _Optional[float] = ..., required_experience_years: _Optional[int] = ..., candidate_experience_years: _Optional[int] = ..., experience_meets_requirement: bool = ..., location_score: _Optional[float] = ..., salary_fit_score: _Optional[float] = ..., job_type_score: _Optional[float] = ..., strengths: _Optional[_Iterable[str]] = ..., gaps: _Optional[_Iterable[str]] = ...) -> None: ...
+    def __init__(self, skill_matches: _Optional[_Iterable[_Union[SkillMatch, _Mapping]]] = ..., skill_coverage: _Optional[float] = ..., required_experience_years: _Optional[int] = ..., candidate_experience_years: _Optional[int] = ..., experience_meets_requirement: _Optional[bool] = ..., location_score: _Optional[float] = ..., salary_fit_score: _Optional[float] = ..., job_type_score: _Optional[float] = ..., strengths: _Optional[_Iterable[str]] = ..., gaps: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class SkillMatch(_message.Message):
     __slots__ = ("skill_name", "required", "matched", "proficiency_score", "candidate_years")
@@ -117,7 +121,7 @@ class SkillMatch(_message.Message):
     matched: bool
     proficiency_score: float
     candidate_years: int
-    def __init__(self, skill_name: _Optional[str] = ..., required: bool = ..., matched: bool = ..., proficiency_score: _Optional[float] = ..., candidate_years: _Optional[int] = ...) -> None: ...
+    def __init__(self, skill_name: _Optional[str] = ..., required: _Optional[bool] = ..., matched: _Optional[bool] = ..., proficiency_score: _Optional[float] = ..., candidate_years: _Optional[int] = ...) -> None: ...
 
 class MatchFeedback(_message.Message):
     __slots__ = ("id", "match_id", "feedback_type", "feedback_by", "comment", "created_at")
@@ -163,6 +167,30 @@ class GetMatchResponse(_message.Message):
     match: Match
     def __init__(self, match: _Optional[_Union[Match, _Mapping]] = ...) -> None: ...
 
+class UpdateMatchRequest(_message.Message):
+    __slots__ = ("id", "overall_score", "skill_score", "experience_score", "culture_score", "ai_reasoning", "is_recommended")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    OVERALL_SCORE_FIELD_NUMBER: _ClassVar[int]
+    SKILL_SCORE_FIELD_NUMBER: _ClassVar[int]
+    EXPERIENCE_SCORE_FIELD_NUMBER: _ClassVar[int]
+    CULTURE_SCORE_FIELD_NUMBER: _ClassVar[int]
+    AI_REASONING_FIELD_NUMBER: _ClassVar[int]
+    IS_RECOMMENDED_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    overall_score: float
+    skill_score: float
+    experience_score: float
+    culture_score: float
+    ai_reasoning: str
+    is_recommended: bool
+    def __init__(self, id: _Optional[str] = ..., overall_score: _Optional[float] = ..., skill_score: _Optional[float] = ..., experience_score: _Optional[float] = ..., culture_score: _Optional[float] = ..., ai_reasoning: _Optional[str] = ..., is_recommended: _Optional[bool] = ...) -> None: ...
+
+class UpdateMatchResponse(_message.Message):
+    __slots__ = ("match",)
+    MATCH_FIELD_NUMBER: _ClassVar[int]
+    match: Match
+    def __init__(self, match: _Optional[_Union[Match, _Mapping]] = ...) -> None: ...
+
 class DeleteMatchRequest(_message.Message):
     __slots__ = ("id",)
     ID_FIELD_NUMBER: _ClassVar[int]
@@ -173,7 +201,7 @@ class DeleteMatchResponse(_message.Message):
     __slots__ = ("success",)
     SUCCESS_FIELD_NUMBER: _ClassVar[int]
     success: bool
-    def __init__(self, success: bool = ...) -> None: ...
+    def __init__(self, success: _Optional[bool] = ...) -> None: ...
 
 class ListMatchesRequest(_message.Message):
     __slots__ = ("pagination", "job_id", "resume_id", "user_id", "overall_score_range", "is_recommended", "status", "sort")
@@ -193,7 +221,7 @@ class ListMatchesRequest(_message.Message):
     is_recommended: bool
     status: MatchStatus
     sort: _common_pb2.SortOrder
-    def __init__(self, pagination: _Optional[_Union[_common_pb2.PaginationRequest, _Mapping]] = ..., job_id: _Optional[str] = ..., resume_id: _Optional[str] = ..., user_id: _Optional[str] = ..., overall_score_range: _Optional[_Union[_common_pb2.IntRange, _Mapping]] = ..., is_recommended: bool = ..., status: _Optional[_Union[MatchStatus, str]] = ..., sort: _Optional[_Union[_common_pb2.SortOrder, _Mapping]] = ...) -> None: ...
+    def __init__(self, pagination: _Optional[_Union[_common_pb2.PaginationRequest, _Mapping]] = ..., job_id: _Optional[str] = ..., resume_id: _Optional[str] = ..., user_id: _Optional[str] = ..., overall_score_range: _Optional[_Union[_common_pb2.IntRange, _Mapping]] = ..., is_recommended: _Optional[bool] = ..., status: _Optional[_Union[MatchStatus, str]] = ..., sort: _Optional[_Union[_common_pb2.SortOrder, _Mapping]] = ...) -> None: ...
 
 class ListMatchesResponse(_message.Message):
     __slots__ = ("matches", "pagination")
@@ -215,7 +243,7 @@ class GetMatchesByJobRequest(_message.Message):
     min_score: float
     only_recommended: bool
     sort: _common_pb2.SortOrder
-    def __init__(self, job_id: _Optional[str] = ..., pagination: _Optional[_Union[_common_pb2.PaginationRequest, _Mapping]] = ..., min_score: _Optional[float] = ..., only_recommended: bool = ..., sort: _Optional[_Union[_common_pb2.SortOrder, _Mapping]] = ...) -> None: ...
+    def __init__(self, job_id: _Optional[str] = ..., pagination: _Optional[_Union[_common_pb2.PaginationRequest, _Mapping]] = ..., min_score: _Optional[float] = ..., only_recommended: _Optional[bool] = ..., sort: _Optional[_Union[_common_pb2.SortOrder, _Mapping]] = ...) -> None: ...
 
 class GetMatchesByJobResponse(_message.Message):
     __slots__ = ("matches", "pagination")
@@ -237,7 +265,7 @@ class GetMatchesByUserRequest(_message.Message):
     min_score: float
     only_recommended: bool
     sort: _common_pb2.SortOrder
-    def __init__(self, user_id: _Optional[str] = ..., pagination: _Optional[_Union[_common_pb2.PaginationRequest, _Mapping]] = ..., min_score: _Optional[float] = ..., only_recommended: bool = ..., sort: _Optional[_Union[_common_pb2.SortOrder, _Mapping]] = ...) -> None: ...
+    def __init__(self, user_id: _Optional[str] = ..., pagination: _Optional[_Union[_common_pb2.PaginationRequest, _Mapping]] = ..., min_score: _Optional[float] = ..., only_recommended: _Optional[bool] = ..., sort: _Optional[_Union[_common_pb2.SortOrder, _Mapping]] = ...) -> None: ...
 
 class GetMatchesByUserResponse(_message.Message):
     __slots__ = ("matches", "pagination")
@@ -259,7 +287,7 @@ class GetMatchesByResumeRequest(_message.Message):
     min_score: float
     only_recommended: bool
     sort: _common_pb2.SortOrder
-    def __init__(self, resume_id: _Optional[str] = ..., pagination: _Optional[_Union[_common_pb2.PaginationRequest, _Mapping]] = ..., min_score: _Optional[float] = ..., only_recommended: bool = ..., sort: _Optional[_Union[_common_pb2.SortOrder, _Mapping]] = ...) -> None: ...
+    def __init__(self, resume_id: _Optional[str] = ..., pagination: _Optional[_Union[_common_pb2.PaginationRequest, _Mapping]] = ..., min_score: _Optional[float] = ..., only_recommended: _Optional[bool] = ..., sort: _Optional[_Union[_common_pb2.SortOrder, _Mapping]] = ...) -> None: ...
 
 class GetMatchesByResumeResponse(_message.Message):
     __slots__ = ("matches", "pagination")
@@ -279,7 +307,7 @@ class CalculateMatchRequest(_message.Message):
     resume_id: str
     user_id: str
     force_recalculate: bool
-    def __init__(self, job_id: _Optional[str] = ..., resume_id: _Optional[str] = ..., user_id: _Optional[str] = ..., force_recalculate: bool = ...) -> None: ...
+    def __init__(self, job_id: _Optional[str] = ..., resume_id: _Optional[str] = ..., user_id: _Optional[str] = ..., force_recalculate: _Optional[bool] = ...) -> None: ...
 
 class CalculateMatchResponse(_message.Message):
     __slots__ = ("match", "was_cached")
@@ -287,17 +315,26 @@ class CalculateMatchResponse(_message.Message):
     WAS_CACHED_FIELD_NUMBER: _ClassVar[int]
     match: Match
     was_cached: bool
-    def __init__(self, match: _Optional[_Union[Match, _Mapping]] = ..., was_cached: bool = ...) -> None: ...
+    def __init__(self, match: _Optional[_Union[Match, _Mapping]] = ..., was_cached: _Optional[bool] = ...) -> None: ...
 
 class BatchCalculateMatchesRequest(_message.Message):
-    __slots__ = ("job_id", "resume_ids", "force_recalculate")
+    __slots__ = ("job_id", "resume_ids", "force_recalculate", "user_ids")
+    class UserIdsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
     JOB_ID_FIELD_NUMBER: _ClassVar[int]
     RESUME_IDS_FIELD_NUMBER: _ClassVar[int]
     FORCE_RECALCULATE_FIELD_NUMBER: _ClassVar[int]
+    USER_IDS_FIELD_NUMBER: _ClassVar[int]
     job_id: str
     resume_ids: _containers.RepeatedScalarFieldContainer[str]
     force_recalculate: bool
-    def __init__(self, job_id: _Optional[str] = ..., resume_ids: _Optional[_Iterable[str]] = ..., force_recalculate: bool = ...) -> None: ...
+    user_ids: _containers.ScalarMap[str, str]
+    def __init__(self, job_id: _Optional[str] = ..., resume_ids: _Optional[_Iterable[str]] = ..., force_recalculate: _Optional[bool] = ..., user_ids: _Optional[_Mapping[str, str]] = ...) -> None: ...
 
 class BatchCalculateMatchesResponse(_message.Message):
     __slots__ = ("matches", "result")
@@ -307,6 +344,18 @@ class BatchCalculateMatchesResponse(_message.Message):
     result: _common_pb2.BatchResult
     def __init__(self, matches: _Optional[_Iterable[_Union[Match, _Mapping]]] = ..., result: _Optional[_Union[_common_pb2.BatchResult, _Mapping]] = ...) -> None: ...
 
+class BatchCalculateMatchResult(_message.Message):
+    __slots__ = ("resume_id", "match", "was_cached", "error")
+    RESUME_ID_FIELD_NUMBER: _ClassVar[int]
+    MATCH_FIELD_NUMBER: _ClassVar[int]
+    WAS_CACHED_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    resume_id: str
+    match: Match
+    was_cached: bool
+    error: str
+    def __init__(self, resume_id: _Optional[str] = ..., match: _Optional[_Union[Match, _Mapping]] = ..., was_cached: _Optional[bool] = ..., error: _Optional[str] = ...) -> None: ...
+
 class CalculateMatchesForJobRequest(_message.Message):
     __slots__ = ("job_id", "limit", "min_score_threshold", "force_recalculate")
     JOB_ID_FIELD_NUMBER: _ClassVar[int]
@@ -317,17 +366,19 @@ class CalculateMatchesForJobRequest(_message.Message):
     limit: int
     min_score_threshold: float
     force_recalculate: bool
-    def __init__(self, job_id: _Optional[str] = ..., limit: _Optional[int] = ..., min_score_threshold: _Optional[float] = ..., force_recalculate: bool = ...) -> None: ...
+    def __init__(self, job_id: _Optional[str] = ..., limit: _Optional[int] = ..., min_score_threshold: _Optional[float] = ..., force_recalculate: _Optional[bool] = ...) -> None: ...
 
 class CalculateMatchesForJobResponse(_message.Message):
-    __slots__ = ("matches", "total_processed", "total_qualified")
+    __slots__ = ("matches", "total_processed", "total_qualified", "total_queued")
     MATCHES_FIELD_NUMBER: _ClassVar[int]
     TOTAL_PROCESSED_FIELD_NUMBER: _ClassVar[int]
     TOTAL_QUALIFIED_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_QUEUED_FIELD_NUMBER: _ClassVar[int]
     matches: _containers.RepeatedCompositeFieldContainer[Match]
     total_processed: int
     total_qualified: int
-    def __init__(self, matches: _Optional[_Iterable[_Union[Match, _Mapping]]] = ..., total_processed: _Optional[int] = ..., total_qualified: _Optional[int] = ...) -> None: ...
+    total_queued: int
+    def __init__(self, matches: _Optional[_Iterable[_Union[Match, _Mapping]]] = ..., total_processed: _Optional[int] = ..., total_qualified: _Optional[int] = ..., total_queued: _Optional[int] = ...) -> None: ...
 
 class CalculateMatchesForUserRequest(_message.Message):
     __slots__ = ("user_id", "resume_id", "limit", "min_score_threshold", "force_recalculate")
@@ -341,17 +392,19 @@ class CalculateMatchesForUserRequest(_message.Message):
     limit: int
     min_score_threshold: float
     force_recalculate: bool
-    def __init__(self, user_id: _Optional[str] = ..., resume_id: _Optional[str] = ..., limit: _Optional[int] = ..., min_score_threshold: _Optional[float] = ..., force_recalculate: bool = ...) -> None: ...
+    def __init__(self, user_id: _Optional[str] = ..., resume_id: _Optional[str] = ..., limit: _Optional[int] = ..., min_score_threshold: _Optional[float] = ..., force_recalculate: _Optional[bool] = ...) -> None: ...
 
 class CalculateMatchesForUserResponse(_message.Message):
-    __slots__ = ("matches", "total_processed", "total_qualified")
+    __slots__ = ("matches", "total_processed", "total_qualified", "total_queued")
     MATCHES_FIELD_NUMBER: _ClassVar[int]
     TOTAL_PROCESSED_FIELD_NUMBER: _ClassVar[int]
     TOTAL_QUALIFIED_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_QUEUED_FIELD_NUMBER: _ClassVar[int]
     matches: _containers.RepeatedCompositeFieldContainer[Match]
     total_processed: int
     total_qualified: int
-    def __init__(self, matches: _Optional[_Iterable[_Union[Match, _Mapping]]] = ..., total_processed: _Optional[int] = ..., total_qualified: _Optional[int] = ...) -> None: ...
+    total_queued: int
+    def __init__(self, matches: _Optional[_Iterable[_Union[Match, _Mapping]]] = ..., total_processed: _Optional[int] = ..., total_qualified: _Optional[int] = ..., total_queued: _Optional[int] = ...) -> None: ...
 
 class GetTopMatchesForJobRequest(_message.Message):
     __slots__ = ("job_id", "top_n", "min_score")
@@ -5,7 +5,7 @@ import warnings
 
 from match.v1 import match_pb2 as match_dot_v1_dot_match__pb2
 
-GRPC_GENERATED_VERSION = '1.76.0'
+GRPC_GENERATED_VERSION = '1.84.0'
 GRPC_VERSION = grpc.__version__
 _version_not_supported = False
 
@@ -25,7 +25,7 @@ if _version_not_supported:
     )
 
 
-class MatchServiceStub(object):
+class MatchServiceStub:
     """============================================================================
     Service Definition
     ============================================================================
@@ -48,6 +48,11 @@ class MatchServiceStub(object):
                 request_serializer=match_dot_v1_dot_match__pb2.GetMatchRequest.SerializeToString,
                 response_deserializer=match_dot_v1_dot_match__pb2.GetMatchResponse.FromString,
                 _registered_method=True)
+        self.UpdateMatch = channel.unary_unary(
+                '/hirehub.match.v1.MatchService/UpdateMatch',
+                request_serializer=match_dot_v1_dot_match__pb2.UpdateMatchRequest.SerializeToString,
+                response_deserializer=match_dot_v1_dot_match__pb2.UpdateMatchResponse.FromString,
+                _registered_method=True)
         self.DeleteMatch = channel.unary_unary(
                 '/hirehub.match.v1.MatchService/DeleteMatch',
                 request_serializer=match_dot_v1_dot_match__pb2.DeleteMatchRequest.SerializeToString,
@@ -103,6 +108,16 @@ class MatchServiceStub(object):
                 request_serializer=match_dot_v1_dot_match__pb2.GetRecommendedJobsForUserRequest.SerializeToString,
                 response_deserializer=match_dot_v1_dot_match__pb2.GetRecommendedJobsForUserResponse.FromString,
                 _registered_method=True)
+        self.StreamBatchCalculateMatches = channel.unary_stream(
+                '/hirehub.match.v1.MatchService/StreamBatchCalculateMatches',
+                request_serializer=match_dot_v1_dot_match__pb2.BatchCalculateMatchesRequest.SerializeToString,
+                response_deserializer=match_dot_v1_dot_match__pb2.BatchCalculateMatchResult.FromString,
+                _registered_method=True)
+        self.StreamTopMatchesForJob = channel.unary_stream(
+                '/hirehub.match.v1.MatchService/StreamTopMatchesForJob',
+                request_serializer=match_dot_v1_dot_match__pb2.GetTopMatchesForJobRequest.SerializeToString,
+                response_deserializer=match_dot_v1_dot_match__pb2.Match.FromString,
+                _registered_method=True)
         self.CreateMatchFeedback = channel.unary_unary(
                 '/hirehub.match.v1.MatchService/CreateMatchFeedback',
                 request_serializer=match_dot_v1_dot_match__pb2.CreateMatchFeedbackRequest.SerializeToString,
@@ -135,7 +150,7 @@ class MatchServiceStub(object):
                 _registered_method=True)
 
 
-class MatchServiceServicer(object):
+class MatchServiceServicer:
     """============================================================================
     Service Definition
     ============================================================================
@@ -155,6 +170,12 @@ class MatchServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def UpdateMatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def DeleteMatch(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -222,6 +243,19 @@ class MatchServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamBatchCalculateMatches(self, request, context):
+        """Streaming match calculation (results are sent as they are ready)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamTopMatchesForJob(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CreateMatchFeedback(self, request, context):
         """Match feedback
         """
@@ -273,6 +307,11 @@ def add_MatchServiceServicer_to_server(servicer, server):
                     request_deserializer=match_dot_v1_dot_match__pb2.GetMatchRequest.FromString,
                     response_serializer=match_dot_v1_dot_match__pb2.GetMatchResponse.SerializeToString,
             ),
+            'UpdateMatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateMatch,
+                    request_deserializer=match_dot_v1_dot_match__pb2.UpdateMatchRequest.FromString,
+                    response_serializer=match_dot_v1_dot_match__pb2.UpdateMatchResponse.SerializeToString,
+            ),
             'DeleteMatch': grpc.unary_unary_rpc_method_handler(
                     servicer.DeleteMatch,
                     request_deserializer=match_dot_v1_dot_match__pb2.DeleteMatchRequest.FromString,
@@ -328,6 +367,16 @@ def add_MatchServiceServicer_to_server(servicer, server):
                     request_deserializer=match_dot_v1_dot_match__pb2.GetRecommendedJobsForUserRequest.FromString,
                     response_serializer=match_dot_v1_dot_match__pb2.GetRecommendedJobsForUserResponse.SerializeToString,
             ),
+            'StreamBatchCalculateMatches': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamBatchCalculateMatches,
+                    request_deserializer=match_dot_v1_dot_match__pb2.BatchCalculateMatchesRequest.FromString,
+                    response_serializer=match_dot_v1_dot_match__pb2.BatchCalculateMatchResult.SerializeToString,
+            ),
+            'StreamTopMatchesForJob': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamTopMatchesForJob,
+                    request_deserializer=match_dot_v1_dot_match__pb2.GetTopMatchesForJobRequest.FromString,
+                    response_serializer=match_dot_v1_dot_match__pb2.Match.SerializeToString,
+            ),
             'CreateMatchFeedback': grpc.unary_unary_rpc_method_handler(
                     servicer.CreateMatchFeedback,
                     request_deserializer=match_dot_v1_dot_match__pb2.CreateMatchFeedbackRequest.FromString,
@@ -366,7 +415,7 @@ def add_MatchServiceServicer_to_server(servicer, server):
 
 
  # This class is part of an EXPERIMENTAL API.
-class MatchService(object):
+class MatchService:
     """============================================================================
     Service Definition
     ============================================================================
@@ -427,6 +476,33 @@ class MatchService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def UpdateMatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/hirehub.match.v1.MatchService/UpdateMatch',
+            match_dot_v1_dot_match__pb2.UpdateMatchRequest.SerializeToString,
+            match_dot_v1_dot_match__pb2.UpdateMatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def DeleteMatch(request,
             target,
@@ -724,6 +800,60 @@ class MatchService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamBatchCalculateMatches(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/hirehub.match.v1.MatchService/StreamBatchCalculateMatches',
+            match_dot_v1_dot_match__pb2.BatchCalculateMatchesRequest.SerializeToString,
+            match_dot_v1_dot_match__pb2.BatchCalculateMatchResult.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamTopMatchesForJob(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/hirehub.match.v1.MatchService/StreamTopMatchesForJob',
+            match_dot_v1_dot_match__pb2.GetTopMatchesForJobRequest.SerializeToString,
+            match_dot_v1_dot_match__pb2.Match.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def CreateMatchFeedback(request,
             target,
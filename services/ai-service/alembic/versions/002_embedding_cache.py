@@ -0,0 +1,40 @@
+"""Add embedding_cache for persisted embedding vectors.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the embedding cache table."""
+    op.create_table(
+        "embedding_cache",
+        sa.Column("model_id", sa.String(100), nullable=False),
+        sa.Column("text_hash", sa.LargeBinary(32), nullable=False),
+        sa.Column("vector", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("model_id", "text_hash"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the embedding cache table."""
+    op.drop_table("embedding_cache")
@@ -6,6 +6,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.bedrock import BedrockClient, get_bedrock
 from app.core.database import get_db
 from app.models.schemas import (
     ResumeAnalysisRequest,
@@ -30,6 +31,7 @@ router = APIRouter()
 async def analyze_resume(
     request: ResumeAnalysisRequest,
     db: AsyncSession = Depends(get_db),
+    bedrock: BedrockClient = Depends(get_bedrock),
 ):
     """
     Analyze a resume using AgentCore.
@@ -37,7 +39,7 @@ async def analyze_resume(
     Extracts skills, experience, education, and provides a structured analysis.
     """
     repository = AITaskRepository(db)
-    service = AnalysisService(repository)
+    service = AnalysisService(repository, bedrock)
 
     try:
         result = await service.analyze_resume(
@@ -57,6 +59,7 @@ async def analyze_resume(
 async def match_job(
     request: JobMatchRequest,
     db: AsyncSession = Depends(get_db),
+    bedrock: BedrockClient = Depends(get_bedrock),
 ):
     """
     Match a resume against job requirements.
@@ -65,7 +68,7 @@ async def match_job(
     For AgentCore-powered matching, use /match/agent endpoint.
     """
     repository = AITaskRepository(db)
-    service = AnalysisService(repository)
+    service = AnalysisService(repository, bedrock)
 
     try:
         result = await service.match_resume_to_job(
@@ -86,6 +89,7 @@ async def match_job(
 async def match_job_with_agent(
     request: AgentMatchRequest,
     db: AsyncSession = Depends(get_db),
+    bedrock: BedrockClient = Depends(get_bedrock),
 ):
     """
     Match a resume against job requirements using AgentCore.
@@ -99,7 +103,7 @@ async def match_job_with_agent(
     Returns a session_id that can be used for follow-up questions.
     """
     repository = AITaskRepository(db)
-    service = AnalysisService(repository)
+    service = AnalysisService(repository, bedrock)
 
     try:
         result = await service.match_with_agent(
@@ -126,6 +130,7 @@ async def match_job_with_agent(
 async def agent_match_followup(
     request: AgentFollowupRequest,
     db: AsyncSession = Depends(get_db),
+    bedrock: BedrockClient = Depends(get_bedrock),
 ):
     """
     Ask a follow-up question about a previous agent match analysis.
@@ -134,7 +139,7 @@ async def agent_match_followup(
     Sessions expire after 1 hour of inactivity.
     """
     repository = AITaskRepository(db)
-    service = AnalysisService(repository)
+    service = AnalysisService(repository, bedrock)
 
     try:
         result = await service.followup_match_question(
@@ -165,6 +170,7 @@ async def agent_match_followup(
 async def end_agent_session(
     session_id: str,
     db: AsyncSession = Depends(get_db),
+    bedrock: BedrockClient = Depends(get_bedrock),
 ):
     """
     End an agent matching session.
@@ -173,7 +179,7 @@ async def end_agent_session(
     for follow-up questions after this call.
     """
     repository = AITaskRepository(db)
-    service = AnalysisService(repository)
+    service = AnalysisService(repository, bedrock)
 
     try:
         service.matching_agent.end_session(session_id)
@@ -189,6 +195,7 @@ async def end_agent_session(
 async def extract_skills(
     request: SkillExtractionRequest,
     db: AsyncSession = Depends(get_db),
+    bedrock: BedrockClient = Depends(get_bedrock),
 ):
     """
     Extract skills from text.
@@ -196,7 +203,7 @@ async def extract_skills(
     Uses AgentCore to identify technical skills, soft skills, and certifications.
     """
     repository = AITaskRepository(db)
-    service = AnalysisService(repository)
+    service = AnalysisService(repository, bedrock)
 
     try:
         result = await service.extract_skills(
@@ -6,6 +6,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.bedrock import BedrockClient, get_bedrock
 from app.core.database import get_db
 from app.models.schemas import (
     EmbeddingRequest,
@@ -16,7 +17,10 @@ from app.models.schemas import (
     SimilaritySearchResponse,
     JobEmbeddingCreate,
     JobEmbeddingResponse,
+    BatchJobEmbeddingRequest,
+    BatchJobEmbeddingResponse,
 )
+from app.services.embedding_cache import EmbeddingCache, get_embedding_cache
 from app.services.embedding_service import EmbeddingService
 from app.repositories.ai_task_repository import AITaskRepository
 
@@ -27,6 +31,8 @@ router = APIRouter()
 async def generate_embedding(
     request: EmbeddingRequest,
     db: AsyncSession = Depends(get_db),
+    bedrock: BedrockClient = Depends(get_bedrock),
+    cache: EmbeddingCache = Depends(get_embedding_cache),
 ):
     """
     Generate vector embedding for text.
@@ -34,7 +40,7 @@ async def generate_embedding(
     Uses Amazon Bedrock Titan Embeddings model.
     """
     repository = AITaskRepository(db)
-    service = EmbeddingService(repository)
+    service = EmbeddingService(repository, bedrock, cache)
 
     try:
         result = await service.generate_embedding(
@@ -53,6 +59,8 @@ async def generate_embedding(
 async def generate_batch_embeddings(
     request: BatchEmbeddingRequest,
     db: AsyncSession = Depends(get_db),
+    bedrock: BedrockClient = Depends(get_bedrock),
+    cache: EmbeddingCache = Depends(get_embedding_cache),
 ):
     """
     Generate vector embeddings for multiple texts.
@@ -60,7 +68,7 @@ async def generate_batch_embeddings(
     Uses Amazon Bedrock Titan Embeddings model.
     """
     repository = AITaskRepository(db)
-    service = EmbeddingService(repository)
+    service = EmbeddingService(repository, bedrock, cache)
 
     try:
         result = await service.generate_batch_embeddings(
@@ -79,6 +87,8 @@ async def generate_batch_embeddings(
 async def create_job_embedding(
     request: JobEmbeddingCreate,
     db: AsyncSession = Depends(get_db),
+    bedrock: BedrockClient = Depends(get_bedrock),
+    cache: EmbeddingCache = Depends(get_embedding_cache),
 ):
     """
     Create and store embedding for a job posting.
@@ -86,7 +96,7 @@ async def create_job_embedding(
     Chunks the job description and creates embeddings for each chunk.
     """
     repository = AITaskRepository(db)
-    service = EmbeddingService(repository)
+    service = EmbeddingService(repository, bedrock, cache)
 
     try:
         result = await service.create_job_embedding(
@@ -103,10 +113,38 @@ async def create_job_embedding(
         )
 
 
+@router.post("/job/batch", response_model=BatchJobEmbeddingResponse)
+async def create_job_embeddings(
+    request: BatchJobEmbeddingRequest,
+    db: AsyncSession = Depends(get_db),
+    bedrock: BedrockClient = Depends(get_bedrock),
+    cache: EmbeddingCache = Depends(get_embedding_cache),
+):
+    """
+    Create and store embeddings for many job postings.
+
+    Replaces each job's existing chunks in one transaction; use this to
+    re-index the job catalogue.
+    """
+    repository = AITaskRepository(db)
+    service = EmbeddingService(repository, bedrock, cache)
+
+    try:
+        result = await service.create_job_embeddings(jobs=request.jobs)
+        return result
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch job embedding creation failed: {str(e)}",
+        ) from e
+
+
 @router.post("/search", response_model=SimilaritySearchResponse)
 async def similarity_search(
     request: SimilaritySearchRequest,
     db: AsyncSession = Depends(get_db),
+    bedrock: BedrockClient = Depends(get_bedrock),
+    cache: EmbeddingCache = Depends(get_embedding_cache),
 ):
     """
     Search for similar job embeddings.
@@ -114,7 +152,7 @@ async def similarity_search(
     Uses cosine similarity to find the most similar job embeddings.
     """
     repository = AITaskRepository(db)
-    service = EmbeddingService(repository)
+    service = EmbeddingService(repository, bedrock, cache)
 
     try:
         result = await service.similarity_search(
@@ -134,10 +172,12 @@ async def similarity_search(
 async def delete_job_embeddings(
     job_id: UUID,
     db: AsyncSession = Depends(get_db),
+    bedrock: BedrockClient = Depends(get_bedrock),
+    cache: EmbeddingCache = Depends(get_embedding_cache),
 ):
     """Delete all embeddings for a job posting."""
     repository = AITaskRepository(db)
-    service = EmbeddingService(repository)
+    service = EmbeddingService(repository, bedrock, cache)
 
     try:
         deleted_count = await service.delete_job_embeddings(job_id)
@@ -8,7 +8,8 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.bedrock import BedrockClient
+from app.core.bedrock import BedrockClient, get_bedrock
+from app.services.embedding_cache import EmbeddingCache, get_embedding_cache
 from app.services.embedding_service import EmbeddingService
 from app.repositories.ai_task_repository import AITaskRepository
 
@@ -70,6 +71,8 @@ class RAGDeleteResponse(BaseModel):
 async def rag_query(
     request: RAGQueryRequest,
     db: AsyncSession = Depends(get_db),
+    bedrock: BedrockClient = Depends(get_bedrock),
+    cache: EmbeddingCache = Depends(get_embedding_cache),
 ):
     """
     RAG Query - Retrieve relevant context and generate an answer.
@@ -88,8 +91,7 @@ async def rag_query(
     start_time = time.time()
 
     repository = AITaskRepository(db)
-    embedding_service = EmbeddingService(repository)
-    bedrock = BedrockClient()
+    embedding_service = EmbeddingService(repository, bedrock, cache)
 
     try:
         # Step 1: Retrieve relevant chunks
@@ -167,6 +169,8 @@ Answer:"""
 async def rag_index(
     request: RAGIndexRequest,
     db: AsyncSession = Depends(get_db),
+    bedrock: BedrockClient = Depends(get_bedrock),
+    cache: EmbeddingCache = Depends(get_embedding_cache),
 ):
     """
     Index a document for RAG retrieval.
@@ -181,7 +185,7 @@ async def rag_index(
     - job: Job postings
     """
     repository = AITaskRepository(db)
-    embedding_service = EmbeddingService(repository)
+    embedding_service = EmbeddingService(repository, bedrock, cache)
 
     try:
         # Use the existing job embedding logic (can be extended for other types)
@@ -211,6 +215,8 @@ async def rag_index(
 async def rag_delete(
     document_id: UUID,
     db: AsyncSession = Depends(get_db),
+    bedrock: BedrockClient = Depends(get_bedrock),
+    cache: EmbeddingCache = Depends(get_embedding_cache),
 ):
     """
     Delete a document from the RAG index.
@@ -218,7 +224,7 @@ async def rag_delete(
     Removes all vector embeddings associated with the document.
     """
     repository = AITaskRepository(db)
-    embedding_service = EmbeddingService(repository)
+    embedding_service = EmbeddingService(repository, bedrock, cache)
 
     try:
         deleted_count = await embedding_service.delete_job_embeddings(document_id)
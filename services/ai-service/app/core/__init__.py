@@ -2,6 +2,6 @@
 
 from app.core.config import settings
 from app.core.database import get_db, engine, Base
-from app.core.bedrock import BedrockClient
+from app.core.bedrock import BedrockClient, get_bedrock
 
-__all__ = ["settings", "get_db", "engine", "Base", "BedrockClient"]
+__all__ = ["settings", "get_db", "engine", "Base", "BedrockClient", "get_bedrock"]
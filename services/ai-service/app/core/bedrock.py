@@ -1,27 +1,84 @@
 """Amazon Bedrock client for embeddings and model invocation."""
 
+import asyncio
 import json
-from typing import List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 import boto3
 from botocore.config import Config
+from fastapi import Request
 
 from app.core.config import settings
 
+T = TypeVar("T")
+
+
+class BedrockBusyError(RuntimeError):
+    """Raised when too many Bedrock calls are already queued."""
+
+
+class BedrockExecutor:
+    """
+    Thread pool that runs blocking boto3 calls off the event loop.
+
+    At most ``max_workers`` calls run at once and up to ``max_pending`` more
+    wait for a free thread. Further calls fail fast with BedrockBusyError
+    instead of queueing without bound.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="bedrock"
+        )
+        # Released by the worker thread, so not an asyncio.Semaphore
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking call on the pool and await its result."""
+        if not self._slots.acquire(blocking=False):
+            raise BedrockBusyError("Too many Bedrock calls in flight")
+        try:
+            future = self._pool.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        # The slot is held until the thread finishes, even if the caller
+        # is cancelled, so abandoned calls still count against the limit
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        """Drop queued calls and stop the pool."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+bedrock_executor = BedrockExecutor(
+    max_workers=settings.BEDROCK_MAX_CONCURRENCY,
+    max_pending=settings.BEDROCK_MAX_PENDING,
+)
+
 
 class BedrockClient:
     """Client for Amazon Bedrock services."""
 
-    def __init__(self):
+    def __init__(self, executor: Optional[BedrockExecutor] = None):
         """Initialize Bedrock client."""
+        self.executor = executor or bedrock_executor
         config = Config(
             region_name=settings.AWS_REGION,
             retries={"max_attempts": 3, "mode": "standard"},
+            # One pooled connection per executor thread, kept warm across
+            # requests now that the client lives as long as the process
+            max_pool_connections=settings.BEDROCK_MAX_CONCURRENCY,
+            tcp_keepalive=True,
         )
 
         self.bedrock_runtime = boto3.client(
             "bedrock-runtime",
             config=config,
+            endpoint_url=settings.BEDROCK_ENDPOINT_URL,
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
         )
@@ -33,6 +90,26 @@ class BedrockClient:
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
         )
 
+    def _invoke_model_sync(self, model_id: str, body: str) -> Dict[str, Any]:
+        """Invoke a model and read its response body (blocking)."""
+        response = self.bedrock_runtime.invoke_model(
+            modelId=model_id,
+            body=body,
+            contentType="application/json",
+            accept="application/json",
+        )
+        return json.loads(response["body"].read())
+
+    def _invoke_agent_sync(self, **kwargs: Any) -> str:
+        """Invoke an agent and drain its event stream (blocking)."""
+        response = self.bedrock_agent_runtime.invoke_agent(**kwargs)
+        completion = ""
+        for event in response["completion"]:
+            if "chunk" in event:
+                chunk = event["chunk"]
+                completion += chunk["bytes"].decode("utf-8")
+        return completion
+
     async def generate_embedding(
         self,
         text: str,
@@ -52,14 +129,7 @@ class BedrockClient:
 
         body = json.dumps({"inputText": text})
 
-        response = self.bedrock_runtime.invoke_model(
-            modelId=model_id,
-            body=body,
-            contentType="application/json",
-            accept="application/json",
-        )
-
-        response_body = json.loads(response["body"].read())
+        response_body = await self.executor.run(self._invoke_model_sync, model_id, body)
         return response_body["embedding"]
 
     async def invoke_model(
@@ -111,15 +181,10 @@ class BedrockClient:
                 "temperature": temperature,
             }
 
-        response = self.bedrock_runtime.invoke_model(
-            modelId=model_id,
-            body=json.dumps(body),
-            contentType="application/json",
-            accept="application/json",
+        response_body = await self.executor.run(
+            self._invoke_model_sync, model_id, json.dumps(body)
         )
 
-        response_body = json.loads(response["body"].read())
-
         # Parse response based on model type
         if "anthropic" in model_id:
             text = response_body["content"][0]["text"]
@@ -159,22 +224,15 @@ class BedrockClient:
         if not agent_id or not agent_alias_id:
             raise ValueError("AgentCore agent_id and agent_alias_id must be configured")
 
-        response = self.bedrock_agent_runtime.invoke_agent(
+        # Draining the event stream blocks too, so it runs on the executor
+        return await self.executor.run(
+            self._invoke_agent_sync,
             agentId=agent_id,
             agentAliasId=agent_alias_id,
             sessionId=session_id,
             inputText=input_text,
         )
 
-        # Stream response
-        completion = ""
-        for event in response["completion"]:
-            if "chunk" in event:
-                chunk = event["chunk"]
-                completion += chunk["bytes"].decode("utf-8")
-
-        return completion
-
     async def retrieve_and_generate(
         self,
         input_text: str,
@@ -197,7 +255,8 @@ class BedrockClient:
             or f"arn:aws:bedrock:{settings.AWS_REGION}::foundation-model/{settings.BEDROCK_ANALYSIS_MODEL}"
         )
 
-        response = self.bedrock_agent_runtime.retrieve_and_generate(
+        response = await self.executor.run(
+            self.bedrock_agent_runtime.retrieve_and_generate,
             input={"text": input_text},
             retrieveAndGenerateConfiguration={
                 "type": "KNOWLEDGE_BASE",
@@ -239,3 +298,8 @@ class BedrockClient:
             temperature=temperature,
         )
         return text
+
+
+def get_bedrock(request: Request) -> BedrockClient:
+    """Dependency for the process-wide Bedrock client created at startup."""
+    return request.app.state.bedrock
@@ -1,7 +1,7 @@
 """Application configuration."""
 
 from functools import lru_cache
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -31,6 +31,15 @@ class Settings(BaseSettings):
     AWS_SECRET_ACCESS_KEY: Optional[str] = None
     BEDROCK_EMBEDDING_MODEL: str = "amazon.titan-embed-text-v1"
     BEDROCK_ANALYSIS_MODEL: str = "anthropic.claude-3-sonnet-20240229-v1:0"
+    BEDROCK_ENDPOINT_URL: Optional[str] = None  # Local stub or VPC endpoint
+    BEDROCK_MAX_CONCURRENCY: int = 32  # Bedrock calls in flight per worker
+    BEDROCK_MAX_PENDING: int = 256  # Calls queued beyond that before rejecting
+
+    # Batch embedding
+    EMBEDDING_BATCH_CONCURRENCY: int = 16  # Embedding calls in flight per batch
+    # Per worker: split the account's Bedrock quota across workers and replicas
+    BEDROCK_EMBEDDING_DEFAULT_RPM: int = 2000
+    BEDROCK_EMBEDDING_RPM: Dict[str, int] = {}  # Per-model overrides, JSON in env
 
     # AgentCore
     AGENTCORE_AGENT_ID: Optional[str] = None
@@ -45,6 +54,11 @@ class Settings(BaseSettings):
     # Redis Cache
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Embedding cache, keyed by (model_id, sha256(text))
+    EMBEDDING_CACHE_LOCAL_MAX_ENTRIES: int = 4096  # ~6 KB each at 1536 dims
+    EMBEDDING_CACHE_REDIS_TTL: int = 30 * 24 * 3600  # Bounds memory; never stale
+    EMBEDDING_CACHE_PERSIST: bool = False  # Also keep vectors in Postgres
+
     # Logging
     LOG_LEVEL: str = "INFO"
 
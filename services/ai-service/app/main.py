@@ -4,10 +4,13 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from redis.asyncio import Redis
 
 from app.api.routes import pii, embedding, analysis, rag
+from app.core.bedrock import BedrockClient, bedrock_executor
 from app.core.config import settings
-from app.core.database import engine, Base
+from app.core.database import async_session_maker, engine, Base
+from app.services.embedding_cache import EmbeddingCache
 
 
 @asynccontextmanager
@@ -16,8 +19,17 @@ async def lifespan(app: FastAPI):
     # Startup
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    # Built once: each client resolves credentials and owns a connection pool
+    app.state.bedrock = BedrockClient()
+    redis = Redis.from_url(settings.REDIS_URL)
+    app.state.embedding_cache = EmbeddingCache(
+        redis=redis,
+        session_maker=async_session_maker if settings.EMBEDDING_CACHE_PERSIST else None,
+    )
     yield
     # Shutdown
+    bedrock_executor.shutdown()
+    await redis.aclose()
     await engine.dispose()
 
 
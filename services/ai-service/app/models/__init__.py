@@ -1,6 +1,6 @@
 """Data models."""
 
-from app.models.ai_task import AITask, JobEmbedding
+from app.models.ai_task import AITask, EmbeddingCacheEntry, JobEmbedding
 from app.models.schemas import (
     PIIMaskRequest,
     PIIMaskResponse,
@@ -15,6 +15,7 @@ from app.models.schemas import (
 __all__ = [
     "AITask",
     "JobEmbedding",
+    "EmbeddingCacheEntry",
     "PIIMaskRequest",
     "PIIMaskResponse",
     "PIIDetectRequest",
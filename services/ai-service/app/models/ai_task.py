@@ -11,6 +11,7 @@ from sqlalchemy import (
     Integer,
     DateTime,
     JSON,
+    LargeBinary,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from pgvector.sqlalchemy import Vector
@@ -63,3 +64,19 @@ class JobEmbedding(Base):
 
     def __repr__(self) -> str:
         return f"<JobEmbedding(id={self.id}, job_id={self.job_id}, chunk={self.chunk_index})>"
+
+
+class EmbeddingCacheEntry(Base):
+    """Model for persisted embedding cache entries."""
+
+    __tablename__ = "embedding_cache"
+
+    model_id = Column(String(100), primary_key=True)
+    text_hash = Column(LargeBinary(32), primary_key=True)  # SHA-256 of the text
+    vector = Column(LargeBinary, nullable=False)  # Little-endian float32
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return (
+            f"<EmbeddingCacheEntry(model={self.model_id}, hash={self.text_hash.hex()})>"
+        )
@@ -126,12 +126,20 @@ class BatchEmbeddingRequest(BaseModel):
     model: Optional[str] = Field(None, description="Model to use for embedding")
 
 
+class BatchEmbeddingFailure(BaseModel):
+    """A text of a batch embedding request that could not be embedded."""
+
+    index: int  # Position in the request's texts
+    error: str
+
+
 class BatchEmbeddingResponse(BaseModel):
     """Response for batch embedding generation."""
 
     task_id: UUID
-    embeddings: List[List[float]]
-    count: int
+    embeddings: List[Optional[List[float]]]  # In request order; None if failed
+    failures: List[BatchEmbeddingFailure] = []
+    count: int  # Texts embedded successfully
     dimensions: int
     model_used: str
     processing_time_ms: int
@@ -157,6 +165,23 @@ class JobEmbeddingResponse(BaseModel):
     processing_time_ms: int
 
 
+class BatchJobEmbeddingRequest(BaseModel):
+    """Request for creating embeddings for many job postings."""
+
+    jobs: List[JobEmbeddingCreate] = Field(..., description="Job postings to embed")
+
+
+class BatchJobEmbeddingResponse(BaseModel):
+    """Response for batch job embedding creation."""
+
+    task_id: UUID
+    job_count: int
+    chunk_count: int
+    dimensions: int
+    model_used: str
+    processing_time_ms: int
+
+
 class SimilarityResult(BaseModel):
     """A similarity search result."""
 
@@ -1,13 +1,63 @@
 """Repository for AI tasks and embeddings."""
 
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import io
+import struct
+import sys
+import uuid
+from array import array
+from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Iterable, Sequence, Tuple
 from uuid import UUID
 
 from sqlalchemy import select, delete, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.ai_task import AITask, JobEmbedding
+from app.models.ai_task import AITask, EmbeddingCacheEntry, JobEmbedding
+
+# Header of PostgreSQL's binary COPY format: signature, flags, extension length
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_COPY_TRAILER = struct.pack(">h", -1)
+_PG_EPOCH = datetime(2000, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+JOB_EMBEDDING_COPY_COLUMNS = [
+    "id",
+    "job_id",
+    "chunk_index",
+    "chunk_text",
+    "embedding",
+    "created_at",
+]
+
+
+def _copy_vector(vector: Sequence[float]) -> bytes:
+    """Encode a pgvector value: dimensions, an unused word, big-endian float32s."""
+    values = array("f", vector)
+    if sys.byteorder == "little":
+        values.byteswap()
+    return struct.pack(">HH", len(values), 0) + values.tobytes()
+
+
+def encode_job_embedding_copy(
+    records: Iterable[Tuple[UUID, UUID, int, str, Sequence[float], datetime]],
+) -> bytes:
+    """Encode job_embeddings rows for binary COPY into JOB_EMBEDDING_COPY_COLUMNS."""
+    buffer = io.BytesIO()
+    buffer.write(_COPY_HEADER)
+    for row_id, job_id, chunk_index, chunk_text, embedding, created_at in records:
+        text_bytes = chunk_text.encode("utf-8")
+        vector_bytes = _copy_vector(embedding)
+        micros = (created_at - _PG_EPOCH) // _MICROSECOND
+        buffer.write(struct.pack(">h", len(JOB_EMBEDDING_COPY_COLUMNS)))
+        buffer.write(struct.pack(">i", 16) + row_id.bytes)
+        buffer.write(struct.pack(">i", 16) + job_id.bytes)
+        buffer.write(struct.pack(">ii", 4, chunk_index))
+        buffer.write(struct.pack(">i", len(text_bytes)) + text_bytes)
+        buffer.write(struct.pack(">i", len(vector_bytes)) + vector_bytes)
+        buffer.write(struct.pack(">iq", 8, micros))
+    buffer.write(_COPY_TRAILER)
+    return buffer.getvalue()
 
 
 class AITaskRepository:
@@ -105,24 +155,47 @@ class AITaskRepository:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    async def create_job_embedding(
+    async def replace_job_embeddings(
         self,
-        job_id: UUID,
-        chunk_index: int,
-        chunk_text: str,
-        embedding: List[float],
-    ) -> JobEmbedding:
-        """Create a job embedding record."""
-        job_embedding = JobEmbedding(
-            job_id=job_id,
-            chunk_index=chunk_index,
-            chunk_text=chunk_text,
-            embedding=embedding,
-        )
-        self.db.add(job_embedding)
-        await self.db.commit()
-        await self.db.refresh(job_embedding)
-        return job_embedding
+        chunks_by_job: Dict[UUID, Sequence[Tuple[str, Sequence[float]]]],
+    ) -> int:
+        """
+        Replace the embedded chunks of one or more jobs.
+
+        The jobs' existing chunks are deleted and the new ones written with a
+        single binary COPY, in one transaction, so readers see either all old
+        or all new chunks of a job. Returns the number of chunks written.
+        """
+        if not chunks_by_job:
+            return 0
+
+        # job_embeddings may come from create_all, without server-side defaults
+        created_at = datetime.utcnow()
+        records = [
+            (uuid.uuid4(), job_id, chunk_index, chunk_text, embedding, created_at)
+            for job_id, chunks in chunks_by_job.items()
+            for chunk_index, (chunk_text, embedding) in enumerate(chunks)
+        ]
+
+        try:
+            await self.db.execute(
+                delete(JobEmbedding).where(JobEmbedding.job_id.in_(list(chunks_by_job)))
+            )
+            if records:
+                connection = await self.db.connection()
+                raw_connection = await connection.get_raw_connection()
+                # COPY runs on the asyncpg connection inside the session's transaction
+                await raw_connection.driver_connection.copy_to_table(
+                    JobEmbedding.__tablename__,
+                    source=io.BytesIO(encode_job_embedding_copy(records)),
+                    columns=JOB_EMBEDDING_COPY_COLUMNS,
+                    format="binary",
+                )
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        return len(records)
 
     async def get_job_embeddings(self, job_id: UUID) -> List[JobEmbedding]:
         """Get all embeddings for a job."""
@@ -141,6 +214,35 @@ class AITaskRepository:
         await self.db.commit()
         return result.rowcount
 
+    async def get_cached_embeddings(
+        self,
+        model_id: str,
+        text_hashes: List[bytes],
+    ) -> Dict[bytes, bytes]:
+        """Get persisted embedding cache entries by text hash."""
+        result = await self.db.execute(
+            select(EmbeddingCacheEntry.text_hash, EmbeddingCacheEntry.vector).where(
+                EmbeddingCacheEntry.model_id == model_id,
+                EmbeddingCacheEntry.text_hash.in_(text_hashes),
+            )
+        )
+        return {bytes(row[0]): bytes(row[1]) for row in result.all()}
+
+    async def save_cached_embeddings(
+        self,
+        model_id: str,
+        vectors: Dict[bytes, bytes],
+    ) -> None:
+        """Persist embedding cache entries, keeping any already stored."""
+        stmt = insert(EmbeddingCacheEntry).values(
+            [
+                {"model_id": model_id, "text_hash": text_hash, "vector": vector}
+                for text_hash, vector in vectors.items()
+            ]
+        )
+        await self.db.execute(stmt.on_conflict_do_nothing())
+        await self.db.commit()
+
     async def search_similar_embeddings(
         self,
         embedding: List[float],
@@ -83,11 +83,11 @@ Return JSON with a "skills" array, each skill having:
 Return valid JSON only.
 """
 
-    def __init__(self, repository: AITaskRepository):
+    def __init__(self, repository: AITaskRepository, bedrock: BedrockClient):
         self.repository = repository
-        self.bedrock = BedrockClient()
+        self.bedrock = bedrock
         self.model_id = settings.BEDROCK_ANALYSIS_MODEL
-        self.matching_agent = MatchingAgentService(repository)
+        self.matching_agent = MatchingAgentService(repository, bedrock)
         self.use_agentcore = settings.USE_AGENTCORE
 
     async def _invoke_model(
@@ -0,0 +1,91 @@
+"""Concurrent, rate-limited batch embedding."""
+
+import asyncio
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from app.core.bedrock import BedrockClient
+from app.core.config import settings
+
+
+class TokenBucket:
+    """Paces callers to a steady rate, allowing bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        # Waiters queue on the lock, so tokens go out first come, first served
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+
+
+def model_rate_limiter(model_id: str) -> TokenBucket:
+    """Get the process-wide token bucket for an embedding model's quota."""
+    bucket = _buckets.get(model_id)
+    if bucket is None:
+        per_minute = settings.BEDROCK_EMBEDDING_RPM.get(
+            model_id, settings.BEDROCK_EMBEDDING_DEFAULT_RPM
+        )
+        rate = per_minute / 60
+        bucket = _buckets[model_id] = TokenBucket(rate=rate, capacity=max(rate, 1))
+    return bucket
+
+
+class EmbeddingOutcome(NamedTuple):
+    """Result of embedding one text of a batch: a vector or an error."""
+
+    embedding: Optional[List[float]]
+    error: Optional[str] = None
+
+
+async def embed_batch(
+    bedrock: BedrockClient,
+    texts: Sequence[str],
+    model_id: str,
+    concurrency: Optional[int] = None,
+    limiter: Optional[TokenBucket] = None,
+) -> List[EmbeddingOutcome]:
+    """
+    Embed texts concurrently, returning one outcome per text in input order.
+
+    Identical texts are embedded once. At most ``concurrency`` calls are in
+    flight, each paced by the model's token bucket. A failed text yields an
+    outcome with its error instead of failing the batch.
+    """
+    concurrency = concurrency or settings.EMBEDDING_BATCH_CONCURRENCY
+    limiter = limiter or model_rate_limiter(model_id)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def embed(text: str) -> EmbeddingOutcome:
+        async with semaphore:
+            await limiter.acquire()
+            try:
+                return EmbeddingOutcome(
+                    await bedrock.generate_embedding(text, model_id)
+                )
+            except Exception as e:
+                return EmbeddingOutcome(None, str(e) or type(e).__name__)
+
+    unique = list(dict.fromkeys(texts))
+    outcomes = dict(
+        zip(unique, await asyncio.gather(*map(embed, unique)), strict=True)
+    )
+    return [outcomes[text] for text in texts]
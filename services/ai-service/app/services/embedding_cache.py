@@ -0,0 +1,176 @@
+"""Content-addressed cache of embedding vectors."""
+
+import hashlib
+import logging
+import sys
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from fastapi import Request
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.repositories.ai_task_repository import AITaskRepository
+
+logger = logging.getLogger(__name__)
+
+
+def pack_vector(vector: Sequence[float]) -> bytes:
+    """Pack a vector as little-endian float32, as pgvector stores it."""
+    packed = array("f", vector)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_vector(data: bytes) -> List[float]:
+    """Unpack a vector packed by pack_vector."""
+    packed = array("f")
+    packed.frombytes(data)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tolist()
+
+
+def text_digest(text: str) -> bytes:
+    """Get the SHA-256 digest that identifies a text."""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """
+    Embedding vectors keyed by (model_id, sha256(text)).
+
+    Lookups go through a bounded in-process LRU, then Redis shared by all
+    replicas, then optionally the ``embedding_cache`` table. Hits in a
+    lower tier are copied into the tiers above it. Since keys address
+    content, entries never go stale; Redis and the LRU only evict to
+    bound memory. A failing Redis or database tier counts as a miss.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis] = None,
+        session_maker: Optional[async_sessionmaker[AsyncSession]] = None,
+        max_entries: int = settings.EMBEDDING_CACHE_LOCAL_MAX_ENTRIES,
+        redis_ttl: int = settings.EMBEDDING_CACHE_REDIS_TTL,
+    ):
+        self.redis = redis
+        self.session_maker = session_maker
+        self.max_entries = max_entries
+        self.redis_ttl = redis_ttl
+        self._local: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+
+    @staticmethod
+    def _redis_key(model_id: str, digest: bytes) -> str:
+        return f"embedding:{model_id}:{digest.hex()}"
+
+    async def get_many(
+        self, model_id: str, texts: Sequence[str]
+    ) -> List[Optional[List[float]]]:
+        """Get the cached vectors of texts, None for each miss."""
+        digests = [text_digest(text) for text in texts]
+        found: Dict[bytes, bytes] = {}
+        for digest in digests:
+            data = self._local.get((model_id, digest))
+            if data is not None:
+                self._local.move_to_end((model_id, digest))
+                found[digest] = data
+
+        missing = [digest for digest in dict.fromkeys(digests) if digest not in found]
+        if missing:
+            from_redis = await self._redis_get(model_id, missing)
+            found.update(from_redis)
+            self._remember(model_id, from_redis)
+            missing = [digest for digest in missing if digest not in from_redis]
+
+        if missing:
+            from_db = await self._db_get(model_id, missing)
+            found.update(from_db)
+            self._remember(model_id, from_db)
+            await self._redis_set(model_id, from_db)
+
+        return [
+            unpack_vector(found[digest]) if digest in found else None
+            for digest in digests
+        ]
+
+    async def set_many(
+        self, model_id: str, embeddings: Dict[str, Sequence[float]]
+    ) -> None:
+        """Store freshly generated vectors in every tier."""
+        packed = {
+            text_digest(text): pack_vector(vector)
+            for text, vector in embeddings.items()
+        }
+        self._remember(model_id, packed)
+        await self._redis_set(model_id, packed)
+        await self._db_set(model_id, packed)
+
+    def _remember(self, model_id: str, packed: Dict[bytes, bytes]) -> None:
+        """Add vectors to the in-process LRU, evicting the oldest."""
+        if self.max_entries <= 0:
+            return
+        for digest, data in packed.items():
+            self._local[(model_id, digest)] = data
+            self._local.move_to_end((model_id, digest))
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    async def _redis_get(
+        self, model_id: str, digests: List[bytes]
+    ) -> Dict[bytes, bytes]:
+        if not digests or self.redis is None:
+            return {}
+        try:
+            values = await self.redis.mget(
+                [self._redis_key(model_id, digest) for digest in digests]
+            )
+        except Exception as e:
+            logger.warning(f"Embedding cache read from Redis failed: {e}")
+            return {}
+        # The client does not decode responses, so every hit is bytes
+        return {
+            digest: value
+            for digest, value in zip(digests, values, strict=True)
+            if isinstance(value, bytes)
+        }
+
+    async def _redis_set(self, model_id: str, packed: Dict[bytes, bytes]) -> None:
+        if not packed or self.redis is None:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for digest, data in packed.items():
+                    pipe.set(self._redis_key(model_id, digest), data, ex=self.redis_ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Embedding cache write to Redis failed: {e}")
+
+    async def _db_get(self, model_id: str, digests: List[bytes]) -> Dict[bytes, bytes]:
+        if not digests or self.session_maker is None:
+            return {}
+        try:
+            async with self.session_maker() as session:
+                repository = AITaskRepository(session)
+                return await repository.get_cached_embeddings(model_id, digests)
+        except Exception as e:
+            logger.warning(f"Embedding cache read from database failed: {e}")
+            return {}
+
+    async def _db_set(self, model_id: str, packed: Dict[bytes, bytes]) -> None:
+        if not packed or self.session_maker is None:
+            return
+        try:
+            async with self.session_maker() as session:
+                repository = AITaskRepository(session)
+                await repository.save_cached_embeddings(model_id, packed)
+        except Exception as e:
+            logger.warning(f"Embedding cache write to database failed: {e}")
+
+
+def get_embedding_cache(request: Request) -> EmbeddingCache:
+    """Dependency for the process-wide embedding cache created at startup."""
+    return request.app.state.embedding_cache
@@ -1,19 +1,24 @@
 """Embedding service using Amazon Bedrock Titan."""
 
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from app.core.config import settings
 from app.core.bedrock import BedrockClient
 from app.models.schemas import (
     EmbeddingResponse,
+    BatchEmbeddingFailure,
     BatchEmbeddingResponse,
+    BatchJobEmbeddingResponse,
+    JobEmbeddingCreate,
     JobEmbeddingResponse,
     SimilaritySearchResponse,
     SimilarityResult,
 )
 from app.repositories.ai_task_repository import AITaskRepository
+from app.services.embedding_batch import EmbeddingOutcome, embed_batch
+from app.services.embedding_cache import EmbeddingCache, pack_vector, unpack_vector
 
 
 class EmbeddingService:
@@ -22,11 +27,25 @@ class EmbeddingService:
     CHUNK_SIZE = 512  # Characters per chunk
     CHUNK_OVERLAP = 50  # Overlap between chunks
 
-    def __init__(self, repository: AITaskRepository):
+    def __init__(
+        self,
+        repository: AITaskRepository,
+        bedrock: BedrockClient,
+        cache: Optional[EmbeddingCache] = None,
+    ):
         self.repository = repository
-        self.bedrock = BedrockClient()
+        self.bedrock = bedrock
+        self.cache = cache
         self.model_id = settings.BEDROCK_EMBEDDING_MODEL
 
+    @staticmethod
+    def _job_text(title: str, description: str, requirements: Optional[str]) -> str:
+        """Combine a job posting's fields into the text that gets embedded."""
+        full_text = f"Title: {title}\n\nDescription: {description}"
+        if requirements:
+            full_text += f"\n\nRequirements: {requirements}"
+        return full_text
+
     def _chunk_text(self, text: str) -> List[str]:
         """Split text into overlapping chunks."""
         if len(text) <= self.CHUNK_SIZE:
@@ -42,6 +61,52 @@ class EmbeddingService:
 
         return chunks
 
+    async def _embed(self, texts: List[str], model_id: str) -> List[EmbeddingOutcome]:
+        """
+        Embed texts in input order, calling Bedrock only for uncached ones.
+
+        Distinct misses go through the concurrent, rate-limited batch path;
+        a text that fails gets an outcome with its error.
+        """
+        if self.cache is None:
+            cached: List[Optional[List[float]]] = [None] * len(texts)
+        else:
+            cached = await self.cache.get_many(model_id, texts)
+
+        misses = [
+            text for text, vector in zip(texts, cached, strict=True) if vector is None
+        ]
+        outcomes = dict(
+            zip(misses, await embed_batch(self.bedrock, misses, model_id), strict=True)
+        )
+        # Round to float32 like cached vectors, so hits and misses agree
+        fresh: Dict[str, List[float]] = {
+            text: unpack_vector(pack_vector(outcome.embedding))
+            for text, outcome in outcomes.items()
+            if outcome.embedding is not None
+        }
+        if fresh and self.cache is not None:
+            await self.cache.set_many(model_id, fresh)
+
+        return [
+            EmbeddingOutcome(vector)
+            if vector is not None
+            else EmbeddingOutcome(fresh[text])
+            if text in fresh
+            else outcomes[text]
+            for text, vector in zip(texts, cached, strict=True)
+        ]
+
+    async def _embed_all(self, texts: List[str], model_id: str) -> List[List[float]]:
+        """Embed texts in input order, failing if any one of them fails."""
+        outcomes = await self._embed(texts, model_id)
+        errors = [outcome.error for outcome in outcomes if outcome.error]
+        if errors:
+            raise RuntimeError(
+                f"Embedding failed for {len(errors)} of {len(texts)} texts: {errors[0]}"
+            )
+        return [outcome.embedding for outcome in outcomes]
+
     async def generate_embedding(
         self,
         text: str,
@@ -57,7 +122,7 @@ class EmbeddingService:
         )
 
         try:
-            embedding = await self.bedrock.generate_embedding(text, model_id)
+            [embedding] = await self._embed_all([text], model_id)
             processing_time_ms = int((time.time() - start_time) * 1000)
 
             await self.repository.update(
@@ -89,7 +154,12 @@ class EmbeddingService:
         texts: List[str],
         model: Optional[str] = None,
     ) -> BatchEmbeddingResponse:
-        """Generate embeddings for multiple texts."""
+        """
+        Generate embeddings for multiple texts, in request order.
+
+        Texts that fail are reported in ``failures`` with a null embedding;
+        the request only fails if every text does.
+        """
         start_time = time.time()
         model_id = model or self.model_id
 
@@ -99,17 +169,28 @@ class EmbeddingService:
         )
 
         try:
-            embeddings = []
-            for text in texts:
-                embedding = await self.bedrock.generate_embedding(text, model_id)
-                embeddings.append(embedding)
+            outcomes = await self._embed(texts, model_id)
+            embeddings = [outcome.embedding for outcome in outcomes]
+            failures = [
+                BatchEmbeddingFailure(index=idx, error=outcome.error)
+                for idx, outcome in enumerate(outcomes)
+                if outcome.error
+            ]
+            if failures and len(failures) == len(texts):
+                raise RuntimeError(failures[0].error)
 
+            count = len(texts) - len(failures)
+            dimensions = next((len(e) for e in embeddings if e is not None), 0)
             processing_time_ms = int((time.time() - start_time) * 1000)
 
             await self.repository.update(
                 task_id=task.id,
                 status="completed",
-                output_data={"count": len(embeddings), "dimensions": len(embeddings[0])},
+                output_data={
+                    "count": count,
+                    "failed": len(failures),
+                    "dimensions": dimensions,
+                },
                 model_used=model_id,
                 processing_time_ms=processing_time_ms,
             )
@@ -117,8 +198,9 @@ class EmbeddingService:
             return BatchEmbeddingResponse(
                 task_id=task.id,
                 embeddings=embeddings,
-                count=len(embeddings),
-                dimensions=len(embeddings[0]) if embeddings else 0,
+                failures=failures,
+                count=count,
+                dimensions=dimensions,
                 model_used=model_id,
                 processing_time_ms=processing_time_ms,
             )
@@ -149,28 +231,16 @@ class EmbeddingService:
         )
 
         try:
-            # Combine job content
-            full_text = f"Title: {title}\n\nDescription: {description}"
-            if requirements:
-                full_text += f"\n\nRequirements: {requirements}"
-
-            # Chunk the text
-            chunks = self._chunk_text(full_text)
-
-            # Generate embeddings for each chunk
-            chunk_embeddings = []
-            for idx, chunk in enumerate(chunks):
-                embedding = await self.bedrock.generate_embedding(chunk, self.model_id)
-
-                # Store in database
-                await self.repository.create_job_embedding(
-                    job_id=job_id,
-                    chunk_index=idx,
-                    chunk_text=chunk,
-                    embedding=embedding,
-                )
+            # Chunk the combined job content
+            chunks = self._chunk_text(self._job_text(title, description, requirements))
+
+            # Generate embeddings for each chunk; unchanged chunks hit the cache
+            chunk_embeddings = await self._embed_all(chunks, self.model_id)
 
-                chunk_embeddings.append(embedding)
+            # Replace the job's stored chunks
+            await self.repository.replace_job_embeddings(
+                {job_id: list(zip(chunks, chunk_embeddings, strict=True))}
+            )
 
             processing_time_ms = int((time.time() - start_time) * 1000)
 
@@ -202,6 +272,74 @@ class EmbeddingService:
             )
             raise
 
+    async def create_job_embeddings(
+        self,
+        jobs: List[JobEmbeddingCreate],
+    ) -> BatchJobEmbeddingResponse:
+        """
+        Create and store embeddings for many job postings at once.
+
+        All chunks are embedded as one batch and written with a single COPY
+        that replaces the jobs' existing chunks, e.g. to re-index the catalogue.
+        """
+        start_time = time.time()
+
+        task = await self.repository.create(
+            task_type="batch_job_embedding",
+            source_type="job",
+            input_data={"job_count": len(jobs)},
+        )
+
+        try:
+            chunks_by_job = {
+                job.job_id: self._chunk_text(
+                    self._job_text(job.title, job.description, job.requirements)
+                )
+                for job in jobs
+            }
+            all_chunks = [chunk for chunks in chunks_by_job.values() for chunk in chunks]
+            embeddings = await self._embed_all(all_chunks, self.model_id)
+
+            remaining = iter(embeddings)
+            chunk_count = await self.repository.replace_job_embeddings(
+                {
+                    job_id: [(chunk, next(remaining)) for chunk in chunks]
+                    for job_id, chunks in chunks_by_job.items()
+                }
+            )
+
+            dimensions = len(embeddings[0]) if embeddings else 0
+            processing_time_ms = int((time.time() - start_time) * 1000)
+
+            await self.repository.update(
+                task_id=task.id,
+                status="completed",
+                output_data={
+                    "job_count": len(chunks_by_job),
+                    "chunk_count": chunk_count,
+                    "dimensions": dimensions,
+                },
+                model_used=self.model_id,
+                processing_time_ms=processing_time_ms,
+            )
+
+            return BatchJobEmbeddingResponse(
+                task_id=task.id,
+                job_count=len(chunks_by_job),
+                chunk_count=chunk_count,
+                dimensions=dimensions,
+                model_used=self.model_id,
+                processing_time_ms=processing_time_ms,
+            )
+
+        except Exception as e:
+            await self.repository.update(
+                task_id=task.id,
+                status="failed",
+                error_message=str(e),
+            )
+            raise
+
     async def similarity_search(
         self,
         query_text: str,
@@ -222,9 +360,7 @@ class EmbeddingService:
 
         try:
             # Generate query embedding
-            query_embedding = await self.bedrock.generate_embedding(
-                query_text, self.model_id
-            )
+            [query_embedding] = await self._embed_all([query_text], self.model_id)
 
             # Search for similar embeddings
             results = await self.repository.search_similar_embeddings(
@@ -87,6 +87,10 @@ class SessionManager:
         return len(expired)
 
 
+# Shared by every request, so follow-ups reach the session they continue
+session_manager = SessionManager()
+
+
 class MatchingAgentService:
     """Service for AgentCore-powered resume-job matching."""
 
@@ -134,11 +138,11 @@ Return valid JSON only, no additional text.
 Provide a concise and helpful response.
 """
 
-    def __init__(self, repository: AITaskRepository):
+    def __init__(self, repository: AITaskRepository, bedrock: BedrockClient):
         """Initialize the matching agent service."""
         self.repository = repository
-        self.bedrock = BedrockClient()
-        self.session_manager = SessionManager()
+        self.bedrock = bedrock
+        self.session_manager = session_manager
         self.agent_id = settings.AGENTCORE_AGENT_ID
         self.agent_alias_id = settings.AGENTCORE_ALIAS_ID
 
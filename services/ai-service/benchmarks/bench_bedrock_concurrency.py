@@ -0,0 +1,112 @@
+"""Compare blocking boto3 calls on the event loop vs. the Bedrock executor.
+
+Starts a local stub of the bedrock-runtime InvokeModel API that answers
+after a fixed delay, then fires concurrent embedding requests at it from
+one event loop. Run from the service root:
+
+    python -m benchmarks.bench_bedrock_concurrency
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LATENCY = 0.1  # Seconds the stub takes per call
+REQUESTS = 128
+DIMENSIONS = 1536
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers every InvokeModel call with a fixed embedding."""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real endpoint
+    body = json.dumps({"embedding": [0.01] * DIMENSIONS}).encode()
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """Accepts every benchmark connection at once."""
+
+    request_queue_size = REQUESTS
+    daemon_threads = True
+
+
+def start_stub() -> StubServer:
+    """Serve the stub on a free local port in a background thread."""
+    server = StubServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def watch_loop(stop: asyncio.Event) -> float:
+    """Report the longest the event loop went without running this task."""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.005)
+        worst = max(worst, time.perf_counter() - started - 0.005)
+    return worst
+
+
+async def run(label: str, call) -> None:
+    """Fire REQUESTS concurrent calls and print throughput and loop stall."""
+    stop = asyncio.Event()
+    watcher = asyncio.create_task(watch_loop(stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(call(f"text {i}") for i in range(REQUESTS)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    stall = await watcher
+    print(
+        f"  {label:9s} {REQUESTS / elapsed:8.1f} req/s "
+        f"  {elapsed:6.2f} s total   worst loop stall {stall * 1000:7.1f} ms"
+    )
+
+
+async def main() -> None:
+    server = start_stub()
+    os.environ["BEDROCK_ENDPOINT_URL"] = f"http://127.0.0.1:{server.server_port}"
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "stub")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "stub")
+
+    from app.core.bedrock import BedrockClient, bedrock_executor
+    from app.core.config import settings
+
+    client = BedrockClient()
+
+    async def blocking(text: str) -> list:
+        # What generate_embedding did before: boto3 straight on the loop
+        return client._invoke_model_sync(
+            settings.BEDROCK_EMBEDDING_MODEL, json.dumps({"inputText": text})
+        )["embedding"]
+
+    # Warm up connections so both runs start from a full pool
+    await asyncio.gather(*(client.generate_embedding("warm") for _ in range(32)))
+
+    print(
+        f"\n{REQUESTS} concurrent embeddings, {LATENCY * 1000:.0f} ms stub latency, "
+        f"{settings.BEDROCK_MAX_CONCURRENCY} executor threads"
+    )
+    await run("blocking", blocking)
+    await run("executor", client.generate_embedding)
+
+    bedrock_executor.shutdown()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+"""Unit tests for the Bedrock client executor."""
+
+import asyncio
+import io
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.bedrock import BedrockBusyError, BedrockClient, BedrockExecutor
+
+
+@pytest.fixture
+def executor():
+    """Create a small Bedrock executor."""
+    executor = BedrockExecutor(max_workers=4, max_pending=0)
+    yield executor
+    executor.shutdown()
+
+
+class TestBedrockExecutor:
+    """Tests for BedrockExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_overlaps_blocking_calls(self, executor):
+        """Should run blocking calls concurrently off the event loop."""
+        started = time.perf_counter()
+
+        results = await asyncio.gather(
+            *(executor.run(lambda i=i: time.sleep(0.1) or i) for i in range(4))
+        )
+
+        assert results == [0, 1, 2, 3]
+        assert time.perf_counter() - started < 0.3
+
+    @pytest.mark.asyncio
+    async def test_rejects_calls_beyond_capacity(self, executor):
+        """Should fail fast once every slot is taken, then recover."""
+        release = threading.Event()
+        blocked = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(4)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(BedrockBusyError):
+            await executor.run(lambda: None)
+
+        release.set()
+        await asyncio.gather(*blocked)
+        assert await executor.run(lambda: "ok") == "ok"
+
+
+class TestBedrockClient:
+    """Tests for BedrockClient."""
+
+    @pytest.mark.asyncio
+    async def test_generate_embedding_runs_on_executor(self, executor):
+        """Should invoke boto3 on an executor thread, not the event loop."""
+        client = BedrockClient(executor=executor)
+        threads = []
+
+        def invoke_model(**kwargs):
+            threads.append(threading.current_thread().name)
+            return {"body": io.BytesIO(json.dumps({"embedding": [0.5]}).encode())}
+
+        client.bedrock_runtime = MagicMock()
+        client.bedrock_runtime.invoke_model.side_effect = invoke_model
+
+        assert await client.generate_embedding("python developer") == [0.5]
+        assert threads[0].startswith("bedrock")
+
+    def test_dependency_returns_shared_client(self):
+        """Should hand every request the client built at startup."""
+        from app.core.bedrock import get_bedrock
+
+        request = MagicMock()
+
+        assert get_bedrock(request) is request.app.state.bedrock
@@ -0,0 +1,125 @@
+"""Unit tests for concurrent batch embedding."""
+
+import asyncio
+import time
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.embedding_batch import TokenBucket, embed_batch
+from app.services.embedding_service import EmbeddingService
+
+
+@pytest.fixture
+def unlimited():
+    """Create a token bucket that never makes callers wait."""
+    return TokenBucket(rate=1e9, capacity=1e9)
+
+
+class TestEmbedBatch:
+    """Tests for embed_batch."""
+
+    @pytest.mark.asyncio
+    async def test_keeps_input_order_and_dedupes(self, unlimited):
+        """Should return outcomes in input order, embedding each text once."""
+
+        async def generate(text, model_id):
+            # Finish in reverse order of submission
+            await asyncio.sleep(0.01 * (3 - int(text)))
+            return [float(text)]
+
+        bedrock = MagicMock()
+        bedrock.generate_embedding = AsyncMock(side_effect=generate)
+
+        outcomes = await embed_batch(
+            bedrock, ["1", "2", "1", "3"], "titan", limiter=unlimited
+        )
+
+        assert [o.embedding for o in outcomes] == [[1.0], [2.0], [1.0], [3.0]]
+        assert bedrock.generate_embedding.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_reports_failures_per_text(self, unlimited):
+        """Should report a failed text without failing the others."""
+
+        async def generate(text, model_id):
+            if text == "bad":
+                raise ValueError("throttled")
+            return [1.0]
+
+        bedrock = MagicMock()
+        bedrock.generate_embedding = AsyncMock(side_effect=generate)
+
+        outcomes = await embed_batch(
+            bedrock, ["ok", "bad", "ok"], "titan", limiter=unlimited
+        )
+
+        assert outcomes[0].embedding == [1.0]
+        assert outcomes[1].embedding is None
+        assert outcomes[1].error == "throttled"
+        assert outcomes[2].error is None
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency(self, unlimited):
+        """Should keep at most `concurrency` calls in flight."""
+        in_flight = peak = 0
+
+        async def generate(text, model_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [1.0]
+
+        bedrock = MagicMock()
+        bedrock.generate_embedding = AsyncMock(side_effect=generate)
+
+        texts = [str(i) for i in range(20)]
+        await embed_batch(bedrock, texts, "titan", concurrency=4, limiter=unlimited)
+
+        assert peak == 4
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_paces_beyond_burst(self):
+        """Should allow a burst of `capacity`, then pace at `rate`."""
+        bucket = TokenBucket(rate=100, capacity=2)
+        start = time.monotonic()
+
+        for _ in range(5):
+            await bucket.acquire()
+
+        # Two tokens up front, three more at 10 ms apiece
+        assert time.monotonic() - start >= 0.025
+
+
+class TestEmbeddingServiceBatch:
+    """Tests for EmbeddingService batch embedding."""
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_partial_failure(self):
+        """Should return the successes and list the failed indexes."""
+
+        async def generate(text, model_id):
+            if text == "bad":
+                raise ValueError("throttled")
+            return [1.0, 2.0]
+
+        bedrock = MagicMock()
+        bedrock.generate_embedding = AsyncMock(side_effect=generate)
+        repository = AsyncMock()
+        repository.create.return_value = MagicMock(id=uuid.uuid4())
+        service = EmbeddingService(repository, bedrock)
+
+        response = await service.generate_batch_embeddings(["ok", "bad"])
+
+        assert response.embeddings == [[1.0, 2.0], None]
+        assert [(f.index, f.error) for f in response.failures] == [(1, "throttled")]
+        assert response.count == 1
+        assert response.dimensions == 2
+        assert repository.update.await_args.kwargs["status"] == "completed"
@@ -0,0 +1,96 @@
+"""Unit tests for the embedding cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.embedding_cache import (
+    EmbeddingCache,
+    pack_vector,
+    text_digest,
+    unpack_vector,
+)
+from app.services.embedding_service import EmbeddingService
+
+
+@pytest.fixture
+def mock_redis():
+    """Create a mock Redis client with an empty keyspace."""
+    redis = MagicMock()
+    redis.mget = AsyncMock(side_effect=lambda keys: [None] * len(keys))
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis.pipeline.return_value.__aenter__.return_value = pipe
+    return redis
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache."""
+
+    def test_packs_float32(self):
+        """Should store 4 bytes per dimension and round to float32."""
+        packed = pack_vector([0.1, -2.5, 3.0])
+
+        assert len(packed) == 12
+        assert unpack_vector(packed) == pytest.approx([0.1, -2.5, 3.0], rel=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_serves_local_hits_without_redis(self, mock_redis):
+        """Should answer repeated lookups from the in-process tier."""
+        cache = EmbeddingCache(redis=mock_redis)
+        await cache.set_many("titan", {"python": [0.5, 0.25]})
+
+        result = await cache.get_many("titan", ["python"])
+
+        assert result == [[0.5, 0.25]]
+        mock_redis.mget.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_redis(self, mock_redis):
+        """Should read misses from Redis and keep them locally."""
+        key = f"embedding:titan:{text_digest('python').hex()}"
+        mock_redis.mget.side_effect = lambda keys: [
+            pack_vector([1.0]) if k == key else None for k in keys
+        ]
+        cache = EmbeddingCache(redis=mock_redis)
+
+        assert await cache.get_many("titan", ["python", "go"]) == [[1.0], None]
+        assert await cache.get_many("titan", ["python"]) == [[1.0]]
+        assert mock_redis.mget.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Should keep at most max_entries vectors in process."""
+        cache = EmbeddingCache(max_entries=2)
+        await cache.set_many("titan", {"a": [1.0], "b": [2.0]})
+        await cache.get_many("titan", ["a"])
+        await cache.set_many("titan", {"c": [3.0]})
+
+        assert await cache.get_many("titan", ["a", "b", "c"]) == [[1.0], None, [3.0]]
+
+    @pytest.mark.asyncio
+    async def test_keys_by_model(self):
+        """Should not share vectors between models."""
+        cache = EmbeddingCache()
+        await cache.set_many("titan-v1", {"python": [1.0]})
+
+        assert await cache.get_many("titan-v2", ["python"]) == [None]
+
+
+class TestEmbeddingServiceCache:
+    """Tests for EmbeddingService cache use."""
+
+    @pytest.mark.asyncio
+    async def test_embeds_only_uncached_texts(self):
+        """Should call Bedrock once per distinct uncached text."""
+        cache = EmbeddingCache()
+        await cache.set_many("titan", {"cached": [1.0]})
+        bedrock = MagicMock()
+        bedrock.generate_embedding = AsyncMock(side_effect=lambda text, model: [2.0])
+        service = EmbeddingService(AsyncMock(), bedrock, cache)
+
+        result = await service._embed_all(["cached", "new", "new"], "titan")
+
+        assert result == [[1.0], [2.0], [2.0]]
+        bedrock.generate_embedding.assert_awaited_once_with("new", "titan")
+        assert await cache.get_many("titan", ["new"]) == [[2.0]]
@@ -0,0 +1,108 @@
+"""Unit tests for bulk job embedding ingestion."""
+
+import struct
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models.schemas import JobEmbeddingCreate
+from app.repositories.ai_task_repository import (
+    JOB_EMBEDDING_COPY_COLUMNS,
+    encode_job_embedding_copy,
+)
+from app.services.embedding_service import EmbeddingService
+
+
+def read_fields(data: bytes, offset: int):
+    """Read one binary COPY tuple, returning its fields and the next offset."""
+    (count,) = struct.unpack_from(">h", data, offset)
+    offset += 2
+    fields = []
+    for _ in range(count):
+        (length,) = struct.unpack_from(">i", data, offset)
+        offset += 4
+        fields.append(data[offset : offset + length])
+        offset += length
+    return fields, offset
+
+
+class TestJobEmbeddingCopy:
+    """Tests for the binary COPY encoding of job_embeddings rows."""
+
+    def test_encodes_rows(self):
+        """Should encode each column in PostgreSQL's binary format."""
+        row_id, job_id = uuid.uuid4(), uuid.uuid4()
+        created_at = datetime(2000, 1, 2, 0, 0, 0, 5)
+
+        data = encode_job_embedding_copy(
+            [(row_id, job_id, 3, "chunk é", [1.5, -2.0], created_at)]
+        )
+
+        assert data.startswith(b"PGCOPY\n\xff\r\n\x00")
+        fields, offset = read_fields(data, 19)
+        assert len(fields) == len(JOB_EMBEDDING_COPY_COLUMNS)
+        assert fields[0] == row_id.bytes
+        assert fields[1] == job_id.bytes
+        assert struct.unpack(">i", fields[2]) == (3,)
+        assert fields[3].decode("utf-8") == "chunk é"
+        assert struct.unpack(">HHff", fields[4]) == (2, 0, 1.5, -2.0)
+        assert struct.unpack(">q", fields[5]) == (86_400_000_005,)
+        assert data[offset:] == struct.pack(">h", -1)
+
+
+class TestEmbeddingServiceJobIngestion:
+    """Tests for EmbeddingService job embedding storage."""
+
+    @pytest.fixture
+    def repository(self):
+        """Create a mock repository that counts the chunks it replaces."""
+        repository = AsyncMock()
+        repository.create.return_value = MagicMock(id=uuid.uuid4())
+        repository.replace_job_embeddings.side_effect = lambda chunks_by_job: sum(
+            map(len, chunks_by_job.values())
+        )
+        return repository
+
+    @pytest.fixture
+    def bedrock(self):
+        """Create a mock Bedrock client embedding a text as its length."""
+        bedrock = MagicMock()
+        bedrock.generate_embedding = AsyncMock(
+            side_effect=lambda text, model_id: [float(len(text))]
+        )
+        return bedrock
+
+    @pytest.mark.asyncio
+    async def test_job_replaces_chunks_in_one_call(self, repository, bedrock):
+        """Should store all of a job's chunks with a single replace."""
+        service = EmbeddingService(repository, bedrock)
+        job_id = uuid.uuid4()
+
+        response = await service.create_job_embedding(job_id, "Engineer", "x" * 1000)
+
+        repository.replace_job_embeddings.assert_awaited_once()
+        [chunks_by_job] = repository.replace_job_embeddings.await_args.args
+        assert list(chunks_by_job) == [job_id]
+        assert len(chunks_by_job[job_id]) == response.chunk_count > 1
+
+    @pytest.mark.asyncio
+    async def test_many_jobs_keep_chunks_with_their_job(self, repository, bedrock):
+        """Should pair each job's chunks with their own embeddings."""
+        service = EmbeddingService(repository, bedrock)
+        jobs = [
+            JobEmbeddingCreate(job_id=uuid.uuid4(), title="A", description="short"),
+            JobEmbeddingCreate(job_id=uuid.uuid4(), title="B", description="y" * 900),
+        ]
+
+        response = await service.create_job_embeddings(jobs)
+
+        [chunks_by_job] = repository.replace_job_embeddings.await_args.args
+        assert list(chunks_by_job) == [job.job_id for job in jobs]
+        for chunks in chunks_by_job.values():
+            for chunk, embedding in chunks:
+                assert embedding == [float(len(chunk))]
+        assert response.job_count == 2
+        assert response.chunk_count == sum(map(len, chunks_by_job.values()))
+        assert response.dimensions == 1
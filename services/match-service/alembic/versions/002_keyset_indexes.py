@@ -0,0 +1,36 @@
+"""Add (owner, overall_score DESC, id) indexes for keyset pagination
+
+Revision ID: 002_keyset_indexes
+Revises: 001_init
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '002_keyset_indexes'
+down_revision: Union[str, None] = '001_init'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The composite indexes also serve plain job_id / user_id lookups
+    op.execute(
+        'CREATE INDEX ix_matches_job_score_id '
+        'ON matches (job_id, overall_score DESC NULLS LAST, id DESC)'
+    )
+    op.execute(
+        'CREATE INDEX ix_matches_user_score_id '
+        'ON matches (user_id, overall_score DESC NULLS LAST, id DESC)'
+    )
+    op.drop_index('ix_matches_job_id', table_name='matches')
+    op.drop_index('ix_matches_user_id', table_name='matches')
+
+
+def downgrade() -> None:
+    op.create_index('ix_matches_user_id', 'matches', ['user_id'])
+    op.create_index('ix_matches_job_id', 'matches', ['job_id'])
+    op.drop_index('ix_matches_user_score_id', table_name='matches')
+    op.drop_index('ix_matches_job_score_id', table_name='matches')
@@ -0,0 +1,27 @@
+"""Add matches.input_fingerprint for reusing scores of unchanged inputs
+
+Revision ID: 003_input_fingerprint
+Revises: 002_keyset_indexes
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = '003_input_fingerprint'
+down_revision: Union[str, None] = '002_keyset_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable: existing rows simply miss the reuse check once
+    op.add_column(
+        'matches', sa.Column('input_fingerprint', sa.String(64), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('matches', 'input_fingerprint')
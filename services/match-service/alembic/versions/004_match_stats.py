@@ -0,0 +1,159 @@
+"""Add match_stats with per-job and per-user match statistics
+
+Each match stores its statistics contribution, and the counters in
+match_stats are sharded so concurrent writers spread over several rows.
+
+Revision ID: 004_match_stats
+Revises: 003_input_fingerprint
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = '004_match_stats'
+down_revision: Union[str, None] = '003_input_fingerprint'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same metrics as app.core.match_stats.match_contribution, per existing match
+CONTRIBUTIONS = r"""
+WITH scored AS (
+    SELECT
+        m.id,
+        m.overall_score,
+        m.skill_score,
+        m.experience_score,
+        m.culture_score,
+        m.is_recommended,
+        least(floor(m.overall_score / 10) * 10, 90)::int AS bucket,
+        coalesce(
+            nullif(m.score_breakdown -> 'skill_match' -> 'matched_skills', 'null'),
+            m.score_breakdown -> 'matched_skills'
+        ) AS matched_skills,
+        coalesce(
+            nullif(m.score_breakdown -> 'skill_match' -> 'missing_skills', 'null'),
+            m.score_breakdown -> 'missing_skills'
+        ) AS missing_skills,
+        coalesce(
+            nullif(m.score_breakdown -> 'experience_match' -> 'required_years', 'null'),
+            m.score_breakdown -> 'required_years'
+        ) AS required_years,
+        coalesce(
+            nullif(m.score_breakdown -> 'experience_match' -> 'relevant_years', 'null'),
+            m.score_breakdown -> 'relevant_years'
+        ) AS relevant_years
+    FROM matches m
+),
+metrics AS (
+    SELECT s.id, metric.name, metric.value, false AS job_only
+    FROM scored s
+    CROSS JOIN LATERAL (VALUES
+        ('matches', 1::numeric),
+        ('sum:overall_score', s.overall_score),
+        ('count:overall_score', CASE WHEN s.overall_score IS NOT NULL THEN 1 END),
+        ('sum:skill_score', s.skill_score),
+        ('count:skill_score', CASE WHEN s.skill_score IS NOT NULL THEN 1 END),
+        ('sum:experience_score', s.experience_score),
+        ('count:experience_score', CASE WHEN s.experience_score IS NOT NULL THEN 1 END),
+        ('sum:culture_score', s.culture_score),
+        ('count:culture_score', CASE WHEN s.culture_score IS NOT NULL THEN 1 END),
+        ('bucket:' || s.bucket || '-' || (s.bucket + 10), CASE WHEN s.overall_score IS NOT NULL THEN 1 END),
+        ('recommended', CASE WHEN s.is_recommended THEN 1 END)
+    ) AS metric(name, value)
+    WHERE metric.value IS NOT NULL
+    UNION ALL
+    SELECT s.id, skill.name, 1, true
+    FROM scored s
+    CROSS JOIN LATERAL (
+        SELECT DISTINCT prefix.name || btrim(
+            lower(regexp_replace(element.value, '\s+', ' ', 'g'))
+        ) AS name
+        FROM (VALUES
+            ('matched_skill:', s.matched_skills),
+            ('skill_gap:', s.missing_skills)
+        ) AS prefix(name, skills)
+        CROSS JOIN LATERAL jsonb_array_elements_text(
+            CASE WHEN jsonb_typeof(prefix.skills) = 'array' THEN prefix.skills END
+        ) AS element(value)
+        WHERE btrim(regexp_replace(element.value, '\s+', ' ', 'g')) <> ''
+    ) AS skill
+    UNION ALL
+    SELECT s.id, metric.name, metric.value, true
+    FROM scored s
+    CROSS JOIN LATERAL (
+        SELECT CASE
+            WHEN jsonb_typeof(s.required_years) = 'number'
+                AND jsonb_typeof(s.relevant_years) = 'number'
+            THEN s.required_years::text::numeric - s.relevant_years::text::numeric
+        END AS gap
+    ) AS experience
+    CROSS JOIN LATERAL (VALUES
+        ('sum:experience_gap', experience.gap),
+        ('count:experience_gap', CASE WHEN experience.gap IS NOT NULL THEN 1 END)
+    ) AS metric(name, value)
+    WHERE metric.value IS NOT NULL
+)
+UPDATE matches m
+SET stats_metrics = jsonb_build_object('job', c.job_metrics, 'user', c.user_metrics)
+FROM (
+    SELECT
+        id,
+        jsonb_object_agg(name, value::text) AS job_metrics,
+        jsonb_object_agg(name, value::text) FILTER (WHERE NOT job_only) AS user_metrics
+    FROM metrics
+    GROUP BY id
+) AS c
+WHERE m.id = c.id
+"""
+
+# Counters start as the sums of the contributions plus the feedback on matches
+TOTALS = """
+INSERT INTO match_stats (scope, scope_id, metric, value)
+SELECT 'job', m.job_id, c.key, sum(c.value::numeric)
+FROM matches m
+CROSS JOIN LATERAL jsonb_each_text(m.stats_metrics -> 'job') AS c
+GROUP BY m.job_id, c.key
+UNION ALL
+SELECT 'user', m.user_id, c.key, sum(c.value::numeric)
+FROM matches m
+CROSS JOIN LATERAL jsonb_each_text(m.stats_metrics -> 'user') AS c
+GROUP BY m.user_id, c.key
+UNION ALL
+SELECT scope.name, scope.id, 'feedback:' || f.feedback_type, count(*)
+FROM match_feedback f
+JOIN matches m ON m.id = f.match_id
+CROSS JOIN LATERAL (VALUES ('job', m.job_id), ('user', m.user_id)) AS scope(name, id)
+WHERE f.feedback_type IS NOT NULL
+GROUP BY scope.name, scope.id, f.feedback_type
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        'matches',
+        sa.Column(
+            'stats_metrics', postgresql.JSONB(astext_type=sa.Text()), nullable=True
+        ),
+    )
+    op.execute(CONTRIBUTIONS)
+
+    op.create_table(
+        'match_stats',
+        sa.Column('scope', sa.String(length=10), nullable=False),
+        sa.Column('scope_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('metric', sa.Text(), nullable=False),
+        sa.Column('shard', sa.SmallInteger(), server_default=sa.text('0'), nullable=False),
+        sa.Column('value', sa.Numeric(precision=20, scale=4), server_default=sa.text('0'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+        sa.PrimaryKeyConstraint('scope', 'scope_id', 'metric', 'shard'),
+    )
+    op.execute(TOTALS)
+
+
+def downgrade() -> None:
+    op.drop_table('match_stats')
+    op.drop_column('matches', 'stats_metrics')
@@ -0,0 +1,841 @@
+"""gRPC API for match service.
+
+Serves ``hirehub.match.v1.MatchService`` from the stubs generated into
+``proto/gen/python``, on top of the same ``MatchService`` as the REST API.
+"""
+
+import math
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, NoReturn, Optional, Union
+from uuid import UUID
+
+import grpc
+import httpx
+from common.v1 import common_pb2
+from google.protobuf.timestamp_pb2 import Timestamp
+from match.v1 import match_pb2, match_pb2_grpc
+from pydantic import ValidationError
+from sqlalchemy import Row
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.http import http_client
+from app.core.match_stats import breakdown_value
+from app.core.redis import redis_client
+from app.models.match import Match, MatchFeedback
+from app.models.schemas import (
+    BatchMatchScoreRequest,
+    CalculateMatchesForJobRequest,
+    CalculateMatchesForUserRequest,
+    FeedbackType,
+    MatchCreate,
+    MatchFeedbackCreate,
+    MatchListFilter,
+    MatchScorePair,
+    MatchScoreRequest,
+    MatchScoreResponse,
+    MatchScoreStatus,
+    MatchSortField,
+    MatchUpdate,
+    StatsScope,
+)
+from app.services.match_service import MatchService
+
+# Page size of list RPCs that set none, and the largest one allowed
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Fields of UpdateMatchRequest that map onto MatchUpdate
+UPDATE_FIELDS = (
+    "overall_score",
+    "skill_score",
+    "experience_score",
+    "culture_score",
+    "ai_reasoning",
+    "is_recommended",
+)
+
+# Feedback types by their protobuf enum value, and the reverse by stored value.
+# NOT_FIT, APPLIED and SAVED have no stored counterpart and are rejected.
+FEEDBACK_TYPES = {
+    match_pb2.FEEDBACK_TYPE_POSITIVE: FeedbackType.HELPFUL,
+    match_pb2.FEEDBACK_TYPE_NEGATIVE: FeedbackType.NOT_HELPFUL,
+    match_pb2.FEEDBACK_TYPE_HIRED: FeedbackType.HIRED,
+    match_pb2.FEEDBACK_TYPE_REJECTED: FeedbackType.REJECTED,
+    match_pb2.FEEDBACK_TYPE_INTERVIEWING: FeedbackType.INTERVIEWING,
+}
+FEEDBACK_TYPES_PB = {value.value: key for key, value in FEEDBACK_TYPES.items()}
+
+
+def _timestamp(value: datetime) -> Timestamp:
+    """Convert a datetime to a protobuf timestamp."""
+    timestamp = Timestamp()
+    timestamp.FromDatetime(value)
+    return timestamp
+
+
+def _years(value: Any) -> Optional[int]:
+    """Get a whole number of years from a breakdown value."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return int(value)
+    return None
+
+
+def breakdown_to_pb(breakdown: Optional[dict[str, Any]]) -> match_pb2.ScoreBreakdown:
+    """Map the skill and experience sections of a score breakdown."""
+    if not breakdown:
+        return match_pb2.ScoreBreakdown()
+
+    skills: list[match_pb2.SkillMatch] = []
+    for key, matched in (("matched_skills", True), ("missing_skills", False)):
+        names = breakdown_value(breakdown, "skill_match", key)
+        if isinstance(names, list):
+            skills.extend(
+                match_pb2.SkillMatch(skill_name=name, required=True, matched=matched)
+                for name in names
+                if isinstance(name, str)
+            )
+    result = match_pb2.ScoreBreakdown(skill_matches=skills)
+    if skills:
+        matched_count = sum(skill.matched for skill in skills)
+        result.skill_coverage = 100 * matched_count / len(skills)
+
+    required = _years(breakdown_value(breakdown, "experience_match", "required_years"))
+    relevant = _years(breakdown_value(breakdown, "experience_match", "relevant_years"))
+    if required is not None:
+        result.required_experience_years = required
+    if relevant is not None:
+        result.candidate_experience_years = relevant
+    if required is not None and relevant is not None:
+        result.experience_meets_requirement = relevant >= required
+    return result
+
+
+def match_to_pb(match: Union[Match, Row[Any]]) -> match_pb2.Match:
+    """Convert a stored match, or a listing row of its columns, to protobuf."""
+    return match_pb2.Match(
+        id=str(match.id),
+        job_id=str(match.job_id),
+        resume_id=str(match.resume_id),
+        user_id=str(match.user_id),
+        overall_score=float(match.overall_score or 0),
+        skill_score=float(match.skill_score or 0),
+        experience_score=float(match.experience_score or 0),
+        culture_score=float(match.culture_score or 0),
+        score_breakdown=breakdown_to_pb(match.score_breakdown),
+        ai_reasoning=match.ai_reasoning or "",
+        is_recommended=match.is_recommended,
+        status=(
+            match_pb2.MATCH_STATUS_PENDING
+            if match.overall_score is None
+            else match_pb2.MATCH_STATUS_COMPLETED
+        ),
+        created_at=_timestamp(match.created_at),
+        updated_at=_timestamp(match.updated_at),
+    )
+
+
+def score_to_pb(score: MatchScoreResponse, user_id: Optional[UUID]) -> match_pb2.Match:
+    """Convert a score result to a protobuf match.
+
+    Score results carry no timestamps, and cached ones no owner, so
+    ``user_id`` is left empty when the caller does not know it. Stale
+    scores count as completed; their rescore is already queued.
+    """
+    return match_pb2.Match(
+        id=str(score.match_id) if score.match_id else "",
+        job_id=str(score.job_id),
+        resume_id=str(score.resume_id),
+        user_id=str(user_id) if user_id else "",
+        overall_score=float(score.overall_score or 0),
+        skill_score=float(score.skill_score or 0),
+        experience_score=float(score.experience_score or 0),
+        culture_score=float(score.culture_score or 0),
+        score_breakdown=breakdown_to_pb(score.score_breakdown),
+        ai_reasoning=score.ai_reasoning,
+        is_recommended=score.is_recommended,
+        status=(
+            match_pb2.MATCH_STATUS_PENDING
+            if score.status == MatchScoreStatus.PENDING
+            else match_pb2.MATCH_STATUS_COMPLETED
+        ),
+    )
+
+
+def feedback_to_pb(feedback: MatchFeedback) -> match_pb2.MatchFeedback:
+    """Convert a stored feedback record to its protobuf message."""
+    return match_pb2.MatchFeedback(
+        id=str(feedback.id),
+        match_id=str(feedback.match_id) if feedback.match_id else "",
+        feedback_type=FEEDBACK_TYPES_PB.get(
+            feedback.feedback_type or "", match_pb2.FEEDBACK_TYPE_UNSPECIFIED
+        ),
+        feedback_by=str(feedback.feedback_by) if feedback.feedback_by else "",
+        created_at=_timestamp(feedback.created_at),
+    )
+
+
+def _pagination_pb(
+    page: int, page_size: int, total: int
+) -> common_pb2.PaginationResponse:
+    """Describe the page a list RPC answered with."""
+    return common_pb2.PaginationResponse(
+        page=page,
+        page_size=page_size,
+        total=total,
+        total_pages=math.ceil(total / page_size),
+    )
+
+
+def _ai_error_status(error: httpx.HTTPError) -> grpc.StatusCode:
+    """Map a failed AI service call to the status of the RPC that made it.
+
+    The AI service rejects malformed input with 400 or 422 and pairs it
+    cannot score yet, such as unparsed resumes, with other 4xx codes. 5xx
+    responses and transport errors mean it is down.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        code = error.response.status_code
+        if code in (400, 422):
+            return grpc.StatusCode.INVALID_ARGUMENT
+        if code < 500:
+            return grpc.StatusCode.FAILED_PRECONDITION
+    return grpc.StatusCode.UNAVAILABLE
+
+
+async def _abort(
+    context: grpc.aio.ServicerContext, code: grpc.StatusCode, details: str
+) -> NoReturn:
+    """End an RPC with an error status."""
+    await context.abort(code, details)
+    raise AssertionError("context.abort() returned")
+
+
+async def _uuid(context: grpc.aio.ServicerContext, value: str, field: str) -> UUID:
+    """Parse a UUID request field, failing the RPC if it is malformed."""
+    try:
+        return UUID(value)
+    except ValueError:
+        await _abort(
+            context, grpc.StatusCode.INVALID_ARGUMENT, f"Invalid {field}: {value!r}"
+        )
+
+
+async def _page(
+    context: grpc.aio.ServicerContext, pagination: common_pb2.PaginationRequest
+) -> tuple[int, int]:
+    """Get the page and page size of a list request, defaulting unset ones."""
+    page = pagination.page or 1
+    page_size = pagination.page_size or DEFAULT_PAGE_SIZE
+    if page < 1 or not 1 <= page_size <= MAX_PAGE_SIZE:
+        await _abort(
+            context,
+            grpc.StatusCode.INVALID_ARGUMENT,
+            f"page must be positive and page_size between 1 and {MAX_PAGE_SIZE}",
+        )
+    return page, page_size
+
+
+async def _sort(
+    context: grpc.aio.ServicerContext, sort: common_pb2.SortOrder
+) -> dict[str, Any]:
+    """Get the listing order of a request; best score first by default."""
+    try:
+        sort_by = MatchSortField(sort.field or MatchSortField.OVERALL_SCORE)
+    except ValueError:
+        await _abort(
+            context, grpc.StatusCode.INVALID_ARGUMENT, f"Cannot sort by {sort.field!r}"
+        )
+    return {
+        "sort_by": sort_by,
+        "descending": sort.direction != common_pb2.SORT_DIRECTION_ASC,
+    }
+
+
+class MatchServicer(match_pb2_grpc.MatchServiceServicer):
+    """Match service RPCs, sharing the app's Redis and HTTP pools."""
+
+    @asynccontextmanager
+    async def _service(self) -> AsyncIterator[MatchService]:
+        """Open a session-scoped service, committing if the RPC succeeds."""
+        async with AsyncSessionLocal() as session:
+            try:
+                yield MatchService(session, redis_client, http_client)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    async def CreateMatch(
+        self,
+        request: match_pb2.CreateMatchRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.CreateMatchResponse:
+        """Create a new match record."""
+        data = MatchCreate(
+            job_id=await _uuid(context, request.job_id, "job_id"),
+            resume_id=await _uuid(context, request.resume_id, "resume_id"),
+            user_id=await _uuid(context, request.user_id, "user_id"),
+        )
+        async with self._service() as service:
+            match = await service.create_match(data)
+        return match_pb2.CreateMatchResponse(match=match_to_pb(match))
+
+    async def GetMatch(
+        self,
+        request: match_pb2.GetMatchRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.GetMatchResponse:
+        """Get a match by its ID."""
+        match_id = await _uuid(context, request.id, "id")
+        async with self._service() as service:
+            match = await service.get_match(match_id)
+        if not match:
+            await _abort(
+                context, grpc.StatusCode.NOT_FOUND, f"Match {match_id} not found"
+            )
+        return match_pb2.GetMatchResponse(match=match_to_pb(match))
+
+    async def UpdateMatch(
+        self,
+        request: match_pb2.UpdateMatchRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.UpdateMatchResponse:
+        """Update the fields of a match that the request sets."""
+        match_id = await _uuid(context, request.id, "id")
+        try:
+            data = MatchUpdate(
+                **{
+                    field: getattr(request, field)
+                    for field in UPDATE_FIELDS
+                    if request.HasField(field)
+                }
+            )
+        except ValidationError as e:
+            await _abort(context, grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        async with self._service() as service:
+            match = await service.update_match(match_id, data)
+        if not match:
+            await _abort(
+                context, grpc.StatusCode.NOT_FOUND, f"Match {match_id} not found"
+            )
+        return match_pb2.UpdateMatchResponse(match=match_to_pb(match))
+
+    async def DeleteMatch(
+        self,
+        request: match_pb2.DeleteMatchRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.DeleteMatchResponse:
+        """Delete a match record."""
+        match_id = await _uuid(context, request.id, "id")
+        async with self._service() as service:
+            deleted = await service.delete_match(match_id)
+        if not deleted:
+            await _abort(
+                context, grpc.StatusCode.NOT_FOUND, f"Match {match_id} not found"
+            )
+        return match_pb2.DeleteMatchResponse(success=True)
+
+    async def ListMatches(
+        self,
+        request: match_pb2.ListMatchesRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.ListMatchesResponse:
+        """List matches by any combination of filters."""
+        filters = await _sort(context, request.sort)
+        for field in ("job_id", "resume_id", "user_id"):
+            if request.HasField(field):
+                filters[field] = await _uuid(context, getattr(request, field), field)
+        if request.HasField("overall_score_range"):
+            filters["min_score"] = request.overall_score_range.min
+            # An unset max leaves the range open above
+            filters["max_score"] = request.overall_score_range.max or None
+        if request.HasField("is_recommended"):
+            filters["is_recommended"] = request.is_recommended
+        if request.HasField("status"):
+            if request.status == match_pb2.MATCH_STATUS_PENDING:
+                filters["scored"] = False
+            elif request.status == match_pb2.MATCH_STATUS_COMPLETED:
+                filters["scored"] = True
+            else:
+                await _abort(
+                    context,
+                    grpc.StatusCode.INVALID_ARGUMENT,
+                    "Matches are only stored pending or completed",
+                )
+        matches, pagination = await self._list_matches(
+            context, request.pagination, filters
+        )
+        return match_pb2.ListMatchesResponse(matches=matches, pagination=pagination)
+
+    async def GetMatchesByJob(
+        self,
+        request: match_pb2.GetMatchesByJobRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.GetMatchesByJobResponse:
+        """List a job's matches."""
+        matches, pagination = await self._list_owned(request, context, "job_id")
+        return match_pb2.GetMatchesByJobResponse(matches=matches, pagination=pagination)
+
+    async def GetMatchesByUser(
+        self,
+        request: match_pb2.GetMatchesByUserRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.GetMatchesByUserResponse:
+        """List a user's matches."""
+        matches, pagination = await self._list_owned(request, context, "user_id")
+        return match_pb2.GetMatchesByUserResponse(
+            matches=matches, pagination=pagination
+        )
+
+    async def GetMatchesByResume(
+        self,
+        request: match_pb2.GetMatchesByResumeRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.GetMatchesByResumeResponse:
+        """List a resume's matches."""
+        matches, pagination = await self._list_owned(request, context, "resume_id")
+        return match_pb2.GetMatchesByResumeResponse(
+            matches=matches, pagination=pagination
+        )
+
+    async def _list_owned(
+        self,
+        request: (
+            match_pb2.GetMatchesByJobRequest
+            | match_pb2.GetMatchesByUserRequest
+            | match_pb2.GetMatchesByResumeRequest
+        ),
+        context: grpc.aio.ServicerContext,
+        owner: str,
+    ) -> tuple[list[match_pb2.Match], common_pb2.PaginationResponse]:
+        """List the matches of the job, user or resume named by ``owner``."""
+        filters = await _sort(context, request.sort)
+        filters[owner] = await _uuid(context, getattr(request, owner), owner)
+        if request.HasField("min_score"):
+            filters["min_score"] = request.min_score
+        if request.only_recommended:
+            filters["is_recommended"] = True
+        return await self._list_matches(context, request.pagination, filters)
+
+    async def _list_matches(
+        self,
+        context: grpc.aio.ServicerContext,
+        pagination: common_pb2.PaginationRequest,
+        filters: dict[str, Any],
+    ) -> tuple[list[match_pb2.Match], common_pb2.PaginationResponse]:
+        """Read one page of a filtered listing."""
+        page, page_size = await _page(context, pagination)
+        try:
+            list_filter = MatchListFilter(**filters)
+        except ValidationError as e:
+            await _abort(context, grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        async with self._service() as service:
+            matches, total = await service.list_matches(list_filter, page, page_size)
+        return (
+            [match_to_pb(match) for match in matches],
+            _pagination_pb(page, page_size, total),
+        )
+
+    async def CalculateMatch(
+        self,
+        request: match_pb2.CalculateMatchRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.CalculateMatchResponse:
+        """Calculate or retrieve the match score of a job-resume pair."""
+        score_request = MatchScoreRequest(
+            job_id=await _uuid(context, request.job_id, "job_id"),
+            resume_id=await _uuid(context, request.resume_id, "resume_id"),
+            user_id=await _uuid(context, request.user_id, "user_id"),
+            force_recalculate=request.force_recalculate,
+        )
+        try:
+            async with self._service() as service:
+                score = await service.calculate_match_score(score_request)
+        except httpx.HTTPError as e:
+            if isinstance(e, httpx.HTTPStatusError):
+                details = f"AI service rejected the request: {e.response.status_code}"
+            else:
+                details = f"AI service unreachable: {e}"
+            await _abort(context, _ai_error_status(e), details)
+        return match_pb2.CalculateMatchResponse(
+            match=score_to_pb(score, score_request.user_id),
+            was_cached=score.is_cached,
+        )
+
+    async def BatchCalculateMatches(
+        self,
+        request: match_pb2.BatchCalculateMatchesRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.BatchCalculateMatchesResponse:
+        """Score many resumes against a job and return every result at once."""
+        response = match_pb2.BatchCalculateMatchesResponse(
+            result=common_pb2.BatchResult(total=len(request.resume_ids))
+        )
+        async for item in self._batch_results(request, context):
+            if item.error:
+                response.result.failed += 1
+                response.result.failed_ids.append(item.resume_id)
+                response.result.error_messages.append(item.error)
+            else:
+                response.result.succeeded += 1
+                response.matches.append(item.match)
+        return response
+
+    async def StreamBatchCalculateMatches(
+        self,
+        request: match_pb2.BatchCalculateMatchesRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncGenerator[match_pb2.BatchCalculateMatchResult, None]:
+        """Score many resumes against a job, streaming each result when ready.
+
+        Results arrive in completion order: cache hits first, then AI-scored
+        resumes as their bulk writes commit.
+        """
+        async for item in self._batch_results(request, context):
+            yield item
+
+    async def _batch_results(
+        self,
+        request: match_pb2.BatchCalculateMatchesRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncGenerator[match_pb2.BatchCalculateMatchResult, None]:
+        """Run a batch request through the batch scoring path.
+
+        ``user_ids`` maps each resume to its owner; resumes without one
+        fail individually instead of failing the batch.
+        """
+        if not request.resume_ids:
+            await _abort(
+                context, grpc.StatusCode.INVALID_ARGUMENT, "No resume_ids given"
+            )
+        if len(request.resume_ids) > settings.match_batch_max_pairs:
+            await _abort(
+                context,
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"Batch exceeds {settings.match_batch_max_pairs} pairs",
+            )
+        job_id = await _uuid(context, request.job_id, "job_id")
+
+        owners: dict[UUID, UUID] = {}
+        unowned: list[str] = []
+        for value in dict.fromkeys(request.resume_ids):
+            resume_id = await _uuid(context, value, "resume_id")
+            if request.user_ids.get(value):
+                user_id = request.user_ids[value]
+                owners[resume_id] = await _uuid(context, user_id, "user_id")
+            else:
+                unowned.append(value)
+
+        for value in unowned:
+            yield match_pb2.BatchCalculateMatchResult(
+                resume_id=value, error="No user_id given for resume"
+            )
+        if not owners:
+            return
+
+        batch = BatchMatchScoreRequest(
+            pairs=[
+                MatchScorePair(job_id=job_id, resume_id=resume_id, user_id=user_id)
+                for resume_id, user_id in owners.items()
+            ],
+            force_recalculate=request.force_recalculate,
+        )
+        # The stream outlives a single unit of work, so own the session
+        async with AsyncSessionLocal() as session:
+            service = MatchService(session, redis_client, http_client)
+            try:
+                async for item in service.batch_calculate_match_scores(batch):
+                    # Commit before sending so streamed scores are durable
+                    await session.commit()
+                    if item.result is None:
+                        yield match_pb2.BatchCalculateMatchResult(
+                            resume_id=str(item.resume_id),
+                            error=item.error or "Scoring failed",
+                        )
+                    else:
+                        yield match_pb2.BatchCalculateMatchResult(
+                            resume_id=str(item.resume_id),
+                            match=score_to_pb(item.result, owners[item.resume_id]),
+                            was_cached=item.result.is_cached,
+                        )
+            except Exception:
+                await session.rollback()
+                raise
+
+    async def CalculateMatchesForJob(
+        self,
+        request: match_pb2.CalculateMatchesForJobRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.CalculateMatchesForJobResponse:
+        """Shortlist a job's candidates and queue the top of the list for scoring.
+
+        Only cached scores are returned; the rest are counted as queued.
+        """
+        job_id = await _uuid(context, request.job_id, "job_id")
+        try:
+            calculate = CalculateMatchesForJobRequest(
+                limit=request.limit or None,
+                min_score_threshold=request.min_score_threshold,
+                force_recalculate=request.force_recalculate,
+            )
+        except ValidationError as e:
+            await _abort(context, grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        async with self._service() as service:
+            result = await service.calculate_matches_for_job(job_id, calculate)
+        return match_pb2.CalculateMatchesForJobResponse(
+            matches=[score_to_pb(score, None) for score in result.matches],
+            total_processed=result.total_processed,
+            total_qualified=result.total_qualified,
+            total_queued=len(result.tasks),
+        )
+
+    async def CalculateMatchesForUser(
+        self,
+        request: match_pb2.CalculateMatchesForUserRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.CalculateMatchesForUserResponse:
+        """Score jobs similar to the user's resume, queueing only stale pairs."""
+        user_id = await _uuid(context, request.user_id, "user_id")
+        resume_id = None
+        if request.resume_id:
+            resume_id = await _uuid(context, request.resume_id, "resume_id")
+        try:
+            calculate = CalculateMatchesForUserRequest(
+                resume_id=resume_id,
+                limit=request.limit or None,
+                min_score_threshold=request.min_score_threshold,
+                force_recalculate=request.force_recalculate,
+            )
+        except ValidationError as e:
+            await _abort(context, grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        async with self._service() as service:
+            result = await service.calculate_matches_for_user(user_id, calculate)
+        return match_pb2.CalculateMatchesForUserResponse(
+            matches=[score_to_pb(score, user_id) for score in result.matches],
+            total_processed=result.total_processed,
+            total_qualified=result.total_qualified,
+            total_queued=len(result.tasks),
+        )
+
+    async def GetTopMatchesForJob(
+        self,
+        request: match_pb2.GetTopMatchesForJobRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.GetTopMatchesForJobResponse:
+        """Get a job's top matches at once."""
+        matches = self.StreamTopMatchesForJob(request, context)
+        return match_pb2.GetTopMatchesForJobResponse(
+            matches=[match async for match in matches]
+        )
+
+    async def StreamTopMatchesForJob(
+        self,
+        request: match_pb2.GetTopMatchesForJobRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncGenerator[match_pb2.Match, None]:
+        """Stream a job's top matches, best first, as their rows load."""
+        job_id = await _uuid(context, request.job_id, "job_id")
+        async with self._service() as service:
+            async for match in service.iter_top_matches_for_job(
+                job_id, request.top_n or 10, request.min_score
+            ):
+                yield match_to_pb(match)
+
+    async def GetRecommendedJobsForUser(
+        self,
+        request: match_pb2.GetRecommendedJobsForUserRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.GetRecommendedJobsForUserResponse:
+        """Get a user's recommended jobs, best first, from the cached ranking.
+
+        Each match carries only its job, user and score.
+        """
+        if request.resume_id:
+            await _abort(
+                context,
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "Recommendations are only kept per user",
+            )
+        user_id = await _uuid(context, request.user_id, "user_id")
+        async with self._service() as service:
+            result = await service.get_recommended_jobs_for_user(
+                user_id, request.limit or 10
+            )
+        return match_pb2.GetRecommendedJobsForUserResponse(
+            matches=[
+                match_pb2.Match(
+                    job_id=str(job.job_id),
+                    user_id=str(user_id),
+                    overall_score=job.score,
+                    is_recommended=True,
+                    status=match_pb2.MATCH_STATUS_COMPLETED,
+                )
+                for job in result.jobs
+            ]
+        )
+
+    async def CreateMatchFeedback(
+        self,
+        request: match_pb2.CreateMatchFeedbackRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.CreateMatchFeedbackResponse:
+        """Record feedback on a match; comments are not stored."""
+        if request.feedback_type == match_pb2.FEEDBACK_TYPE_UNSPECIFIED:
+            await _abort(
+                context, grpc.StatusCode.INVALID_ARGUMENT, "feedback_type is required"
+            )
+        if request.feedback_type not in FEEDBACK_TYPES:
+            name = match_pb2.FeedbackType.Name(request.feedback_type)
+            await _abort(
+                context,
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"feedback_type {name} is not supported",
+            )
+        if request.comment:
+            await _abort(
+                context,
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "Feedback comments are not supported",
+            )
+        data = MatchFeedbackCreate(
+            match_id=await _uuid(context, request.match_id, "match_id"),
+            feedback_type=FEEDBACK_TYPES[request.feedback_type],
+            feedback_by=await _uuid(context, request.feedback_by, "feedback_by"),
+        )
+        async with self._service() as service:
+            feedback = await service.add_feedback(data)
+        if not feedback:
+            await _abort(
+                context,
+                grpc.StatusCode.NOT_FOUND,
+                f"Match {data.match_id} not found",
+            )
+        return match_pb2.CreateMatchFeedbackResponse(feedback=feedback_to_pb(feedback))
+
+    async def GetMatchFeedback(
+        self,
+        request: match_pb2.GetMatchFeedbackRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.GetMatchFeedbackResponse:
+        """Get a feedback record by its ID."""
+        feedback_id = await _uuid(context, request.id, "id")
+        async with self._service() as service:
+            feedback = await service.get_feedback(feedback_id)
+        if not feedback:
+            await _abort(
+                context,
+                grpc.StatusCode.NOT_FOUND,
+                f"Feedback {feedback_id} not found",
+            )
+        return match_pb2.GetMatchFeedbackResponse(feedback=feedback_to_pb(feedback))
+
+    async def ListMatchFeedbacks(
+        self,
+        request: match_pb2.ListMatchFeedbacksRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.ListMatchFeedbacksResponse:
+        """List feedback by match, author or type, newest first."""
+        page, page_size = await _page(context, request.pagination)
+        filters: dict[str, Any] = {}
+        for field in ("match_id", "feedback_by"):
+            if request.HasField(field):
+                filters[field] = await _uuid(context, getattr(request, field), field)
+        if request.HasField("feedback_type"):
+            if request.feedback_type not in FEEDBACK_TYPES:
+                name = match_pb2.FeedbackType.Name(request.feedback_type)
+                await _abort(
+                    context,
+                    grpc.StatusCode.INVALID_ARGUMENT,
+                    f"feedback_type {name} is not supported",
+                )
+            filters["feedback_type"] = FEEDBACK_TYPES[request.feedback_type]
+        async with self._service() as service:
+            feedbacks, total = await service.list_feedback(page, page_size, **filters)
+        return match_pb2.ListMatchFeedbacksResponse(
+            feedbacks=[feedback_to_pb(feedback) for feedback in feedbacks],
+            pagination=_pagination_pb(page, page_size, total),
+        )
+
+    async def GetFeedbackByMatch(
+        self,
+        request: match_pb2.GetFeedbackByMatchRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.GetFeedbackByMatchResponse:
+        """Get all feedback on a match, newest first."""
+        match_id = await _uuid(context, request.match_id, "match_id")
+        async with self._service() as service:
+            feedbacks = await service.get_feedback_for_match(match_id)
+        return match_pb2.GetFeedbackByMatchResponse(
+            feedbacks=[feedback_to_pb(feedback) for feedback in feedbacks]
+        )
+
+    async def GetMatchStats(
+        self,
+        request: match_pb2.GetMatchStatsRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.GetMatchStatsResponse:
+        """Get the materialized match statistics of a job or a user."""
+        if request.HasField("company_id") or request.HasField("date_range"):
+            await _abort(
+                context,
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "Statistics are only kept per job or per user",
+            )
+        if request.HasField("job_id") == request.HasField("user_id"):
+            await _abort(
+                context,
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "Exactly one of job_id or user_id is required",
+            )
+        if request.HasField("job_id"):
+            scope = StatsScope.JOB
+            scope_id = await _uuid(context, request.job_id, "job_id")
+        else:
+            scope = StatsScope.USER
+            scope_id = await _uuid(context, request.user_id, "user_id")
+
+        async with self._service() as service:
+            stats = await service.get_match_stats(scope, scope_id)
+        return match_pb2.GetMatchStatsResponse(
+            total_matches=stats.total_matches,
+            average_overall_score=stats.average_overall_score or 0,
+            average_skill_score=stats.average_skill_score or 0,
+            average_experience_score=stats.average_experience_score or 0,
+            average_culture_score=stats.average_culture_score or 0,
+            recommended_count=stats.recommended_count,
+            score_distribution=stats.score_distribution,
+            feedback_distribution=stats.feedback_distribution,
+        )
+
+    async def GetMatchingInsights(
+        self,
+        request: match_pb2.GetMatchingInsightsRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> match_pb2.GetMatchingInsightsResponse:
+        """Get skill and experience insights across a job's matches."""
+        job_id = await _uuid(context, request.job_id, "job_id")
+        async with self._service() as service:
+            insights = await service.get_matching_insights(job_id)
+        return match_pb2.GetMatchingInsightsResponse(
+            most_common_skill_gaps=insights.most_common_skill_gaps,
+            most_matched_skills=insights.most_matched_skills,
+            average_experience_gap=insights.average_experience_gap or 0,
+            recommendation=insights.recommendation,
+        )
+
+
+def create_grpc_server() -> grpc.aio.Server:
+    """Build the gRPC server; the caller starts and stops it."""
+    server = grpc.aio.server(
+        maximum_concurrent_rpcs=settings.grpc_max_concurrent_rpcs,
+        options=[
+            ("grpc.keepalive_time_ms", settings.grpc_keepalive_time_ms),
+            ("grpc.keepalive_permit_without_calls", 1),
+        ],
+    )
+    match_pb2_grpc.add_MatchServiceServicer_to_server(MatchServicer(), server)
+    server.add_insecure_port(f"{settings.host}:{settings.grpc_port}")
+    return server
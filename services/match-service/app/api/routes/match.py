@@ -1,15 +1,25 @@
 """Match API routes."""
 
 import math
-from typing import Optional
+from collections.abc import AsyncGenerator
+from typing import Any, Optional
 from uuid import UUID
 
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, get_db
 from app.core.redis import get_redis, RedisClient
 from app.models.schemas import (
+    BatchMatchScoreRequest,
+    CalculateMatchesForJobRequest,
+    CalculateMatchesForJobResponse,
+    CalculateMatchesForUserRequest,
+    CalculateMatchesForUserResponse,
     MatchCreate,
     MatchUpdate,
     MatchResponse,
@@ -18,8 +28,13 @@ from app.models.schemas import (
     MatchScoreResponse,
     MatchFeedbackCreate,
     MatchFeedbackResponse,
+    MatchStatsResponse,
+    MatchingInsightsResponse,
     TopMatchesResponse,
     RecommendedJobsResponse,
+    ScoringTaskResponse,
+    ScoringTaskSubmitRequest,
+    StatsScope,
 )
 from app.services.match_service import MatchService
 
@@ -98,19 +113,23 @@ async def list_matches_for_job(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     min_score: Optional[float] = Query(None, ge=0, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(True),
     service: MatchService = Depends(get_service),
 ) -> MatchListResponse:
     """Get all matches for a job with pagination."""
-    matches, total = await service.get_matches_for_job(
-        job_id, page=page, page_size=page_size, min_score=min_score
-    )
-    return MatchListResponse(
-        items=[MatchResponse.model_validate(m) for m in matches],
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=math.ceil(total / page_size) if total > 0 else 0,
-    )
+    try:
+        matches, total, next_cursor = await service.get_matches_for_job(
+            job_id,
+            page=page,
+            page_size=page_size,
+            min_score=min_score,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return _list_response(matches, total, page, page_size, cursor, next_cursor)
 
 
 @router.get(
@@ -123,21 +142,44 @@ async def list_matches_for_user(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     recommended_only: bool = Query(False),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(True),
     service: MatchService = Depends(get_service),
 ) -> MatchListResponse:
     """Get all matches for a user with pagination."""
-    matches, total = await service.get_matches_for_user(
-        user_id,
-        page=page,
-        page_size=page_size,
-        recommended_only=recommended_only,
-    )
+    try:
+        matches, total, next_cursor = await service.get_matches_for_user(
+            user_id,
+            page=page,
+            page_size=page_size,
+            recommended_only=recommended_only,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return _list_response(matches, total, page, page_size, cursor, next_cursor)
+
+
+def _list_response(
+    matches: list[Row[Any]],
+    total: Optional[int],
+    page: int,
+    page_size: int,
+    cursor: Optional[str],
+    next_cursor: Optional[str],
+) -> MatchListResponse:
+    """Build a list response for either page- or cursor-based paging."""
+    pages = None
+    if total is not None:
+        pages = math.ceil(total / page_size) if total > 0 else 0
     return MatchListResponse(
         items=[MatchResponse.model_validate(m) for m in matches],
         total=total,
-        page=page,
+        page=page if cursor is None else None,
         page_size=page_size,
-        pages=math.ceil(total / page_size) if total > 0 else 0,
+        pages=pages,
+        next_cursor=next_cursor,
     )
 
 
@@ -188,8 +230,147 @@ async def calculate_match_score(
     request: MatchScoreRequest,
     service: MatchService = Depends(get_service),
 ) -> MatchScoreResponse:
-    """Calculate or retrieve match score for a job-resume pair."""
-    return await service.calculate_match_score(request)
+    """Calculate or retrieve match score for a job-resume pair.
+
+    While the AI service is unavailable this answers immediately with the
+    last known score (status ``stale``) or status ``pending``.
+    """
+    try:
+        return await service.calculate_match_score(request)
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"AI service rejected the request: {e.response.status_code}",
+        )
+
+
+@router.post(
+    "/score/batch",
+    summary="Calculate match scores for many pairs",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def batch_calculate_match_scores(
+    request: BatchMatchScoreRequest,
+    redis: RedisClient = Depends(get_redis),
+) -> StreamingResponse:
+    """Score many job-resume pairs, streaming one JSON line per pair.
+
+    Lines arrive in completion order: cache hits first, then AI-scored
+    pairs as their bulk writes commit.
+    """
+    if len(request.pairs) > settings.match_batch_max_pairs:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Batch exceeds {settings.match_batch_max_pairs} pairs",
+        )
+
+    async def stream() -> AsyncGenerator[str, None]:
+        # The stream outlives the request dependencies, so own the session
+        async with AsyncSessionLocal() as session:
+            service = MatchService(session, redis)
+            try:
+                async for item in service.batch_calculate_match_scores(request):
+                    # Commit before emitting so streamed scores are durable
+                    await session.commit()
+                    yield item.model_dump_json() + "\n"
+            except Exception:
+                await session.rollback()
+                raise
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/score/tasks",
+    response_model=list[ScoringTaskResponse],
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue match scores for background calculation",
+)
+async def submit_scoring_tasks(
+    request: ScoringTaskSubmitRequest,
+    service: MatchService = Depends(get_service),
+) -> list[ScoringTaskResponse]:
+    """Queue job-resume pairs on a priority lane; poll or wait on the tasks."""
+    if len(request.pairs) > settings.match_batch_max_pairs:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Batch exceeds {settings.match_batch_max_pairs} pairs",
+        )
+    return await service.submit_scores(
+        request.pairs, request.lane, request.force_recalculate
+    )
+
+
+@router.get(
+    "/score/tasks/{task_id}",
+    response_model=ScoringTaskResponse,
+    summary="Get a queued scoring task",
+)
+async def get_scoring_task(
+    task_id: UUID,
+    service: MatchService = Depends(get_service),
+) -> ScoringTaskResponse:
+    """Get the status of a scoring task, with its result once done."""
+    task = await service.get_scoring_task(task_id)
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Scoring task {task_id} not found",
+        )
+    return task
+
+
+@router.get(
+    "/score/tasks/{task_id}/wait",
+    response_model=ScoringTaskResponse,
+    summary="Wait for a queued scoring task to finish",
+)
+async def wait_for_scoring_task(
+    task_id: UUID,
+    timeout: float = Query(30.0, gt=0, le=60),
+    service: MatchService = Depends(get_service),
+) -> ScoringTaskResponse:
+    """Block until a scoring task finishes or ``timeout`` seconds pass.
+
+    Returns the task's status either way; a queued or running status
+    means the wait timed out.
+    """
+    task = await service.wait_for_scoring_task(task_id, timeout)
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Scoring task {task_id} not found",
+        )
+    return task
+
+
+@router.post(
+    "/job/{job_id}/calculate",
+    response_model=CalculateMatchesForJobResponse,
+    summary="Calculate matches for a job",
+)
+async def calculate_matches_for_job(
+    job_id: UUID,
+    request: CalculateMatchesForJobRequest,
+    service: MatchService = Depends(get_service),
+) -> CalculateMatchesForJobResponse:
+    """Shortlist candidates for a job and queue the top of the list for scoring."""
+    return await service.calculate_matches_for_job(job_id, request)
+
+
+@router.post(
+    "/user/{user_id}/calculate",
+    response_model=CalculateMatchesForUserResponse,
+    summary="Calculate job recommendations for a user",
+)
+async def calculate_matches_for_user(
+    user_id: UUID,
+    request: CalculateMatchesForUserRequest,
+    service: MatchService = Depends(get_service),
+) -> CalculateMatchesForUserResponse:
+    """Match jobs similar to the user's resume, queueing only stale pairs."""
+    return await service.calculate_matches_for_user(user_id, request)
 
 
 @router.get(
@@ -220,6 +401,45 @@ async def get_recommended_jobs_for_user(
     return await service.get_recommended_jobs_for_user(user_id, limit)
 
 
+@router.get(
+    "/job/{job_id}/stats",
+    response_model=MatchStatsResponse,
+    summary="Get match statistics for a job",
+)
+async def get_job_match_stats(
+    job_id: UUID,
+    service: MatchService = Depends(get_service),
+) -> MatchStatsResponse:
+    """Get materialized match statistics for a job."""
+    return await service.get_match_stats(StatsScope.JOB, job_id)
+
+
+@router.get(
+    "/user/{user_id}/stats",
+    response_model=MatchStatsResponse,
+    summary="Get match statistics for a user",
+)
+async def get_user_match_stats(
+    user_id: UUID,
+    service: MatchService = Depends(get_service),
+) -> MatchStatsResponse:
+    """Get materialized match statistics for a user."""
+    return await service.get_match_stats(StatsScope.USER, user_id)
+
+
+@router.get(
+    "/job/{job_id}/insights",
+    response_model=MatchingInsightsResponse,
+    summary="Get matching insights for a job",
+)
+async def get_matching_insights(
+    job_id: UUID,
+    service: MatchService = Depends(get_service),
+) -> MatchingInsightsResponse:
+    """Get skill and experience insights across a job's matches."""
+    return await service.get_matching_insights(job_id)
+
+
 @router.post(
     "/feedback",
     response_model=MatchFeedbackResponse,
@@ -229,24 +449,12 @@ async def get_recommended_jobs_for_user(
 async def add_match_feedback(
     data: MatchFeedbackCreate,
     service: MatchService = Depends(get_service),
-    session: AsyncSession = Depends(get_db),
 ) -> MatchFeedbackResponse:
     """Add feedback for a match."""
-    from app.repositories.match_repository import MatchRepository
-
-    success = await service.add_feedback(data)
-    if not success:
+    feedback = await service.add_feedback(data)
+    if not feedback:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Match {data.match_id} not found",
         )
-
-    # Fetch the created feedback
-    repo = MatchRepository(session)
-    feedbacks = await repo.get_feedback_by_match_id(data.match_id)
-    if not feedbacks:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create feedback",
-        )
-    return MatchFeedbackResponse.model_validate(feedbacks[0])
+    return MatchFeedbackResponse.model_validate(feedback)
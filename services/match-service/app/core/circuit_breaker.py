@@ -0,0 +1,150 @@
+"""Circuit breaker for calls to an unreliable downstream service."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from enum import Enum
+
+from prometheus_client import Counter, Gauge
+
+from app.core.config import settings
+
+CIRCUIT_STATE = Gauge(
+    "match_circuit_state",
+    "Circuit state per downstream (0 closed, 1 half-open, 2 open)",
+    ["circuit"],
+)
+CIRCUIT_REJECTIONS = Counter(
+    "match_circuit_rejections_total",
+    "Calls rejected without being attempted because the circuit was open",
+    ["circuit"],
+)
+
+
+class CircuitState(str, Enum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+_STATE_VALUES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because its circuit is open."""
+
+
+class CircuitBreaker:
+    """Fail fast after repeated failures and probe for recovery.
+
+    The circuit opens after ``failure_threshold`` consecutive failures.
+    Once ``reset_timeout`` seconds have passed it turns half-open and lets
+    up to ``half_open_max_calls`` probe calls through: a successful probe
+    closes the circuit, a failed one opens it again for another timeout.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        CIRCUIT_STATE.labels(name).set(0)
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the current state, turning half-open once the timeout elapses."""
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: CircuitState) -> None:
+        """Move to a new state and reset the per-state counters."""
+        self._state = state
+        self._probes = 0
+        if state is CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        elif state is CircuitState.CLOSED:
+            self._failures = 0
+        CIRCUIT_STATE.labels(self.name).set(_STATE_VALUES[state])
+
+    def allow(self) -> bool:
+        """Check whether a call may go through, claiming a probe slot if half-open."""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and self._probes < self.half_open_max_calls:
+            self._probes += 1
+            return True
+        CIRCUIT_REJECTIONS.labels(self.name).inc()
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._transition(CircuitState.CLOSED)
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if needed."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._transition(CircuitState.OPEN)
+            return
+        self._failures += 1
+        if (
+            self._state is CircuitState.CLOSED
+            and self._failures >= self.failure_threshold
+        ):
+            self._transition(CircuitState.OPEN)
+
+    def _release_probe(self) -> None:
+        """Give back a probe slot without a verdict."""
+        if self._state is CircuitState.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    @asynccontextmanager
+    async def guard(self) -> AsyncIterator[None]:
+        """Run a block through the breaker.
+
+        Raises ``CircuitOpenError`` instead of entering the block while the
+        circuit is open. An exception raised by the block counts as a
+        failure; a cancelled block counts as neither.
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"Circuit {self.name} is open")
+        try:
+            yield
+        except asyncio.CancelledError:
+            self._release_probe()
+            raise
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+
+
+ai_circuit_breaker = CircuitBreaker(
+    "ai-service",
+    failure_threshold=settings.ai_circuit_failure_threshold,
+    reset_timeout=settings.ai_circuit_reset_timeout,
+    half_open_max_calls=settings.ai_circuit_half_open_max_calls,
+)
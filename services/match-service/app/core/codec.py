@@ -0,0 +1,108 @@
+"""Compact binary encoding for cached match details.
+
+A v1 payload is a fixed header followed by a body::
+
+    version:u8 | flags:u8 | match_id:16 bytes | 4 x score:u16 (hundredths)
+    body: JSON [score_breakdown, ai_reasoning], zlib-compressed when large
+
+Scores and the recommendation flag are read straight from the header. The
+body is only parsed when ``score_breakdown`` or ``ai_reasoning`` is
+accessed. Payloads that start with ``{`` are legacy JSON details and are
+still decoded, so a rolling deploy can read keys written by old replicas.
+"""
+
+import json
+import struct
+import zlib
+from collections.abc import Iterator, Mapping
+from typing import Any, cast
+from uuid import UUID
+
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("!BB16s4H")
+_SCORE_FIELDS = ("overall_score", "skill_score", "experience_score", "culture_score")
+_BODY_FIELDS = ("score_breakdown", "ai_reasoning")
+_FIELDS = ("match_id", *_SCORE_FIELDS, *_BODY_FIELDS, "is_recommended")
+
+FLAG_RECOMMENDED = 0x01
+FLAG_COMPRESSED = 0x02
+
+# Bodies at least this long are worth the zlib call
+COMPRESS_MIN_BYTES = 512
+
+
+class MatchDetail(Mapping[str, Any]):
+    """Read-only view of an encoded match detail with a lazily parsed body."""
+
+    __slots__ = ("_data", "_flags", "_fields")
+
+    def __init__(self, data: bytes) -> None:
+        if data[0] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported match detail version: {data[0]}")
+        self._data = data
+        self._flags = data[1]
+        self._fields: dict[str, Any] = {}
+
+    def _decode_header(self) -> None:
+        """Unpack match_id and the scores on first access."""
+        _, _, match_id, *scores = _HEADER.unpack_from(self._data)
+        self._fields["match_id"] = str(UUID(bytes=match_id))
+        for field, score in zip(_SCORE_FIELDS, scores):
+            self._fields[field] = score / 100
+
+    def _decode_body(self) -> None:
+        """Parse score_breakdown and ai_reasoning on first access."""
+        body = self._data[_HEADER.size :]
+        if self._flags & FLAG_COMPRESSED:
+            body = zlib.decompress(body)
+        breakdown, reasoning = json.loads(body)
+        self._fields["score_breakdown"] = breakdown
+        self._fields["ai_reasoning"] = reasoning
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "is_recommended":
+            return bool(self._flags & FLAG_RECOMMENDED)
+        if key not in self._fields:
+            if key in _BODY_FIELDS:
+                self._decode_body()
+            elif key in _FIELDS:
+                self._decode_header()
+        return self._fields[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_FIELDS)
+
+
+def _hundredths(value: Any) -> int:
+    """Convert a 0-100 score to integer hundredths."""
+    return round(float(value or 0) * 100)
+
+
+def encode_match_detail(detail: Mapping[str, Any]) -> bytes:
+    """Encode a match detail dict into the current binary format."""
+    flags = FLAG_RECOMMENDED if detail.get("is_recommended") else 0
+    body = json.dumps(
+        [detail.get("score_breakdown") or {}, detail.get("ai_reasoning") or ""],
+        separators=(",", ":"),
+    ).encode()
+    if len(body) >= COMPRESS_MIN_BYTES:
+        body = zlib.compress(body, 1)
+        flags |= FLAG_COMPRESSED
+    header = _HEADER.pack(
+        FORMAT_VERSION,
+        flags,
+        UUID(str(detail["match_id"])).bytes,
+        *(_hundredths(detail.get(field)) for field in _SCORE_FIELDS),
+    )
+    return header + body
+
+
+def decode_match_detail(data: bytes) -> Mapping[str, Any]:
+    """Decode a cached match detail in the binary or legacy JSON format."""
+    if data[:1] == b"{":
+        return cast(Mapping[str, Any], json.loads(data))
+    return MatchDetail(data)
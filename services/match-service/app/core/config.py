@@ -25,6 +25,13 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8005
 
+    # gRPC server (runs in the uvicorn event loop, so one process per port)
+    grpc_enabled: bool = True
+    grpc_port: int = 9005
+    grpc_max_concurrent_rpcs: int = 1000  # Further RPCs fail with RESOURCE_EXHAUSTED
+    grpc_keepalive_time_ms: int = 30000
+    grpc_shutdown_grace: float = 10.0  # Seconds in-flight RPCs get on shutdown
+
     # Database
     db_host: str = "localhost"
     db_port: int = 5432
@@ -39,10 +46,33 @@ class Settings(BaseSettings):
     redis_port: int = 6379
     redis_password: Optional[str] = None
     redis_db: int = 0
-    redis_cache_ttl: int = 3600  # 1 hour
+    redis_cache_ttl: int = 3600  # 1 hour; hard TTL, keys are gone after this
+    redis_cache_soft_ttl: int = 900  # Older keys are served but refreshed
+    redis_invalidation_channel: str = "match:cache:invalidate"
+
+    # In-process cache tier in front of Redis
+    local_cache_max_entries: int = 10000  # 0 disables the local tier
+    local_cache_ttl: float = 5.0  # Bounds staleness if an invalidation is missed
+
+    # Outbound HTTP (shared pool for ai/job/resume service calls)
+    http_client_max_connections: int = 100
+    http_client_max_keepalive: int = 40
+    http_client_keepalive_expiry: float = 60.0  # Seconds an idle connection is kept
+    http_client_max_connections_per_host: int = 32
+    http_client_timeout: float = 30.0
+    http_client_pool_timeout: float = 5.0  # Max wait for a free pooled connection
 
     # AI Service
     ai_service_url: str = "http://ai-service:8006"
+    ai_service_max_concurrency: int = 16  # In-flight AI calls per batch
+    # Part of each score's input fingerprint; bump either to force rescoring
+    ai_scoring_prompt_version: str = "1"
+    ai_scoring_model_version: str = "anthropic.claude-3-sonnet-20240229-v1:0"
+
+    # AI service circuit breaker
+    ai_circuit_failure_threshold: int = 5  # Consecutive failures before opening
+    ai_circuit_reset_timeout: float = 30.0  # Seconds open before probing again
+    ai_circuit_half_open_max_calls: int = 1  # Concurrent probes while half-open
 
     # Job Service
     job_service_url: str = "http://job-service:8002"
@@ -53,6 +83,57 @@ class Settings(BaseSettings):
     # Matching thresholds
     match_recommendation_threshold: float = 75.0
     top_matches_limit: int = 100
+    top_matches_load_size: int = 25  # Ranked rows read per query when streaming
+
+    # Listings
+    match_count_cache_ttl: int = 60  # Seconds a listing total may lag behind
+
+    # Match statistics and insights
+    match_stats_cache_ttl: int = 60  # Seconds a cached summary may lag behind
+    match_stats_shards: int = 16  # Rows per counter, so writers rarely share one
+    match_insights_top_skills: int = 5
+    match_insights_low_recommended_rate: float = 0.1  # Below this, suggest gaps
+
+    # Score coalescing
+    match_score_lease_ms: int = 45000  # Outlives one AI call at http_client_timeout
+    match_score_wait_seconds: float = 45.0  # Max wait on another replica's lease
+    match_score_poll_interval: float = 0.1
+    match_refresh_lease_ms: int = 30000  # One background refresh per key per window
+
+    # Batch scoring
+    match_batch_max_pairs: int = 1000
+    match_batch_write_size: int = 50  # Scored pairs per bulk upsert
+
+    # Scoring work queue (one Redis stream per priority lane)
+    scoring_queue_interactive_concurrency: int = 8  # Workers per lane and replica
+    scoring_queue_bulk_concurrency: int = 4
+    scoring_queue_backfill_concurrency: int = 1
+    scoring_queue_batch_size: int = 50  # Bulk and backfill tasks scored together
+    scoring_queue_block_ms: int = 5000  # Max wait for new work per read
+    scoring_queue_claim_idle_ms: int = 300000  # Retake tasks of dead workers after
+    scoring_queue_max_length: int = 100000  # Approximate cap per lane stream
+    scoring_task_ttl: int = 86400  # Seconds task status stays pollable
+    scoring_pair_pending_ttl: int = 3600  # Max seconds a queued pair blocks repeats
+    scoring_task_max_attempts: int = 5  # Runs of a deferred task before it fails
+
+    # Deterministic pre-scoring
+    match_prescore_gate: float = 35.0  # Pairs pre-scoring below this skip the AI
+
+    # Job-level matching
+    match_job_candidate_limit: int = 200  # Shortlisted resumes sent to AI scoring
+    job_document_cache_max_entries: int = 1000  # 0 fetches every job each time
+    job_document_cache_ttl: float = 60.0  # Seconds a fetched job is reused
+
+    # In-memory resume skill index for job-level shortlisting
+    skill_index_enabled: bool = True  # Falls back to resume-service search if off
+    skill_index_poll_interval: float = 10.0  # Seconds between change polls
+    skill_index_poll_overlap: float = 5.0  # Seconds re-read to catch late commits
+    skill_index_rebuild_interval: float = 3600.0  # Full rebuilds drop deleted resumes
+    skill_index_page_size: int = 1000
+
+    # User-level recommendations
+    match_user_job_limit: int = 50  # Similar jobs scored per resume
+    match_user_similarity_threshold: float = 0.5
 
     # Observability
     log_level: str = "INFO"
@@ -0,0 +1,50 @@
+"""Fingerprints of the inputs a match score was computed from."""
+
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import Any
+
+from app.core.config import settings
+
+# Bookkeeping fields that change without changing what the AI scores
+_VOLATILE_FIELDS = frozenset(
+    {
+        "status",
+        "created_at",
+        "createdAt",
+        "updated_at",
+        "updatedAt",
+        "posted_at",
+        "postedAt",
+        "expires_at",
+        "expiresAt",
+        "views_count",
+        "viewsCount",
+        "applies_count",
+        "appliesCount",
+        "original_file_url",
+    }
+)
+
+
+def content_hash(document: Mapping[str, Any]) -> str:
+    """Hash a job or resume document, ignoring bookkeeping fields."""
+    content = {
+        key: value for key, value in document.items() if key not in _VOLATILE_FIELDS
+    }
+    encoded = json.dumps(
+        content, sort_keys=True, separators=(",", ":"), default=str
+    ).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def input_fingerprint(job_hash: str, resume_hash: str) -> str:
+    """Combine document hashes with the scoring prompt and model versions."""
+    parts = (
+        job_hash,
+        resume_hash,
+        settings.ai_scoring_prompt_version,
+        settings.ai_scoring_model_version,
+    )
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
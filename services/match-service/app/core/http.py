@@ -0,0 +1,111 @@
+"""Shared HTTP client for calls to downstream services."""
+
+import asyncio
+import time
+from typing import Any, Optional
+
+import httpx
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.core.config import settings
+
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "match_http_client_requests_in_flight",
+    "Outbound requests currently holding a connection slot",
+    ["host"],
+)
+HTTP_CONNECTION_SLOTS = Gauge(
+    "match_http_client_connection_slots",
+    "Connection slots currently free per downstream host",
+    ["host"],
+)
+HTTP_POOL_WAIT_SECONDS = Histogram(
+    "match_http_client_pool_wait_seconds",
+    "Time spent waiting for a free connection slot",
+    ["host"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+HTTP_POOL_TIMEOUTS = Counter(
+    "match_http_client_pool_timeouts_total",
+    "Requests that gave up waiting for a pooled connection",
+    ["host"],
+)
+
+
+class HttpClient:
+    """Process-wide pooled httpx client with per-host connection caps.
+
+    Downstream services are reached over plain ``http://``, where httpx only
+    speaks HTTP/1.1 (HTTP/2 needs TLS ALPN; there is no h2c), so the pool
+    saves handshakes through keep-alive rather than multiplexing.
+    """
+
+    def __init__(self) -> None:
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+
+    async def connect(self) -> None:
+        """Open the shared connection pool."""
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.http_client_max_connections,
+                max_keepalive_connections=settings.http_client_max_keepalive,
+                keepalive_expiry=settings.http_client_keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                settings.http_client_timeout,
+                pool=settings.http_client_pool_timeout,
+            ),
+        )
+
+    async def disconnect(self) -> None:
+        """Close the shared connection pool."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get httpx client instance."""
+        if self._client is None:
+            raise RuntimeError("HTTP client not initialized")
+        return self._client
+
+    def _slots_for(self, host: str) -> asyncio.Semaphore:
+        """Get the connection slot semaphore for a host."""
+        slots = self._host_slots.get(host)
+        if slots is None:
+            slots = asyncio.Semaphore(settings.http_client_max_connections_per_host)
+            self._host_slots[host] = slots
+            HTTP_CONNECTION_SLOTS.labels(host).set(
+                settings.http_client_max_connections_per_host
+            )
+        return slots
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, waiting for a free slot on the target host first."""
+        host = httpx.URL(url).host
+        started = time.perf_counter()
+        async with self._slots_for(host):
+            HTTP_POOL_WAIT_SECONDS.labels(host).observe(time.perf_counter() - started)
+            HTTP_CONNECTION_SLOTS.labels(host).dec()
+            HTTP_REQUESTS_IN_FLIGHT.labels(host).inc()
+            try:
+                return await self.client.request(method, url, **kwargs)
+            except httpx.PoolTimeout:
+                HTTP_POOL_TIMEOUTS.labels(host).inc()
+                raise
+            finally:
+                HTTP_REQUESTS_IN_FLIGHT.labels(host).dec()
+                HTTP_CONNECTION_SLOTS.labels(host).inc()
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a POST request."""
+        return await self.request("POST", url, **kwargs)
+
+
+http_client = HttpClient()
@@ -0,0 +1,68 @@
+"""Bounded in-process LRU/TTL cache used in front of Redis."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from prometheus_client import Counter
+
+CACHE_REQUESTS = Counter(
+    "match_cache_requests_total",
+    "Cache lookups by tier, cache and result",
+    ["tier", "cache", "result"],
+)
+
+
+def record_lookup(tier: str, cache: str, hit: bool) -> None:
+    """Count a cache lookup for the hit/miss ratio of a tier."""
+    CACHE_REQUESTS.labels(tier, cache, "hit" if hit else "miss").inc()
+
+
+class LocalCache:
+    """Least-recently-used cache with a per-entry time to live.
+
+    Every invalidation bumps ``epoch``. A caller that read a value from
+    Redis passes the epoch it saw before the read to ``set``, so a value
+    read before a concurrent invalidation is never stored.
+    """
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.epoch = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a live value and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, epoch: int) -> None:
+        """Store a value unless an invalidation happened since ``epoch``."""
+        if self.max_entries <= 0 or epoch != self.epoch:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop the given keys."""
+        self.epoch += 1
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.epoch += 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,173 @@
+"""Incrementally maintained match statistics per job and per user.
+
+Statistics are stored as named counters (metrics) per scope, such as
+``matches``, ``sum:overall_score`` or ``bucket:70-80``. Every write to a
+match adds the difference between its new and old contribution, so
+reading the statistics of a job never aggregates over its matches.
+Skill and experience-gap metrics feed job insights and are kept for
+jobs only.
+"""
+
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any, Optional
+from uuid import UUID
+
+from app.models.schemas import StatsScope
+
+SCORE_COLUMNS = ("overall_score", "skill_score", "experience_score", "culture_score")
+# Width of the overall score histogram buckets
+SCORE_BUCKET_WIDTH = 10
+
+# Metric changes per (scope, scope_id)
+StatsDeltas = dict[tuple[StatsScope, UUID], dict[str, Decimal]]
+
+# Stored contribution of a match: scope -> metric -> value as a decimal string
+Contribution = dict[str, dict[str, str]]
+
+
+def score_bucket(score: Decimal) -> str:
+    """Get the histogram bucket label of an overall score."""
+    lower = min(int(score // SCORE_BUCKET_WIDTH), 100 // SCORE_BUCKET_WIDTH - 1)
+    lower *= SCORE_BUCKET_WIDTH
+    return f"{lower}-{lower + SCORE_BUCKET_WIDTH}"
+
+
+def breakdown_value(breakdown: Mapping[str, Any], section: str, key: str) -> Any:
+    """Get a breakdown value from its AI section, or from the top level."""
+    nested = breakdown.get(section)
+    if isinstance(nested, Mapping) and nested.get(key) is not None:
+        return nested[key]
+    return breakdown.get(key)
+
+
+def _breakdown_skills(breakdown: Mapping[str, Any], key: str) -> set[str]:
+    """Get the skills listed under a breakdown key, lowercased and collapsed."""
+    skills = breakdown_value(breakdown, "skill_match", key)
+    if not isinstance(skills, list):
+        return set()
+    names = (" ".join(name.lower().split()) for name in skills if isinstance(name, str))
+    return {name for name in names if name}
+
+
+def _experience_gap(breakdown: Mapping[str, Any]) -> Optional[Decimal]:
+    """Get the years a candidate falls short of a job's requirement."""
+    required = breakdown_value(breakdown, "experience_match", "required_years")
+    relevant = breakdown_value(breakdown, "experience_match", "relevant_years")
+    if not all(
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+        for value in (required, relevant)
+    ):
+        return None
+    return Decimal(str(required)) - Decimal(str(relevant))
+
+
+def match_metrics(
+    match: Mapping[str, Any], insights: bool = False
+) -> dict[str, Decimal]:
+    """Get the metrics one match contributes to its scope."""
+    metrics: dict[str, Decimal] = {"matches": Decimal(1)}
+    for column in SCORE_COLUMNS:
+        value = match.get(column)
+        if value is not None:
+            metrics[f"sum:{column}"] = Decimal(value)
+            metrics[f"count:{column}"] = Decimal(1)
+    overall_score = match.get("overall_score")
+    if overall_score is not None:
+        metrics[f"bucket:{score_bucket(Decimal(overall_score))}"] = Decimal(1)
+    if match.get("is_recommended"):
+        metrics["recommended"] = Decimal(1)
+
+    breakdown = match.get("score_breakdown")
+    if insights and isinstance(breakdown, Mapping):
+        for skill in _breakdown_skills(breakdown, "matched_skills"):
+            metrics[f"matched_skill:{skill}"] = Decimal(1)
+        for skill in _breakdown_skills(breakdown, "missing_skills"):
+            metrics[f"skill_gap:{skill}"] = Decimal(1)
+        gap = _experience_gap(breakdown)
+        if gap is not None:
+            metrics["sum:experience_gap"] = gap
+            metrics["count:experience_gap"] = Decimal(1)
+    return metrics
+
+
+def _add(
+    deltas: StatsDeltas, key: tuple[StatsScope, UUID], metrics: Mapping[str, Decimal]
+) -> None:
+    """Add metrics into the deltas of one scope."""
+    scope = deltas.setdefault(key, {})
+    for metric, value in metrics.items():
+        scope[metric] = scope.get(metric, Decimal(0)) + value
+
+
+def match_contribution(match: Mapping[str, Any]) -> Contribution:
+    """Get the job and user metrics of a match in its stored form.
+
+    Values are strings so they round-trip through JSON exactly.
+    """
+    return {
+        StatsScope.JOB.value: {
+            metric: str(value)
+            for metric, value in match_metrics(match, insights=True).items()
+        },
+        StatsScope.USER.value: {
+            metric: str(value) for metric, value in match_metrics(match).items()
+        },
+    }
+
+
+def add_contribution(
+    deltas: StatsDeltas,
+    job_id: UUID,
+    user_id: UUID,
+    contribution: Optional[Mapping[str, Mapping[str, Any]]],
+    sign: int = 1,
+) -> None:
+    """Add (or with ``sign=-1`` take away) a stored match contribution."""
+    if not contribution:
+        return
+    for scope, scope_id in ((StatsScope.JOB, job_id), (StatsScope.USER, user_id)):
+        metrics = contribution.get(scope.value, {})
+        _add(
+            deltas,
+            (scope, scope_id),
+            {metric: sign * Decimal(value) for metric, value in metrics.items()},
+        )
+
+
+def add_feedback(
+    deltas: StatsDeltas,
+    job_id: UUID,
+    user_id: UUID,
+    feedback_type: Optional[str],
+    count: int = 1,
+) -> None:
+    """Add (or with a negative ``count`` take away) feedback on a match."""
+    if feedback_type is None:
+        return
+    metrics = {f"feedback:{feedback_type}": Decimal(count)}
+    _add(deltas, (StatsScope.JOB, job_id), metrics)
+    _add(deltas, (StatsScope.USER, user_id), metrics)
+
+
+def prefixed(metrics: Mapping[str, Decimal], prefix: str) -> dict[str, int]:
+    """Get the non-zero counters under a metric prefix, keyed by the rest."""
+    return {
+        metric[len(prefix) :]: int(value)
+        for metric, value in metrics.items()
+        if metric.startswith(prefix) and value
+    }
+
+
+def average(metrics: Mapping[str, Decimal], name: str) -> Optional[float]:
+    """Get the mean of a summed metric, or None without samples."""
+    count = metrics.get(f"count:{name}")
+    if not count:
+        return None
+    return round(float(metrics.get(f"sum:{name}", Decimal(0)) / count), 2)
+
+
+def most_common(counts: Mapping[str, int], limit: int) -> list[str]:
+    """Get the keys with the highest counts, ties in name order."""
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    return [name for name, _ in ranked[:limit]]
@@ -1,19 +1,160 @@
 """Redis client for caching."""
 
+import asyncio
 import json
-from typing import Any, Optional
-from collections.abc import AsyncGenerator
+import logging
+import time
+from decimal import Decimal
+from typing import Any, NamedTuple, Optional
+from collections.abc import AsyncGenerator, Mapping
+from uuid import uuid4
 
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 
+from app.core.codec import decode_match_detail, encode_match_detail
 from app.core.config import settings
+from app.core.local_cache import LocalCache, record_lookup
+
+logger = logging.getLogger(__name__)
+
+# Delete a lease only if it is still held by the caller's token
+RELEASE_LEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+# Upsert one job ranking member while keeping its watermark honest.
+#
+# The watermark ("<loaded_at>:<exhaustive 1/0>") says the ZSET holds the
+# true top ZCARD matches of the job; exhaustive means it holds all of them.
+# While it is not exhaustive, unseen rows may sit just below the lowest
+# member, so a new member below that point is left to the database, and a
+# score decrease drops the watermark. Trimming to the limit ends
+# exhaustiveness.
+RANKING_UPSERT_LUA = """
+local function upsert_ranking(ranking, watermark, member, score, limit, ttl)
+    local mark = redis.call("GET", watermark)
+    if mark and string.sub(mark, -1) == "0" then
+        local old = redis.call("ZSCORE", ranking, member)
+        if old then
+            if tonumber(old) > tonumber(score) then
+                redis.call("DEL", watermark)
+            end
+        else
+            local lowest = redis.call("ZRANGE", ranking, 0, 0, "WITHSCORES")
+            if lowest[2] and tonumber(score) < tonumber(lowest[2]) then
+                return
+            end
+        end
+    end
+    redis.call("ZADD", ranking, score, member)
+    local trimmed = redis.call("ZREMRANGEBYRANK", ranking, 0, -tonumber(limit) - 1)
+    redis.call("EXPIRE", ranking, ttl)
+    if mark and trimmed > 0 and string.sub(mark, -1) == "1" then
+        redis.call("SET", watermark, string.sub(mark, 1, -2) .. "0", "KEEPTTL")
+    end
+end
+"""
+
+# Add many members to a job ranking.
+# KEYS: job ranking, watermark
+# ARGV: top limit, ttl, then resume_id/score pairs
+ADD_TO_RANKING_SCRIPT = RANKING_UPSERT_LUA + """
+for i = 3, #ARGV, 2 do
+    upsert_ranking(KEYS[1], KEYS[2], ARGV[i], ARGV[i + 1], ARGV[1], ARGV[2])
+end
+return 1
+"""
+
+# Write a match detail and its ranking entries atomically.
+# KEYS: detail, job ranking, user recommendations, job ranking watermark
+# ARGV: encoded detail, ttl, resume_id, job_id, score, recommended (1/0), top limit
+CACHE_MATCH_SCRIPT = RANKING_UPSERT_LUA + """
+local ttl = tonumber(ARGV[2])
+redis.call("SET", KEYS[1], ARGV[1], "EX", ttl)
+upsert_ranking(KEYS[2], KEYS[4], ARGV[3], ARGV[5], ARGV[7], ttl)
+if ARGV[6] == "1" then
+    redis.call("ZADD", KEYS[3], ARGV[5], ARGV[4])
+    redis.call("EXPIRE", KEYS[3], ttl)
+else
+    redis.call("ZREM", KEYS[3], ARGV[4])
+end
+return 1
+"""
+
+# Queue scoring tasks for pairs that no task already holds.
+# KEYS: lane stream, then a pending marker and a status key per task
+# ARGV: marker ttl, status ttl, stream cap, then per task: task_id, job_id,
+#       resume_id, user_id, force (1/0), attempt, queued status JSON
+# Returns per task the id of the task holding its pair: its own if queued
+ENQUEUE_SCORING_SCRIPT = """
+local owners = {}
+for n = 0, (#KEYS - 1) / 2 - 1 do
+    local marker, status = KEYS[2 + n * 2], KEYS[3 + n * 2]
+    local a = 4 + n * 7
+    if redis.call("SET", marker, ARGV[a], "NX", "EX", ARGV[1]) then
+        redis.call("SET", status, ARGV[a + 6], "EX", ARGV[2])
+        redis.call(
+            "XADD", KEYS[1], "MAXLEN", "~", ARGV[3], "*",
+            "task_id", ARGV[a], "job_id", ARGV[a + 1], "resume_id", ARGV[a + 2],
+            "user_id", ARGV[a + 3], "force", ARGV[a + 4], "attempt", ARGV[a + 5]
+        )
+        owners[n + 1] = ARGV[a]
+    else
+        owners[n + 1] = redis.call("GET", marker)
+    end
+end
+return owners
+"""
+
+# Consumer group shared by every scoring worker on every replica
+SCORING_GROUP = "match-scorers"
+
+
+class CachedRead(NamedTuple):
+    """A cached value and whether it is past its soft TTL."""
+
+    value: Any
+    stale: bool
+
+
+def _pending_key(job_id: str, resume_id: str) -> str:
+    """Get the key marking a pair as held by a queued or running task."""
+    return f"match:scoring:pending:{job_id}:{resume_id}"
+
+
+def _is_stale(ttl_remaining: int) -> bool:
+    """Check whether a key written with ``redis_cache_ttl`` is past the soft TTL.
+
+    Every write resets the key's TTL to ``redis_cache_ttl``, so the time
+    remaining tells how long ago it was last written.
+    """
+    soft_remaining = settings.redis_cache_ttl - settings.redis_cache_soft_ttl
+    return 0 <= ttl_remaining <= soft_remaining
 
 
 class RedisClient:
-    """Async Redis client wrapper with caching utilities."""
+    """Async Redis client wrapper with caching utilities.
+
+    Match details and rankings are also kept in a small in-process tier.
+    Every write publishes the keys it touched on
+    ``redis_invalidation_channel`` so other replicas drop their copies.
+    """
 
     def __init__(self) -> None:
         self._client: Optional[redis.Redis] = None
+        self._binary_client: Optional[redis.Redis] = None
+        self._release_lease: Optional[AsyncScript] = None
+        self._cache_match: Optional[AsyncScript] = None
+        self._add_to_ranking: Optional[AsyncScript] = None
+        self._enqueue_scoring: Optional[AsyncScript] = None
+        self._local = LocalCache(
+            settings.local_cache_max_entries, settings.local_cache_ttl
+        )
+        self._listener: Optional[asyncio.Task[None]] = None
 
     async def connect(self) -> None:
         """Initialize Redis connection."""
@@ -22,9 +163,27 @@ class RedisClient:
             encoding="utf-8",
             decode_responses=True,
         )
+        # Match details are binary-encoded and must not be utf-8 decoded
+        self._binary_client = redis.from_url(settings.redis_url)
+        self._release_lease = self._client.register_script(RELEASE_LEASE_SCRIPT)
+        self._cache_match = self._client.register_script(CACHE_MATCH_SCRIPT)
+        self._add_to_ranking = self._client.register_script(ADD_TO_RANKING_SCRIPT)
+        self._enqueue_scoring = self._client.register_script(ENQUEUE_SCORING_SCRIPT)
+        if settings.local_cache_max_entries > 0:
+            self._listener = asyncio.create_task(self._listen_for_invalidations())
 
     async def disconnect(self) -> None:
         """Close Redis connection."""
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._local.clear()
+        if self._binary_client:
+            await self._binary_client.close()
         if self._client:
             await self._client.close()
 
@@ -35,16 +194,96 @@ class RedisClient:
             raise RuntimeError("Redis client not initialized")
         return self._client
 
+    @property
+    def binary_client(self) -> redis.Redis:
+        """Get the Redis client that returns raw bytes."""
+        if self._binary_client is None:
+            raise RuntimeError("Redis client not initialized")
+        return self._binary_client
+
+    @staticmethod
+    def _script(script: Optional[AsyncScript]) -> AsyncScript:
+        """Get a Lua script registered by ``connect``."""
+        if script is None:
+            raise RuntimeError("Redis client not initialized")
+        return script
+
+    # Cross-replica invalidation of the in-process tier
+    async def _listen_for_invalidations(self) -> None:
+        """Drop local entries for keys other replicas have written."""
+        while True:
+            try:
+                async with self.client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(settings.redis_invalidation_channel)
+                    # Anything written while unsubscribed was missed
+                    self._local.clear()
+                    async for message in pubsub.listen():
+                        self._local.invalidate(*json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener failed: {e}")
+                self._local.clear()
+                await asyncio.sleep(1)
+
+    async def _execute_write(self, pipe: Any, keys: list[str]) -> None:
+        """Execute a write pipeline and invalidate its keys on every replica."""
+        pipe.publish(settings.redis_invalidation_channel, json.dumps(keys))
+        await pipe.execute()
+        self._local.invalidate(*keys)
+
     # String operations for match details
     async def get_match_detail(
         self, job_id: str, resume_id: str
-    ) -> Optional[dict[str, Any]]:
+    ) -> Optional[Mapping[str, Any]]:
         """Get cached match detail."""
+        return (await self.read_match_detail(job_id, resume_id)).value
+
+    async def read_match_detail(self, job_id: str, resume_id: str) -> CachedRead:
+        """Get cached match detail and whether it is due for a refresh."""
         key = f"match:detail:{job_id}:{resume_id}"
-        data = await self.client.get(key)
-        if data:
-            return json.loads(data)
-        return None
+        detail = self._local.get(key)
+        record_lookup("local", "detail", detail is not None)
+        if detail is not None:
+            return CachedRead(detail, False)
+
+        epoch = self._local.epoch
+        async with self.binary_client.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.ttl(key)
+            data, ttl = await pipe.execute()
+        record_lookup("redis", "detail", bool(data))
+        if not data:
+            return CachedRead(None, False)
+
+        detail = decode_match_detail(data)
+        stale = _is_stale(ttl)
+        if not stale:
+            self._local.set(key, detail, epoch)
+        return CachedRead(detail, stale)
+
+    async def get_match_details(
+        self, pairs: list[tuple[str, str]]
+    ) -> list[Optional[Mapping[str, Any]]]:
+        """Get cached match details for many (job_id, resume_id) pairs in one MGET."""
+        if not pairs:
+            return []
+        keys = [f"match:detail:{job_id}:{resume_id}" for job_id, resume_id in pairs]
+        details = [self._local.get(key) for key in keys]
+        missing = [i for i, detail in enumerate(details) if detail is None]
+        for detail in details:
+            record_lookup("local", "detail", detail is not None)
+        if not missing:
+            return details
+
+        epoch = self._local.epoch
+        values = await self.binary_client.mget([keys[i] for i in missing])
+        for i, data in zip(missing, values):
+            record_lookup("redis", "detail", bool(data))
+            if data:
+                details[i] = decode_match_detail(data)
+                self._local.set(keys[i], details[i], epoch)
+        return details
 
     async def set_match_detail(
         self,
@@ -55,67 +294,496 @@ class RedisClient:
     ) -> None:
         """Cache match detail."""
         key = f"match:detail:{job_id}:{resume_id}"
-        await self.client.set(
-            key,
-            json.dumps(detail),
-            ex=ttl or settings.redis_cache_ttl,
-        )
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(
+                key,
+                encode_match_detail(detail),
+                ex=ttl or settings.redis_cache_ttl,
+            )
+            await self._execute_write(pipe, [key])
 
     async def delete_match_detail(self, job_id: str, resume_id: str) -> None:
         """Delete cached match detail."""
         key = f"match:detail:{job_id}:{resume_id}"
-        await self.client.delete(key)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.delete(key)
+            await self._execute_write(pipe, [key])
+
+    # Listing counts
+    async def get_match_count(self, scope: str) -> Optional[int]:
+        """Get a cached listing count."""
+        count = await self.client.get(f"match:count:{scope}")
+        return int(count) if count is not None else None
+
+    async def set_match_count(self, scope: str, count: int) -> None:
+        """Cache a listing count for a short while."""
+        await self.client.set(
+            f"match:count:{scope}", count, ex=settings.match_count_cache_ttl
+        )
+
+    # Match statistics
+    async def get_match_stats(
+        self, scope: str, scope_id: str
+    ) -> Optional[dict[str, Decimal]]:
+        """Get cached statistics of a job or a user as metric -> value."""
+        stats = await self.client.hgetall(f"match:stats:{scope}:{scope_id}")
+        if not stats:
+            return None
+        return {metric: Decimal(value) for metric, value in stats.items()}
+
+    async def set_match_stats(
+        self, scope: str, scope_id: str, stats: Mapping[str, Decimal]
+    ) -> None:
+        """Cache the statistics of a job or a user for a short while."""
+        if not stats:
+            return
+        key = f"match:stats:{scope}:{scope_id}"
+        mapping = {metric: str(value) for metric, value in stats.items()}
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, settings.match_stats_cache_ttl)
+            await pipe.execute()
+
+    async def invalidate_match_stats(self, scopes: list[tuple[str, str]]) -> None:
+        """Drop cached statistics of (scope, scope_id) pairs after a write."""
+        if scopes:
+            await self.client.delete(
+                *{f"match:stats:{scope}:{scope_id}" for scope, scope_id in scopes}
+            )
+
+    # Combined operations keeping detail and rankings in step
+    async def cache_matches(self, entries: list[dict[str, Any]]) -> None:
+        """Cache many matches with one atomic script call each, in one round trip.
+
+        Each entry carries job_id, resume_id, user_id, score, is_recommended
+        and the detail dict. The job ranking is trimmed to
+        ``top_matches_limit`` and the user's recommendation is added or
+        dropped to follow ``is_recommended``.
+        """
+        if not entries:
+            return
+        ttl = settings.redis_cache_ttl
+        written: list[str] = []
+        async with self.client.pipeline(transaction=False) as pipe:
+            for entry in entries:
+                job_id, resume_id = entry["job_id"], entry["resume_id"]
+                keys = [
+                    f"match:detail:{job_id}:{resume_id}",
+                    f"match:job:{job_id}:top",
+                    f"match:user:{entry['user_id']}:recommended",
+                    f"match:job:{job_id}:top:watermark",
+                ]
+                written.extend(keys[:3])
+                await self._script(self._cache_match)(
+                    keys=keys,
+                    args=[
+                        encode_match_detail(entry["detail"]),
+                        ttl,
+                        resume_id,
+                        job_id,
+                        entry["score"],
+                        1 if entry["is_recommended"] else 0,
+                        settings.top_matches_limit,
+                    ],
+                    client=pipe,
+                )
+            await self._execute_write(pipe, written)
+
+    async def remove_match(self, job_id: str, resume_id: str, user_id: str) -> None:
+        """Drop a match from the detail cache and both rankings atomically."""
+        detail_key = f"match:detail:{job_id}:{resume_id}"
+        job_key = f"match:job:{job_id}:top"
+        user_key = f"match:user:{user_id}:recommended"
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.delete(detail_key)
+            pipe.zrem(job_key, resume_id)
+            pipe.zrem(user_key, job_id)
+            await self._execute_write(pipe, [detail_key, job_key, user_key])
+
+    # Leases for coalescing score computations across replicas
+    async def acquire_score_lease(
+        self, job_id: str, resume_id: str, ttl_ms: int
+    ) -> Optional[str]:
+        """Try to take the scoring lease for a pair; return its token if acquired."""
+        key = f"match:lease:{job_id}:{resume_id}"
+        token = uuid4().hex
+        if await self.client.set(key, token, nx=True, px=ttl_ms):
+            return token
+        return None
+
+    async def release_score_lease(
+        self, job_id: str, resume_id: str, token: str
+    ) -> None:
+        """Release the scoring lease for a pair if it is still ours."""
+        key = f"match:lease:{job_id}:{resume_id}"
+        await self._script(self._release_lease)(keys=[key], args=[token])
+
+    async def acquire_refresh_lease(self, key: str) -> bool:
+        """Claim the background refresh of a stale key for a short while.
+
+        The lease is never released; it simply expires, which also rate
+        limits refreshes of the same key across replicas.
+        """
+        return bool(
+            await self.client.set(
+                f"match:refresh:{key}",
+                1,
+                nx=True,
+                px=settings.match_refresh_lease_ms,
+            )
+        )
+
+    async def score_lease_held(self, job_id: str, resume_id: str) -> bool:
+        """Check whether any replica holds the scoring lease for a pair."""
+        key = f"match:lease:{job_id}:{resume_id}"
+        return bool(await self.client.exists(key))
+
+    # Scoring work queue: one stream per priority lane, one consumer group
+    async def ensure_scoring_group(self, lane: str) -> None:
+        """Create a lane's stream and consumer group if they do not exist."""
+        try:
+            await self.client.xgroup_create(
+                f"match:scoring:{lane}", SCORING_GROUP, id="0", mkstream=True
+            )
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def enqueue_scoring_tasks(
+        self, lane: str, tasks: list[dict[str, str]]
+    ) -> list[str]:
+        """Queue tasks on a lane, skipping pairs a task already holds.
+
+        Each task carries task_id, job_id, resume_id, user_id, force (1/0)
+        and attempt. A pair stays held by its task from queueing until the
+        task finishes, on any lane, so a pair is never queued twice. Returns
+        per task the id of the task holding its pair.
+        """
+        keys = [f"match:scoring:{lane}"]
+        args: list[Any] = [
+            settings.scoring_pair_pending_ttl,
+            settings.scoring_task_ttl,
+            settings.scoring_queue_max_length,
+        ]
+        for task in tasks:
+            keys.append(_pending_key(task["job_id"], task["resume_id"]))
+            keys.append(f"match:scoring:task:{task['task_id']}")
+            status = {
+                "task_id": task["task_id"],
+                "lane": lane,
+                "status": "queued",
+                "job_id": task["job_id"],
+                "resume_id": task["resume_id"],
+            }
+            args += [
+                task["task_id"],
+                task["job_id"],
+                task["resume_id"],
+                task["user_id"],
+                task["force"],
+                task["attempt"],
+                json.dumps(status),
+            ]
+        return list(await self._script(self._enqueue_scoring)(keys=keys, args=args))
+
+    async def requeue_scoring_task(self, lane: str, task: dict[str, str]) -> None:
+        """Queue a held task again under the same id, keeping its pair held."""
+        status = {
+            "task_id": task["task_id"],
+            "lane": lane,
+            "status": "queued",
+            "job_id": task["job_id"],
+            "resume_id": task["resume_id"],
+        }
+        pipe = self.client.pipeline(transaction=True)
+        pipe.set(
+            _pending_key(task["job_id"], task["resume_id"]),
+            task["task_id"],
+            ex=settings.scoring_pair_pending_ttl,
+        )
+        pipe.set(
+            f"match:scoring:task:{task['task_id']}",
+            json.dumps(status),
+            ex=settings.scoring_task_ttl,
+        )
+        pipe.xadd(
+            f"match:scoring:{lane}",
+            task,
+            maxlen=settings.scoring_queue_max_length,
+            approximate=True,
+        )
+        await pipe.execute()
+
+    async def release_scoring_pair(
+        self, job_id: str, resume_id: str, task_id: str
+    ) -> None:
+        """Let a pair be queued again once the task holding it has finished."""
+        key = _pending_key(job_id, resume_id)
+        await self._script(self._release_lease)(keys=[key], args=[task_id])
+
+    async def read_scoring_tasks(
+        self, lane: str, consumer: str, count: int, block_ms: int
+    ) -> list[tuple[str, dict[str, str]]]:
+        """Take new tasks off a lane, waiting up to ``block_ms`` for one."""
+        response = await self.client.xreadgroup(
+            SCORING_GROUP,
+            consumer,
+            {f"match:scoring:{lane}": ">"},
+            count=count,
+            block=block_ms,
+        )
+        if not response:
+            return []
+        return [(entry_id, fields) for entry_id, fields in response[0][1]]
+
+    async def claim_scoring_tasks(
+        self, lane: str, consumer: str, count: int
+    ) -> list[tuple[str, dict[str, str]]]:
+        """Take over tasks a dead worker left unacknowledged for too long."""
+        # Redis 7 adds a third element, the ids of deleted entries
+        entries = (
+            await self.client.xautoclaim(
+                f"match:scoring:{lane}",
+                SCORING_GROUP,
+                consumer,
+                min_idle_time=settings.scoring_queue_claim_idle_ms,
+                count=count,
+            )
+        )[1]
+        # Entries trimmed from the stream come back without fields
+        return [(entry_id, fields) for entry_id, fields in entries if fields]
+
+    async def ack_scoring_task(self, lane: str, *entry_ids: str) -> None:
+        """Acknowledge finished tasks and drop them from their lane."""
+        pipe = self.client.pipeline(transaction=False)
+        pipe.xack(f"match:scoring:{lane}", SCORING_GROUP, *entry_ids)
+        pipe.xdel(f"match:scoring:{lane}", *entry_ids)
+        await pipe.execute()
+
+    async def set_scoring_task_status(
+        self, task_id: str, status: dict[str, Any]
+    ) -> None:
+        """Store a task's status and notify anyone waiting on it."""
+        payload = json.dumps(status)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.set(f"match:scoring:task:{task_id}", payload, ex=settings.scoring_task_ttl)
+        pipe.publish(f"match:scoring:task:{task_id}", payload)
+        await pipe.execute()
+
+    async def get_scoring_task_status(self, task_id: str) -> Optional[dict[str, Any]]:
+        """Get a task's last stored status."""
+        payload = await self.client.get(f"match:scoring:task:{task_id}")
+        return json.loads(payload) if payload else None
+
+    async def get_scoring_task_statuses(
+        self, task_ids: list[str]
+    ) -> list[Optional[dict[str, Any]]]:
+        """Get the last stored status of many tasks with one MGET."""
+        if not task_ids:
+            return []
+        payloads = await self.client.mget(
+            [f"match:scoring:task:{task_id}" for task_id in task_ids]
+        )
+        return [json.loads(payload) if payload else None for payload in payloads]
+
+    async def wait_for_scoring_task(
+        self, task_id: str, timeout: float
+    ) -> Optional[dict[str, Any]]:
+        """Wait up to ``timeout`` seconds for a task to finish; return its status."""
+        channel = f"match:scoring:task:{task_id}"
+        async with self.client.pubsub(ignore_subscribe_messages=True) as pubsub:
+            # Subscribe before reading so a completion in between is not missed
+            await pubsub.subscribe(channel)
+            status = await self.get_scoring_task_status(task_id)
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while status is not None and status["status"] in ("queued", "running"):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                message = await pubsub.get_message(timeout=remaining)
+                if message is not None:
+                    status = json.loads(message["data"])
+            return status
+
+    # ZSET range reads shared by job rankings and user recommendations
+    async def _read_ranking(self, key: str, cache: str, limit: int) -> CachedRead:
+        """Read the top of a ranking ZSET through the in-process tier.
+
+        The local entry remembers how many members were requested, so it
+        also serves any smaller limit, or any limit at all once the whole
+        ZSET fits.
+        """
+        cached = self._local.get(key)
+        hit = cached is not None and (
+            cached[0] >= limit or len(cached[1]) < cached[0]
+        )
+        record_lookup("local", cache, hit)
+        if hit:
+            return CachedRead(cached[1][:limit], False)
+
+        epoch = self._local.epoch
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.zrevrange(key, 0, limit - 1, withscores=True)
+            pipe.ttl(key)
+            ranking, ttl = await pipe.execute()
+        record_lookup("redis", cache, bool(ranking))
+        stale = bool(ranking) and _is_stale(ttl)
+        if ranking and not stale:
+            self._local.set(key, (limit, ranking), epoch)
+        return CachedRead(ranking, stale)
 
     # ZSET operations for top matches by job
     async def get_top_matches_for_job(
         self, job_id: str, limit: int = 10
-    ) -> list[tuple[str, float]]:
+    ) -> Optional[list[tuple[str, float]]]:
         """Get top matches for a job (resume_id, score pairs)."""
+        return (await self.read_top_matches_for_job(job_id, limit)).value
+
+    async def read_top_matches_for_job(
+        self, job_id: str, limit: int = 10
+    ) -> CachedRead:
+        """Get top matches for a job and whether they are due for a refresh.
+
+        The value is None unless the ranking's watermark vouches for the
+        first ``limit`` members. Staleness follows the watermark's age,
+        since partial writes keep extending the ZSET's own TTL.
+        """
+        key = f"match:job:{job_id}:top"
+        cached = self._local.get(key)
+        hit = cached is not None and (
+            cached[0] >= limit or len(cached[1]) < cached[0]
+        )
+        record_lookup("local", "job_ranking", hit)
+        if hit:
+            return CachedRead(cached[1][:limit], False)
+
+        epoch = self._local.epoch
+        watermark = f"{key}:watermark"
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.zrevrange(key, 0, limit - 1, withscores=True)
+            pipe.zcard(key)
+            pipe.get(watermark)
+            pipe.ttl(watermark)
+            ranking, size, mark, ttl = await pipe.execute()
+        complete = mark is not None and (size >= limit or mark.endswith(":1"))
+        record_lookup("redis", "job_ranking", complete)
+        if not complete:
+            return CachedRead(None, False)
+
+        stale = _is_stale(ttl)
+        if not stale:
+            self._local.set(key, (limit, ranking), epoch)
+        return CachedRead(ranking, stale)
+
+    async def replace_job_ranking(
+        self, job_id: str, scores: dict[str, float], exhaustive: bool
+    ) -> None:
+        """Replace a job ranking with a full load from the database.
+
+        ``scores`` must be the job's top ``top_matches_limit`` matches;
+        ``exhaustive`` says the job has no others.
+        """
         key = f"match:job:{job_id}:top"
-        return await self.client.zrevrange(key, 0, limit - 1, withscores=True)
+        ttl = settings.redis_cache_ttl
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            if scores:
+                pipe.zadd(key, scores)
+                pipe.expire(key, ttl)
+            watermark = f"{int(time.time())}:{int(exhaustive)}"
+            pipe.set(f"{key}:watermark", watermark, ex=ttl)
+            await self._execute_write(pipe, [key])
 
     async def add_match_to_job_ranking(
         self, job_id: str, resume_id: str, score: float
     ) -> None:
         """Add or update match in job ranking."""
+        await self.add_matches_to_job_ranking(job_id, {resume_id: score})
+
+    async def add_matches_to_job_ranking(
+        self, job_id: str, scores: dict[str, float]
+    ) -> None:
+        """Add or update many matches in job ranking with one script call."""
+        if not scores:
+            return
         key = f"match:job:{job_id}:top"
-        await self.client.zadd(key, {resume_id: score})
-        await self.client.expire(key, settings.redis_cache_ttl)
+        args: list[Any] = [settings.top_matches_limit, settings.redis_cache_ttl]
+        for resume_id, score in scores.items():
+            args.extend((resume_id, score))
+        async with self.client.pipeline(transaction=False) as pipe:
+            await self._script(self._add_to_ranking)(
+                keys=[key, f"{key}:watermark"], args=args, client=pipe
+            )
+            await self._execute_write(pipe, [key])
 
     async def remove_match_from_job_ranking(
         self, job_id: str, resume_id: str
     ) -> None:
         """Remove match from job ranking."""
         key = f"match:job:{job_id}:top"
-        await self.client.zrem(key, resume_id)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.zrem(key, resume_id)
+            await self._execute_write(pipe, [key])
 
     # ZSET operations for user recommendations
     async def get_recommended_jobs_for_user(
         self, user_id: str, limit: int = 10
     ) -> list[tuple[str, float]]:
         """Get recommended jobs for a user (job_id, score pairs)."""
+        return (await self.read_recommended_jobs_for_user(user_id, limit)).value
+
+    async def read_recommended_jobs_for_user(
+        self, user_id: str, limit: int = 10
+    ) -> CachedRead:
+        """Get recommended jobs for a user and whether they are due for a refresh."""
         key = f"match:user:{user_id}:recommended"
-        return await self.client.zrevrange(key, 0, limit - 1, withscores=True)
+        return await self._read_ranking(key, "user_recommendations", limit)
 
     async def add_recommendation_for_user(
         self, user_id: str, job_id: str, score: float
     ) -> None:
         """Add or update job recommendation for user."""
         key = f"match:user:{user_id}:recommended"
-        await self.client.zadd(key, {job_id: score})
-        await self.client.expire(key, settings.redis_cache_ttl)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.zadd(key, {job_id: score})
+            pipe.expire(key, settings.redis_cache_ttl)
+            await self._execute_write(pipe, [key])
+
+    async def update_recommendations_for_user(
+        self,
+        user_id: str,
+        recommended: dict[str, float],
+        removed: list[str],
+    ) -> None:
+        """Add and drop job recommendations for a user in one round trip."""
+        if not recommended and not removed:
+            return
+        key = f"match:user:{user_id}:recommended"
+        async with self.client.pipeline(transaction=True) as pipe:
+            if removed:
+                pipe.zrem(key, *removed)
+            if recommended:
+                pipe.zadd(key, recommended)
+            pipe.expire(key, settings.redis_cache_ttl)
+            await self._execute_write(pipe, [key])
 
     async def remove_recommendation_for_user(
         self, user_id: str, job_id: str
     ) -> None:
         """Remove job recommendation for user."""
         key = f"match:user:{user_id}:recommended"
-        await self.client.zrem(key, job_id)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.zrem(key, job_id)
+            await self._execute_write(pipe, [key])
 
     async def clear_user_recommendations(self, user_id: str) -> None:
         """Clear all recommendations for a user."""
         key = f"match:user:{user_id}:recommended"
-        await self.client.delete(key)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.delete(key)
+            await self._execute_write(pipe, [key])
 
     # Health check
     async def ping(self) -> bool:
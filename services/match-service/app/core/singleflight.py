@@ -0,0 +1,55 @@
+"""In-process single-flight coalescing of identical async calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its result.
+
+    Callers that arrive while a call for the same key is in flight wait
+    for that call instead of starting their own. If the leading caller
+    is cancelled, a waiting caller takes over and runs the call itself.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future[Any]] = {}
+
+    def in_flight(self, key: str) -> bool:
+        """Check whether a call for the key is currently running."""
+        return key in self._calls
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fn`` for the key, or wait for the in-flight call to finish."""
+        future = self._calls.get(key)
+        if future is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not future.cancelled() or (task and task.cancelling()):
+                    raise
+                # The leader was cancelled; retry as the new leader
+                return await self.do(key, fn)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not logged as lost
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+
+single_flight = SingleFlight()
@@ -1,18 +1,24 @@
 """Main FastAPI application for match service."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from app.api import router
+from app.api.grpc_server import create_grpc_server
 from app.core.config import settings
 from app.core.database import close_db, engine
+from app.core.http import http_client
 from app.core.redis import redis_client
 from app.models.schemas import HealthResponse
+from app.services.scoring_worker import ScoringWorkerPool
+from app.services.skill_index import skill_index, sync_skill_index
 
 # Configure logging
 logging.basicConfig(
@@ -35,10 +41,41 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error(f"Failed to connect to Redis: {e}")
 
+    await http_client.connect()
+    logger.info("HTTP client pool initialized")
+
+    scoring_workers = ScoringWorkerPool(redis_client, http_client)
+    try:
+        await scoring_workers.start()
+        logger.info("Scoring queue workers started")
+    except Exception as e:
+        logger.error(f"Failed to start scoring queue workers: {e}")
+
+    skill_index_sync = None
+    if settings.skill_index_enabled:
+        skill_index_sync = asyncio.create_task(
+            sync_skill_index(skill_index, http_client)
+        )
+        logger.info("Skill index sync started")
+
+    grpc_server = None
+    if settings.grpc_enabled:
+        grpc_server = create_grpc_server()
+        await grpc_server.start()
+        logger.info(f"gRPC server listening on port {settings.grpc_port}")
+
     yield
 
     # Shutdown
     logger.info("Shutting down...")
+    if grpc_server is not None:
+        # In-flight RPCs still need the pools closed below
+        await grpc_server.stop(settings.grpc_shutdown_grace)
+    if skill_index_sync is not None:
+        skill_index_sync.cancel()
+        await asyncio.gather(skill_index_sync, return_exceptions=True)
+    await scoring_workers.stop()
+    await http_client.disconnect()
     await redis_client.disconnect()
     await close_db()
     logger.info("Cleanup complete")
@@ -142,6 +179,16 @@ async def liveness() -> JSONResponse:
     )
 
 
+@app.get(
+    "/metrics",
+    tags=["health"],
+    summary="Prometheus metrics",
+)
+async def metrics() -> Response:
+    """Expose Prometheus metrics, including HTTP client pool saturation."""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -1,6 +1,6 @@
 """Models package for match service."""
 
-from app.models.match import Match, MatchFeedback, Base
+from app.models.match import Match, MatchFeedback, MatchStat, Base
 from app.models.schemas import (
     MatchCreate,
     MatchUpdate,
@@ -10,6 +10,13 @@ from app.models.schemas import (
     MatchFeedbackResponse,
     MatchScoreRequest,
     MatchScoreResponse,
+    MatchScorePair,
+    BatchMatchScoreRequest,
+    BatchMatchScoreItem,
+    CalculateMatchesForJobRequest,
+    CalculateMatchesForJobResponse,
+    CalculateMatchesForUserRequest,
+    CalculateMatchesForUserResponse,
     TopMatchesResponse,
     RecommendedJobsResponse,
 )
@@ -17,6 +24,7 @@ from app.models.schemas import (
 __all__ = [
     "Match",
     "MatchFeedback",
+    "MatchStat",
     "Base",
     "MatchCreate",
     "MatchUpdate",
@@ -26,6 +34,13 @@ __all__ = [
     "MatchFeedbackResponse",
     "MatchScoreRequest",
     "MatchScoreResponse",
+    "MatchScorePair",
+    "BatchMatchScoreRequest",
+    "BatchMatchScoreItem",
+    "CalculateMatchesForJobRequest",
+    "CalculateMatchesForJobResponse",
+    "CalculateMatchesForUserRequest",
+    "CalculateMatchesForUserResponse",
     "TopMatchesResponse",
     "RecommendedJobsResponse",
 ]
@@ -11,10 +11,12 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Numeric,
+    SmallInteger,
     String,
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship, DeclarativeBase
@@ -60,6 +62,14 @@ class Match(Base):
     is_recommended: Mapped[bool] = mapped_column(
         Boolean, server_default="false", default=False
     )
+    # sha256 of the job/resume content hashes and prompt/model versions
+    input_fingerprint: Mapped[Optional[str]] = mapped_column(
+        String(64), nullable=True
+    )
+    # Metrics this match last added to match_stats: {"job": {...}, "user": {...}}
+    stats_metrics: Mapped[Optional[dict[str, Any]]] = mapped_column(
+        JSONB, nullable=True
+    )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.current_timestamp()
@@ -77,8 +87,19 @@ class Match(Base):
 
     __table_args__ = (
         UniqueConstraint("job_id", "resume_id", name="uq_matches_job_resume"),
-        Index("ix_matches_job_id", "job_id"),
-        Index("ix_matches_user_id", "user_id"),
+        # Keyset pagination order: overall_score DESC NULLS LAST, id DESC
+        Index(
+            "ix_matches_job_score_id",
+            "job_id",
+            text("overall_score DESC NULLS LAST"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_matches_user_score_id",
+            "user_id",
+            text("overall_score DESC NULLS LAST"),
+            text("id DESC"),
+        ),
         Index("ix_matches_overall_score", "overall_score"),
     )
 
@@ -116,3 +137,29 @@ class MatchFeedback(Base):
 
     def __repr__(self) -> str:
         return f"<MatchFeedback(id={self.id}, type={self.feedback_type})>"
+
+
+class MatchStat(Base):
+    """One incrementally maintained statistic of a job's or a user's matches."""
+
+    __tablename__ = "match_stats"
+
+    scope: Mapped[str] = mapped_column(String(10), primary_key=True)
+    scope_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    # Counter name, e.g. "matches", "sum:overall_score" or "bucket:70-80"
+    metric: Mapped[str] = mapped_column(Text, primary_key=True)
+    # Writers spread a counter over shards; its value is the sum of them all
+    shard: Mapped[int] = mapped_column(
+        SmallInteger, primary_key=True, server_default="0"
+    )
+    value: Mapped[Decimal] = mapped_column(
+        Numeric(precision=20, scale=4), nullable=False, server_default="0"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        server_default=func.current_timestamp(),
+        onupdate=func.current_timestamp(),
+    )
+
+    def __repr__(self) -> str:
+        return f"<MatchStat({self.scope}:{self.scope_id} {self.metric}={self.value})>"
@@ -19,6 +19,46 @@ class FeedbackType(str, Enum):
     INTERVIEWING = "interviewing"
 
 
+class MatchScoreStatus(str, Enum):
+    """How current a returned match score is."""
+
+    SCORED = "scored"  # Freshly scored or served from cache
+    STALE = "stale"  # Last known score; a rescore is queued
+    PENDING = "pending"  # No score yet; a rescore is queued
+
+
+class ScoringLane(str, Enum):
+    """Priority lanes of the scoring work queue."""
+
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+    BACKFILL = "backfill"
+
+
+class ScoringTaskStatus(str, Enum):
+    """Lifecycle of a queued scoring task."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class StatsScope(str, Enum):
+    """Owners that match statistics are kept for."""
+
+    JOB = "job"
+    USER = "user"
+
+
+class MatchSortField(str, Enum):
+    """Columns a match listing can be ordered by."""
+
+    OVERALL_SCORE = "overall_score"
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+
+
 # Base schemas
 class MatchBase(BaseModel):
     """Base schema for match data."""
@@ -58,6 +98,20 @@ class MatchUpdate(BaseModel):
     is_recommended: Optional[bool] = None
 
 
+class MatchListFilter(BaseModel):
+    """Filters and order of a match listing; unset filters match every row."""
+
+    job_id: Optional[UUID] = None
+    resume_id: Optional[UUID] = None
+    user_id: Optional[UUID] = None
+    min_score: Optional[Decimal] = Field(None, ge=0, le=100)
+    max_score: Optional[Decimal] = Field(None, ge=0, le=100)
+    is_recommended: Optional[bool] = None
+    scored: Optional[bool] = None  # False lists matches still awaiting a score
+    sort_by: MatchSortField = MatchSortField.OVERALL_SCORE
+    descending: bool = True
+
+
 class MatchScoreRequest(BaseModel):
     """Request schema for calculating match score."""
 
@@ -67,6 +121,47 @@ class MatchScoreRequest(BaseModel):
     force_recalculate: bool = False
 
 
+class MatchScorePair(BaseModel):
+    """Single job-resume pair in a batch score request."""
+
+    job_id: UUID
+    resume_id: UUID
+    user_id: UUID
+
+
+class BatchMatchScoreRequest(BaseModel):
+    """Request schema for scoring many job-resume pairs at once."""
+
+    pairs: list[MatchScorePair] = Field(..., min_length=1)
+    force_recalculate: bool = False
+
+
+class ScoringTaskSubmitRequest(BaseModel):
+    """Request schema for queueing job-resume pairs for scoring."""
+
+    pairs: list[MatchScorePair] = Field(..., min_length=1)
+    lane: ScoringLane = ScoringLane.INTERACTIVE
+    force_recalculate: bool = False
+
+
+class CalculateMatchesForJobRequest(BaseModel):
+    """Request schema for scoring a job against its shortlisted candidates."""
+
+    limit: Optional[int] = Field(None, ge=1, le=1000)
+    min_score_threshold: float = Field(0, ge=0, le=100)
+    force_recalculate: bool = False
+    required_skills: Optional[list[str]] = None
+
+
+class CalculateMatchesForUserRequest(BaseModel):
+    """Request schema for computing job recommendations for a user."""
+
+    resume_id: Optional[UUID] = None  # Defaults to the primary resume
+    limit: Optional[int] = Field(None, ge=1, le=500)
+    min_score_threshold: float = Field(0, ge=0, le=100)
+    force_recalculate: bool = False
+
+
 class MatchFeedbackCreate(BaseModel):
     """Schema for creating match feedback."""
 
@@ -104,26 +199,75 @@ class MatchListResponse(BaseModel):
     """Response schema for list of matches."""
 
     items: list[MatchResponse]
-    total: int
-    page: int
+    total: Optional[int]  # None when the count was not requested
+    page: Optional[int]  # None when paging by cursor
     page_size: int
-    pages: int
+    pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class MatchScoreResponse(BaseModel):
-    """Response schema for match score calculation."""
+    """Response schema for match score calculation.
 
-    match_id: UUID
+    Scores and ``match_id`` are None only while ``status`` is pending.
+    """
+
+    match_id: Optional[UUID]
     job_id: UUID
     resume_id: UUID
-    overall_score: Decimal
-    skill_score: Decimal
-    experience_score: Decimal
-    culture_score: Decimal
+    overall_score: Optional[Decimal]
+    skill_score: Optional[Decimal]
+    experience_score: Optional[Decimal]
+    culture_score: Optional[Decimal]
     score_breakdown: dict[str, Any]
     ai_reasoning: str
     is_recommended: bool
     is_cached: bool = False
+    status: MatchScoreStatus = MatchScoreStatus.SCORED
+
+
+class BatchMatchScoreItem(BaseModel):
+    """Per-pair result streamed back from a batch score request."""
+
+    job_id: UUID
+    resume_id: UUID
+    result: Optional[MatchScoreResponse] = None
+    error: Optional[str] = None
+
+
+class ScoringTaskResponse(BaseModel):
+    """Status of a queued scoring task, with its result once done."""
+
+    task_id: UUID
+    lane: ScoringLane
+    status: ScoringTaskStatus
+    job_id: UUID
+    resume_id: UUID
+    result: Optional[MatchScoreResponse] = None
+    error: Optional[str] = None
+
+
+class CalculateMatchesForJobResponse(BaseModel):
+    """Response schema for job-level match calculation."""
+
+    job_id: UUID
+    matches: list[MatchScoreResponse]
+    total_processed: int
+    total_qualified: int
+    # Candidates queued on the bulk lane; their scores arrive through the tasks
+    tasks: list[ScoringTaskResponse] = Field(default_factory=list)
+
+
+class CalculateMatchesForUserResponse(BaseModel):
+    """Response schema for user-level match calculation."""
+
+    user_id: UUID
+    resume_id: Optional[UUID]
+    matches: list[MatchScoreResponse]
+    total_processed: int
+    total_qualified: int
+    total_rescored: int  # Stale pairs queued on the bulk lane for rescoring
+    tasks: list[ScoringTaskResponse] = Field(default_factory=list)
 
 
 class TopMatchItem(BaseModel):
@@ -156,6 +300,31 @@ class RecommendedJobsResponse(BaseModel):
     total: int
 
 
+class MatchStatsResponse(BaseModel):
+    """Aggregated match statistics for a job or a user."""
+
+    scope: StatsScope
+    scope_id: UUID
+    total_matches: int
+    average_overall_score: Optional[float] = None
+    average_skill_score: Optional[float] = None
+    average_experience_score: Optional[float] = None
+    average_culture_score: Optional[float] = None
+    recommended_count: int
+    score_distribution: dict[str, int]  # Overall score range -> count
+    feedback_distribution: dict[str, int]  # Feedback type -> count
+
+
+class MatchingInsightsResponse(BaseModel):
+    """Skill and experience insights across the matches of a job."""
+
+    job_id: UUID
+    most_common_skill_gaps: list[str]
+    most_matched_skills: list[str]
+    average_experience_gap: Optional[float] = None
+    recommendation: str
+
+
 class HealthResponse(BaseModel):
     """Response schema for health check."""
 
@@ -1,14 +1,213 @@
 """Repository for match database operations."""
 
-from typing import Optional
+import random
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select, delete
+from sqlalchemy import (
+    ColumnElement,
+    FromClause,
+    Numeric,
+    Row,
+    Select,
+    SmallInteger,
+    cast,
+    delete,
+    exists,
+    func,
+    literal,
+    select,
+    true,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import Insert, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
-from app.models.match import Match, MatchFeedback
-from app.models.schemas import MatchCreate, MatchUpdate, MatchFeedbackCreate
+from app.models.match import Match, MatchFeedback, MatchStat
+from app.models.schemas import (
+    FeedbackType,
+    MatchCreate,
+    MatchListFilter,
+    MatchUpdate,
+    MatchFeedbackCreate,
+    StatsScope,
+)
+from app.core.config import settings
+from app.core.match_stats import (
+    SCORE_COLUMNS,
+    StatsDeltas,
+    add_contribution,
+    add_feedback,
+    match_contribution,
+)
+
+# Position of the last row on a page: (overall_score, id)
+KeysetPosition = tuple[Optional[Decimal], UUID]
+
+# Scalar columns served by list endpoints; feedbacks load only for detail reads
+LIST_COLUMNS = (
+    Match.id,
+    Match.job_id,
+    Match.resume_id,
+    Match.user_id,
+    Match.overall_score,
+    Match.skill_score,
+    Match.experience_score,
+    Match.culture_score,
+    Match.score_breakdown,
+    Match.ai_reasoning,
+    Match.is_recommended,
+    Match.created_at,
+    Match.updated_at,
+)
+
+# Columns a match's contribution to its job and user statistics derives from
+STATS_COLUMNS = (
+    Match.job_id,
+    Match.resume_id,
+    Match.user_id,
+    Match.overall_score,
+    Match.skill_score,
+    Match.experience_score,
+    Match.culture_score,
+    Match.score_breakdown,
+    Match.is_recommended,
+)
+
+# Statistic rows per upsert statement, well under the bind parameter limit
+STATS_WRITE_SIZE = 5000
+
+# Score upsert statements per batch before giving up on pairs that keep
+# being inserted concurrently
+UPSERT_ATTEMPTS = 3
+
+# Scale of the score columns
+SCORE_QUANTUM = Decimal("0.01")
+
+
+def _stats_fields(match: Match) -> dict[str, Any]:
+    """Get the statistics columns of a loaded match."""
+    return {column.key: getattr(match, column.key) for column in STATS_COLUMNS}
+
+
+def _rounded_scores(values: dict[str, Any]) -> dict[str, Any]:
+    """Round score columns as Postgres stores them, so counted equals stored."""
+    return {
+        key: (
+            Decimal(str(value)).quantize(SCORE_QUANTUM, ROUND_HALF_UP)
+            if key in SCORE_COLUMNS and value is not None
+            else value
+        )
+        for key, value in values.items()
+    }
+
+
+def _contribution_rows(
+    source: FromClause, columns: Any, sign: int
+) -> list[Select[Any]]:
+    """Select the stored contributions of rows as (scope, scope_id, metric, value)."""
+    selects = []
+    for scope, scope_id in (
+        (StatsScope.JOB, columns.job_id),
+        (StatsScope.USER, columns.user_id),
+    ):
+        entry = (
+            func.jsonb_each_text(columns.stats_metrics[scope.value])
+            .table_valued("key", "value")
+            .lateral()
+        )
+        selects.append(
+            select(
+                literal(scope.value).label("scope"),
+                scope_id.label("scope_id"),
+                entry.c.key.label("metric"),
+                (cast(entry.c.value, Numeric) * sign).label("value"),
+            )
+            .select_from(source)
+            .join(entry, true())
+        )
+    return selects
+
+
+def _add_to_stats(stmt: Insert) -> Insert:
+    """Make an insert of statistic rows add onto the existing counters."""
+    return stmt.on_conflict_do_update(
+        index_elements=[
+            MatchStat.scope,
+            MatchStat.scope_id,
+            MatchStat.metric,
+            MatchStat.shard,
+        ],
+        set_={
+            "value": MatchStat.value + stmt.excluded.value,
+            "updated_at": func.current_timestamp(),
+        },
+    )
+
+
+def _order_by_score(stmt: Select[Any]) -> Select[Any]:
+    """Order by score then id.
+
+    The ``(owner, overall_score DESC NULLS LAST, id DESC)`` indexes return
+    rows in this order, so pages are read without a sort.
+    """
+    return stmt.order_by(Match.overall_score.desc().nulls_last(), Match.id.desc())
+
+
+def _after_scored(stmt: Select[Any], score: Decimal, match_id: UUID) -> Select[Any]:
+    """Resume among scored rows, after the row at (score, id)."""
+    return stmt.where(tuple_(Match.overall_score, Match.id) < tuple_(score, match_id))
+
+
+def _after_unscored(stmt: Select[Any], match_id: Optional[UUID] = None) -> Select[Any]:
+    """Resume among unscored rows, after ``match_id`` or from the first one."""
+    stmt = stmt.where(Match.overall_score.is_(None))
+    if match_id is not None:
+        stmt = stmt.where(Match.id < match_id)
+    return stmt
+
+
+def _list_conditions(filters: MatchListFilter) -> list[ColumnElement[bool]]:
+    """Build the conditions of a filtered match listing."""
+    conditions = []
+    if filters.job_id is not None:
+        conditions.append(Match.job_id == filters.job_id)
+    if filters.resume_id is not None:
+        conditions.append(Match.resume_id == filters.resume_id)
+    if filters.user_id is not None:
+        conditions.append(Match.user_id == filters.user_id)
+    if filters.min_score is not None:
+        conditions.append(Match.overall_score >= filters.min_score)
+    if filters.max_score is not None:
+        conditions.append(Match.overall_score <= filters.max_score)
+    if filters.is_recommended is not None:
+        conditions.append(Match.is_recommended == filters.is_recommended)
+    if filters.scored is not None:
+        conditions.append(
+            Match.overall_score.is_not(None)
+            if filters.scored
+            else Match.overall_score.is_(None)
+        )
+    return conditions
+
+
+def _feedback_conditions(
+    match_id: Optional[UUID],
+    feedback_by: Optional[UUID],
+    feedback_type: Optional[FeedbackType],
+) -> list[ColumnElement[bool]]:
+    """Build the conditions of a filtered feedback listing."""
+    conditions = []
+    if match_id is not None:
+        conditions.append(MatchFeedback.match_id == match_id)
+    if feedback_by is not None:
+        conditions.append(MatchFeedback.feedback_by == feedback_by)
+    if feedback_type is not None:
+        conditions.append(MatchFeedback.feedback_type == feedback_type.value)
+    return conditions
 
 
 class MatchRepository:
@@ -16,6 +215,9 @@ class MatchRepository:
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
+        # Statistics this repository writes go to one shard of each counter,
+        # so concurrent transactions on a popular job rarely wait on each other
+        self.stats_shard = random.randrange(settings.match_stats_shards)
 
     async def create(self, data: MatchCreate) -> Match:
         """Create a new match record."""
@@ -24,9 +226,14 @@ class MatchRepository:
             resume_id=data.resume_id,
             user_id=data.user_id,
         )
+        match.stats_metrics = match_contribution(_stats_fields(match))
         self.session.add(match)
         await self.session.flush()
         await self.session.refresh(match)
+
+        deltas: StatsDeltas = {}
+        add_contribution(deltas, match.job_id, match.user_id, match.stats_metrics)
+        await self._apply_stats(deltas)
         return match
 
     async def get_by_id(self, match_id: UUID) -> Optional[Match]:
@@ -57,18 +264,28 @@ class MatchRepository:
         limit: int = 100,
         offset: int = 0,
         min_score: Optional[float] = None,
-    ) -> list[Match]:
-        """Get all matches for a job, ordered by score."""
-        stmt = (
-            select(Match)
-            .options(selectinload(Match.feedbacks))
-            .where(Match.job_id == job_id)
-        )
+        after: Optional[KeysetPosition] = None,
+    ) -> list[Row[Any]]:
+        """Get all matches for a job as column rows, ordered by score."""
+        stmt = select(*LIST_COLUMNS).where(Match.job_id == job_id)
         if min_score is not None:
             stmt = stmt.where(Match.overall_score >= min_score)
-        stmt = stmt.order_by(Match.overall_score.desc()).offset(offset).limit(limit)
+        return await self._score_page(
+            stmt, limit, offset, after, include_unscored=min_score is None
+        )
+
+    async def get_job_ranking(
+        self, job_id: UUID, limit: int = 10
+    ) -> list[tuple[UUID, Decimal]]:
+        """Get the top (resume_id, overall_score) pairs for a job."""
+        stmt = (
+            select(Match.resume_id, Match.overall_score)
+            .where(Match.job_id == job_id, Match.overall_score.is_not(None))
+            .order_by(Match.overall_score.desc(), Match.id.desc())
+            .limit(limit)
+        )
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.tuples().all())
 
     async def get_by_user_id(
         self,
@@ -76,33 +293,120 @@ class MatchRepository:
         limit: int = 100,
         offset: int = 0,
         recommended_only: bool = False,
-    ) -> list[Match]:
-        """Get all matches for a user."""
-        stmt = (
-            select(Match)
-            .options(selectinload(Match.feedbacks))
-            .where(Match.user_id == user_id)
-        )
+        after: Optional[KeysetPosition] = None,
+    ) -> list[Row[Any]]:
+        """Get all matches for a user as column rows, ordered by score."""
+        stmt = select(*LIST_COLUMNS).where(Match.user_id == user_id)
         if recommended_only:
             stmt = stmt.where(Match.is_recommended == True)
-        stmt = stmt.order_by(Match.overall_score.desc()).offset(offset).limit(limit)
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return await self._score_page(stmt, limit, offset, after)
+
+    async def _score_page(
+        self,
+        stmt: Select[Any],
+        limit: int,
+        offset: int = 0,
+        after: Optional[KeysetPosition] = None,
+        include_unscored: bool = True,
+    ) -> list[Row[Any]]:
+        """Read a page of rows in score order, by offset or after a keyset position.
+
+        A keyset page seeks in two phases, each an index range scan: scored
+        rows after the position, then, once those run out, unscored rows.
+        A single predicate covering both would have to OR the two ranges,
+        which Postgres can only filter row by row from the start of the owner.
+        """
+        if after is None:
+            result = await self.session.execute(
+                _order_by_score(stmt).offset(offset).limit(limit)
+            )
+            return list(result.all())
+
+        match_id: Optional[UUID]
+        score, match_id = after
+        rows: list[Row[Any]] = []
+        if score is not None:
+            result = await self.session.execute(
+                _order_by_score(_after_scored(stmt, score, match_id)).limit(limit)
+            )
+            rows = list(result.all())
+            if len(rows) == limit or not include_unscored:
+                return rows
+            # The scored rows ran out on this page; continue from the first
+            # unscored one
+            match_id = None
+
+        result = await self.session.execute(
+            _order_by_score(_after_unscored(stmt, match_id)).limit(limit - len(rows))
+        )
+        return rows + list(result.all())
 
     async def get_recommended_for_user(
         self, user_id: UUID, limit: int = 10
-    ) -> list[Match]:
-        """Get recommended matches for a user."""
+    ) -> list[tuple[UUID, Decimal]]:
+        """Get the top recommended (job_id, overall_score) pairs for a user."""
         stmt = (
-            select(Match)
-            .options(selectinload(Match.feedbacks))
-            .where(Match.user_id == user_id, Match.is_recommended == True)
-            .order_by(Match.overall_score.desc())
+            select(Match.job_id, Match.overall_score)
+            .where(
+                Match.user_id == user_id,
+                Match.is_recommended == True,
+                Match.overall_score.is_not(None),
+            )
+            .order_by(Match.overall_score.desc(), Match.id.desc())
             .limit(limit)
         )
         result = await self.session.execute(stmt)
+        return list(result.tuples().all())
+
+    async def get_by_resume_and_job_ids(
+        self, resume_id: UUID, job_ids: list[UUID]
+    ) -> list[Match]:
+        """Get existing matches between a resume and a set of jobs."""
+        if not job_ids:
+            return []
+        stmt = select(Match).where(
+            Match.resume_id == resume_id, Match.job_id.in_(job_ids)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_by_pairs(self, pairs: list[tuple[UUID, UUID]]) -> list[Match]:
+        """Get existing matches for a set of (job_id, resume_id) pairs."""
+        if not pairs:
+            return []
+        stmt = select(Match).where(tuple_(Match.job_id, Match.resume_id).in_(pairs))
+        result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_matches(
+        self, filters: MatchListFilter, limit: int = 100, offset: int = 0
+    ) -> list[Row[Any]]:
+        """List filtered matches as column rows, in the requested order.
+
+        Ties break on id in the same direction, so with the default order a
+        job's or user's listing reads its score index without a sort.
+        """
+        column = getattr(Match, filters.sort_by.value)
+        if filters.descending:
+            order = (column.desc().nulls_last(), Match.id.desc())
+        else:
+            order = (column.asc().nulls_last(), Match.id)
+        stmt = (
+            select(*LIST_COLUMNS)
+            .where(*_list_conditions(filters))
+            .order_by(*order)
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def count_matches(self, filters: MatchListFilter) -> int:
+        """Count filtered matches."""
+        stmt = select(func.count(Match.id)).where(*_list_conditions(filters))
+        result = await self.session.execute(stmt)
+        return result.scalar() or 0
+
     async def count_by_job_id(
         self, job_id: UUID, min_score: Optional[float] = None
     ) -> int:
@@ -129,31 +433,174 @@ class MatchRepository:
         if not match:
             return None
 
-        update_data = data.model_dump(exclude_unset=True)
+        # Lock the row so the statistics delta is taken from current values
+        await self.session.refresh(match, with_for_update=True)
+        deltas: StatsDeltas = {}
+        add_contribution(deltas, match.job_id, match.user_id, match.stats_metrics, -1)
+
+        update_data = _rounded_scores(data.model_dump(exclude_unset=True))
         for field, value in update_data.items():
             setattr(match, field, value)
+        match.stats_metrics = match_contribution(_stats_fields(match))
+        add_contribution(deltas, match.job_id, match.user_id, match.stats_metrics)
 
         await self.session.flush()
         await self.session.refresh(match)
+        await self._apply_stats(deltas)
         return match
 
+    async def upsert_score(self, row: dict[str, Any]) -> Match:
+        """Insert or update one scored match in a single round trip.
+
+        The statistics update rides in the same statement; see
+        ``bulk_upsert_scores``.
+        """
+        matches = await self.bulk_upsert_scores([row])
+        return matches[0]
+
+    async def bulk_upsert_scores(self, rows: list[dict[str, Any]]) -> list[Match]:
+        """Insert or update scored matches and their statistics in one statement.
+
+        Each row carries job_id, resume_id, user_id, the score columns and
+        input_fingerprint.
+        Conflicts on ``uq_matches_job_resume`` overwrite the scores in place.
+        Rows must be unique per (job_id, resume_id).
+
+        Each match stores the metrics it contributes, and the statement moves
+        the job and user statistics by the new contributions minus the stored
+        ones it overwrites. A pair another transaction inserts after the
+        statement started has no stored contribution visible to it, so that
+        row is left alone and written again by a second statement.
+        """
+        if not rows:
+            return []
+
+        # New pairs are inserted in one order, so overlapping batches of two
+        # writers cannot deadlock
+        pending = sorted(
+            (_rounded_scores(row) for row in rows),
+            key=lambda row: (row["job_id"], row["resume_id"]),
+        )
+        for row in pending:
+            row["stats_metrics"] = match_contribution(row)
+
+        matches: list[Match] = []
+        for _ in range(UPSERT_ATTEMPTS):
+            written = await self._upsert_scores(pending)
+            matches.extend(written)
+            done = {(match.job_id, match.resume_id) for match in written}
+            pending = [
+                row for row in pending if (row["job_id"], row["resume_id"]) not in done
+            ]
+            if not pending:
+                return matches
+        raise RuntimeError(
+            f"{len(pending)} matches were inserted concurrently on every attempt"
+        )
+
+    async def _upsert_scores(self, rows: list[dict[str, Any]]) -> list[Match]:
+        """Run one score upsert; rows inserted concurrently are not returned."""
+        pairs = [(row["job_id"], row["resume_id"]) for row in rows]
+        # Lock the existing rows in id order and read their stored contribution
+        old = (
+            select(Match.id, Match.job_id, Match.user_id, Match.stats_metrics)
+            .where(tuple_(Match.job_id, Match.resume_id).in_(pairs))
+            .order_by(Match.id)
+            .with_for_update()
+            .cte("old")
+        )
+
+        insert = pg_insert(Match).values(rows)
+        upserted = (
+            insert.on_conflict_do_update(
+                constraint="uq_matches_job_resume",
+                set_={
+                    "overall_score": insert.excluded.overall_score,
+                    "skill_score": insert.excluded.skill_score,
+                    "experience_score": insert.excluded.experience_score,
+                    "culture_score": insert.excluded.culture_score,
+                    "score_breakdown": insert.excluded.score_breakdown,
+                    "ai_reasoning": insert.excluded.ai_reasoning,
+                    "is_recommended": insert.excluded.is_recommended,
+                    "input_fingerprint": insert.excluded.input_fingerprint,
+                    "stats_metrics": insert.excluded.stats_metrics,
+                    "updated_at": func.current_timestamp(),
+                },
+                # Only rows whose old contribution is taken out below
+                where=exists().where(old.c.id == Match.id),
+            )
+            .returning(*Match.__table__.columns)
+            .cte("upserted")
+        )
+
+        deltas = union_all(
+            *_contribution_rows(upserted, upserted.c, 1),
+            *_contribution_rows(
+                old.join(upserted, upserted.c.id == old.c.id), old.c, -1
+            ),
+        ).subquery("deltas")
+        total = func.sum(deltas.c.value)
+        keys = (deltas.c.scope, deltas.c.scope_id, deltas.c.metric)
+        stats = _add_to_stats(
+            pg_insert(MatchStat).from_select(
+                ["scope", "scope_id", "metric", "shard", "value"],
+                select(*keys, literal(self.stats_shard, SmallInteger), total)
+                .group_by(*keys)
+                .having(total != 0)
+                # Same lock order as _apply_stats
+                .order_by(*keys),
+            )
+        )
+
+        stmt = select(aliased(Match, upserted)).add_cte(stats.cte("stats"))
+        result = await self.session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        return list(result.scalars().all())
+
     async def delete(self, match_id: UUID) -> bool:
         """Delete a match record."""
-        stmt = delete(Match).where(Match.id == match_id)
-        result = await self.session.execute(stmt)
-        return result.rowcount > 0
+        return await self._delete_matches(Match.id == match_id) > 0
 
     async def delete_by_job_id(self, job_id: UUID) -> int:
         """Delete all matches for a job."""
-        stmt = delete(Match).where(Match.job_id == job_id)
-        result = await self.session.execute(stmt)
-        return result.rowcount
+        return await self._delete_matches(Match.job_id == job_id)
 
     async def delete_by_resume_id(self, resume_id: UUID) -> int:
         """Delete all matches for a resume."""
-        stmt = delete(Match).where(Match.resume_id == resume_id)
+        return await self._delete_matches(Match.resume_id == resume_id)
+
+    async def _delete_matches(self, condition: ColumnElement[bool]) -> int:
+        """Delete matches and take them and their feedback out of the statistics."""
+        deltas: StatsDeltas = {}
+        # Feedback goes with its match through ON DELETE CASCADE
+        feedback_stmt = (
+            select(
+                Match.job_id,
+                Match.user_id,
+                MatchFeedback.feedback_type,
+                func.count(MatchFeedback.id),
+            )
+            .join(MatchFeedback, MatchFeedback.match_id == Match.id)
+            .where(condition)
+            .group_by(Match.job_id, Match.user_id, MatchFeedback.feedback_type)
+        )
+        for job_id, user_id, feedback_type, count in (
+            await self.session.execute(feedback_stmt)
+        ).all():
+            add_feedback(deltas, job_id, user_id, feedback_type, -count)
+
+        stmt = (
+            delete(Match)
+            .where(condition)
+            .returning(Match.job_id, Match.user_id, Match.stats_metrics)
+        )
         result = await self.session.execute(stmt)
-        return result.rowcount
+        deleted = result.all()
+        for row in deleted:
+            add_contribution(deltas, row.job_id, row.user_id, row.stats_metrics, -1)
+        await self._apply_stats(deltas)
+        return len(deleted)
 
     # Feedback operations
     async def create_feedback(self, data: MatchFeedbackCreate) -> MatchFeedback:
@@ -166,6 +613,7 @@ class MatchRepository:
         self.session.add(feedback)
         await self.session.flush()
         await self.session.refresh(feedback)
+        await self._apply_feedback_stats(feedback.match_id, feedback.feedback_type, 1)
         return feedback
 
     async def get_feedback_by_match_id(self, match_id: UUID) -> list[MatchFeedback]:
@@ -178,8 +626,102 @@ class MatchRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_feedback_by_id(self, feedback_id: UUID) -> Optional[MatchFeedback]:
+        """Get a feedback record by its ID."""
+        result = await self.session.execute(
+            select(MatchFeedback).where(MatchFeedback.id == feedback_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def list_feedback(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        match_id: Optional[UUID] = None,
+        feedback_by: Optional[UUID] = None,
+        feedback_type: Optional[FeedbackType] = None,
+    ) -> list[MatchFeedback]:
+        """List filtered feedback, newest first."""
+        stmt = (
+            select(MatchFeedback)
+            .where(*_feedback_conditions(match_id, feedback_by, feedback_type))
+            .order_by(MatchFeedback.created_at.desc(), MatchFeedback.id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def count_feedback(
+        self,
+        match_id: Optional[UUID] = None,
+        feedback_by: Optional[UUID] = None,
+        feedback_type: Optional[FeedbackType] = None,
+    ) -> int:
+        """Count filtered feedback."""
+        stmt = select(func.count(MatchFeedback.id)).where(
+            *_feedback_conditions(match_id, feedback_by, feedback_type)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar() or 0
+
     async def delete_feedback(self, feedback_id: UUID) -> bool:
         """Delete a feedback record."""
-        stmt = delete(MatchFeedback).where(MatchFeedback.id == feedback_id)
+        stmt = (
+            delete(MatchFeedback)
+            .where(MatchFeedback.id == feedback_id)
+            .returning(MatchFeedback.match_id, MatchFeedback.feedback_type)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return False
+        await self._apply_feedback_stats(row.match_id, row.feedback_type, -1)
+        return True
+
+    # Statistics
+    async def get_stats(self, scope: StatsScope, scope_id: UUID) -> dict[str, Decimal]:
+        """Get the statistics of a job or a user as metric -> value."""
+        stmt = (
+            select(MatchStat.metric, func.sum(MatchStat.value))
+            .where(MatchStat.scope == scope.value, MatchStat.scope_id == scope_id)
+            .group_by(MatchStat.metric)
+        )
         result = await self.session.execute(stmt)
-        return result.rowcount > 0
+        return {metric: value for metric, value in result.tuples().all() if value}
+
+    async def _apply_feedback_stats(
+        self, match_id: Optional[UUID], feedback_type: Optional[str], count: int
+    ) -> None:
+        """Count feedback on a match towards its job and user statistics."""
+        if match_id is None:
+            return
+        stmt = select(Match.job_id, Match.user_id).where(Match.id == match_id)
+        owner = (await self.session.execute(stmt)).one_or_none()
+        if owner is None:
+            return
+        deltas: StatsDeltas = {}
+        add_feedback(deltas, owner.job_id, owner.user_id, feedback_type, count)
+        await self._apply_stats(deltas)
+
+    async def _apply_stats(self, deltas: StatsDeltas) -> None:
+        """Add statistic deltas with one upsert per ``STATS_WRITE_SIZE`` rows.
+
+        Rows are written in key order so concurrent writers lock shared
+        statistic rows in the same order.
+        """
+        rows = [
+            {
+                "scope": scope.value,
+                "scope_id": scope_id,
+                "metric": metric,
+                "shard": self.stats_shard,
+                "value": value,
+            }
+            for (scope, scope_id), metrics in sorted(deltas.items())
+            for metric, value in sorted(metrics.items())
+            if value
+        ]
+        for start in range(0, len(rows), STATS_WRITE_SIZE):
+            stmt = pg_insert(MatchStat).values(rows[start : start + STATS_WRITE_SIZE])
+            await self.session.execute(_add_to_stats(stmt))
@@ -1,31 +1,101 @@
 """Business logic for match service."""
 
+import asyncio
+import base64
+import json
 import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Optional
-from uuid import UUID
+from typing import Any, NamedTuple, Optional
+from uuid import UUID, uuid4
 
 import httpx
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ai_circuit_breaker,
+)
 from app.core.config import settings
+from app.core.fingerprint import content_hash, input_fingerprint
+from app.core.match_stats import average, most_common, prefixed
+from app.core.database import AsyncSessionLocal
+from app.core.http import HttpClient, http_client
+from app.core.local_cache import LocalCache
 from app.core.redis import RedisClient
-from app.models.match import Match
+from app.core.singleflight import single_flight
+from app.models.match import Match, MatchFeedback
 from app.models.schemas import (
+    BatchMatchScoreItem,
+    BatchMatchScoreRequest,
+    CalculateMatchesForJobRequest,
+    CalculateMatchesForJobResponse,
+    CalculateMatchesForUserRequest,
+    CalculateMatchesForUserResponse,
+    FeedbackType,
     MatchCreate,
+    MatchListFilter,
     MatchUpdate,
+    MatchScorePair,
     MatchScoreRequest,
     MatchScoreResponse,
+    MatchScoreStatus,
+    MatchStatsResponse,
+    MatchingInsightsResponse,
     MatchFeedbackCreate,
     TopMatchesResponse,
     TopMatchItem,
     RecommendedJobsResponse,
     RecommendedJobItem,
+    ScoringLane,
+    ScoringTaskResponse,
+    ScoringTaskStatus,
+    StatsScope,
 )
-from app.repositories.match_repository import MatchRepository
+from app.repositories.match_repository import KeysetPosition, MatchRepository
+from app.services.prescorer import PreScore, job_requirements, prescore, resume_profile
+from app.services.skill_index import ResumeSkillIndex
+from app.services.skill_index import skill_index as global_skill_index
 
 logger = logging.getLogger(__name__)
 
+# Error of a batch item whose score was deferred; a rescore is queued
+DEFERRED_SCORE_ERROR = "AI service unavailable; rescore queued"
+
+# Background cache refreshes by lease key; holding the task keeps it alive
+_refresh_tasks: dict[str, asyncio.Task[None]] = {}
+
+# Job documents by job id, so a shortlist and the scoring of its candidates
+# in this process fetch the job once
+_job_documents = LocalCache(
+    settings.job_document_cache_max_entries, settings.job_document_cache_ttl
+)
+
+
+class ScoringInput(NamedTuple):
+    """What is known about a pair's inputs before any AI call."""
+
+    fingerprint: Optional[str]
+    prescore: Optional[PreScore]
+
+    @property
+    def below_gate(self) -> bool:
+        """Check whether the pair pre-scores too low to be worth an AI call."""
+        return (
+            self.prescore is not None
+            and self.prescore.overall_score < settings.match_prescore_gate
+        )
+
+
+def _is_unavailable(error: httpx.HTTPError) -> bool:
+    """Check whether a failed call means the service is down, not the request bad."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return True
+
 
 class MatchService:
     """Service for match-related business logic."""
@@ -34,9 +104,15 @@ class MatchService:
         self,
         session: AsyncSession,
         redis: RedisClient,
+        http: Optional[HttpClient] = None,
+        ai_breaker: Optional[CircuitBreaker] = None,
+        skill_index: Optional[ResumeSkillIndex] = None,
     ) -> None:
         self.repository = MatchRepository(session)
         self.redis = redis
+        self.http = http or http_client
+        self.ai_breaker = ai_breaker or ai_circuit_breaker
+        self.skill_index = skill_index or global_skill_index
         self.session = session
 
     async def create_match(self, data: MatchCreate) -> Match:
@@ -59,14 +135,35 @@ class MatchService:
         page: int = 1,
         page_size: int = 20,
         min_score: Optional[float] = None,
-    ) -> tuple[list[Match], int]:
-        """Get matches for a job with pagination."""
-        offset = (page - 1) * page_size
-        matches = await self.repository.get_by_job_id(
-            job_id, limit=page_size, offset=offset, min_score=min_score
-        )
-        total = await self.repository.count_by_job_id(job_id, min_score=min_score)
-        return matches, total
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> tuple[list[Row[Any]], Optional[int], Optional[str]]:
+        """Get matches for a job with pagination.
+
+        Pages by ``cursor`` when one is given, otherwise by ``page``. Returns
+        the matches, the total (or None when not requested) and the cursor
+        of the next page.
+        """
+        if cursor is not None:
+            matches = await self.repository.get_by_job_id(
+                job_id,
+                limit=page_size,
+                min_score=min_score,
+                after=self._decode_cursor(cursor),
+            )
+        else:
+            offset = (page - 1) * page_size
+            matches = await self.repository.get_by_job_id(
+                job_id, limit=page_size, offset=offset, min_score=min_score
+            )
+
+        total = None
+        if include_total:
+            total = await self._cached_count(
+                f"job:{job_id}:{min_score}",
+                lambda: self.repository.count_by_job_id(job_id, min_score=min_score),
+            )
+        return matches, total, self._next_cursor(matches, page_size)
 
     async def get_matches_for_user(
         self,
@@ -74,20 +171,79 @@ class MatchService:
         page: int = 1,
         page_size: int = 20,
         recommended_only: bool = False,
-    ) -> tuple[list[Match], int]:
-        """Get matches for a user with pagination."""
-        offset = (page - 1) * page_size
-        matches = await self.repository.get_by_user_id(
-            user_id,
-            limit=page_size,
-            offset=offset,
-            recommended_only=recommended_only,
-        )
-        total = await self.repository.count_by_user_id(
-            user_id, recommended_only=recommended_only
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> tuple[list[Row[Any]], Optional[int], Optional[str]]:
+        """Get matches for a user with pagination.
+
+        Pages by ``cursor`` when one is given, otherwise by ``page``.
+        """
+        if cursor is not None:
+            matches = await self.repository.get_by_user_id(
+                user_id,
+                limit=page_size,
+                recommended_only=recommended_only,
+                after=self._decode_cursor(cursor),
+            )
+        else:
+            offset = (page - 1) * page_size
+            matches = await self.repository.get_by_user_id(
+                user_id,
+                limit=page_size,
+                offset=offset,
+                recommended_only=recommended_only,
+            )
+
+        total = None
+        if include_total:
+            total = await self._cached_count(
+                f"user:{user_id}:{recommended_only}",
+                lambda: self.repository.count_by_user_id(
+                    user_id, recommended_only=recommended_only
+                ),
+            )
+        return matches, total, self._next_cursor(matches, page_size)
+
+    async def list_matches(
+        self, filters: MatchListFilter, page: int = 1, page_size: int = 20
+    ) -> tuple[list[Row[Any]], int]:
+        """List matches by any combination of filters, with the total."""
+        matches = await self.repository.list_matches(
+            filters, limit=page_size, offset=(page - 1) * page_size
         )
+        total = await self.repository.count_matches(filters)
         return matches, total
 
+    async def _cached_count(
+        self, scope: str, count: Callable[[], Awaitable[int]]
+    ) -> int:
+        """Get a listing total from Redis, counting in the database on a miss."""
+        total = await self.redis.get_match_count(scope)
+        if total is None:
+            total = await count()
+            await self.redis.set_match_count(scope, total)
+        return total
+
+    @staticmethod
+    def _next_cursor(matches: list[Row[Any]], page_size: int) -> Optional[str]:
+        """Encode the position after the last match of a full page."""
+        if len(matches) < page_size:
+            return None
+        last = matches[-1]
+        score = str(last.overall_score) if last.overall_score is not None else None
+        payload = json.dumps([score, str(last.id)]).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> KeysetPosition:
+        """Decode an opaque page cursor; raise ValueError if it is malformed."""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            score, match_id = json.loads(base64.urlsafe_b64decode(padded))
+            return (Decimal(score) if score is not None else None, UUID(match_id))
+        except (ValueError, TypeError, ArithmeticError) as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+
     async def update_match(
         self, match_id: UUID, data: MatchUpdate
     ) -> Optional[Match]:
@@ -112,93 +268,534 @@ class MatchService:
         """Calculate or retrieve match score for job-resume pair."""
         # Check cache first
         if not request.force_recalculate:
-            cached = await self.redis.get_match_detail(
+            cached, stale = await self.redis.read_match_detail(
                 str(request.job_id), str(request.resume_id)
             )
             if cached:
-                return MatchScoreResponse(
-                    match_id=UUID(cached["match_id"]),
-                    job_id=request.job_id,
-                    resume_id=request.resume_id,
-                    overall_score=Decimal(str(cached["overall_score"])),
-                    skill_score=Decimal(str(cached["skill_score"])),
-                    experience_score=Decimal(str(cached["experience_score"])),
-                    culture_score=Decimal(str(cached["culture_score"])),
-                    score_breakdown=cached["score_breakdown"],
-                    ai_reasoning=cached["ai_reasoning"],
-                    is_recommended=cached["is_recommended"],
-                    is_cached=True,
+                if stale:
+                    self._refresh_in_background(
+                        f"detail:{request.job_id}:{request.resume_id}",
+                        lambda service: single_flight.do(
+                            f"{request.job_id}:{request.resume_id}",
+                            lambda: service._calculate_match_score_leased(request),
+                        ),
+                    )
+                return self._response_from_cache(
+                    cached, request.job_id, request.resume_id
                 )
 
-        # Check if match exists in database
-        existing_match = await self.repository.get_by_job_and_resume(
-            request.job_id, request.resume_id
+        # Concurrent requests for the same pair share one computation
+        return await single_flight.do(
+            f"{request.job_id}:{request.resume_id}",
+            lambda: self._calculate_match_score_leased(request),
         )
 
-        # Call AI service to calculate score
-        score_result = await self._call_ai_service(request)
+    async def _calculate_match_score_leased(
+        self, request: MatchScoreRequest
+    ) -> MatchScoreResponse:
+        """Score a pair while holding its Redis lease.
+
+        If another replica already holds the lease, wait for it to finish
+        and serve its cached result instead of calling the AI service again.
+        """
+        job_id, resume_id = str(request.job_id), str(request.resume_id)
+        token = await self.redis.acquire_score_lease(
+            job_id, resume_id, settings.match_score_lease_ms
+        )
+        if token is None:
+            cached = await self._wait_for_score_lease(job_id, resume_id)
+            if cached:
+                return self._response_from_cache(
+                    cached, request.job_id, request.resume_id
+                )
+            # The holder died or timed out without caching a score
+            token = await self.redis.acquire_score_lease(
+                job_id, resume_id, settings.match_score_lease_ms
+            )
+
+        try:
+            return await self._compute_match_score(request)
+        finally:
+            if token is not None:
+                await self.redis.release_score_lease(job_id, resume_id, token)
 
-        # Determine if recommended
-        is_recommended = float(score_result["overall_score"]) >= settings.match_recommendation_threshold
+    async def _wait_for_score_lease(
+        self, job_id: str, resume_id: str
+    ) -> Optional[Mapping[str, Any]]:
+        """Wait for another replica's lease on a pair, then read its cached score."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.match_score_wait_seconds
+        while loop.time() < deadline:
+            await asyncio.sleep(settings.match_score_poll_interval)
+            if not await self.redis.score_lease_held(job_id, resume_id):
+                return await self.redis.get_match_detail(job_id, resume_id)
+        logger.warning(f"Timed out waiting for score lease on {job_id}:{resume_id}")
+        return None
 
-        if existing_match:
-            # Update existing match
-            update_data = MatchUpdate(
-                overall_score=Decimal(str(score_result["overall_score"])),
-                skill_score=Decimal(str(score_result["skill_score"])),
-                experience_score=Decimal(str(score_result["experience_score"])),
-                culture_score=Decimal(str(score_result["culture_score"])),
-                score_breakdown=score_result["score_breakdown"],
-                ai_reasoning=score_result["ai_reasoning"],
-                is_recommended=is_recommended,
+    async def _compute_match_score(
+        self, request: MatchScoreRequest
+    ) -> MatchScoreResponse:
+        """Call the AI service for a pair and persist the result.
+
+        A stored score whose input fingerprint still matches is returned
+        without calling the AI service, and a pair that pre-scores below
+        ``match_prescore_gate`` is stored with its pre-score instead.
+        """
+        inputs = await self._prepare_inputs(
+            [
+                MatchScorePair(
+                    job_id=request.job_id,
+                    resume_id=request.resume_id,
+                    user_id=request.user_id,
+                )
+            ]
+        )
+        scoring_input = inputs[(request.job_id, request.resume_id)]
+        fingerprint = scoring_input.fingerprint
+        if fingerprint is not None:
+            match = await self.repository.get_by_job_and_resume(
+                request.job_id, request.resume_id
             )
-            match = await self.repository.update(existing_match.id, update_data)
+            if (
+                match is not None
+                and match.overall_score is not None
+                and match.input_fingerprint == fingerprint
+            ):
+                await self._update_cache(match)
+                return self._response_from_match(match)
+
+        if scoring_input.prescore is not None and scoring_input.below_gate:
+            columns = self._prescore_columns(scoring_input.prescore)
         else:
-            # Create new match
-            create_data = MatchCreate(
-                job_id=request.job_id,
-                resume_id=request.resume_id,
-                user_id=request.user_id,
-            )
-            match = await self.repository.create(create_data)
-            update_data = MatchUpdate(
-                overall_score=Decimal(str(score_result["overall_score"])),
-                skill_score=Decimal(str(score_result["skill_score"])),
-                experience_score=Decimal(str(score_result["experience_score"])),
-                culture_score=Decimal(str(score_result["culture_score"])),
-                score_breakdown=score_result["score_breakdown"],
-                ai_reasoning=score_result["ai_reasoning"],
-                is_recommended=is_recommended,
-            )
-            match = await self.repository.update(match.id, update_data)
+            # Call AI service to calculate score
+            try:
+                score_result = await self._call_ai_service(request)
+            except (CircuitOpenError, httpx.HTTPError) as e:
+                if isinstance(e, httpx.HTTPError) and not _is_unavailable(e):
+                    raise
+                logger.warning(
+                    f"Deferring score for job {request.job_id} "
+                    f"resume {request.resume_id}: {e}"
+                )
+                return await self._degraded_score(request)
+            columns = self._score_columns(score_result, scoring_input.prescore)
 
-        if match is None:
-            raise RuntimeError("Failed to create or update match")
+        # Insert or update the match in one statement
+        match = await self.repository.upsert_score(
+            {
+                "job_id": request.job_id,
+                "resume_id": request.resume_id,
+                "user_id": request.user_id,
+                **columns,
+                "input_fingerprint": fingerprint,
+            }
+        )
 
         # Update cache
         await self._update_cache(match)
 
+        return self._response_from_match(match)
+
+    async def _degraded_score(self, request: MatchScoreRequest) -> MatchScoreResponse:
+        """Queue a rescore and answer with the last known score, or pending."""
+        await self.submit_scores(
+            [
+                MatchScorePair(
+                    job_id=request.job_id,
+                    resume_id=request.resume_id,
+                    user_id=request.user_id,
+                )
+            ],
+            ScoringLane.BACKFILL,
+            force_recalculate=True,
+        )
+        match = await self.repository.get_by_job_and_resume(
+            request.job_id, request.resume_id
+        )
+        if match is not None and match.overall_score is not None:
+            response = self._response_from_match(match)
+            response.status = MatchScoreStatus.STALE
+            return response
         return MatchScoreResponse(
-            match_id=match.id,
+            match_id=None,
             job_id=request.job_id,
             resume_id=request.resume_id,
-            overall_score=match.overall_score or Decimal("0"),
-            skill_score=match.skill_score or Decimal("0"),
-            experience_score=match.experience_score or Decimal("0"),
-            culture_score=match.culture_score or Decimal("0"),
-            score_breakdown=match.score_breakdown or {},
-            ai_reasoning=match.ai_reasoning or "",
-            is_recommended=match.is_recommended,
-            is_cached=False,
+            overall_score=None,
+            skill_score=None,
+            experience_score=None,
+            culture_score=None,
+            score_breakdown={},
+            ai_reasoning="",
+            is_recommended=False,
+            status=MatchScoreStatus.PENDING,
+        )
+
+    async def batch_calculate_match_scores(
+        self, request: BatchMatchScoreRequest
+    ) -> AsyncIterator[BatchMatchScoreItem]:
+        """Score many job-resume pairs, yielding each result as it is ready.
+
+        Cache hits are served from a single MGET. Misses are scored against
+        the AI service with at most ``ai_service_max_concurrency`` calls in
+        flight, and persisted with one bulk upsert per
+        ``match_batch_write_size`` completed pairs. Misses whose stored score
+        has an unchanged input fingerprint are served without an AI call,
+        and misses that pre-score below ``match_prescore_gate`` are stored
+        with their pre-score in one bulk write.
+        Pairs that could not be
+        scored because the AI service is unavailable are queued for rescoring.
+        """
+        # Deduplicate pairs; a single upsert cannot touch the same row twice
+        unique: dict[tuple[UUID, UUID], MatchScorePair] = {}
+        for pair in request.pairs:
+            unique[(pair.job_id, pair.resume_id)] = pair
+        pending = list(unique.values())
+
+        if not request.force_recalculate:
+            cached_details = await self.redis.get_match_details(
+                [(str(pair.job_id), str(pair.resume_id)) for pair in pending]
+            )
+            misses: list[MatchScorePair] = []
+            for pair, cached in zip(pending, cached_details):
+                if cached:
+                    yield BatchMatchScoreItem(
+                        job_id=pair.job_id,
+                        resume_id=pair.resume_id,
+                        result=self._response_from_cache(
+                            cached, pair.job_id, pair.resume_id
+                        ),
+                    )
+                else:
+                    misses.append(pair)
+            pending = misses
+
+        if not pending:
+            return
+
+        inputs = await self._prepare_inputs(pending)
+        reusable = await self._reusable_matches(inputs)
+        if reusable:
+            await self._update_caches(reusable)
+            for match in reusable:
+                yield BatchMatchScoreItem(
+                    job_id=match.job_id,
+                    resume_id=match.resume_id,
+                    result=self._response_from_match(match),
+                )
+            reused = {(match.job_id, match.resume_id) for match in reusable}
+            pending = [
+                pair
+                for pair in pending
+                if (pair.job_id, pair.resume_id) not in reused
+            ]
+
+        gated: list[tuple[MatchScorePair, dict[str, Any]]] = []
+        escalated: list[MatchScorePair] = []
+        for pair in pending:
+            scoring_input = inputs[(pair.job_id, pair.resume_id)]
+            if scoring_input.prescore is not None and scoring_input.below_gate:
+                gated.append((pair, self._prescore_columns(scoring_input.prescore)))
+            else:
+                escalated.append(pair)
+        if gated:
+            for item in await self._persist_scores(gated, inputs):
+                yield item
+        pending = escalated
+
+        if not pending:
+            return
+
+        semaphore = asyncio.Semaphore(settings.ai_service_max_concurrency)
+        deferred: list[MatchScorePair] = []
+
+        async def score(
+            pair: MatchScorePair,
+        ) -> tuple[MatchScorePair, Optional[dict[str, Any]], Optional[str]]:
+            async with semaphore:
+                try:
+                    result = await self._call_ai_service(
+                        MatchScoreRequest(
+                            job_id=pair.job_id,
+                            resume_id=pair.resume_id,
+                            user_id=pair.user_id,
+                        )
+                    )
+                    return pair, result, None
+                except (CircuitOpenError, httpx.HTTPError) as e:
+                    if isinstance(e, CircuitOpenError) or _is_unavailable(e):
+                        deferred.append(pair)
+                        return pair, None, DEFERRED_SCORE_ERROR
+                    logger.error(
+                        f"Scoring failed for job {pair.job_id} "
+                        f"resume {pair.resume_id}: {e}"
+                    )
+                    return pair, None, str(e)
+                except Exception as e:
+                    logger.error(
+                        f"Scoring failed for job {pair.job_id} "
+                        f"resume {pair.resume_id}: {e}"
+                    )
+                    return pair, None, str(e)
+
+        tasks = [asyncio.create_task(score(pair)) for pair in pending]
+        scored: list[tuple[MatchScorePair, dict[str, Any]]] = []  # Score columns
+        remaining = len(tasks)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                pair, score_result, error = await next_done
+                remaining -= 1
+                if score_result is None:
+                    yield BatchMatchScoreItem(
+                        job_id=pair.job_id, resume_id=pair.resume_id, error=error
+                    )
+                else:
+                    scored.append(
+                        (
+                            pair,
+                            self._score_columns(
+                                score_result,
+                                inputs[(pair.job_id, pair.resume_id)].prescore,
+                            ),
+                        )
+                    )
+
+                if scored and (
+                    len(scored) >= settings.match_batch_write_size or remaining == 0
+                ):
+                    for item in await self._persist_scores(scored, inputs):
+                        yield item
+                    scored = []
+        finally:
+            for task in tasks:
+                task.cancel()
+            if deferred:
+                await self.submit_scores(
+                    deferred, ScoringLane.BACKFILL, force_recalculate=True
+                )
+
+    async def submit_scores(
+        self,
+        pairs: list[MatchScorePair],
+        lane: ScoringLane,
+        force_recalculate: bool = False,
+    ) -> list[ScoringTaskResponse]:
+        """Queue pairs for scoring by the background workers of a lane.
+
+        A pair already held by a queued or running task, on any lane, is not
+        queued again; its response is the status of that task.
+        """
+        tasks = [
+            ScoringTaskResponse(
+                task_id=uuid4(),
+                lane=lane,
+                status=ScoringTaskStatus.QUEUED,
+                job_id=pair.job_id,
+                resume_id=pair.resume_id,
+            )
+            for pair in pairs
+        ]
+        holders = await self.redis.enqueue_scoring_tasks(
+            lane.value,
+            [
+                {
+                    "task_id": str(task.task_id),
+                    "job_id": str(pair.job_id),
+                    "resume_id": str(pair.resume_id),
+                    "user_id": str(pair.user_id),
+                    "force": "1" if force_recalculate else "0",
+                    "attempt": "1",
+                }
+                for task, pair in zip(tasks, pairs)
+            ],
+        )
+
+        held = [
+            index
+            for index, (task, holder) in enumerate(zip(tasks, holders))
+            if holder != str(task.task_id)
+        ]
+        statuses = await self.redis.get_scoring_task_statuses(
+            [holders[index] for index in held]
+        )
+        for index, status in zip(held, statuses):
+            tasks[index] = (
+                ScoringTaskResponse.model_validate(status)
+                if status
+                else tasks[index].model_copy(update={"task_id": UUID(holders[index])})
+            )
+        return tasks
+
+    async def get_scoring_task(self, task_id: UUID) -> Optional[ScoringTaskResponse]:
+        """Get the status of a queued scoring task."""
+        status = await self.redis.get_scoring_task_status(str(task_id))
+        return ScoringTaskResponse.model_validate(status) if status else None
+
+    async def wait_for_scoring_task(
+        self, task_id: UUID, timeout: float
+    ) -> Optional[ScoringTaskResponse]:
+        """Wait for a queued scoring task to finish, up to ``timeout`` seconds."""
+        status = await self.redis.wait_for_scoring_task(str(task_id), timeout)
+        return ScoringTaskResponse.model_validate(status) if status else None
+
+    async def calculate_matches_for_job(
+        self, job_id: UUID, request: CalculateMatchesForJobRequest
+    ) -> CalculateMatchesForJobResponse:
+        """Queue a job's cheaply retrieved candidate shortlist for scoring.
+
+        Candidates are ranked by rarity-weighted skill overlap in the in-memory
+        skill index, or by resume-service until the index has been built, and
+        only the top ``limit`` are scored. Cached scores are returned at once;
+        the rest go to the bulk lane of the scoring queue, whose workers
+        persist them and add them to the job ranking.
+        """
+        limit = request.limit or settings.match_job_candidate_limit
+        skills = request.required_skills
+        if not skills:
+            job = await self._fetch_job(job_id)
+            skills = self._job_skills(job) if job is not None else []
+        candidates = await self._retrieve_candidates(job_id, skills, limit)
+
+        results: list[MatchScoreResponse] = []
+        queued = candidates
+        if candidates and not request.force_recalculate:
+            cached_details = await self.redis.get_match_details(
+                [(str(pair.job_id), str(pair.resume_id)) for pair in candidates]
+            )
+            queued = []
+            for pair, cached in zip(candidates, cached_details):
+                if cached:
+                    results.append(
+                        self._response_from_cache(cached, pair.job_id, pair.resume_id)
+                    )
+                else:
+                    queued.append(pair)
+        tasks = (
+            await self.submit_scores(
+                queued, ScoringLane.BULK, request.force_recalculate
+            )
+            if queued
+            else []
+        )
+
+        await self.redis.add_matches_to_job_ranking(
+            str(job_id),
+            {
+                str(result.resume_id): float(result.overall_score)
+                for result in results
+                if result.overall_score is not None
+            },
+        )
+
+        qualified = self._qualified(results, request.min_score_threshold)
+        return CalculateMatchesForJobResponse(
+            job_id=job_id,
+            matches=qualified,
+            total_processed=len(results),
+            total_qualified=len(qualified),
+            tasks=tasks,
+        )
+
+    async def calculate_matches_for_user(
+        self, user_id: UUID, request: CalculateMatchesForUserRequest
+    ) -> CalculateMatchesForUserResponse:
+        """Compute job recommendations for a user's resume.
+
+        Open jobs are retrieved by embedding similarity to the resume. Only
+        jobs never scored for this resume, or scored before its last edit,
+        are queued on the bulk lane for rescoring; the rest reuse their
+        stored match, and the recommendation ZSET is updated with them in a
+        single pipelined write. Queued scores reach it through the workers.
+        """
+        limit = request.limit or settings.match_user_job_limit
+        resume = await self._fetch_resume(user_id, request.resume_id)
+        if resume is None:
+            return CalculateMatchesForUserResponse(
+                user_id=user_id,
+                resume_id=request.resume_id,
+                matches=[],
+                total_processed=0,
+                total_qualified=0,
+                total_rescored=0,
+            )
+
+        resume_id = UUID(resume["id"])
+        resume_updated_at = datetime.fromisoformat(resume["updated_at"])
+        if resume_updated_at.tzinfo is not None:
+            # Match timestamps are naive UTC; convert before dropping the offset
+            resume_updated_at = resume_updated_at.astimezone(timezone.utc).replace(
+                tzinfo=None
+            )
+        job_ids = await self._retrieve_similar_jobs(
+            self._resume_query_text(resume), limit
+        )
+
+        existing = {
+            match.job_id: match
+            for match in await self.repository.get_by_resume_and_job_ids(
+                resume_id, job_ids
+            )
+        }
+        results: list[MatchScoreResponse] = []
+        stale: list[MatchScorePair] = []
+        for job_id in job_ids:
+            match = existing.get(job_id)
+            if (
+                match is not None
+                and match.overall_score is not None
+                and not request.force_recalculate
+                and match.updated_at >= resume_updated_at
+            ):
+                results.append(self._response_from_match(match))
+            else:
+                stale.append(
+                    MatchScorePair(job_id=job_id, resume_id=resume_id, user_id=user_id)
+                )
+
+        tasks: list[ScoringTaskResponse] = []
+        if stale:
+            # Cached details for stale pairs predate the resume edit
+            tasks = await self.submit_scores(
+                stale, ScoringLane.BULK, force_recalculate=True
+            )
+
+        await self.redis.update_recommendations_for_user(
+            str(user_id),
+            recommended={
+                str(result.job_id): float(result.overall_score)
+                for result in results
+                if result.is_recommended and result.overall_score is not None
+            },
+            removed=[
+                str(result.job_id) for result in results if not result.is_recommended
+            ],
+        )
+
+        qualified = self._qualified(results, request.min_score_threshold)
+        return CalculateMatchesForUserResponse(
+            user_id=user_id,
+            resume_id=resume_id,
+            matches=qualified,
+            total_processed=len(results),
+            total_qualified=len(qualified),
+            total_rescored=len(stale),
+            tasks=tasks,
         )
 
     async def get_top_matches_for_job(
         self, job_id: UUID, limit: int = 10
     ) -> TopMatchesResponse:
         """Get top matches for a job from cache or database."""
-        # Try cache first
-        cached = await self.redis.get_top_matches_for_job(str(job_id), limit)
-        if cached:
+        # The cached ranking never holds more than top_matches_limit members
+        limit = min(limit, settings.top_matches_limit)
+
+        # Try cache first; only a complete ranking is served
+        cached, stale = await self.redis.read_top_matches_for_job(str(job_id), limit)
+        if cached is not None:
+            if stale:
+                self._refresh_in_background(
+                    f"job:{job_id}",
+                    lambda service: service._refresh_job_ranking(job_id),
+                )
             matches = [
                 TopMatchItem(resume_id=UUID(resume_id), score=score)
                 for resume_id, score in cached
@@ -209,22 +806,12 @@ class MatchService:
                 total=len(matches),
             )
 
-        # Fallback to database
-        db_matches = await self.repository.get_by_job_id(job_id, limit=limit)
-
-        # Populate cache
-        for match in db_matches:
-            if match.overall_score:
-                await self.redis.add_match_to_job_ranking(
-                    str(job_id), str(match.resume_id), float(match.overall_score)
-                )
+        # Refill the whole ranking from the database in one load
+        ranking = await self._refresh_job_ranking(job_id)
 
         matches = [
-            TopMatchItem(
-                resume_id=match.resume_id,
-                score=float(match.overall_score) if match.overall_score else 0,
-            )
-            for match in db_matches
+            TopMatchItem(resume_id=resume_id, score=float(score))
+            for resume_id, score in ranking[:limit]
         ]
         return TopMatchesResponse(
             job_id=job_id,
@@ -232,13 +819,42 @@ class MatchService:
             total=len(matches),
         )
 
+    async def iter_top_matches_for_job(
+        self, job_id: UUID, limit: int = 10, min_score: float = 0.0
+    ) -> AsyncIterator[Match]:
+        """Yield the full rows of a job's top matches, best first.
+
+        Rows are read ``top_matches_load_size`` at a time, so the first ones
+        can be sent while the rest are still loading.
+        """
+        top = await self.get_top_matches_for_job(job_id, limit)
+        resume_ids = [item.resume_id for item in top.matches if item.score >= min_score]
+        size = settings.top_matches_load_size
+        for start in range(0, len(resume_ids), size):
+            chunk = resume_ids[start : start + size]
+            rows = await self.repository.get_by_pairs(
+                [(job_id, resume_id) for resume_id in chunk]
+            )
+            by_resume = {row.resume_id: row for row in rows}
+            for resume_id in chunk:
+                # Skip matches deleted since the ranking was cached
+                if resume_id in by_resume:
+                    yield by_resume[resume_id]
+
     async def get_recommended_jobs_for_user(
         self, user_id: UUID, limit: int = 10
     ) -> RecommendedJobsResponse:
         """Get recommended jobs for a user from cache or database."""
         # Try cache first
-        cached = await self.redis.get_recommended_jobs_for_user(str(user_id), limit)
+        cached, stale = await self.redis.read_recommended_jobs_for_user(
+            str(user_id), limit
+        )
         if cached:
+            if stale:
+                self._refresh_in_background(
+                    f"user:{user_id}",
+                    lambda service: service._refresh_user_recommendations(user_id),
+                )
             jobs = [
                 RecommendedJobItem(job_id=UUID(job_id), score=score)
                 for job_id, score in cached
@@ -250,21 +866,18 @@ class MatchService:
             )
 
         # Fallback to database
-        db_matches = await self.repository.get_recommended_for_user(user_id, limit)
+        ranking = await self.repository.get_recommended_for_user(user_id, limit)
 
         # Populate cache
-        for match in db_matches:
-            if match.overall_score:
-                await self.redis.add_recommendation_for_user(
-                    str(user_id), str(match.job_id), float(match.overall_score)
-                )
+        await self.redis.update_recommendations_for_user(
+            str(user_id),
+            recommended={str(job_id): float(score) for job_id, score in ranking},
+            removed=[],
+        )
 
         jobs = [
-            RecommendedJobItem(
-                job_id=match.job_id,
-                score=float(match.overall_score) if match.overall_score else 0,
-            )
-            for match in db_matches
+            RecommendedJobItem(job_id=job_id, score=float(score))
+            for job_id, score in ranking
         ]
         return RecommendedJobsResponse(
             user_id=user_id,
@@ -272,79 +885,536 @@ class MatchService:
             total=len(jobs),
         )
 
-    async def add_feedback(self, data: MatchFeedbackCreate) -> bool:
-        """Add feedback for a match."""
+    async def _refresh_job_ranking(self, job_id: UUID) -> list[tuple[UUID, Decimal]]:
+        """Reload a job's ranking ZSET from the database and mark it complete."""
+        ranking = await self.repository.get_job_ranking(
+            job_id, limit=settings.top_matches_limit
+        )
+        await self.redis.replace_job_ranking(
+            str(job_id),
+            {str(resume_id): float(score) for resume_id, score in ranking},
+            exhaustive=len(ranking) < settings.top_matches_limit,
+        )
+        return ranking
+
+    async def _refresh_user_recommendations(self, user_id: UUID) -> None:
+        """Reload a user's recommendation ZSET from the database."""
+        ranking = await self.repository.get_recommended_for_user(
+            user_id, limit=settings.top_matches_limit
+        )
+        await self.redis.update_recommendations_for_user(
+            str(user_id),
+            recommended={str(job_id): float(score) for job_id, score in ranking},
+            removed=[],
+        )
+
+    def _refresh_in_background(
+        self,
+        lease_key: str,
+        refresh: Callable[["MatchService"], Awaitable[Any]],
+    ) -> None:
+        """Refresh a stale cache entry after the caller has been answered.
+
+        At most one refresh per key runs in this process, and the Redis
+        refresh lease keeps other replicas from repeating it.
+        """
+        if lease_key in _refresh_tasks:
+            return
+        task = asyncio.create_task(self._run_refresh(lease_key, refresh))
+        _refresh_tasks[lease_key] = task
+        task.add_done_callback(lambda _: _refresh_tasks.pop(lease_key, None))
+
+    async def _run_refresh(
+        self,
+        lease_key: str,
+        refresh: Callable[["MatchService"], Awaitable[Any]],
+    ) -> None:
+        """Run a refresh with its own session once the lease is claimed."""
+        try:
+            if not await self.redis.acquire_refresh_lease(lease_key):
+                return
+            # The request's session is closed by now; refresh in a new one
+            async with AsyncSessionLocal() as session:
+                try:
+                    await refresh(MatchService(
+                        session, self.redis, self.http, self.ai_breaker
+                    ))
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    raise
+        except Exception as e:
+            logger.error(f"Background refresh of {lease_key} failed: {e}")
+
+    async def add_feedback(self, data: MatchFeedbackCreate) -> Optional[MatchFeedback]:
+        """Add feedback for a match; None if the match does not exist."""
         match = await self.repository.get_by_id(data.match_id)
         if not match:
-            return False
-        await self.repository.create_feedback(data)
-        return True
+            return None
+        feedback = await self.repository.create_feedback(data)
+        await self._invalidate_stats([match])
+        return feedback
+
+    async def get_feedback(self, feedback_id: UUID) -> Optional[MatchFeedback]:
+        """Get a feedback record by ID."""
+        return await self.repository.get_feedback_by_id(feedback_id)
+
+    async def get_feedback_for_match(self, match_id: UUID) -> list[MatchFeedback]:
+        """Get all feedback for a match, newest first."""
+        return await self.repository.get_feedback_by_match_id(match_id)
+
+    async def list_feedback(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        match_id: Optional[UUID] = None,
+        feedback_by: Optional[UUID] = None,
+        feedback_type: Optional[FeedbackType] = None,
+    ) -> tuple[list[MatchFeedback], int]:
+        """List feedback by any combination of filters, with the total."""
+        feedbacks = await self.repository.list_feedback(
+            limit=page_size,
+            offset=(page - 1) * page_size,
+            match_id=match_id,
+            feedback_by=feedback_by,
+            feedback_type=feedback_type,
+        )
+        total = await self.repository.count_feedback(
+            match_id=match_id, feedback_by=feedback_by, feedback_type=feedback_type
+        )
+        return feedbacks, total
+
+    async def get_match_stats(
+        self, scope: StatsScope, scope_id: UUID
+    ) -> MatchStatsResponse:
+        """Get the match statistics of a job or a user."""
+        stats = await self._load_stats(scope, scope_id)
+        return MatchStatsResponse(
+            scope=scope,
+            scope_id=scope_id,
+            total_matches=int(stats.get("matches", 0)),
+            average_overall_score=average(stats, "overall_score"),
+            average_skill_score=average(stats, "skill_score"),
+            average_experience_score=average(stats, "experience_score"),
+            average_culture_score=average(stats, "culture_score"),
+            recommended_count=int(stats.get("recommended", 0)),
+            score_distribution=prefixed(stats, "bucket:"),
+            feedback_distribution=prefixed(stats, "feedback:"),
+        )
+
+    async def get_matching_insights(self, job_id: UUID) -> MatchingInsightsResponse:
+        """Get the most common skill gaps and matches across a job's candidates."""
+        stats = await self._load_stats(StatsScope.JOB, job_id)
+        limit = settings.match_insights_top_skills
+        skill_gaps = most_common(prefixed(stats, "skill_gap:"), limit)
+        total = int(stats.get("matches", 0))
+
+        if not total:
+            recommendation = "No candidates have been scored for this job yet."
+        elif (
+            int(stats.get("recommended", 0)) / total
+            < settings.match_insights_low_recommended_rate
+        ):
+            recommendation = "Few candidates meet the bar for this job."
+            if skill_gaps:
+                recommendation += (
+                    f" Consider whether {', '.join(skill_gaps[:2])} must be required."
+                )
+        else:
+            recommendation = "The candidate pool matches this job well."
+
+        return MatchingInsightsResponse(
+            job_id=job_id,
+            most_common_skill_gaps=skill_gaps,
+            most_matched_skills=most_common(prefixed(stats, "matched_skill:"), limit),
+            average_experience_gap=average(stats, "experience_gap"),
+            recommendation=recommendation,
+        )
+
+    async def _load_stats(
+        self, scope: StatsScope, scope_id: UUID
+    ) -> dict[str, Decimal]:
+        """Read materialized statistics through the Redis cache."""
+        cached = await self.redis.get_match_stats(scope.value, str(scope_id))
+        if cached is not None:
+            return cached
+        stats = await self.repository.get_stats(scope, scope_id)
+        await self.redis.set_match_stats(scope.value, str(scope_id), stats)
+        return stats
+
+    async def _persist_scores(
+        self,
+        scored: list[tuple[MatchScorePair, dict[str, Any]]],
+        inputs: Mapping[tuple[UUID, UUID], ScoringInput],
+    ) -> list[BatchMatchScoreItem]:
+        """Write a group of score columns with one upsert and refresh their caches."""
+        rows = [
+            {
+                "job_id": pair.job_id,
+                "resume_id": pair.resume_id,
+                "user_id": pair.user_id,
+                **columns,
+                "input_fingerprint": inputs[(pair.job_id, pair.resume_id)].fingerprint,
+            }
+            for pair, columns in scored
+        ]
+        matches = await self.repository.bulk_upsert_scores(rows)
+
+        await self._update_caches(matches)
+
+        return [
+            BatchMatchScoreItem(
+                job_id=match.job_id,
+                resume_id=match.resume_id,
+                result=self._response_from_match(match),
+            )
+            for match in matches
+        ]
+
+    @staticmethod
+    def _score_columns(
+        score_result: dict[str, Any], pre_score: Optional[PreScore] = None
+    ) -> dict[str, Any]:
+        """Map an AI service score payload onto match score columns."""
+        overall_score = Decimal(str(score_result["overall_score"]))
+        breakdown = score_result["score_breakdown"]
+        if pre_score is not None:
+            breakdown = {**(breakdown or {}), **pre_score.as_breakdown()}
+        return {
+            "overall_score": overall_score,
+            "skill_score": Decimal(str(score_result["skill_score"])),
+            "experience_score": Decimal(str(score_result["experience_score"])),
+            "culture_score": Decimal(str(score_result["culture_score"])),
+            "score_breakdown": breakdown,
+            "ai_reasoning": score_result["ai_reasoning"],
+            "is_recommended": (
+                float(overall_score) >= settings.match_recommendation_threshold
+            ),
+        }
+
+    @staticmethod
+    def _prescore_columns(pre_score: PreScore) -> dict[str, Any]:
+        """Map a pre-score that did not pass the AI gate onto match score columns."""
+        overall_score = Decimal(str(round(pre_score.overall_score, 2)))
+        return {
+            "overall_score": overall_score,
+            "skill_score": Decimal(str(round(pre_score.skill_score, 2))),
+            "experience_score": Decimal(str(round(pre_score.experience_score, 2))),
+            "culture_score": None,
+            "score_breakdown": pre_score.as_breakdown(),
+            "ai_reasoning": "Pre-score below the AI scoring threshold",
+            "is_recommended": (
+                float(overall_score) >= settings.match_recommendation_threshold
+            ),
+        }
+
+    @staticmethod
+    def _response_from_cache(
+        cached: Mapping[str, Any], job_id: UUID, resume_id: UUID
+    ) -> MatchScoreResponse:
+        """Build a score response from a cached match detail."""
+        return MatchScoreResponse(
+            match_id=UUID(cached["match_id"]),
+            job_id=job_id,
+            resume_id=resume_id,
+            overall_score=Decimal(str(cached["overall_score"])),
+            skill_score=Decimal(str(cached["skill_score"])),
+            experience_score=Decimal(str(cached["experience_score"])),
+            culture_score=Decimal(str(cached["culture_score"])),
+            score_breakdown=cached["score_breakdown"],
+            ai_reasoning=cached["ai_reasoning"],
+            is_recommended=cached["is_recommended"],
+            is_cached=True,
+        )
+
+    @staticmethod
+    def _response_from_match(match: Match) -> MatchScoreResponse:
+        """Build a score response from a persisted match."""
+        return MatchScoreResponse(
+            match_id=match.id,
+            job_id=match.job_id,
+            resume_id=match.resume_id,
+            overall_score=match.overall_score or Decimal("0"),
+            skill_score=match.skill_score or Decimal("0"),
+            experience_score=match.experience_score or Decimal("0"),
+            culture_score=match.culture_score or Decimal("0"),
+            score_breakdown=match.score_breakdown or {},
+            ai_reasoning=match.ai_reasoning or "",
+            is_recommended=match.is_recommended,
+            is_cached=False,
+        )
+
+    @staticmethod
+    def _qualified(
+        results: list[MatchScoreResponse], min_score: float
+    ) -> list[MatchScoreResponse]:
+        """Get the scored results reaching ``min_score``, best first."""
+        scored = [
+            (float(result.overall_score), result)
+            for result in results
+            if result.overall_score is not None
+        ]
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [result for score, result in scored if score >= min_score]
+
+    async def _fetch_job(self, job_id: UUID) -> Optional[dict[str, Any]]:
+        """Fetch a job document, reusing one fetched moments ago."""
+        key = str(job_id)
+        job: Optional[dict[str, Any]] = _job_documents.get(key)
+        if job is None:
+            epoch = _job_documents.epoch
+            job = await self._fetch_document(
+                f"{settings.job_service_url}/api/v1/jobs/{job_id}"
+            )
+            if job is not None:
+                _job_documents.set(key, job, epoch)
+        return job
+
+    @staticmethod
+    def _job_skills(job: Mapping[str, Any]) -> list[str]:
+        """Get the normalized skills a job asks for, required ones first."""
+        requirements = job_requirements(job)
+        return sorted(requirements.required_skills) + sorted(
+            requirements.optional_skills
+        )
+
+    async def _retrieve_candidates(
+        self, job_id: UUID, skills: list[str], limit: int
+    ) -> list[MatchScorePair]:
+        """Shortlist resumes for a job by skill overlap."""
+        if not skills:
+            logger.warning(f"No skills to shortlist candidates for job {job_id}")
+            return []
+
+        if self.skill_index.ready:
+            hits = self.skill_index.top_k(dict.fromkeys(skills, 1.0), limit)
+            return [
+                MatchScorePair(
+                    job_id=job_id, resume_id=hit.resume_id, user_id=hit.user_id
+                )
+                for hit in hits
+            ]
+
+        try:
+            response = await self.http.post(
+                f"{settings.resume_service_url}/api/v1/resumes/search/skills",
+                json={"skills": skills, "limit": limit},
+            )
+            response.raise_for_status()
+            items = response.json()["items"]
+        except httpx.HTTPError as e:
+            logger.error(f"Resume service call failed for job {job_id}: {e}")
+            return []
+
+        return [
+            MatchScorePair(
+                job_id=job_id,
+                resume_id=UUID(item["resume_id"]),
+                user_id=UUID(item["user_id"]),
+            )
+            for item in items
+        ]
+
+    async def _fetch_resume(
+        self, user_id: UUID, resume_id: Optional[UUID]
+    ) -> Optional[dict[str, Any]]:
+        """Fetch a resume, or the user's primary resume, from resume-service."""
+        if resume_id is not None:
+            url = f"{settings.resume_service_url}/api/v1/resumes/{resume_id}"
+        else:
+            url = f"{settings.resume_service_url}/api/v1/resumes/user/{user_id}/primary"
+
+        try:
+            response = await self.http.get(url)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError as e:
+            logger.error(f"Resume service call failed for user {user_id}: {e}")
+            return None
+
+    @staticmethod
+    def _resume_query_text(resume: dict[str, Any]) -> str:
+        """Build the text used to find jobs similar to a resume."""
+        parts = [
+            resume.get("title") or "",
+            resume.get("ai_summary") or resume.get("masked_content") or "",
+            ", ".join(
+                skill["skill_name"]
+                for skill in resume.get("skills", [])
+                if skill.get("skill_name")
+            ),
+        ]
+        return "\n".join(part for part in parts if part)
+
+    async def _retrieve_similar_jobs(self, query_text: str, limit: int) -> list[UUID]:
+        """Find open jobs similar to the given text via ai-service vector search."""
+        if not query_text:
+            return []
+
+        try:
+            response = await self.http.post(
+                f"{settings.ai_service_url}/api/v1/embedding/search",
+                json={
+                    "query_text": query_text,
+                    # Jobs are indexed as several chunks; over-fetch
+                    # before collapsing chunks to jobs
+                    "top_k": limit * 4,
+                    "threshold": settings.match_user_similarity_threshold,
+                },
+            )
+            response.raise_for_status()
+            results = response.json()["results"]
+        except httpx.HTTPError as e:
+            logger.error(f"Similar job search failed: {e}")
+            return []
+
+        # Results are ordered by similarity; keep each job's best chunk
+        job_ids = list(dict.fromkeys(UUID(result["job_id"]) for result in results))
+        return job_ids[:limit]
+
+    async def _prepare_inputs(
+        self, pairs: list[MatchScorePair]
+    ) -> dict[tuple[UUID, UUID], ScoringInput]:
+        """Fingerprint and pre-score the inputs of each pair.
+
+        Each job and resume is fetched and reduced once however many pairs
+        share it. A pair whose documents could not be fetched gets neither
+        a fingerprint nor a pre-score.
+        """
+        job_ids = list(dict.fromkeys(pair.job_id for pair in pairs))
+        resume_ids = list(dict.fromkeys(pair.resume_id for pair in pairs))
+        documents = await asyncio.gather(
+            *(self._fetch_job(job_id) for job_id in job_ids),
+            *(
+                self._fetch_document(
+                    f"{settings.resume_service_url}/api/v1/resumes/{resume_id}"
+                )
+                for resume_id in resume_ids
+            ),
+        )
+        jobs = {
+            job_id: (content_hash(job), job_requirements(job))
+            for job_id, job in zip(job_ids, documents[: len(job_ids)])
+            if job is not None
+        }
+        resumes = {
+            resume_id: (content_hash(resume), resume_profile(resume))
+            for resume_id, resume in zip(resume_ids, documents[len(job_ids) :])
+            if resume is not None
+        }
+
+        inputs: dict[tuple[UUID, UUID], ScoringInput] = {}
+        for pair in pairs:
+            job = jobs.get(pair.job_id)
+            resume = resumes.get(pair.resume_id)
+            if job is None or resume is None:
+                inputs[(pair.job_id, pair.resume_id)] = ScoringInput(None, None)
+                continue
+            (job_hash, requirements), (resume_hash, profile) = job, resume
+            inputs[(pair.job_id, pair.resume_id)] = ScoringInput(
+                fingerprint=input_fingerprint(job_hash, resume_hash),
+                prescore=prescore(requirements, profile),
+            )
+        return inputs
+
+    async def _fetch_document(self, url: str) -> Optional[dict[str, Any]]:
+        """Fetch a job or resume document."""
+        try:
+            response = await self.http.get(url)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not fetch scoring input {url}: {e}")
+            return None
+
+    async def _reusable_matches(
+        self, inputs: Mapping[tuple[UUID, UUID], ScoringInput]
+    ) -> list[Match]:
+        """Get stored matches whose inputs are unchanged since they were scored."""
+        known = [pair for pair, value in inputs.items() if value.fingerprint]
+        reusable = []
+        for match in await self.repository.get_by_pairs(known):
+            fingerprint = inputs[(match.job_id, match.resume_id)].fingerprint
+            unchanged = match.input_fingerprint == fingerprint
+            if match.overall_score is not None and unchanged:
+                reusable.append(match)
+        return reusable
 
     async def _call_ai_service(self, request: MatchScoreRequest) -> dict[str, Any]:
-        """Call AI service to calculate match score."""
+        """Call AI service to calculate match score.
+
+        Raises ``CircuitOpenError`` without calling out while the AI service
+        circuit is open, and ``httpx.HTTPError`` if the call fails. Transport
+        errors and 5xx responses count against the circuit; 4xx do not.
+        """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
+            async with self.ai_breaker.guard():
+                response = await self.http.post(
                     f"{settings.ai_service_url}/api/v1/match/score",
                     json={
                         "job_id": str(request.job_id),
                         "resume_id": str(request.resume_id),
                     },
                 )
-                response.raise_for_status()
-                return response.json()
+                if response.status_code >= 500:
+                    response.raise_for_status()
         except httpx.HTTPError as e:
             logger.error(f"AI service call failed: {e}")
-            # Return default scores on failure
-            return {
-                "overall_score": 0.0,
-                "skill_score": 0.0,
-                "experience_score": 0.0,
-                "culture_score": 0.0,
-                "score_breakdown": {},
-                "ai_reasoning": "Score calculation failed - AI service unavailable",
-            }
+            raise
+        response.raise_for_status()
+        return response.json()
 
     async def _update_cache(self, match: Match) -> None:
         """Update all caches for a match."""
-        if match.overall_score is None:
-            return
-
-        score = float(match.overall_score)
+        await self._update_caches([match])
 
-        # Update detail cache
-        await self.redis.set_match_detail(
-            str(match.job_id),
-            str(match.resume_id),
-            {
-                "match_id": str(match.id),
-                "overall_score": score,
-                "skill_score": float(match.skill_score) if match.skill_score else 0,
-                "experience_score": float(match.experience_score) if match.experience_score else 0,
-                "culture_score": float(match.culture_score) if match.culture_score else 0,
-                "score_breakdown": match.score_breakdown or {},
-                "ai_reasoning": match.ai_reasoning or "",
-                "is_recommended": match.is_recommended,
-            },
-        )
-
-        # Update job top matches
-        await self.redis.add_match_to_job_ranking(
-            str(match.job_id), str(match.resume_id), score
-        )
-
-        # Update user recommendations if recommended
-        if match.is_recommended:
-            await self.redis.add_recommendation_for_user(
-                str(match.user_id), str(match.job_id), score
+    async def _update_caches(self, matches: list[Match]) -> None:
+        """Update detail and ranking caches for many matches in one round trip."""
+        entries = []
+        for match in matches:
+            if match.overall_score is None:
+                continue
+            score = float(match.overall_score)
+            entries.append(
+                {
+                    "job_id": str(match.job_id),
+                    "resume_id": str(match.resume_id),
+                    "user_id": str(match.user_id),
+                    "score": score,
+                    "is_recommended": match.is_recommended,
+                    "detail": {
+                        "match_id": str(match.id),
+                        "overall_score": score,
+                        "skill_score": (
+                            float(match.skill_score) if match.skill_score else 0
+                        ),
+                        "experience_score": (
+                            float(match.experience_score)
+                            if match.experience_score
+                            else 0
+                        ),
+                        "culture_score": (
+                            float(match.culture_score) if match.culture_score else 0
+                        ),
+                        "score_breakdown": match.score_breakdown or {},
+                        "ai_reasoning": match.ai_reasoning or "",
+                        "is_recommended": match.is_recommended,
+                    },
+                }
             )
+        await self.redis.cache_matches(entries)
+        await self._invalidate_stats(matches)
+
+    async def _invalidate_stats(self, matches: list[Match]) -> None:
+        """Drop the cached statistics of the jobs and users of written matches."""
+        scopes = {(StatsScope.JOB.value, str(match.job_id)) for match in matches}
+        scopes |= {(StatsScope.USER.value, str(match.user_id)) for match in matches}
+        await self.redis.invalidate_match_stats(sorted(scopes))
 
     async def _remove_from_cache(self, match: Match) -> None:
         """Remove match from all caches."""
-        await self.redis.delete_match_detail(str(match.job_id), str(match.resume_id))
-        await self.redis.remove_match_from_job_ranking(
-            str(match.job_id), str(match.resume_id)
-        )
-        await self.redis.remove_recommendation_for_user(
-            str(match.user_id), str(match.job_id)
+        await self.redis.remove_match(
+            str(match.job_id), str(match.resume_id), str(match.user_id)
         )
+        await self._invalidate_stats([match])
+
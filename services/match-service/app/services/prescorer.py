@@ -0,0 +1,182 @@
+"""Deterministic pre-scoring of job-resume pairs from structured data.
+
+A pre-score needs no AI call: it compares the skills a job asks for with
+the skills a resume lists, and the experience a job wants with the years
+the resume's work history covers. Pairs that pre-score below
+``match_prescore_gate`` are not worth an AI call.
+
+Job requirements and resume profiles are reduced to frozensets and a
+year count once per document, so scoring one job against many resumes
+only costs a set intersection per pair.
+"""
+
+from collections.abc import Iterable, Mapping
+from datetime import date
+from typing import Any, NamedTuple, Optional
+
+# Share of the overall pre-score carried by skills; the rest is experience
+SKILL_WEIGHT = 0.7
+# Share of the skill score carried by required skills when a job has both
+REQUIRED_SKILL_WEIGHT = 0.8
+# Points lost per year of experience beyond a job's maximum, down to half
+OVERQUALIFIED_PENALTY = 10.0
+
+
+class JobRequirements(NamedTuple):
+    """Normalized skills and experience range a job asks for."""
+
+    required_skills: frozenset[str]
+    optional_skills: frozenset[str]
+    min_years: Optional[float]
+    max_years: Optional[float]
+
+
+class ResumeProfile(NamedTuple):
+    """Normalized skills and total years of experience on a resume."""
+
+    skills: frozenset[str]
+    years: float
+
+
+class PreScore(NamedTuple):
+    """Deterministic 0-100 scores for a job-resume pair."""
+
+    skill_score: float
+    experience_score: float
+    overall_score: float
+
+    def as_breakdown(self) -> dict[str, Any]:
+        """Render the pre-score for ``score_breakdown``."""
+        scores = {field: round(value, 2) for field, value in self._asdict().items()}
+        return {"prescore": scores}
+
+
+def normalize_skill(name: Any) -> Optional[str]:
+    """Normalize a skill name for comparison."""
+    if not isinstance(name, str):
+        return None
+    normalized = " ".join(name.lower().split())
+    return normalized or None
+
+
+def _first(document: Mapping[str, Any], *keys: str) -> Any:
+    """Get the first present key; job-service uses camelCase, others snake_case."""
+    for key in keys:
+        if document.get(key) is not None:
+            return document[key]
+    return None
+
+
+def job_requirements(job: Mapping[str, Any]) -> JobRequirements:
+    """Extract the skills and experience range a job document asks for."""
+    required: set[str] = set()
+    optional: set[str] = set()
+    for skill in job.get("skills") or []:
+        if isinstance(skill, Mapping):
+            name = normalize_skill(_first(skill, "name", "skillName", "skill_name"))
+            is_required = _first(skill, "isRequired", "is_required")
+        else:
+            name, is_required = normalize_skill(skill), None
+        if name is None:
+            continue
+        # Skills without the flag count as required
+        (optional if is_required is False else required).add(name)
+
+    min_years = _first(job, "experienceMin", "experience_min")
+    max_years = _first(job, "experienceMax", "experience_max")
+    return JobRequirements(
+        required_skills=frozenset(required),
+        optional_skills=frozenset(optional - required),
+        min_years=float(min_years) if min_years is not None else None,
+        max_years=float(max_years) if max_years is not None else None,
+    )
+
+
+def _covered_years(experiences: Iterable[Mapping[str, Any]], today: date) -> float:
+    """Count the years covered by work periods, counting overlaps once."""
+    periods = []
+    for experience in experiences:
+        start = experience.get("start_date")
+        if not start:
+            continue
+        end = experience.get("end_date")
+        start_date = date.fromisoformat(str(start))
+        end_date = date.fromisoformat(str(end)) if end else today
+        if end_date > start_date:
+            periods.append((start_date, end_date))
+
+    days = 0
+    current_start: Optional[date] = None
+    current_end: Optional[date] = None
+    for start_date, end_date in sorted(periods):
+        if current_end is None or start_date > current_end:
+            if current_start is not None and current_end is not None:
+                days += (current_end - current_start).days
+            current_start, current_end = start_date, end_date
+        elif end_date > current_end:
+            current_end = end_date
+    if current_start is not None and current_end is not None:
+        days += (current_end - current_start).days
+    return days / 365.25
+
+
+def resume_profile(
+    resume: Mapping[str, Any], today: Optional[date] = None
+) -> ResumeProfile:
+    """Extract the skills and total experience of a resume document."""
+    skills = {
+        name
+        for skill in resume.get("skills") or []
+        if (name := normalize_skill(skill.get("skill_name"))) is not None
+    }
+    return ResumeProfile(
+        skills=frozenset(skills),
+        years=_covered_years(resume.get("experiences") or [], today or date.today()),
+    )
+
+
+def _skill_score(job: JobRequirements, resume: ResumeProfile) -> Optional[float]:
+    """Score the share of a job's skills the resume lists."""
+    required = (
+        len(job.required_skills & resume.skills) / len(job.required_skills)
+        if job.required_skills
+        else None
+    )
+    optional = (
+        len(job.optional_skills & resume.skills) / len(job.optional_skills)
+        if job.optional_skills
+        else None
+    )
+    if required is not None and optional is not None:
+        return 100 * (
+            REQUIRED_SKILL_WEIGHT * required + (1 - REQUIRED_SKILL_WEIGHT) * optional
+        )
+    if required is not None:
+        return 100 * required
+    if optional is not None:
+        return 100 * optional
+    return None
+
+
+def _experience_score(job: JobRequirements, resume: ResumeProfile) -> float:
+    """Score how well the resume's years fit the job's experience range."""
+    if job.min_years and resume.years < job.min_years:
+        return 100 * resume.years / job.min_years
+    if job.max_years is not None and resume.years > job.max_years:
+        overage = resume.years - job.max_years
+        return max(50.0, 100 - OVERQUALIFIED_PENALTY * overage)
+    return 100.0
+
+
+def prescore(job: JobRequirements, resume: ResumeProfile) -> Optional[PreScore]:
+    """Pre-score a pair, or return None when the job lists no skills to compare."""
+    skill_score = _skill_score(job, resume)
+    if skill_score is None:
+        return None
+    experience_score = _experience_score(job, resume)
+    return PreScore(
+        skill_score=skill_score,
+        experience_score=experience_score,
+        overall_score=SKILL_WEIGHT * skill_score
+        + (1 - SKILL_WEIGHT) * experience_score,
+    )
@@ -0,0 +1,259 @@
+"""Background workers that drain the scoring work queue."""
+
+import asyncio
+import logging
+import os
+import socket
+from typing import Any
+from uuid import UUID
+
+from app.core.circuit_breaker import CircuitState, ai_circuit_breaker
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.http import HttpClient
+from app.core.redis import RedisClient
+from app.models.schemas import (
+    BatchMatchScoreRequest,
+    MatchScorePair,
+    MatchScoreRequest,
+    MatchScoreStatus,
+    ScoringLane,
+    ScoringTaskResponse,
+    ScoringTaskStatus,
+)
+from app.services.match_service import DEFERRED_SCORE_ERROR, MatchService
+
+logger = logging.getLogger(__name__)
+
+
+def lane_concurrency(lane: ScoringLane) -> int:
+    """Get the number of workers a replica runs for a lane."""
+    return {
+        ScoringLane.INTERACTIVE: settings.scoring_queue_interactive_concurrency,
+        ScoringLane.BULK: settings.scoring_queue_bulk_concurrency,
+        ScoringLane.BACKFILL: settings.scoring_queue_backfill_concurrency,
+    }[lane]
+
+
+class ScoringWorkerPool:
+    """Fixed set of consumers per priority lane.
+
+    Each lane has its own stream and its own workers, so a flood of bulk
+    or backfill work never takes AI capacity reserved for interactive
+    requests. Tasks are acknowledged only after they finish; tasks left
+    unacknowledged by a dead replica are claimed again after
+    ``scoring_queue_claim_idle_ms``.
+
+    A task holds its pair until it finishes, so the rescore a deferred run
+    asks for is not queued again. The worker instead queues the task itself
+    on the backfill lane, up to ``scoring_task_max_attempts`` runs.
+    """
+
+    def __init__(self, redis: RedisClient, http: HttpClient) -> None:
+        self.redis = redis
+        self.http = http
+        self._workers: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        """Create the lane consumer groups and start the workers."""
+        prefix = f"{socket.gethostname()}-{os.getpid()}"
+        for lane in ScoringLane:
+            await self.redis.ensure_scoring_group(lane.value)
+            for index in range(lane_concurrency(lane)):
+                self._workers.append(
+                    asyncio.create_task(
+                        self._consume(lane, f"{prefix}-{lane.value}-{index}")
+                    )
+                )
+
+    async def stop(self) -> None:
+        """Stop the workers; unfinished tasks are claimed again later."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    async def _consume(self, lane: ScoringLane, consumer: str) -> None:
+        """Run tasks from a lane until cancelled.
+
+        Interactive tasks run one at a time. Bulk and backfill tasks are
+        read up to ``scoring_queue_batch_size`` at a time and scored as one
+        batch, so a group is written with one bulk upsert and cached at once.
+        """
+        count = (
+            1 if lane is ScoringLane.INTERACTIVE else settings.scoring_queue_batch_size
+        )
+        while True:
+            try:
+                # Background lanes would only queue themselves a rescore again
+                if (
+                    lane is not ScoringLane.INTERACTIVE
+                    and ai_circuit_breaker.state is CircuitState.OPEN
+                ):
+                    await asyncio.sleep(settings.scoring_queue_block_ms / 1000)
+                    continue
+                entries = await self.redis.read_scoring_tasks(
+                    lane.value, consumer, count, settings.scoring_queue_block_ms
+                )
+                if not entries:
+                    entries = await self.redis.claim_scoring_tasks(
+                        lane.value, consumer, count
+                    )
+                if not entries:
+                    continue
+                if lane is ScoringLane.INTERACTIVE:
+                    for entry_id, fields in entries:
+                        await self._run(lane, fields)
+                        await self.redis.ack_scoring_task(lane.value, entry_id)
+                else:
+                    await self._run_batch(lane, [fields for _, fields in entries])
+                    await self.redis.ack_scoring_task(
+                        lane.value, *(entry_id for entry_id, _ in entries)
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Scoring worker {consumer} failed: {e}")
+                await asyncio.sleep(1)
+
+    async def _start(
+        self, lane: ScoringLane, fields: dict[str, Any]
+    ) -> ScoringTaskResponse:
+        """Mark a queued task running."""
+        task = ScoringTaskResponse(
+            task_id=UUID(fields["task_id"]),
+            lane=lane,
+            status=ScoringTaskStatus.RUNNING,
+            job_id=UUID(fields["job_id"]),
+            resume_id=UUID(fields["resume_id"]),
+        )
+        await self.redis.set_scoring_task_status(
+            str(task.task_id), task.model_dump(mode="json")
+        )
+        return task
+
+    async def _run(self, lane: ScoringLane, fields: dict[str, Any]) -> None:
+        """Score one queued pair and record the outcome."""
+        task = await self._start(lane, fields)
+        request = MatchScoreRequest(
+            job_id=task.job_id,
+            resume_id=task.resume_id,
+            user_id=UUID(fields["user_id"]),
+            force_recalculate=fields["force"] == "1",
+        )
+        try:
+            async with AsyncSessionLocal() as session:
+                try:
+                    service = MatchService(session, self.redis, self.http)
+                    task.result = await service.calculate_match_score(request)
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    raise
+            task.status = ScoringTaskStatus.DONE
+        except Exception as e:
+            logger.error(f"Scoring task {task.task_id} failed: {e}")
+            task.status = ScoringTaskStatus.FAILED
+            task.error = str(e)
+
+        # The AI service was unavailable and the score was deferred
+        deferred = (
+            task.result is not None
+            and task.result.status is not MatchScoreStatus.SCORED
+        )
+        await self._finish(task, fields, deferred)
+
+    async def _run_batch(
+        self, lane: ScoringLane, entries: list[dict[str, Any]]
+    ) -> None:
+        """Score queued pairs together and record each task's outcome.
+
+        Tasks are grouped by whether they force a rescore, and each group
+        goes through one batch score.
+        """
+        tasks = await asyncio.gather(*(self._start(lane, fields) for fields in entries))
+        groups: dict[bool, list[tuple[ScoringTaskResponse, dict[str, Any]]]] = {}
+        for task, fields in zip(tasks, entries, strict=True):
+            groups.setdefault(fields["force"] == "1", []).append((task, fields))
+
+        deferred: set[UUID] = set()
+        for force, group in groups.items():
+            deferred |= await self._score_group(group, force)
+
+        await asyncio.gather(
+            *(
+                self._finish(task, fields, task.task_id in deferred)
+                for task, fields in zip(tasks, entries, strict=True)
+            )
+        )
+
+    async def _score_group(
+        self,
+        group: list[tuple[ScoringTaskResponse, dict[str, Any]]],
+        force: bool,
+    ) -> set[UUID]:
+        """Score a group of tasks in one batch; return the deferred ones."""
+        waiting: dict[tuple[UUID, UUID], list[ScoringTaskResponse]] = {}
+        for task, _ in group:
+            waiting.setdefault((task.job_id, task.resume_id), []).append(task)
+        request = BatchMatchScoreRequest(
+            pairs=[
+                MatchScorePair(
+                    job_id=task.job_id,
+                    resume_id=task.resume_id,
+                    user_id=UUID(fields["user_id"]),
+                )
+                for task, fields in group
+            ],
+            force_recalculate=force,
+        )
+
+        deferred: set[UUID] = set()
+        try:
+            async with AsyncSessionLocal() as session:
+                try:
+                    service = MatchService(session, self.redis, self.http)
+                    async for item in service.batch_calculate_match_scores(request):
+                        # Commit before recording so a done task's score is durable
+                        await session.commit()
+                        for task in waiting.pop((item.job_id, item.resume_id), []):
+                            if item.result is not None:
+                                task.result = item.result
+                                task.status = ScoringTaskStatus.DONE
+                            elif item.error == DEFERRED_SCORE_ERROR:
+                                deferred.add(task.task_id)
+                            else:
+                                task.status = ScoringTaskStatus.FAILED
+                                task.error = item.error
+                except Exception:
+                    await session.rollback()
+                    raise
+        except Exception as e:
+            logger.error(f"Scoring batch of {len(group)} tasks failed: {e}")
+            for tasks in waiting.values():
+                for task in tasks:
+                    task.status = ScoringTaskStatus.FAILED
+                    task.error = str(e)
+        return deferred
+
+    async def _finish(
+        self, task: ScoringTaskResponse, fields: dict[str, Any], deferred: bool
+    ) -> None:
+        """Record a task's outcome and free its pair, or queue a deferred task again."""
+        if deferred:
+            attempt = int(fields.get("attempt", "1"))
+            if attempt < settings.scoring_task_max_attempts:
+                await self.redis.requeue_scoring_task(
+                    ScoringLane.BACKFILL.value,
+                    {**fields, "force": "1", "attempt": str(attempt + 1)},
+                )
+                return
+            task.status = ScoringTaskStatus.FAILED
+            task.error = f"AI service unavailable after {attempt} attempts"
+
+        await self.redis.set_scoring_task_status(
+            str(task.task_id), task.model_dump(mode="json")
+        )
+        await self.redis.release_scoring_pair(
+            fields["job_id"], fields["resume_id"], fields["task_id"]
+        )
@@ -0,0 +1,222 @@
+"""In-memory inverted index from skill to the resumes that list it."""
+
+import asyncio
+import bisect
+import heapq
+import logging
+import math
+from array import array
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple, Optional
+from uuid import UUID
+
+from prometheus_client import Gauge
+
+from app.core.config import settings
+from app.core.http import HttpClient
+from app.services.prescorer import normalize_skill
+
+logger = logging.getLogger(__name__)
+
+SKILL_INDEX_RESUMES = Gauge(
+    "match_skill_index_resumes", "Completed resumes in the in-memory skill index"
+)
+
+
+class SkillHit(NamedTuple):
+    """A resume returned by a skill index query."""
+
+    resume_id: UUID
+    user_id: UUID
+    score: float
+
+
+class ResumeSkillIndex:
+    """Inverted index of completed resumes by normalized skill name.
+
+    Resumes get dense integer ids in the order they are first indexed, and
+    each skill maps to a sorted ``array("I")`` of those ids: four bytes per
+    posting instead of a UUID object. New resumes always get the largest
+    id, so indexing them appends to the postings. Ids of removed resumes
+    are only reclaimed by a full rebuild.
+    """
+
+    def __init__(self) -> None:
+        self._postings: dict[str, array[int]] = {}
+        self._ids: dict[UUID, int] = {}
+        # Id -> (resume_id, user_id, skills); None once removed
+        self._resumes: list[Optional[tuple[UUID, UUID, frozenset[str]]]] = []
+        self.ready = False
+        # (updated_at, resume_id) of the last change applied
+        self.position: Optional[tuple[datetime, UUID]] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def upsert(self, resume_id: UUID, user_id: UUID, skills: Iterable[str]) -> None:
+        """Index a resume's skills, replacing any it was indexed with before."""
+        normalized = frozenset(
+            name for name in map(normalize_skill, skills) if name is not None
+        )
+        doc_id = self._ids.get(resume_id)
+        if doc_id is None:
+            doc_id = len(self._resumes)
+            self._ids[resume_id] = doc_id
+            self._resumes.append((resume_id, user_id, normalized))
+            for skill in normalized:
+                self._postings.setdefault(skill, array("I")).append(doc_id)
+            return
+
+        entry = self._resumes[doc_id]
+        previous = entry[2] if entry else frozenset()
+        self._resumes[doc_id] = (resume_id, user_id, normalized)
+        self._unlink(doc_id, previous - normalized)
+        for skill in normalized - previous:
+            postings = self._postings.setdefault(skill, array("I"))
+            postings.insert(bisect.bisect_left(postings, doc_id), doc_id)
+
+    def remove(self, resume_id: UUID) -> None:
+        """Drop a resume from the index."""
+        doc_id = self._ids.pop(resume_id, None)
+        if doc_id is None:
+            return
+        entry = self._resumes[doc_id]
+        self._resumes[doc_id] = None
+        if entry:
+            self._unlink(doc_id, entry[2])
+
+    def _unlink(self, doc_id: int, skills: Iterable[str]) -> None:
+        """Remove an id from the postings of the given skills."""
+        for skill in skills:
+            postings = self._postings[skill]
+            del postings[bisect.bisect_left(postings, doc_id)]
+            if not postings:
+                del self._postings[skill]
+
+    def _weight(self, skill: str) -> float:
+        """Weigh a skill by rarity; rare skills say more about a match."""
+        postings = self._postings.get(skill)
+        if not postings:
+            return 0.0
+        return math.log(1 + len(self._ids) / len(postings))
+
+    def top_k(self, skills: Mapping[str, float], k: int) -> list[SkillHit]:
+        """Rank resumes by the rarity-weighted sum of the query skills they list.
+
+        ``skills`` maps skill names to query weights. Ties go to the most
+        recently indexed resume.
+        """
+        scores: dict[int, float] = {}
+        for name, query_weight in skills.items():
+            skill = normalize_skill(name)
+            if skill is None or skill not in self._postings:
+                continue
+            weight = query_weight * self._weight(skill)
+            for doc_id in self._postings[skill]:
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight
+
+        best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], item[0]))
+        hits = []
+        for doc_id, score in best:
+            entry = self._resumes[doc_id]
+            if entry:
+                hits.append(SkillHit(entry[0], entry[1], score))
+        return hits
+
+    def intersect(self, skills: Iterable[str]) -> list[UUID]:
+        """Get the resumes that list every one of the given skills."""
+        normalized = {normalize_skill(name) for name in skills} - {None}
+        if not normalized:
+            return []
+        postings = sorted(
+            (self._postings.get(skill, array("I")) for skill in normalized if skill),
+            key=len,
+        )
+        # Walk the shortest list and binary search the longer ones
+        doc_ids = list(postings[0])
+        for other in postings[1:]:
+            doc_ids = [
+                doc_id
+                for doc_id in doc_ids
+                if (index := bisect.bisect_left(other, doc_id)) < len(other)
+                and other[index] == doc_id
+            ]
+            if not doc_ids:
+                break
+        return [entry[0] for doc_id in doc_ids if (entry := self._resumes[doc_id])]
+
+    def apply(self, item: Mapping[str, Any]) -> None:
+        """Apply one resume-service skill export item."""
+        resume_id = UUID(item["resume_id"])
+        if item["status"] == "completed":
+            self.upsert(resume_id, UUID(item["user_id"]), item["skills"])
+        else:
+            self.remove(resume_id)
+        self.position = (datetime.fromisoformat(item["updated_at"]), resume_id)
+
+    def replace_with(self, other: "ResumeSkillIndex") -> None:
+        """Take over the contents of a freshly built index."""
+        self._postings = other._postings
+        self._ids = other._ids
+        self._resumes = other._resumes
+        self.position = other.position
+        self.ready = True
+
+
+skill_index = ResumeSkillIndex()
+
+
+async def _apply_export(
+    index: ResumeSkillIndex,
+    http: HttpClient,
+    after: Optional[tuple[datetime, Optional[UUID]]],
+) -> None:
+    """Page through resume-service skill exports from a position into an index."""
+    while True:
+        params: dict[str, Any] = {"limit": settings.skill_index_page_size}
+        if after is not None:
+            params["updated_after"] = after[0].isoformat()
+            if after[1] is not None:
+                params["after_id"] = str(after[1])
+        response = await http.get(
+            f"{settings.resume_service_url}/api/v1/resumes/skills/export",
+            params=params,
+        )
+        response.raise_for_status()
+        items = response.json()["items"]
+        for item in items:
+            index.apply(item)
+        if len(items) < settings.skill_index_page_size:
+            return
+        after = index.position
+
+
+async def sync_skill_index(index: ResumeSkillIndex, http: HttpClient) -> None:
+    """Keep an index in step with resume-service until cancelled.
+
+    A full rebuild runs at startup and every ``skill_index_rebuild_interval``
+    seconds, which also drops deleted resumes. In between, changes are
+    polled every ``skill_index_poll_interval`` seconds, re-reading the last
+    ``skill_index_poll_overlap`` seconds so late commits are not missed.
+    """
+    loop = asyncio.get_running_loop()
+    rebuilt_at: Optional[float] = None
+    while True:
+        try:
+            if (
+                rebuilt_at is None
+                or loop.time() - rebuilt_at >= settings.skill_index_rebuild_interval
+            ):
+                fresh = ResumeSkillIndex()
+                await _apply_export(fresh, http, None)
+                index.replace_with(fresh)
+                rebuilt_at = loop.time()
+                logger.info(f"Skill index rebuilt with {len(index)} resumes")
+            elif index.position is not None:
+                overlap = timedelta(seconds=settings.skill_index_poll_overlap)
+                await _apply_export(index, http, (index.position[0] - overlap, None))
+            SKILL_INDEX_RESUMES.set(len(index))
+        except Exception as e:
+            logger.error(f"Skill index sync failed: {e}")
+        await asyncio.sleep(settings.skill_index_poll_interval)
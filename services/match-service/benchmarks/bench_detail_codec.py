@@ -0,0 +1,81 @@
+"""Compare cached match detail encodings: legacy JSON vs. the binary codec.
+
+Run from the service root:
+
+    python -m benchmarks.bench_detail_codec
+"""
+
+import json
+import random
+import timeit
+from uuid import uuid4
+
+from app.core.codec import decode_match_detail, encode_match_detail
+
+ROUNDS = 20000
+
+VOCABULARY = (
+    "candidate strong experience python backend services led team migrated "
+    "postgres latency reduced api design mentoring cloud aws lambda streaming "
+    "kafka gaps kubernetes limited frontend exposure role requires on-call"
+).split()
+
+
+def sample_detail(reasoning_words: int) -> dict:
+    """Build a detail shaped like the ones MatchService caches."""
+    return {
+        "match_id": str(uuid4()),
+        "overall_score": 82.5,
+        "skill_score": 88.0,
+        "experience_score": 76.25,
+        "culture_score": 80.0,
+        "score_breakdown": {
+            "matched_skills": ["python", "fastapi", "postgresql", "redis", "aws"],
+            "missing_skills": ["kubernetes", "terraform"],
+            "experience_years": {"required": 5, "candidate": 6},
+        },
+        "ai_reasoning": " ".join(random.choices(VOCABULARY, k=reasoning_words)),
+        "is_recommended": True,
+    }
+
+
+def bench(label: str, detail: dict) -> None:
+    """Print size and per-call timings for one detail shape."""
+    as_json = json.dumps(detail).encode()
+    as_binary = encode_match_detail(detail)
+
+    def json_scores() -> float:
+        return json.loads(as_json)["overall_score"]
+
+    def binary_scores() -> float:
+        return decode_match_detail(as_binary)["overall_score"]
+
+    def json_full() -> str:
+        return json.loads(as_json)["ai_reasoning"]
+
+    def binary_full() -> str:
+        return decode_match_detail(as_binary)["ai_reasoning"]
+
+    def per_call_us(fn) -> float:
+        return timeit.timeit(fn, number=ROUNDS) / ROUNDS * 1e6
+
+    print(f"\n{label}")
+    print(f"  size        json {len(as_json):6d} B   binary {len(as_binary):6d} B")
+    for name, json_fn, binary_fn in (
+        ("scores only", json_scores, binary_scores),
+        ("full decode", json_full, binary_full),
+    ):
+        print(
+            f"  {name:11s} json {per_call_us(json_fn):6.2f} us "
+            f"  binary {per_call_us(binary_fn):6.2f} us"
+        )
+    print(
+        f"  encode      json {per_call_us(lambda: json.dumps(detail)):6.2f} us "
+        f"  binary {per_call_us(lambda: encode_match_detail(detail)):6.2f} us"
+    )
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    bench("short reasoning (~40 words)", sample_detail(reasoning_words=40))
+    bench("long reasoning (~400 words)", sample_detail(reasoning_words=400))
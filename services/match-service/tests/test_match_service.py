@@ -1,13 +1,52 @@
 """Unit tests for MatchService."""
 
+import asyncio
+import json
+from datetime import date, datetime
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
-from app.services.match_service import MatchService
-from app.models.schemas import MatchCreate, MatchUpdate, MatchScoreRequest
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from app.core.config import settings
+from app.core.fingerprint import content_hash, input_fingerprint
+from app.core.match_stats import (
+    StatsDeltas,
+    add_contribution,
+    match_contribution,
+    match_metrics,
+)
+from app.core.redis import CachedRead
+from app.services.match_service import (
+    DEFERRED_SCORE_ERROR,
+    MatchService,
+    ScoringInput,
+)
+from app.models.schemas import (
+    BatchMatchScoreItem,
+    BatchMatchScoreRequest,
+    CalculateMatchesForJobRequest,
+    CalculateMatchesForUserRequest,
+    MatchCreate,
+    MatchScorePair,
+    MatchScoreRequest,
+    MatchScoreStatus,
+    MatchUpdate,
+    ScoringLane,
+    ScoringTaskResponse,
+    ScoringTaskStatus,
+    StatsScope,
+)
+from app.services.prescorer import (
+    PreScore,
+    job_requirements,
+    prescore,
+    resume_profile,
+)
+from app.services.scoring_worker import ScoringWorkerPool
+from app.services.skill_index import ResumeSkillIndex
 
 
 @pytest.fixture
@@ -21,15 +60,31 @@ def mock_redis():
     """Create a mock Redis client."""
     redis = AsyncMock()
     redis.get_match_detail.return_value = None
-    redis.get_top_matches_for_job.return_value = None
-    redis.get_recommended_jobs_for_user.return_value = None
+    redis.read_match_detail.return_value = CachedRead(None, False)
+    redis.read_top_matches_for_job.return_value = CachedRead(None, False)
+    redis.read_recommended_jobs_for_user.return_value = CachedRead([], False)
+    redis.acquire_score_lease.return_value = "lease-token"
+    redis.get_match_count.return_value = None
+    # Every pair is free, so each task queues under its own id
+    redis.enqueue_scoring_tasks.side_effect = lambda lane, tasks: [
+        task["task_id"] for task in tasks
+    ]
+    redis.get_scoring_task_statuses.return_value = []
     return redis
 
 
 @pytest.fixture
 def match_service(mock_session, mock_redis):
     """Create MatchService with mocked dependencies."""
-    return MatchService(mock_session, mock_redis)
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=30.0)
+    service = MatchService(mock_session, mock_redis, ai_breaker=breaker)
+    # No fingerprints or pre-scores by default, so every miss goes to the AI
+    service._prepare_inputs = AsyncMock(
+        side_effect=lambda pairs: {
+            (p.job_id, p.resume_id): ScoringInput(None, None) for p in pairs
+        }
+    )
+    return service
 
 
 @pytest.fixture
@@ -117,7 +172,7 @@ class TestGetMatchesForJob:
             mock_get.return_value = [sample_match]
             mock_count.return_value = 1
 
-            matches, total = await match_service.get_matches_for_job(
+            matches, total, _ = await match_service.get_matches_for_job(
                 job_id, page=1, page_size=20
             )
 
@@ -140,7 +195,7 @@ class TestGetMatchesForJob:
             mock_get.return_value = [sample_match]
             mock_count.return_value = 1
 
-            matches, total = await match_service.get_matches_for_job(
+            matches, total, _ = await match_service.get_matches_for_job(
                 job_id, min_score=0.8
             )
 
@@ -148,6 +203,61 @@ class TestGetMatchesForJob:
             call_kwargs = mock_get.call_args.kwargs
             assert call_kwargs["min_score"] == 0.8
 
+    @pytest.mark.asyncio
+    async def test_get_matches_by_cursor(self, match_service, sample_match):
+        """Should resume after the cursor position without an offset."""
+        job_id = sample_match.job_id
+
+        with patch.object(
+            match_service.repository, "get_by_job_id", new_callable=AsyncMock
+        ) as mock_get, patch.object(
+            match_service.repository, "count_by_job_id", new_callable=AsyncMock
+        ) as mock_count:
+            mock_get.return_value = [sample_match]
+
+            _, _, cursor = await match_service.get_matches_for_job(
+                job_id, page_size=1, include_total=False
+            )
+            matches, total, _ = await match_service.get_matches_for_job(
+                job_id, page_size=1, cursor=cursor, include_total=False
+            )
+
+            assert total is None
+            mock_count.assert_not_called()
+            mock_get.assert_called_with(
+                job_id,
+                limit=1,
+                min_score=None,
+                after=(sample_match.overall_score, sample_match.id),
+            )
+
+    @pytest.mark.asyncio
+    async def test_get_matches_uses_cached_total(
+        self, match_service, mock_redis, sample_match
+    ):
+        """Should serve the total from Redis and leave the last page uncursored."""
+        mock_redis.get_match_count.return_value = 42
+
+        with patch.object(
+            match_service.repository, "get_by_job_id", new_callable=AsyncMock
+        ) as mock_get, patch.object(
+            match_service.repository, "count_by_job_id", new_callable=AsyncMock
+        ) as mock_count:
+            mock_get.return_value = [sample_match]
+
+            _, total, next_cursor = await match_service.get_matches_for_job(
+                sample_match.job_id, page_size=20
+            )
+
+            assert total == 42
+            assert next_cursor is None
+            mock_count.assert_not_called()
+
+    def test_rejects_malformed_cursor(self, match_service):
+        """Should raise ValueError for a cursor it did not issue."""
+        with pytest.raises(ValueError):
+            match_service._decode_cursor("not-a-cursor")
+
 
 class TestCalculateMatchScore:
     """Tests for calculate_match_score method."""
@@ -165,7 +275,7 @@ class TestCalculateMatchScore:
             "ai_reasoning": "Cached reasoning",
             "is_recommended": True,
         }
-        mock_redis.get_match_detail.return_value = cached_data
+        mock_redis.read_match_detail.return_value = CachedRead(cached_data, False)
 
         request = MatchScoreRequest(
             job_id=sample_match.job_id,
@@ -201,169 +311,2138 @@ class TestCalculateMatchScore:
         }
 
         with patch.object(
-            match_service.repository, "get_by_job_and_resume", new_callable=AsyncMock
-        ) as mock_get, patch.object(
-            match_service.repository, "create", new_callable=AsyncMock
-        ) as mock_create, patch.object(
-            match_service.repository, "update", new_callable=AsyncMock
-        ) as mock_update, patch.object(
+            match_service.repository, "upsert_score", new_callable=AsyncMock
+        ) as mock_upsert, patch.object(
             match_service, "_call_ai_service", new_callable=AsyncMock
         ) as mock_ai:
-            mock_get.return_value = None
-            mock_create.return_value = sample_match
-            mock_update.return_value = sample_match
+            mock_upsert.return_value = sample_match
             mock_ai.return_value = ai_response
 
             result = await match_service.calculate_match_score(request)
 
             # Should not check cache
-            mock_redis.get_match_detail.assert_not_called()
+            mock_redis.read_match_detail.assert_not_called()
             assert result.is_cached is False
+            # Should persist with a single upsert
+            mock_upsert.assert_called_once()
+            row = mock_upsert.call_args.args[0]
+            assert row["job_id"] == sample_match.job_id
+            assert row["overall_score"] == Decimal("0.9")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_ai_call(
+        self, match_service, mock_redis, sample_match
+    ):
+        """Should coalesce concurrent requests for the same pair."""
+        import asyncio
 
+        request = MatchScoreRequest(
+            job_id=sample_match.job_id,
+            resume_id=sample_match.resume_id,
+            user_id=sample_match.user_id,
+        )
 
-class TestGetTopMatchesForJob:
-    """Tests for get_top_matches_for_job method."""
+        async def slow_ai(_request):
+            await asyncio.sleep(0.01)
+            return {
+                "overall_score": 0.9,
+                "skill_score": 0.9,
+                "experience_score": 0.9,
+                "culture_score": 0.9,
+                "score_breakdown": {},
+                "ai_reasoning": "Shared",
+            }
+
+        with patch.object(
+            match_service.repository, "upsert_score", new_callable=AsyncMock
+        ) as mock_upsert, patch.object(
+            match_service, "_call_ai_service", side_effect=slow_ai
+        ) as mock_ai:
+            mock_upsert.return_value = sample_match
+
+            results = await asyncio.gather(
+                *(match_service.calculate_match_score(request) for _ in range(5))
+            )
+
+        assert mock_ai.call_count == 1
+        assert len({result.match_id for result in results}) == 1
+        mock_redis.release_score_lease.assert_called_once_with(
+            str(sample_match.job_id), str(sample_match.resume_id), "lease-token"
+        )
 
     @pytest.mark.asyncio
-    async def test_get_top_matches_from_cache(self, match_service, mock_redis):
-        """Should return cached top matches."""
+    async def test_waits_on_lease_held_by_other_replica(
+        self, match_service, mock_redis, sample_match
+    ):
+        """Should serve the other replica's cached score once its lease ends."""
+        cached_data = {
+            "match_id": str(sample_match.id),
+            "overall_score": 0.7,
+            "skill_score": 0.7,
+            "experience_score": 0.7,
+            "culture_score": 0.7,
+            "score_breakdown": {},
+            "ai_reasoning": "Scored elsewhere",
+            "is_recommended": False,
+        }
+        mock_redis.get_match_detail.return_value = cached_data
+        mock_redis.acquire_score_lease.return_value = None
+        mock_redis.score_lease_held.side_effect = [True, False]
+
+        request = MatchScoreRequest(
+            job_id=sample_match.job_id,
+            resume_id=sample_match.resume_id,
+            user_id=sample_match.user_id,
+        )
+
+        with patch(
+            "app.services.match_service.settings.match_score_poll_interval", 0
+        ), patch.object(
+            match_service, "_call_ai_service", new_callable=AsyncMock
+        ) as mock_ai:
+            result = await match_service.calculate_match_score(request)
+
+        mock_ai.assert_not_called()
+        mock_redis.release_score_lease.assert_not_called()
+        assert result.is_cached is True
+        assert result.ai_reasoning == "Scored elsewhere"
+
+
+class TestInputFingerprint:
+    """Tests for reusing scores whose inputs are unchanged."""
+
+    def test_content_hash_ignores_bookkeeping_fields(self):
+        """Should hash only the content the AI scores."""
+        job = {"title": "Engineer", "skills": ["python"], "viewsCount": 3}
+
+        assert content_hash(job) == content_hash({**job, "viewsCount": 40})
+        assert content_hash(job) != content_hash({**job, "title": "Manager"})
+
+    def test_fingerprint_covers_prompt_version(self):
+        """Should change when the scoring prompt version changes."""
+        before = input_fingerprint("job", "resume")
+        with patch("app.core.fingerprint.settings.ai_scoring_prompt_version", "2"):
+            assert input_fingerprint("job", "resume") != before
+
+    @pytest.mark.asyncio
+    async def test_fetches_each_document_once(self, match_service):
+        """Should fingerprint shared jobs with a single fetch."""
         job_id = uuid4()
-        cached_matches = [
-            (str(uuid4()), 0.95),
-            (str(uuid4()), 0.90),
-            (str(uuid4()), 0.85),
+        pairs = [
+            MatchScorePair(job_id=job_id, resume_id=uuid4(), user_id=uuid4())
+            for _ in range(3)
         ]
-        mock_redis.get_top_matches_for_job.return_value = cached_matches
-
-        result = await match_service.get_top_matches_for_job(job_id, limit=10)
 
-        assert result.total == 3
-        assert len(result.matches) == 3
-        assert result.matches[0].score == 0.95
+        with patch.object(
+            match_service, "_fetch_document", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = {"skills": []}
+            inputs = await MatchService._prepare_inputs(match_service, pairs)
+
+        assert mock_fetch.call_count == 4
+        document_hash = content_hash({"skills": []})
+        assert {value.fingerprint for value in inputs.values()} == {
+            input_fingerprint(document_hash, document_hash)
+        }
 
     @pytest.mark.asyncio
-    async def test_get_top_matches_from_database(
+    async def test_unchanged_inputs_skip_ai_call(
         self, match_service, mock_redis, sample_match
     ):
-        """Should fallback to database when cache is empty."""
-        job_id = uuid4()
-        mock_redis.get_top_matches_for_job.return_value = None
+        """Should return the stored score even when forced to recalculate."""
+        sample_match.input_fingerprint = "fingerprint"
+        match_service._prepare_inputs.side_effect = None
+        match_service._prepare_inputs.return_value = {
+            (sample_match.job_id, sample_match.resume_id): ScoringInput(
+                "fingerprint", None
+            )
+        }
+        request = MatchScoreRequest(
+            job_id=sample_match.job_id,
+            resume_id=sample_match.resume_id,
+            user_id=sample_match.user_id,
+            force_recalculate=True,
+        )
 
         with patch.object(
-            match_service.repository, "get_by_job_id", new_callable=AsyncMock
+            match_service, "_call_ai_service", new_callable=AsyncMock
+        ) as mock_ai, patch.object(
+            match_service.repository, "get_by_job_and_resume", new_callable=AsyncMock
         ) as mock_get:
+            mock_get.return_value = sample_match
+
+            result = await match_service.calculate_match_score(request)
+
+        mock_ai.assert_not_called()
+        assert result.overall_score == Decimal("0.85")
+        mock_redis.cache_matches.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_reuses_unchanged_pairs(self, match_service, sample_match):
+        """Should only send pairs with changed inputs to the AI service."""
+        sample_match.input_fingerprint = "fingerprint"
+        changed = MatchScorePair(job_id=uuid4(), resume_id=uuid4(), user_id=uuid4())
+        match_service._prepare_inputs.side_effect = None
+        match_service._prepare_inputs.return_value = {
+            (sample_match.job_id, sample_match.resume_id): ScoringInput(
+                "fingerprint", None
+            ),
+            (changed.job_id, changed.resume_id): ScoringInput("new-fingerprint", None),
+        }
+        request = BatchMatchScoreRequest(
+            pairs=[
+                MatchScorePair(
+                    job_id=sample_match.job_id,
+                    resume_id=sample_match.resume_id,
+                    user_id=sample_match.user_id,
+                ),
+                changed,
+            ],
+            force_recalculate=True,
+        )
+
+        with patch.object(
+            match_service.repository, "get_by_pairs", new_callable=AsyncMock
+        ) as mock_get, patch.object(
+            match_service, "_call_ai_service", new_callable=AsyncMock
+        ) as mock_ai, patch.object(
+            match_service.repository, "bulk_upsert_scores", new_callable=AsyncMock
+        ) as mock_upsert:
             mock_get.return_value = [sample_match]
+            mock_ai.side_effect = CircuitOpenError("open")
+
+            items = [
+                item
+                async for item in match_service.batch_calculate_match_scores(request)
+            ]
+
+        assert items[0].result.match_id == sample_match.id
+        mock_ai.assert_called_once()
+        assert mock_ai.call_args.args[0].job_id == changed.job_id
+        mock_upsert.assert_not_called()
+
+
+class TestPreScorer:
+    """Tests for deterministic pre-scoring and the AI gate."""
+
+    def test_scores_skill_overlap_and_experience(self):
+        """Should weight required skills over optional ones and fit experience."""
+        job = job_requirements(
+            {
+                "skills": [
+                    {"skillName": "Python", "isRequired": True},
+                    {"skillName": "SQL", "isRequired": True},
+                    {"skillName": "Go", "isRequired": False},
+                ],
+                "experienceMin": 2,
+            }
+        )
+        resume = resume_profile(
+            {
+                "skills": [{"skill_name": " python "}, {"skill_name": "Go"}],
+                "experiences": [
+                    {"start_date": "2020-01-01", "end_date": "2021-01-01"},
+                    # Overlapping periods count once
+                    {"start_date": "2020-07-01", "end_date": "2021-01-01"},
+                ],
+            },
+            today=date(2026, 1, 1),
+        )
 
-            result = await match_service.get_top_matches_for_job(job_id, limit=10)
+        result = prescore(job, resume)
 
-            assert result.total == 1
-            mock_get.assert_called_once_with(job_id, limit=10)
+        assert result.skill_score == pytest.approx(60.0)  # 0.8 * 1/2 + 0.2 * 1
+        assert result.experience_score == pytest.approx(50.0, abs=0.5)
 
+    def test_no_job_skills_means_no_prescore(self):
+        """Should not gate pairs when the job lists nothing to compare."""
+        job = job_requirements({"skills": []})
+        resume = resume_profile({"skills": [{"skill_name": "python"}]})
 
-class TestAddFeedback:
-    """Tests for add_feedback method."""
+        assert prescore(job, resume) is None
 
     @pytest.mark.asyncio
-    async def test_add_feedback_success(self, match_service, sample_match):
-        """Should add feedback successfully."""
-        from app.models.schemas import MatchFeedbackCreate
+    async def test_batch_only_escalates_pairs_above_gate(
+        self, match_service, sample_match
+    ):
+        """Should store low pre-scores directly and send the rest to the AI."""
+        low = MatchScorePair(job_id=uuid4(), resume_id=uuid4(), user_id=uuid4())
+        high = MatchScorePair(job_id=uuid4(), resume_id=uuid4(), user_id=uuid4())
+        match_service._prepare_inputs.side_effect = None
+        match_service._prepare_inputs.return_value = {
+            (low.job_id, low.resume_id): ScoringInput("a", PreScore(0.0, 100.0, 30.0)),
+            (high.job_id, high.resume_id): ScoringInput(
+                "b", PreScore(100.0, 100.0, 100.0)
+            ),
+        }
+        request = BatchMatchScoreRequest(pairs=[low, high], force_recalculate=True)
+        ai_response = {
+            "overall_score": 0.9,
+            "skill_score": 0.9,
+            "experience_score": 0.9,
+            "culture_score": 0.9,
+            "score_breakdown": {"skills": 0.9},
+            "ai_reasoning": "Strong match",
+        }
 
-        feedback = MatchFeedbackCreate(
-            match_id=sample_match.id,
+        with patch.object(
+            match_service.repository, "get_by_pairs", new_callable=AsyncMock
+        ) as mock_get, patch.object(
+            match_service, "_call_ai_service", new_callable=AsyncMock
+        ) as mock_ai, patch.object(
+            match_service.repository, "bulk_upsert_scores", new_callable=AsyncMock
+        ) as mock_upsert:
+            mock_get.return_value = []
+            mock_ai.return_value = ai_response
+            mock_upsert.return_value = [sample_match]
+
+            _ = [
+                item
+                async for item in match_service.batch_calculate_match_scores(request)
+            ]
+
+        mock_ai.assert_called_once()
+        assert mock_ai.call_args.args[0].resume_id == high.resume_id
+        gated_rows, ai_rows = (call.args[0] for call in mock_upsert.call_args_list)
+        assert gated_rows[0]["resume_id"] == low.resume_id
+        assert gated_rows[0]["overall_score"] == Decimal("30.0")
+        assert gated_rows[0]["score_breakdown"]["prescore"]["skill_score"] == 0.0
+        assert ai_rows[0]["score_breakdown"]["skills"] == 0.9
+        assert ai_rows[0]["score_breakdown"]["prescore"]["overall_score"] == 100.0
+
+
+class TestSkillIndex:
+    """Tests for the in-memory resume skill index."""
+
+    def test_upsert_and_remove_keep_postings_sorted(self):
+        """Should move a re-indexed resume between postings and drop removed ones."""
+        index = ResumeSkillIndex()
+        first, second = uuid4(), uuid4()
+        index.upsert(first, uuid4(), ["Python", "SQL"])
+        index.upsert(second, uuid4(), ["python"])
+        index.upsert(first, uuid4(), ["Go", "Python"])
+
+        assert list(index._postings["python"]) == [0, 1]
+        assert list(index._postings["go"]) == [0]
+        assert "sql" not in index._postings
+
+        index.remove(first)
+        index.remove(uuid4())
+
+        assert len(index) == 1
+        assert list(index._postings["python"]) == [1]
+        assert "go" not in index._postings
+
+    def test_top_k_weights_rare_skills(self):
+        """Should rank a rare skill over a common one and break ties by recency."""
+        index = ResumeSkillIndex()
+        common = [uuid4() for _ in range(3)]
+        for resume_id in common:
+            index.upsert(resume_id, uuid4(), ["Python"])
+        rare = uuid4()
+        index.upsert(rare, uuid4(), ["Rust"])
+
+        hits = index.top_k({"Python": 1.0, "rust": 1.0}, 2)
+
+        assert [hit.resume_id for hit in hits] == [rare, common[-1]]
+        assert hits[0].score > hits[1].score
+
+    def test_intersect_requires_every_skill(self):
+        """Should only return resumes listing all the given skills."""
+        index = ResumeSkillIndex()
+        both, python_only = uuid4(), uuid4()
+        index.upsert(both, uuid4(), ["Python", "SQL"])
+        index.upsert(python_only, uuid4(), ["Python"])
+
+        assert index.intersect(["python", "SQL"]) == [both]
+        assert index.intersect(["Python", "Haskell"]) == []
+
+    def test_apply_removes_resumes_that_are_not_completed(self):
+        """Should index completed resumes, drop others, and track the position."""
+        index = ResumeSkillIndex()
+        resume_id = uuid4()
+        item = {
+            "resume_id": str(resume_id),
+            "user_id": str(uuid4()),
+            "status": "completed",
+            "skills": ["Python"],
+            "updated_at": "2026-01-01T00:00:00",
+        }
+        index.apply(item)
+        assert index.intersect(["python"]) == [resume_id]
+
+        index.apply({**item, "status": "failed", "updated_at": "2026-01-02T00:00:00"})
+
+        assert len(index) == 0
+        assert index.position == (datetime(2026, 1, 2), resume_id)
+
+    @pytest.mark.asyncio
+    async def test_retrieve_candidates_uses_ready_index(self, match_service):
+        """Should shortlist from a built index without calling resume-service."""
+        job_id, resume_id, user_id = uuid4(), uuid4(), uuid4()
+        index = ResumeSkillIndex()
+        index.upsert(resume_id, user_id, ["Python"])
+        index.ready = True
+        match_service.skill_index = index
+        match_service.http = MagicMock()
+        match_service.http.post = AsyncMock()
+
+        candidates = await match_service._retrieve_candidates(job_id, ["Python"], 10)
+
+        match_service.http.post.assert_not_called()
+        assert [(c.resume_id, c.user_id) for c in candidates] == [(resume_id, user_id)]
+        assert candidates[0].job_id == job_id
+
+
+class TestDegradedScoring:
+    """Tests for scoring while the AI service is unavailable."""
+
+    @pytest.mark.asyncio
+    async def test_returns_last_known_score(
+        self, match_service, mock_redis, sample_match
+    ):
+        """Should serve the stored score and queue a rescore instead of writing."""
+        request = MatchScoreRequest(
+            job_id=sample_match.job_id,
+            resume_id=sample_match.resume_id,
             user_id=sample_match.user_id,
-            rating=5,
-            feedback_type="helpful",
-            feedback_by=sample_match.user_id,
-            comment="Great match!",
+            force_recalculate=True,
         )
 
         with patch.object(
-            match_service.repository, "get_by_id", new_callable=AsyncMock
+            match_service, "_call_ai_service", new_callable=AsyncMock
+        ) as mock_ai, patch.object(
+            match_service.repository, "get_by_job_and_resume", new_callable=AsyncMock
         ) as mock_get, patch.object(
-            match_service.repository, "create_feedback", new_callable=AsyncMock
-        ) as mock_create:
+            match_service.repository, "upsert_score", new_callable=AsyncMock
+        ) as mock_upsert:
+            mock_ai.side_effect = CircuitOpenError("open")
             mock_get.return_value = sample_match
 
-            result = await match_service.add_feedback(feedback)
+            result = await match_service.calculate_match_score(request)
 
-            assert result is True
-            mock_create.assert_called_once_with(feedback)
+        assert result.status is MatchScoreStatus.STALE
+        assert result.overall_score == Decimal("0.85")
+        mock_upsert.assert_not_called()
+        mock_redis.cache_matches.assert_not_called()
+        mock_redis.enqueue_scoring_tasks.assert_called_once()
+        lane, tasks = mock_redis.enqueue_scoring_tasks.call_args.args
+        assert lane == "backfill"
+        assert tasks[0]["resume_id"] == str(sample_match.resume_id)
+        assert tasks[0]["force"] == "1"
 
     @pytest.mark.asyncio
-    async def test_add_feedback_match_not_found(self, match_service):
-        """Should return False when match not found."""
-        from app.models.schemas import MatchFeedbackCreate
-
-        user_id = uuid4()
-        feedback = MatchFeedbackCreate(
-            match_id=uuid4(),
-            user_id=user_id,
-            rating=5,
-            feedback_type="helpful",
-            feedback_by=user_id,
-        )
+    async def test_returns_pending_without_prior_score(
+        self, match_service, mock_redis
+    ):
+        """Should report pending rather than a zero score."""
+        request = MatchScoreRequest(job_id=uuid4(), resume_id=uuid4(), user_id=uuid4())
 
         with patch.object(
-            match_service.repository, "get_by_id", new_callable=AsyncMock
+            match_service, "_call_ai_service", new_callable=AsyncMock
+        ) as mock_ai, patch.object(
+            match_service.repository, "get_by_job_and_resume", new_callable=AsyncMock
         ) as mock_get:
+            mock_ai.side_effect = CircuitOpenError("open")
             mock_get.return_value = None
 
-            result = await match_service.add_feedback(feedback)
+            result = await match_service.calculate_match_score(request)
+
+        assert result.status is MatchScoreStatus.PENDING
+        assert result.overall_score is None
+        mock_redis.enqueue_scoring_tasks.assert_called_once()
 
-            assert result is False
+    @pytest.mark.asyncio
+    async def test_batch_queues_unavailable_pairs(self, match_service, mock_redis):
+        """Should report and queue pairs the AI service could not score."""
+        pair = MatchScorePair(job_id=uuid4(), resume_id=uuid4(), user_id=uuid4())
+        request = BatchMatchScoreRequest(pairs=[pair], force_recalculate=True)
 
+        with patch.object(
+            match_service, "_call_ai_service", new_callable=AsyncMock
+        ) as mock_ai, patch.object(
+            match_service.repository, "bulk_upsert_scores", new_callable=AsyncMock
+        ) as mock_upsert:
+            mock_ai.side_effect = CircuitOpenError("open")
 
-class TestCallAIService:
-    """Tests for _call_ai_service method."""
+            items = [
+                item
+                async for item in match_service.batch_calculate_match_scores(request)
+            ]
+
+        assert items[0].result is None
+        assert "rescore queued" in items[0].error
+        mock_upsert.assert_not_called()
+        lane, tasks = mock_redis.enqueue_scoring_tasks.call_args.args
+        assert lane == "backfill"
+        assert [task["job_id"] for task in tasks] == [str(pair.job_id)]
+
+
+class TestScoringQueue:
+    """Tests for the background scoring work queue."""
 
     @pytest.mark.asyncio
-    async def test_ai_service_call_success(self, match_service):
-        """Should return AI service response."""
-        request = MatchScoreRequest(
-            job_id=uuid4(),
-            resume_id=uuid4(),
-            user_id=uuid4(),
+    async def test_submit_enqueues_on_lane(self, match_service, mock_redis):
+        """Should queue every pair on the requested lane in one call."""
+        pairs = [
+            MatchScorePair(job_id=uuid4(), resume_id=uuid4(), user_id=uuid4())
+            for _ in range(2)
+        ]
+
+        tasks = await match_service.submit_scores(pairs, ScoringLane.BULK)
+
+        assert [task.status for task in tasks] == [ScoringTaskStatus.QUEUED] * 2
+        lane, queued = mock_redis.enqueue_scoring_tasks.call_args.args
+        assert lane == "bulk"
+        assert [item["task_id"] for item in queued] == [
+            str(task.task_id) for task in tasks
+        ]
+        assert queued[0]["force"] == "0"
+        assert queued[0]["attempt"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_submit_reports_task_holding_pair(self, match_service, mock_redis):
+        """Should answer a pair that is already queued with its existing task."""
+        pairs = [
+            MatchScorePair(job_id=uuid4(), resume_id=uuid4(), user_id=uuid4())
+            for _ in range(2)
+        ]
+        holder = ScoringTaskResponse(
+            task_id=uuid4(),
+            lane=ScoringLane.BACKFILL,
+            status=ScoringTaskStatus.RUNNING,
+            job_id=pairs[1].job_id,
+            resume_id=pairs[1].resume_id,
         )
+        mock_redis.enqueue_scoring_tasks.side_effect = lambda lane, tasks: [
+            tasks[0]["task_id"],
+            str(holder.task_id),
+        ]
+        mock_redis.get_scoring_task_statuses.return_value = [
+            holder.model_dump(mode="json")
+        ]
 
-        expected_response = {
-            "overall_score": 0.85,
-            "skill_score": 0.9,
-            "experience_score": 0.8,
-            "culture_score": 0.85,
-            "score_breakdown": {},
-            "ai_reasoning": "Test reasoning",
-        }
+        tasks = await match_service.submit_scores(pairs, ScoringLane.BULK)
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.json.return_value = expected_response
-            mock_response.raise_for_status = MagicMock()
+        mock_redis.get_scoring_task_statuses.assert_called_once_with(
+            [str(holder.task_id)]
+        )
+        assert tasks[0].lane is ScoringLane.BULK
+        assert tasks[1] == holder
 
-            mock_client_instance = AsyncMock()
-            mock_client_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+    @pytest.mark.asyncio
+    async def test_get_unknown_task(self, match_service, mock_redis):
+        """Should return None for an unknown or expired task."""
+        mock_redis.get_scoring_task_status.return_value = None
 
-            result = await match_service._call_ai_service(request)
+        assert await match_service.get_scoring_task(uuid4()) is None
 
-            assert result == expected_response
+    @pytest.mark.asyncio
+    async def test_worker_records_result(self, mock_redis, sample_match):
+        """Should mark a task running, score it and store the result."""
+        pool = ScoringWorkerPool(mock_redis, MagicMock())
+        task_id = uuid4()
+        fields = {
+            "task_id": str(task_id),
+            "job_id": str(sample_match.job_id),
+            "resume_id": str(sample_match.resume_id),
+            "user_id": str(sample_match.user_id),
+            "force": "1",
+        }
+        result = MatchService._response_from_match(sample_match)
+
+        with patch(
+            "app.services.scoring_worker.AsyncSessionLocal"
+        ) as mock_session_factory, patch.object(
+            MatchService, "calculate_match_score", new_callable=AsyncMock
+        ) as mock_score:
+            mock_session_factory.return_value.__aenter__.return_value = AsyncMock()
+            mock_score.return_value = result
+
+            await pool._run(ScoringLane.INTERACTIVE, fields)
+
+        assert mock_score.call_args.args[0].force_recalculate is True
+        statuses = [
+            call.args[1]["status"]
+            for call in mock_redis.set_scoring_task_status.call_args_list
+        ]
+        assert statuses == ["running", "done"]
+        final = mock_redis.set_scoring_task_status.call_args.args[1]
+        assert final["result"]["match_id"] == str(sample_match.id)
+        mock_redis.release_scoring_pair.assert_called_once_with(
+            str(sample_match.job_id), str(sample_match.resume_id), str(task_id)
+        )
 
     @pytest.mark.asyncio
-    async def test_ai_service_call_failure(self, match_service):
-        """Should return default scores on failure."""
-        import httpx
+    @pytest.mark.parametrize("attempt", ["1", "4"])
+    async def test_worker_requeues_deferred_task(
+        self, mock_redis, sample_match, attempt
+    ):
+        """Should queue a deferred task again on backfill, keeping its pair."""
+        pool = ScoringWorkerPool(mock_redis, MagicMock())
+        fields = {
+            "task_id": str(uuid4()),
+            "job_id": str(sample_match.job_id),
+            "resume_id": str(sample_match.resume_id),
+            "user_id": str(sample_match.user_id),
+            "force": "0",
+            "attempt": attempt,
+        }
+        deferred = MatchService._response_from_match(sample_match)
+        deferred.status = MatchScoreStatus.STALE
 
-        request = MatchScoreRequest(
-            job_id=uuid4(),
-            resume_id=uuid4(),
-            user_id=uuid4(),
+        with patch(
+            "app.services.scoring_worker.AsyncSessionLocal"
+        ) as mock_session_factory, patch.object(
+            MatchService, "calculate_match_score", new_callable=AsyncMock
+        ) as mock_score:
+            mock_session_factory.return_value.__aenter__.return_value = AsyncMock()
+            mock_score.return_value = deferred
+
+            await pool._run(ScoringLane.BULK, fields)
+
+        mock_redis.requeue_scoring_task.assert_called_once_with(
+            "backfill", {**fields, "force": "1", "attempt": str(int(attempt) + 1)}
+        )
+        mock_redis.release_scoring_pair.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_worker_fails_deferred_task_after_max_attempts(
+        self, mock_redis, sample_match
+    ):
+        """Should stop requeueing after scoring_task_max_attempts runs."""
+        pool = ScoringWorkerPool(mock_redis, MagicMock())
+        fields = {
+            "task_id": str(uuid4()),
+            "job_id": str(sample_match.job_id),
+            "resume_id": str(sample_match.resume_id),
+            "user_id": str(sample_match.user_id),
+            "force": "1",
+            "attempt": str(settings.scoring_task_max_attempts),
+        }
+        deferred = MatchService._response_from_match(sample_match)
+        deferred.status = MatchScoreStatus.PENDING
+
+        with patch(
+            "app.services.scoring_worker.AsyncSessionLocal"
+        ) as mock_session_factory, patch.object(
+            MatchService, "calculate_match_score", new_callable=AsyncMock
+        ) as mock_score:
+            mock_session_factory.return_value.__aenter__.return_value = AsyncMock()
+            mock_score.return_value = deferred
+
+            await pool._run(ScoringLane.BACKFILL, fields)
+
+        mock_redis.requeue_scoring_task.assert_not_called()
+        final = mock_redis.set_scoring_task_status.call_args.args[1]
+        assert final["status"] == "failed"
+        assert "unavailable" in final["error"]
+        mock_redis.release_scoring_pair.assert_called_once_with(
+            fields["job_id"], fields["resume_id"], fields["task_id"]
         )
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.post.side_effect = httpx.HTTPError("Connection failed")
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
 
-            result = await match_service._call_ai_service(request)
+    @pytest.mark.asyncio
+    async def test_worker_scores_bulk_tasks_as_batches(self, mock_redis, sample_match):
+        """Should score a read of bulk tasks with one batch per force flag."""
+        pool = ScoringWorkerPool(mock_redis, MagicMock())
+        entries = [
+            {
+                "task_id": str(uuid4()),
+                "job_id": str(sample_match.job_id),
+                "resume_id": str(uuid4()),
+                "user_id": str(sample_match.user_id),
+                "force": force,
+            }
+            for force in ("0", "1", "0")
+        ]
+        result = MatchService._response_from_match(sample_match)
+        requests = []
+
+        async def batch(self, request):
+            requests.append(request)
+            for pair in request.pairs:
+                yield BatchMatchScoreItem(
+                    job_id=pair.job_id, resume_id=pair.resume_id, result=result
+                )
+
+        with patch(
+            "app.services.scoring_worker.AsyncSessionLocal"
+        ) as mock_session_factory, patch.object(
+            MatchService, "batch_calculate_match_scores", batch
+        ):
+            mock_session_factory.return_value.__aenter__.return_value = AsyncMock()
+
+            await pool._run_batch(ScoringLane.BULK, entries)
+
+        assert [
+            (request.force_recalculate, [str(p.resume_id) for p in request.pairs])
+            for request in requests
+        ] == [
+            (False, [entries[0]["resume_id"], entries[2]["resume_id"]]),
+            (True, [entries[1]["resume_id"]]),
+        ]
+        final = {
+            call.args[0]: call.args[1]["status"]
+            for call in mock_redis.set_scoring_task_status.call_args_list
+        }
+        assert final == {entry["task_id"]: "done" for entry in entries}
+        assert mock_redis.release_scoring_pair.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_worker_batch_requeues_deferred_and_fails_errors(
+        self, mock_redis, sample_match
+    ):
+        """Should requeue deferred pairs of a batch and fail only errored ones."""
+        pool = ScoringWorkerPool(mock_redis, MagicMock())
+        deferred, failed = [
+            {
+                "task_id": str(uuid4()),
+                "job_id": str(sample_match.job_id),
+                "resume_id": str(uuid4()),
+                "user_id": str(sample_match.user_id),
+                "force": "0",
+                "attempt": "1",
+            }
+            for _ in range(2)
+        ]
+        errors = {
+            deferred["resume_id"]: DEFERRED_SCORE_ERROR,
+            failed["resume_id"]: "AI service returned 422",
+        }
+
+        async def batch(self, request):
+            for pair in request.pairs:
+                yield BatchMatchScoreItem(
+                    job_id=pair.job_id,
+                    resume_id=pair.resume_id,
+                    error=errors[str(pair.resume_id)],
+                )
+
+        with patch(
+            "app.services.scoring_worker.AsyncSessionLocal"
+        ) as mock_session_factory, patch.object(
+            MatchService, "batch_calculate_match_scores", batch
+        ):
+            mock_session_factory.return_value.__aenter__.return_value = AsyncMock()
+
+            await pool._run_batch(ScoringLane.BACKFILL, [deferred, failed])
+
+        mock_redis.requeue_scoring_task.assert_called_once_with(
+            "backfill", {**deferred, "force": "1", "attempt": "2"}
+        )
+        final = mock_redis.set_scoring_task_status.call_args.args
+        assert final[0] == failed["task_id"]
+        assert final[1]["status"] == "failed"
+        assert final[1]["error"] == "AI service returned 422"
+        mock_redis.release_scoring_pair.assert_called_once_with(
+            failed["job_id"], failed["resume_id"], failed["task_id"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_worker_acks_a_batch_in_one_call(self, mock_redis):
+        """Should read bulk tasks in groups and acknowledge each group at once."""
+        pool = ScoringWorkerPool(mock_redis, MagicMock())
+        entries = [("1-0", {"task_id": "a"}), ("1-1", {"task_id": "b"})]
+        mock_redis.read_scoring_tasks.side_effect = [entries, asyncio.CancelledError]
+
+        with patch.object(pool, "_run_batch", new_callable=AsyncMock) as run_batch:
+            with pytest.raises(asyncio.CancelledError):
+                await pool._consume(ScoringLane.BULK, "worker")
+
+        assert mock_redis.read_scoring_tasks.call_args.args[2] == (
+            settings.scoring_queue_batch_size
+        )
+        run_batch.assert_called_once_with(
+            ScoringLane.BULK, [{"task_id": "a"}, {"task_id": "b"}]
+        )
+        mock_redis.ack_scoring_task.assert_called_once_with("bulk", "1-0", "1-1")
+
+
+class TestStaleWhileRevalidate:
+    """Tests for serving stale cache entries while refreshing them."""
+
+    @pytest.mark.asyncio
+    async def test_serves_stale_score_and_refreshes_once(
+        self, match_service, mock_redis, sample_match
+    ):
+        """Should answer from a stale entry and rescore it in the background."""
+        import asyncio
+
+        from app.services import match_service as module
+
+        cached_data = {
+            "match_id": str(sample_match.id),
+            "overall_score": 0.5,
+            "skill_score": 0.5,
+            "experience_score": 0.5,
+            "culture_score": 0.5,
+            "score_breakdown": {},
+            "ai_reasoning": "Stale",
+            "is_recommended": False,
+        }
+        mock_redis.read_match_detail.return_value = CachedRead(cached_data, True)
+        mock_redis.acquire_refresh_lease.return_value = True
+        refresh_session = AsyncMock()
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__.return_value = refresh_session
+
+        request = MatchScoreRequest(
+            job_id=sample_match.job_id,
+            resume_id=sample_match.resume_id,
+            user_id=sample_match.user_id,
+        )
+
+        with patch.object(module, "AsyncSessionLocal", session_factory), patch.object(
+            MatchService, "_calculate_match_score_leased", new_callable=AsyncMock
+        ) as mock_leased:
+            results = await asyncio.gather(
+                match_service.calculate_match_score(request),
+                match_service.calculate_match_score(request),
+            )
+            await asyncio.gather(*module._refresh_tasks.values())
+
+        assert all(result.ai_reasoning == "Stale" for result in results)
+        mock_redis.acquire_refresh_lease.assert_called_once_with(
+            f"detail:{sample_match.job_id}:{sample_match.resume_id}"
+        )
+        mock_leased.assert_called_once_with(request)
+        refresh_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_skips_refresh_leased_elsewhere(self, match_service, mock_redis):
+        """Should leave the refresh to the replica holding the lease."""
+        import asyncio
+
+        from app.services import match_service as module
+
+        job_id = uuid4()
+        mock_redis.read_top_matches_for_job.return_value = CachedRead(
+            [(str(uuid4()), 90.0)], True
+        )
+        mock_redis.acquire_refresh_lease.return_value = False
+
+        with patch.object(
+            match_service.repository, "get_job_ranking", new_callable=AsyncMock
+        ) as mock_ranking:
+            result = await match_service.get_top_matches_for_job(job_id)
+            await asyncio.gather(*module._refresh_tasks.values())
+
+        assert result.total == 1
+        mock_redis.acquire_refresh_lease.assert_called_once_with(f"job:{job_id}")
+        mock_ranking.assert_not_called()
+
+
+class TestBatchCalculateMatchScores:
+    """Tests for batch_calculate_match_scores method."""
+
+    @staticmethod
+    def _scored_match(pair, score):
+        match = MagicMock()
+        match.id = uuid4()
+        match.job_id = pair.job_id
+        match.resume_id = pair.resume_id
+        match.user_id = pair.user_id
+        match.overall_score = Decimal(str(score))
+        match.skill_score = Decimal(str(score))
+        match.experience_score = Decimal(str(score))
+        match.culture_score = Decimal(str(score))
+        match.score_breakdown = {}
+        match.ai_reasoning = "Batch reasoning"
+        match.is_recommended = False
+        return match
+
+    @pytest.mark.asyncio
+    async def test_batch_serves_hits_and_scores_misses(
+        self, match_service, mock_redis
+    ):
+        """Should return cache hits and score only the misses in bulk."""
+        job_id = uuid4()
+        hit, miss = (
+            MatchScorePair(job_id=job_id, resume_id=uuid4(), user_id=uuid4())
+            for _ in range(2)
+        )
+        mock_redis.get_match_details.return_value = [
+            {
+                "match_id": str(uuid4()),
+                "overall_score": 80.0,
+                "skill_score": 80.0,
+                "experience_score": 80.0,
+                "culture_score": 80.0,
+                "score_breakdown": {},
+                "ai_reasoning": "Cached",
+                "is_recommended": True,
+            },
+            None,
+        ]
+        ai_response = {
+            "overall_score": 40.0,
+            "skill_score": 40.0,
+            "experience_score": 40.0,
+            "culture_score": 40.0,
+            "score_breakdown": {},
+            "ai_reasoning": "Batch reasoning",
+        }
+
+        with patch.object(
+            match_service.repository, "bulk_upsert_scores", new_callable=AsyncMock
+        ) as mock_upsert, patch.object(
+            match_service, "_call_ai_service", new_callable=AsyncMock
+        ) as mock_ai:
+            mock_ai.return_value = ai_response
+            mock_upsert.return_value = [self._scored_match(miss, 40.0)]
+
+            items = [
+                item
+                async for item in match_service.batch_calculate_match_scores(
+                    BatchMatchScoreRequest(pairs=[hit, miss])
+                )
+            ]
+
+        assert [item.resume_id for item in items] == [hit.resume_id, miss.resume_id]
+        assert items[0].result.is_cached is True
+        assert items[1].result.is_cached is False
+        mock_redis.get_match_details.assert_called_once()
+        mock_ai.assert_called_once()
+        mock_upsert.assert_called_once()
+        (rows,) = mock_upsert.call_args.args
+        assert rows[0]["resume_id"] == miss.resume_id
+        assert rows[0]["is_recommended"] is False
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_per_pair_failures(self, match_service, mock_redis):
+        """Should report failed pairs without aborting the batch."""
+        pair = MatchScorePair(job_id=uuid4(), resume_id=uuid4(), user_id=uuid4())
+
+        with patch.object(
+            match_service.repository, "bulk_upsert_scores", new_callable=AsyncMock
+        ) as mock_upsert, patch.object(
+            match_service, "_call_ai_service", new_callable=AsyncMock
+        ) as mock_ai:
+            mock_ai.side_effect = ValueError("bad payload")
+
+            items = [
+                item
+                async for item in match_service.batch_calculate_match_scores(
+                    BatchMatchScoreRequest(pairs=[pair], force_recalculate=True)
+                )
+            ]
+
+        assert len(items) == 1
+        assert items[0].result is None
+        assert items[0].error == "bad payload"
+        mock_redis.get_match_details.assert_not_called()
+        mock_upsert.assert_not_called()
+
+
+class TestCalculateMatchesForJob:
+    """Tests for calculate_matches_for_job method."""
+
+    @pytest.mark.asyncio
+    async def test_serves_cached_and_queues_the_rest(
+        self, match_service, mock_redis, sample_match
+    ):
+        """Should answer cached candidates and queue the others on the bulk lane."""
+        job_id = uuid4()
+        candidates = [
+            MatchScorePair(job_id=job_id, resume_id=uuid4(), user_id=uuid4())
+            for _ in range(3)
+        ]
+        cached = {
+            "match_id": str(sample_match.id),
+            "overall_score": 90.0,
+            "skill_score": 90.0,
+            "experience_score": 90.0,
+            "culture_score": 90.0,
+            "score_breakdown": {},
+            "ai_reasoning": "",
+            "is_recommended": True,
+        }
+        mock_redis.get_match_details.return_value = [cached, None, None]
+
+        with patch.object(
+            match_service, "_retrieve_candidates", new_callable=AsyncMock
+        ) as mock_retrieve, patch.object(
+            match_service, "batch_calculate_match_scores"
+        ) as mock_batch:
+            mock_retrieve.return_value = candidates
+
+            result = await match_service.calculate_matches_for_job(
+                job_id,
+                CalculateMatchesForJobRequest(
+                    limit=3, min_score_threshold=50, required_skills=["Python"]
+                ),
+            )
+
+        mock_retrieve.assert_called_once_with(job_id, ["Python"], 3)
+        mock_batch.assert_not_called()
+        assert result.total_processed == 1
+        assert result.matches[0].resume_id == candidates[0].resume_id
+        lane, queued = mock_redis.enqueue_scoring_tasks.call_args.args
+        assert lane == "bulk"
+        assert [task["resume_id"] for task in queued] == [
+            str(pair.resume_id) for pair in candidates[1:]
+        ]
+        assert [task.resume_id for task in result.tasks] == [
+            pair.resume_id for pair in candidates[1:]
+        ]
+        mock_redis.add_matches_to_job_ranking.assert_called_once_with(
+            str(job_id), {str(candidates[0].resume_id): 90.0}
+        )
+
+    @pytest.mark.asyncio
+    async def test_force_queues_every_candidate(self, match_service, mock_redis):
+        """Should skip the cache and queue every candidate with force set."""
+        job_id = uuid4()
+        candidates = [
+            MatchScorePair(job_id=job_id, resume_id=uuid4(), user_id=uuid4())
+            for _ in range(2)
+        ]
+
+        with patch.object(
+            match_service, "_retrieve_candidates", new_callable=AsyncMock
+        ) as mock_retrieve:
+            mock_retrieve.return_value = candidates
+
+            result = await match_service.calculate_matches_for_job(
+                job_id,
+                CalculateMatchesForJobRequest(
+                    force_recalculate=True, required_skills=["Python"]
+                ),
+            )
+
+        mock_redis.get_match_details.assert_not_called()
+        _, queued = mock_redis.enqueue_scoring_tasks.call_args.args
+        assert [task["force"] for task in queued] == ["1", "1"]
+        assert len(result.tasks) == 2
+        assert result.total_processed == 0
+
+
+    @pytest.mark.asyncio
+    async def test_shortlists_by_job_requirements(self, match_service):
+        """Should read job-service's skill fields and fetch the job only once."""
+        job_id = uuid4()
+        job = {
+            "skills": [
+                {"skillName": "Go", "isRequired": False},
+                {"skillName": " Python ", "isRequired": True},
+            ]
+        }
+
+        with patch.object(
+            match_service, "_fetch_document", new_callable=AsyncMock
+        ) as mock_fetch, patch.object(
+            match_service, "_retrieve_candidates", new_callable=AsyncMock
+        ) as mock_retrieve:
+            mock_fetch.return_value = job
+            mock_retrieve.return_value = []
+
+            await match_service.calculate_matches_for_job(
+                job_id, CalculateMatchesForJobRequest(limit=5)
+            )
+            # Scoring the shortlist reuses the fetched job
+            assert await match_service._fetch_job(job_id) == job
+
+        mock_retrieve.assert_called_once_with(job_id, ["python", "go"], 5)
+        mock_fetch.assert_awaited_once()
+
+
+class TestCalculateMatchesForUser:
+    """Tests for calculate_matches_for_user method."""
+
+    @pytest.mark.asyncio
+    async def test_rescores_only_stale_jobs(
+        self, match_service, mock_redis, sample_match
+    ):
+        """Should reuse matches newer than the resume and rescore the rest."""
+        user_id = uuid4()
+        resume_id = uuid4()
+        fresh_job, stale_job, new_job = uuid4(), uuid4(), uuid4()
+        resume = {
+            "id": str(resume_id),
+            "title": "Backend Engineer",
+            "ai_summary": "Python developer",
+            "skills": [{"skill_name": "Python"}],
+            "updated_at": "2026-01-10T00:00:00",
+        }
+
+        def existing_match(job_id, updated_at, score, recommended):
+            match = MagicMock()
+            match.id = uuid4()
+            match.job_id = job_id
+            match.resume_id = resume_id
+            match.overall_score = Decimal(score)
+            match.skill_score = Decimal(score)
+            match.experience_score = Decimal(score)
+            match.culture_score = Decimal(score)
+            match.score_breakdown = {}
+            match.ai_reasoning = ""
+            match.is_recommended = recommended
+            match.updated_at = updated_at
+            return match
+
+        fresh = existing_match(fresh_job, datetime(2026, 1, 11), "90", True)
+        stale = existing_match(stale_job, datetime(2026, 1, 9), "80", True)
+
+        with patch.object(
+            match_service, "_fetch_resume", new_callable=AsyncMock
+        ) as mock_resume, patch.object(
+            match_service, "_retrieve_similar_jobs", new_callable=AsyncMock
+        ) as mock_jobs, patch.object(
+            match_service.repository,
+            "get_by_resume_and_job_ids",
+            new_callable=AsyncMock,
+        ) as mock_existing, patch.object(
+            match_service, "batch_calculate_match_scores"
+        ) as mock_batch:
+            mock_resume.return_value = resume
+            mock_jobs.return_value = [fresh_job, stale_job, new_job]
+            mock_existing.return_value = [fresh, stale]
+
+            result = await match_service.calculate_matches_for_user(
+                user_id, CalculateMatchesForUserRequest()
+            )
+
+        # Stale pairs go to the bulk lane instead of being scored inline
+        mock_batch.assert_not_called()
+        lane, queued = mock_redis.enqueue_scoring_tasks.call_args.args
+        assert lane == "bulk"
+        assert [task["job_id"] for task in queued] == [str(stale_job), str(new_job)]
+        assert {task["force"] for task in queued} == {"1"}
+        assert [task.job_id for task in result.tasks] == [stale_job, new_job]
+        assert result.total_rescored == 2
+        assert [match.job_id for match in result.matches] == [fresh_job]
+        mock_redis.update_recommendations_for_user.assert_called_once_with(
+            str(user_id),
+            recommended={str(fresh_job): 90.0},
+            removed=[],
+        )
+
+    @pytest.mark.asyncio
+    async def test_converts_resume_offset_to_utc(
+        self, match_service, mock_redis, sample_match
+    ):
+        """Should compare an offset resume timestamp in UTC, not wall-clock time."""
+        resume_id = uuid4()
+        newer_job, older_job = uuid4(), uuid4()
+        resume = {
+            "id": str(resume_id),
+            "title": "Backend Engineer",
+            # 2026-01-09 23:00 UTC
+            "updated_at": "2026-01-10T08:00:00+09:00",
+        }
+
+        def existing_match(job_id, updated_at):
+            match = MagicMock()
+            match.id = uuid4()
+            match.job_id = job_id
+            match.resume_id = resume_id
+            match.overall_score = Decimal("80")
+            match.skill_score = Decimal("80")
+            match.experience_score = Decimal("80")
+            match.culture_score = Decimal("80")
+            match.score_breakdown = {}
+            match.ai_reasoning = ""
+            match.is_recommended = True
+            match.updated_at = updated_at
+            return match
+
+        with patch.object(
+            match_service, "_fetch_resume", new_callable=AsyncMock
+        ) as mock_resume, patch.object(
+            match_service, "_retrieve_similar_jobs", new_callable=AsyncMock
+        ) as mock_jobs, patch.object(
+            match_service.repository,
+            "get_by_resume_and_job_ids",
+            new_callable=AsyncMock,
+        ) as mock_existing:
+            mock_resume.return_value = resume
+            mock_jobs.return_value = [newer_job, older_job]
+            mock_existing.return_value = [
+                existing_match(newer_job, datetime(2026, 1, 10, 0, 0)),
+                existing_match(older_job, datetime(2026, 1, 9, 22, 0)),
+            ]
+
+            result = await match_service.calculate_matches_for_user(
+                uuid4(), CalculateMatchesForUserRequest()
+            )
+
+        _, queued = mock_redis.enqueue_scoring_tasks.call_args.args
+        assert [task["job_id"] for task in queued] == [str(older_job)]
+        assert result.total_rescored == 1
+
+    @pytest.mark.asyncio
+    async def test_no_resume_returns_empty(self, match_service, mock_redis):
+        """Should return an empty result when the user has no resume."""
+        with patch.object(
+            match_service, "_fetch_resume", new_callable=AsyncMock
+        ) as mock_resume:
+            mock_resume.return_value = None
+
+            result = await match_service.calculate_matches_for_user(
+                uuid4(), CalculateMatchesForUserRequest()
+            )
+
+        assert result.total_processed == 0
+        mock_redis.update_recommendations_for_user.assert_not_called()
+
+
+class TestGetTopMatchesForJob:
+    """Tests for get_top_matches_for_job method."""
+
+    @pytest.mark.asyncio
+    async def test_get_top_matches_from_cache(self, match_service, mock_redis):
+        """Should return cached top matches."""
+        job_id = uuid4()
+        cached_matches = [
+            (str(uuid4()), 0.95),
+            (str(uuid4()), 0.90),
+            (str(uuid4()), 0.85),
+        ]
+        mock_redis.read_top_matches_for_job.return_value = CachedRead(
+            cached_matches, False
+        )
+
+        result = await match_service.get_top_matches_for_job(job_id, limit=10)
+
+        assert result.total == 3
+        assert len(result.matches) == 3
+        assert result.matches[0].score == 0.95
+
+    @pytest.mark.asyncio
+    async def test_get_top_matches_from_database(
+        self, match_service, mock_redis, sample_match
+    ):
+        """Should fallback to database when cache is empty."""
+        job_id = uuid4()
+        mock_redis.read_top_matches_for_job.return_value = CachedRead(None, False)
+
+        with patch.object(
+            match_service.repository, "get_job_ranking", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.return_value = [
+                (sample_match.resume_id, sample_match.overall_score)
+            ]
+
+            result = await match_service.get_top_matches_for_job(job_id, limit=10)
+
+            assert result.total == 1
+            # Refills the full ranking, not just the requested page
+            mock_get.assert_called_once_with(job_id, limit=100)
+            mock_redis.replace_job_ranking.assert_called_once_with(
+                str(job_id), {str(sample_match.resume_id): 0.85}, exhaustive=True
+            )
+
+    @pytest.mark.asyncio
+    async def test_serves_complete_empty_ranking(self, match_service, mock_redis):
+        """Should trust an exhaustive empty ranking without querying the database."""
+        mock_redis.read_top_matches_for_job.return_value = CachedRead([], False)
+
+        with patch.object(
+            match_service.repository, "get_job_ranking", new_callable=AsyncMock
+        ) as mock_get:
+            result = await match_service.get_top_matches_for_job(uuid4())
+
+        assert result.total == 0
+        mock_get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_iter_top_matches_in_rank_order(self, match_service, mock_redis):
+        """Should yield ranked rows best first, skipping low and deleted ones."""
+        job_id = uuid4()
+        first, second, deleted, low = uuid4(), uuid4(), uuid4(), uuid4()
+        mock_redis.read_top_matches_for_job.return_value = CachedRead(
+            [
+                (str(first), 90.0),
+                (str(deleted), 85.0),
+                (str(second), 80.0),
+                (str(low), 40.0),
+            ],
+            False,
+        )
+        rows = [MagicMock(resume_id=second), MagicMock(resume_id=first)]
+
+        with patch.object(
+            match_service.repository, "get_by_pairs", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.return_value = rows
+            result = [
+                match
+                async for match in match_service.iter_top_matches_for_job(
+                    job_id, limit=10, min_score=50
+                )
+            ]
+
+        assert [match.resume_id for match in result] == [first, second]
+        mock_get.assert_called_once_with(
+            [(job_id, first), (job_id, deleted), (job_id, second)]
+        )
+
+
+class TestGetRecommendedJobsForUser:
+    """Tests for get_recommended_jobs_for_user method."""
+
+    @pytest.mark.asyncio
+    async def test_warms_cache_from_score_projection(self, match_service, mock_redis):
+        """Should build the response and warm the cache from (job_id, score) rows."""
+        user_id, job_id = uuid4(), uuid4()
+
+        with patch.object(
+            match_service.repository, "get_recommended_for_user", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.return_value = [(job_id, Decimal("88.50"))]
+
+            result = await match_service.get_recommended_jobs_for_user(user_id)
+
+        assert result.jobs[0].job_id == job_id
+        assert result.jobs[0].score == 88.5
+        mock_redis.update_recommendations_for_user.assert_called_once_with(
+            str(user_id), recommended={str(job_id): 88.5}, removed=[]
+        )
+
+
+class TestCacheMaintenance:
+    """Tests for _update_caches and _remove_from_cache methods."""
+
+    @pytest.mark.asyncio
+    async def test_update_caches_in_one_call(self, match_service, mock_redis):
+        """Should send every scored match to Redis in a single call."""
+        matches = []
+        for score in ("80", "40", None):
+            match = MagicMock()
+            match.id, match.job_id = uuid4(), uuid4()
+            match.resume_id, match.user_id = uuid4(), uuid4()
+            match.overall_score = Decimal(score) if score else None
+            match.skill_score = match.experience_score = match.culture_score = None
+            match.score_breakdown, match.ai_reasoning = {}, ""
+            match.is_recommended = score == "80"
+            matches.append(match)
+
+        await match_service._update_caches(matches)
+
+        mock_redis.cache_matches.assert_called_once()
+        entries = mock_redis.cache_matches.call_args.args[0]
+        assert [entry["score"] for entry in entries] == [80.0, 40.0]
+        assert [entry["is_recommended"] for entry in entries] == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_remove_from_cache(self, match_service, mock_redis, sample_match):
+        """Should drop detail and rankings with one call."""
+        await match_service._remove_from_cache(sample_match)
+
+        mock_redis.remove_match.assert_called_once_with(
+            str(sample_match.job_id),
+            str(sample_match.resume_id),
+            str(sample_match.user_id),
+        )
+
+
+class TestMatchStats:
+    """Tests for materialized match statistics and insights."""
+
+    def test_rescore_moves_bucket_and_recommendation(self):
+        """Should net a rescore out to its change in each metric."""
+        job_id, user_id = uuid4(), uuid4()
+        old = {
+            "job_id": job_id,
+            "user_id": user_id,
+            "overall_score": Decimal("62.5"),
+            "skill_score": Decimal("70"),
+            "is_recommended": False,
+            "score_breakdown": {"skill_match": {"missing_skills": ["Go"]}},
+        }
+        new = {
+            **old,
+            "overall_score": Decimal("100"),
+            "is_recommended": True,
+            "score_breakdown": {"missing_skills": [], "matched_skills": [" GO "]},
+        }
+        # Contributions are stored as JSON on the match
+        stored = json.loads(json.dumps(match_contribution(old)))
+        deltas: StatsDeltas = {}
+        add_contribution(deltas, job_id, user_id, stored, -1)
+        add_contribution(deltas, job_id, user_id, match_contribution(new))
+
+        job = {k: v for k, v in deltas[(StatsScope.JOB, job_id)].items() if v}
+        assert job == {
+            "sum:overall_score": Decimal("37.5"),
+            "bucket:60-70": -1,
+            "bucket:90-100": 1,
+            "recommended": 1,
+            "skill_gap:go": -1,
+            "matched_skill:go": 1,
+        }
+        user = {k: v for k, v in deltas[(StatsScope.USER, user_id)].items() if v}
+        assert "matched_skill:go" not in user
+        assert user["recommended"] == 1
+
+    def test_experience_gap_needs_both_numbers(self):
+        """Should only count an experience gap when both years are numbers."""
+        match = {
+            "job_id": uuid4(),
+            "user_id": uuid4(),
+            "score_breakdown": {
+                "experience_match": {"required_years": 5, "relevant_years": 3.5}
+            },
+        }
+        assert match_metrics(match, insights=True)["sum:experience_gap"] == Decimal(
+            "1.5"
+        )
+        match["score_breakdown"]["experience_match"]["relevant_years"] = "3"
+        assert "sum:experience_gap" not in match_metrics(match, insights=True)
+
+    @pytest.mark.asyncio
+    async def test_stats_read_through_cache(self, match_service, mock_redis):
+        """Should fill Redis from the summary table on a miss."""
+        job_id = uuid4()
+        stats = {
+            "matches": Decimal(4),
+            "sum:overall_score": Decimal(300),
+            "count:overall_score": Decimal(4),
+            "recommended": Decimal(1),
+            "bucket:70-80": Decimal(4),
+            "feedback:helpful": Decimal(2),
+        }
+        mock_redis.get_match_stats.return_value = None
+
+        with patch.object(
+            match_service.repository, "get_stats", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.return_value = stats
+            result = await match_service.get_match_stats(StatsScope.JOB, job_id)
+
+        mock_get.assert_called_once_with(StatsScope.JOB, job_id)
+        mock_redis.set_match_stats.assert_called_once_with("job", str(job_id), stats)
+        assert result.total_matches == 4
+        assert result.average_overall_score == 75.0
+        assert result.average_culture_score is None
+        assert result.score_distribution == {"70-80": 4}
+        assert result.feedback_distribution == {"helpful": 2}
+
+    @pytest.mark.asyncio
+    async def test_insights_from_cached_stats(self, match_service, mock_redis):
+        """Should rank skills and suggest gaps without touching the database."""
+        mock_redis.get_match_stats.return_value = {
+            "matches": Decimal(20),
+            "recommended": Decimal(1),
+            "skill_gap:kubernetes": Decimal(12),
+            "skill_gap:go": Decimal(12),
+            "skill_gap:sql": Decimal(3),
+            "matched_skill:python": Decimal(18),
+            "sum:experience_gap": Decimal(30),
+            "count:experience_gap": Decimal(20),
+        }
+
+        with patch.object(
+            match_service.repository, "get_stats", new_callable=AsyncMock
+        ) as mock_get:
+            result = await match_service.get_matching_insights(uuid4())
+
+        mock_get.assert_not_called()
+        assert result.most_common_skill_gaps == ["go", "kubernetes", "sql"]
+        assert result.most_matched_skills == ["python"]
+        assert result.average_experience_gap == 1.5
+        assert "go, kubernetes" in result.recommendation
+
+
+class TestAddFeedback:
+    """Tests for add_feedback method."""
+
+    @pytest.mark.asyncio
+    async def test_add_feedback_success(self, match_service, sample_match):
+        """Should add feedback successfully."""
+        from app.models.schemas import MatchFeedbackCreate
+
+        feedback = MatchFeedbackCreate(
+            match_id=sample_match.id,
+            user_id=sample_match.user_id,
+            rating=5,
+            feedback_type="helpful",
+            feedback_by=sample_match.user_id,
+            comment="Great match!",
+        )
+
+        with patch.object(
+            match_service.repository, "get_by_id", new_callable=AsyncMock
+        ) as mock_get, patch.object(
+            match_service.repository, "create_feedback", new_callable=AsyncMock
+        ) as mock_create:
+            mock_get.return_value = sample_match
+
+            result = await match_service.add_feedback(feedback)
+
+            assert result is mock_create.return_value
+            mock_create.assert_called_once_with(feedback)
+            match_service.redis.invalidate_match_stats.assert_called_once_with(
+                [
+                    ("job", str(sample_match.job_id)),
+                    ("user", str(sample_match.user_id)),
+                ]
+            )
+
+    @pytest.mark.asyncio
+    async def test_add_feedback_match_not_found(self, match_service):
+        """Should return None when match not found."""
+        from app.models.schemas import MatchFeedbackCreate
+
+        user_id = uuid4()
+        feedback = MatchFeedbackCreate(
+            match_id=uuid4(),
+            user_id=user_id,
+            rating=5,
+            feedback_type="helpful",
+            feedback_by=user_id,
+        )
+
+        with patch.object(
+            match_service.repository, "get_by_id", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.return_value = None
+
+            result = await match_service.add_feedback(feedback)
+
+            assert result is None
+
+
+class TestCallAIService:
+    """Tests for _call_ai_service method."""
+
+    @pytest.mark.asyncio
+    async def test_ai_service_call_success(self, match_service):
+        """Should return AI service response."""
+        request = MatchScoreRequest(
+            job_id=uuid4(),
+            resume_id=uuid4(),
+            user_id=uuid4(),
+        )
+
+        expected_response = {
+            "overall_score": 0.85,
+            "skill_score": 0.9,
+            "experience_score": 0.8,
+            "culture_score": 0.85,
+            "score_breakdown": {},
+            "ai_reasoning": "Test reasoning",
+        }
+
+        with patch.object(
+            match_service.http, "post", new_callable=AsyncMock
+        ) as mock_post:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = expected_response
+            mock_response.raise_for_status = MagicMock()
+            mock_post.return_value = mock_response
+
+            result = await match_service._call_ai_service(request)
+
+            assert result == expected_response
+
+    @pytest.mark.asyncio
+    async def test_ai_service_call_failure(self, match_service):
+        """Should raise instead of returning placeholder scores."""
+        import httpx
+
+        request = MatchScoreRequest(
+            job_id=uuid4(),
+            resume_id=uuid4(),
+            user_id=uuid4(),
+        )
+
+        with patch.object(
+            match_service.http, "post", new_callable=AsyncMock
+        ) as mock_post:
+            mock_post.side_effect = httpx.HTTPError("Connection failed")
+
+            with pytest.raises(httpx.HTTPError):
+                await match_service._call_ai_service(request)
+
+    @pytest.mark.asyncio
+    async def test_fails_fast_once_circuit_opens(self, match_service):
+        """Should stop calling the AI service after repeated failures."""
+        import httpx
+
+        request = MatchScoreRequest(
+            job_id=uuid4(),
+            resume_id=uuid4(),
+            user_id=uuid4(),
+        )
+
+        with patch.object(
+            match_service.http, "post", new_callable=AsyncMock
+        ) as mock_post:
+            mock_post.side_effect = httpx.ConnectError("Connection refused")
+
+            for _ in range(3):
+                with pytest.raises(httpx.HTTPError):
+                    await match_service._call_ai_service(request)
+            with pytest.raises(CircuitOpenError):
+                await match_service._call_ai_service(request)
+
+            assert mock_post.call_count == 3
+
+
+class TestCircuitBreaker:
+    """Tests for the circuit breaker state machine."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Should open only after the threshold of consecutive failures."""
+        breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30.0)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.allow() is False
+
+    def test_half_open_probe_closes_or_reopens(self):
+        """Should admit one probe after the timeout and act on its outcome."""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30.0)
+
+        with patch("app.core.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+        with patch("app.core.circuit_breaker.time.monotonic", return_value=131.0):
+            assert breaker.state is CircuitState.HALF_OPEN
+            assert breaker.allow() is True
+            assert breaker.allow() is False  # Only one probe at a time
+            breaker.record_failure()
+            assert breaker.state is CircuitState.OPEN
+        with patch("app.core.circuit_breaker.time.monotonic", return_value=162.0):
+            assert breaker.allow() is True
+            breaker.record_success()
+            assert breaker.state is CircuitState.CLOSED
+
+
+class TestHttpClient:
+    """Tests for the shared HttpClient pool."""
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrent_requests_per_host(self):
+        """Should never exceed the per-host connection cap."""
+        import asyncio
+
+        import httpx
+
+        from app.core.http import HttpClient
+
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={})
+
+        http = HttpClient()
+        http._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch(
+            "app.core.http.settings.http_client_max_connections_per_host", 2
+        ):
+            responses = await asyncio.gather(
+                *(http.get("http://ai-service:8006/health") for _ in range(6))
+            )
+        await http.disconnect()
+
+        assert all(response.status_code == 200 for response in responses)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_tracks_free_connection_slots(self):
+        """Should count slots down while requests hold them and back up after."""
+        import asyncio
+
+        import httpx
+        from prometheus_client import REGISTRY
+
+        from app.core.http import HttpClient
+
+        host = "slots-test"
+        free_during: list[float] = []
+
+        def free_slots():
+            return REGISTRY.get_sample_value(
+                "match_http_client_connection_slots", {"host": host}
+            )
+
+        async def handler(request):
+            await asyncio.sleep(0.01)
+            free_during.append(free_slots())
+            return httpx.Response(200, json={})
+
+        http = HttpClient()
+        http._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch(
+            "app.core.http.settings.http_client_max_connections_per_host", 4
+        ):
+            await asyncio.gather(*(http.get(f"http://{host}/") for _ in range(3)))
+        await http.disconnect()
+
+        assert min(free_during) == 1
+        assert free_slots() == 4
+
+
+class TestLocalCache:
+    """Tests for the in-process cache tier."""
+
+    def test_evicts_least_recently_used(self):
+        """Should drop the least recently used key when full."""
+        from app.core.local_cache import LocalCache
+
+        cache = LocalCache(max_entries=2, ttl=60)
+        cache.set("a", 1, cache.epoch)
+        cache.set("b", 2, cache.epoch)
+        cache.get("a")
+        cache.set("c", 3, cache.epoch)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_expires_entries(self):
+        """Should not serve entries past their TTL."""
+        from app.core.local_cache import LocalCache
+
+        cache = LocalCache(max_entries=10, ttl=0)
+        cache.set("a", 1, cache.epoch)
+
+        assert cache.get("a") is None
+
+    def test_skips_fill_raced_by_invalidation(self):
+        """Should not store a value read before a concurrent invalidation."""
+        from app.core.local_cache import LocalCache
+
+        cache = LocalCache(max_entries=10, ttl=60)
+        epoch = cache.epoch
+        cache.invalidate("a")
+        cache.set("a", "stale", epoch)
+
+        assert cache.get("a") is None
+
+
+class TestMatchDetailCodec:
+    """Tests for the cached match detail encoding."""
+
+    def _detail(self, reasoning: str) -> dict:
+        return {
+            "match_id": str(uuid4()),
+            "overall_score": 82.5,
+            "skill_score": 90.0,
+            "experience_score": 76.25,
+            "culture_score": 0,
+            "score_breakdown": {"skills": ["python"]},
+            "ai_reasoning": reasoning,
+            "is_recommended": True,
+        }
+
+    @pytest.mark.parametrize("reasoning", ["Short", "Long reasoning " * 100])
+    def test_round_trip(self, reasoning):
+        """Should decode exactly what was encoded, compressed or not."""
+        from app.core.codec import decode_match_detail, encode_match_detail
+
+        detail = self._detail(reasoning)
+        encoded = encode_match_detail(detail)
+
+        assert len(encoded) < len(json.dumps(detail))
+        assert dict(decode_match_detail(encoded)) == detail
+
+    def test_reads_legacy_json(self):
+        """Should still decode details cached as JSON."""
+        from app.core.codec import decode_match_detail
+
+        detail = self._detail("Legacy")
+
+        assert decode_match_detail(json.dumps(detail).encode()) == detail
+
+    def test_builds_score_response(self, match_service):
+        """Should build a cached score response from an encoded detail."""
+        from app.core.codec import decode_match_detail, encode_match_detail
+
+        detail = self._detail("Encoded")
+        cached = decode_match_detail(encode_match_detail(detail))
+
+        result = match_service._response_from_cache(cached, uuid4(), uuid4())
+
+        assert result.overall_score == Decimal("82.5")
+        assert result.experience_score == Decimal("76.25")
+        assert result.ai_reasoning == "Encoded"
+        assert result.is_cached is True
+
+
+class TestGrpcServicer:
+    """Tests for the gRPC servicer."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a mock service that the servicer opens for each RPC."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def servicer(self, service):
+        """Create a servicer whose RPCs run on the mock service."""
+        from contextlib import asynccontextmanager
+
+        from app.api.grpc_server import MatchServicer
+
+        @asynccontextmanager
+        async def open_service():
+            yield service
+
+        servicer = MatchServicer()
+        servicer._service = open_service
+        return servicer
+
+    @pytest.fixture
+    def context(self):
+        """Create a servicer context whose abort ends the RPC."""
+        import grpc
+
+        context = AsyncMock()
+        context.abort.side_effect = grpc.aio.AbortError()
+        return context
+
+    def test_maps_score_breakdown(self):
+        """Should map nested skill and experience sections."""
+        from app.api.grpc_server import breakdown_to_pb
+
+        result = breakdown_to_pb(
+            {
+                "skill_match": {
+                    "matched_skills": ["Python", "SQL", "Go"],
+                    "missing_skills": ["Rust"],
+                },
+                "experience_match": {"required_years": 5, "relevant_years": 3.5},
+            }
+        )
+
+        assert [skill.skill_name for skill in result.skill_matches] == [
+            "Python",
+            "SQL",
+            "Go",
+            "Rust",
+        ]
+        assert result.skill_matches[3].matched is False
+        assert result.skill_coverage == 75.0
+        assert result.required_experience_years == 5
+        assert result.candidate_experience_years == 3
+        assert result.experience_meets_requirement is False
+
+    @pytest.mark.asyncio
+    async def test_streams_top_matches(self, sample_match):
+        """Should stream full match rows in rank order."""
+        from contextlib import asynccontextmanager
+
+        from app.api.grpc_server import MatchServicer
+        from match.v1 import match_pb2
+
+        sample_match.created_at = datetime(2026, 1, 1)
+        sample_match.updated_at = datetime(2026, 1, 2)
+
+        async def iter_top(job_id, limit, min_score):
+            yield sample_match
+
+        service = MagicMock()
+        service.iter_top_matches_for_job = MagicMock(side_effect=iter_top)
+
+        @asynccontextmanager
+        async def open_service():
+            yield service
+
+        servicer = MatchServicer()
+        request = match_pb2.GetTopMatchesForJobRequest(
+            job_id=str(sample_match.job_id), min_score=50
+        )
+        with patch.object(servicer, "_service", open_service):
+            result = [
+                match
+                async for match in servicer.StreamTopMatchesForJob(
+                    request, AsyncMock()
+                )
+            ]
+
+        assert [match.id for match in result] == [str(sample_match.id)]
+        assert result[0].overall_score == pytest.approx(0.85)
+        assert result[0].status == match_pb2.MATCH_STATUS_COMPLETED
+        service.iter_top_matches_for_job.assert_called_once_with(
+            sample_match.job_id, 10, 50
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_fails_unowned_resumes_individually(self):
+        """Should score owned resumes and report ones without a user_id."""
+        from app.api.grpc_server import MatchServicer
+        from app.models.schemas import BatchMatchScoreItem, MatchScoreResponse
+        from match.v1 import match_pb2
+
+        job_id, owned, unowned, user_id = uuid4(), uuid4(), uuid4(), uuid4()
+
+        async def batch(request):
+            assert [pair.resume_id for pair in request.pairs] == [owned]
+            yield BatchMatchScoreItem(
+                job_id=job_id,
+                resume_id=owned,
+                result=MatchScoreResponse(
+                    match_id=uuid4(),
+                    job_id=job_id,
+                    resume_id=owned,
+                    overall_score=Decimal("82"),
+                    skill_score=Decimal("80"),
+                    experience_score=Decimal("85"),
+                    culture_score=Decimal("75"),
+                    score_breakdown={},
+                    ai_reasoning="Strong fit",
+                    is_recommended=True,
+                ),
+            )
+
+        session = AsyncMock()
+        request = match_pb2.BatchCalculateMatchesRequest(
+            job_id=str(job_id),
+            resume_ids=[str(owned), str(unowned)],
+            user_ids={str(owned): str(user_id)},
+        )
+        with patch("app.api.grpc_server.AsyncSessionLocal") as session_factory, patch(
+            "app.api.grpc_server.MatchService"
+        ) as service_cls:
+            session_factory.return_value.__aenter__.return_value = session
+            service_cls.return_value.batch_calculate_match_scores = batch
+            result = await MatchServicer().BatchCalculateMatches(request, AsyncMock())
+
+        assert result.result.succeeded == 1
+        assert list(result.result.failed_ids) == [str(unowned)]
+        assert result.matches[0].user_id == str(user_id)
+        assert result.matches[0].status == match_pb2.MATCH_STATUS_COMPLETED
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rejects_malformed_ids(self):
+        """Should fail the RPC with INVALID_ARGUMENT on a malformed UUID."""
+        import grpc
+
+        from app.api.grpc_server import MatchServicer
+        from match.v1 import match_pb2
+
+        context = AsyncMock()
+        context.abort.side_effect = grpc.aio.AbortError()
+
+        with pytest.raises(grpc.aio.AbortError):
+            await MatchServicer().GetMatch(
+                match_pb2.GetMatchRequest(id="not-a-uuid"), context
+            )
+
+        assert context.abort.call_args.args[0] == grpc.StatusCode.INVALID_ARGUMENT
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "status_code, expected",
+        [(422, "INVALID_ARGUMENT"), (404, "FAILED_PRECONDITION"), (502, "UNAVAILABLE")],
+    )
+    async def test_maps_ai_service_rejections(
+        self, servicer, service, context, status_code, expected
+    ):
+        """Should fail a 4xx as the caller's problem and a 5xx as unavailable."""
+        import grpc
+        import httpx
+
+        from match.v1 import match_pb2
+
+        response = httpx.Response(
+            status_code, request=httpx.Request("POST", "http://ai/score")
+        )
+        service.calculate_match_score.side_effect = httpx.HTTPStatusError(
+            "rejected", request=response.request, response=response
+        )
+        request = match_pb2.CalculateMatchRequest(
+            job_id=str(uuid4()), resume_id=str(uuid4()), user_id=str(uuid4())
+        )
+
+        with pytest.raises(grpc.aio.AbortError):
+            await servicer.CalculateMatch(request, context)
+
+        assert context.abort.call_args.args[0] == grpc.StatusCode[expected]
+
+    @pytest.mark.asyncio
+    async def test_lists_job_matches_a_page_at_a_time(
+        self, servicer, service, sample_match
+    ):
+        """Should map the job, filters and page onto a filtered listing."""
+        from app.models.schemas import MatchListFilter, MatchSortField
+        from common.v1 import common_pb2
+        from match.v1 import match_pb2
+
+        sample_match.created_at = datetime(2026, 1, 1)
+        sample_match.updated_at = datetime(2026, 1, 2)
+        service.list_matches.return_value = ([sample_match], 21)
+        request = match_pb2.GetMatchesByJobRequest(
+            job_id=str(sample_match.job_id),
+            pagination=common_pb2.PaginationRequest(page=3, page_size=10),
+            min_score=60,
+            only_recommended=True,
+            sort=common_pb2.SortOrder(
+                field="created_at", direction=common_pb2.SORT_DIRECTION_ASC
+            ),
+        )
+
+        result = await servicer.GetMatchesByJob(request, AsyncMock())
+
+        service.list_matches.assert_awaited_once_with(
+            MatchListFilter(
+                job_id=sample_match.job_id,
+                min_score=Decimal("60"),
+                is_recommended=True,
+                sort_by=MatchSortField.CREATED_AT,
+                descending=False,
+            ),
+            3,
+            10,
+        )
+        assert [match.id for match in result.matches] == [str(sample_match.id)]
+        assert result.pagination.total == 21
+        assert result.pagination.total_pages == 3
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_sort_field(self, servicer, service, context):
+        """Should fail a listing sorted by a column it cannot order by."""
+        import grpc
+
+        from common.v1 import common_pb2
+        from match.v1 import match_pb2
+
+        request = match_pb2.ListMatchesRequest(
+            sort=common_pb2.SortOrder(field="ai_reasoning")
+        )
+
+        with pytest.raises(grpc.aio.AbortError):
+            await servicer.ListMatches(request, context)
+
+        assert context.abort.call_args.args[0] == grpc.StatusCode.INVALID_ARGUMENT
+        service.list_matches.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_update_changes_only_fields_that_are_set(
+        self, servicer, service, sample_match
+    ):
+        """Should leave fields the request does not set out of the update."""
+        from match.v1 import match_pb2
+
+        sample_match.created_at = datetime(2026, 1, 1)
+        sample_match.updated_at = datetime(2026, 1, 2)
+        service.update_match.return_value = sample_match
+        request = match_pb2.UpdateMatchRequest(
+            id=str(sample_match.id), overall_score=72.5, is_recommended=False
+        )
+
+        await servicer.UpdateMatch(request, AsyncMock())
+
+        match_id, data = service.update_match.await_args.args
+        assert match_id == sample_match.id
+        assert data.model_dump(exclude_unset=True) == {
+            "overall_score": Decimal("72.5"),
+            "is_recommended": False,
+        }
+
+    @pytest.mark.asyncio
+    async def test_creates_feedback(self, servicer, service):
+        """Should record feedback with the service's feedback type."""
+        from app.models.schemas import FeedbackType
+        from match.v1 import match_pb2
+
+        match_id, author = uuid4(), uuid4()
+        service.add_feedback.return_value = MagicMock(
+            id=uuid4(),
+            match_id=match_id,
+            feedback_type="hired",
+            feedback_by=author,
+            created_at=datetime(2026, 1, 1),
+        )
+        request = match_pb2.CreateMatchFeedbackRequest(
+            match_id=str(match_id),
+            feedback_type=match_pb2.FEEDBACK_TYPE_HIRED,
+            feedback_by=str(author),
+        )
+
+        result = await servicer.CreateMatchFeedback(request, AsyncMock())
+
+        [data] = service.add_feedback.await_args.args
+        assert data.feedback_type == FeedbackType.HIRED
+        assert result.feedback.match_id == str(match_id)
+        assert result.feedback.feedback_type == match_pb2.FEEDBACK_TYPE_HIRED
+
+    @pytest.mark.asyncio
+    async def test_feedback_on_missing_match_is_not_found(
+        self, servicer, service, context
+    ):
+        """Should fail with NOT_FOUND when the match does not exist."""
+        import grpc
+
+        from match.v1 import match_pb2
+
+        service.add_feedback.return_value = None
+        request = match_pb2.CreateMatchFeedbackRequest(
+            match_id=str(uuid4()),
+            feedback_type=match_pb2.FEEDBACK_TYPE_POSITIVE,
+            feedback_by=str(uuid4()),
+        )
+
+        with pytest.raises(grpc.aio.AbortError):
+            await servicer.CreateMatchFeedback(request, context)
+
+        assert context.abort.call_args.args[0] == grpc.StatusCode.NOT_FOUND
+
+    def test_feedback_types_keep_their_wire_values(self):
+        """Should map stored types onto the proto values clients already send."""
+        from app.api.grpc_server import FEEDBACK_TYPES
+        from app.models.schemas import FeedbackType
+        from match.v1 import match_pb2
+
+        assert FEEDBACK_TYPES == {
+            1: FeedbackType.HELPFUL,
+            2: FeedbackType.NOT_HELPFUL,
+            3: FeedbackType.HIRED,
+            7: FeedbackType.REJECTED,
+            8: FeedbackType.INTERVIEWING,
+        }
+        assert match_pb2.FEEDBACK_TYPE_POSITIVE == 1
+        assert match_pb2.FEEDBACK_TYPE_SAVED == 6
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "feedback_type, comment",
+        [("FEEDBACK_TYPE_SAVED", ""), ("FEEDBACK_TYPE_POSITIVE", "Great match!")],
+    )
+    async def test_rejects_feedback_the_service_cannot_store(
+        self, servicer, service, context, feedback_type, comment
+    ):
+        """Should reject types without a stored counterpart, and comments."""
+        import grpc
+
+        from match.v1 import match_pb2
+
+        request = match_pb2.CreateMatchFeedbackRequest(
+            match_id=str(uuid4()),
+            feedback_type=match_pb2.FeedbackType.Value(feedback_type),
+            feedback_by=str(uuid4()),
+            comment=comment,
+        )
+
+        with pytest.raises(grpc.aio.AbortError):
+            await servicer.CreateMatchFeedback(request, context)
+
+        assert context.abort.call_args.args[0] == grpc.StatusCode.INVALID_ARGUMENT
+        service.add_feedback.assert_not_called()
+
+    def test_every_rpc_is_implemented(self):
+        """Should serve every RPC the proto declares."""
+        from app.api.grpc_server import MatchServicer
+        from match.v1 import match_pb2, match_pb2_grpc
 
-            assert result["overall_score"] == 0.0
-            assert "unavailable" in result["ai_reasoning"].lower()
+        service = match_pb2.DESCRIPTOR.services_by_name["MatchService"]
+        for method in service.methods:
+            assert getattr(MatchServicer, method.name) is not getattr(
+                match_pb2_grpc.MatchServiceServicer, method.name
+            ), method.name
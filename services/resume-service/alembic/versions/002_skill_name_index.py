@@ -0,0 +1,30 @@
+"""Add indexes for skill search and the skills export
+
+Revision ID: 002_skill_name_index
+Revises: 001_init
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "002_skill_name_index"
+down_revision: Union[str, None] = "001_init"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX ix_resume_skills_skill_name_lower "
+        "ON resume_skills (lower(skill_name))"
+    )
+    # Lets /skills/export seek its (updated_at, id) keyset instead of sorting
+    op.create_index("ix_resumes_updated_at_id", "resumes", ["updated_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resumes_updated_at_id", table_name="resumes")
+    op.drop_index("ix_resume_skills_skill_name_lower", table_name="resume_skills")
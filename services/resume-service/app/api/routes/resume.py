@@ -1,5 +1,6 @@
 """Resume API routes."""
 
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
@@ -11,6 +12,9 @@ from app.models.schemas import (
     ResumeCreate,
     ResumeListResponse,
     ResumeResponse,
+    ResumeSkillExportResponse,
+    ResumeSkillSearchRequest,
+    ResumeSkillSearchResponse,
     ResumeUpdate,
 )
 from app.services.resume_service import ResumeService
@@ -37,6 +41,43 @@ async def create_resume(
     return await service.create_resume(resume_data)
 
 
+@router.post(
+    "/search/skills",
+    response_model=ResumeSkillSearchResponse,
+    summary="Search resumes by skills",
+)
+async def search_resumes_by_skills(
+    request: ResumeSkillSearchRequest,
+    service: ResumeService = Depends(get_resume_service),
+) -> ResumeSkillSearchResponse:
+    """Find completed resumes ranked by how many of the given skills they list."""
+    return await service.search_by_skills(request)
+
+
+@router.get(
+    "/skills/export",
+    response_model=ResumeSkillExportResponse,
+    summary="Export resume skills changed since a position",
+)
+async def export_resume_skills(
+    updated_after: Optional[datetime] = Query(
+        None, description="updated_at of the last resume already seen"
+    ),
+    after_id: Optional[UUID] = Query(
+        None, description="ID of the last resume already seen"
+    ),
+    limit: int = Query(1000, ge=1, le=5000, description="Page size"),
+    service: ResumeService = Depends(get_resume_service),
+) -> ResumeSkillExportResponse:
+    """Page through resume skills in (updated_at, id) order, for search indexes.
+
+    Resumes of every status are returned so an index can drop resumes that
+    are no longer completed. Pass the last item's ``updated_at`` and
+    ``resume_id`` to get the next page.
+    """
+    return await service.export_skills(updated_after, after_id, limit)
+
+
 @router.get(
     "/{resume_id}",
     response_model=ResumeResponse,
@@ -4,7 +4,7 @@ import uuid
 from datetime import date, datetime
 from typing import Any, Optional
 
-from sqlalchemy import Boolean, Date, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Date, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -58,6 +58,11 @@ class Resume(Base):
         lazy="selectin",
     )
 
+    __table_args__ = (
+        # Keyset order of the skills export
+        Index("ix_resumes_updated_at_id", updated_at, id),
+    )
+
 
 class ResumeExperience(Base):
     """Resume experience model."""
@@ -109,6 +114,10 @@ class ResumeSkill(Base):
     # Relationships
     resume: Mapped["Resume"] = relationship("Resume", back_populates="skills")
 
+    __table_args__ = (
+        Index("ix_resume_skills_skill_name_lower", func.lower(skill_name)),
+    )
+
 
 class ResumeEducation(Base):
     """Resume education model."""
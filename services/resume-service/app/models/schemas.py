@@ -145,3 +145,40 @@ class ResumeListResponse(BaseModel):
     page: int
     size: int
     pages: int
+
+
+class ResumeSkillSearchRequest(BaseModel):
+    """Schema for finding resumes that list any of the given skills."""
+
+    skills: list[str] = Field(..., min_length=1)
+    limit: int = Field(100, ge=1, le=1000)
+
+
+class ResumeSkillSearchResult(BaseModel):
+    """Schema for a single skill search hit."""
+
+    resume_id: UUID
+    user_id: UUID
+    matched_skills: int
+
+
+class ResumeSkillSearchResponse(BaseModel):
+    """Schema for skill search results ordered by overlap."""
+
+    items: list[ResumeSkillSearchResult]
+
+
+class ResumeSkillExportItem(BaseModel):
+    """Schema for one resume's skills in a skill export page."""
+
+    resume_id: UUID
+    user_id: UUID
+    status: str
+    skills: list[str]
+    updated_at: datetime
+
+
+class ResumeSkillExportResponse(BaseModel):
+    """Schema for a page of resume skills ordered by (updated_at, resume_id)."""
+
+    items: list[ResumeSkillExportItem]
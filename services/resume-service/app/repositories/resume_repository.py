@@ -1,9 +1,10 @@
 """Repository for resume database operations."""
 
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -169,3 +170,53 @@ class ResumeRepository:
         )
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
+
+    async def search_by_skills(
+        self,
+        skills: list[str],
+        limit: int = 100,
+    ) -> list[tuple[UUID, UUID, int]]:
+        """Find completed resumes ranked by the number of matching skills."""
+        normalized = {skill.strip().lower() for skill in skills if skill.strip()}
+        if not normalized:
+            return []
+
+        skill_key = func.lower(ResumeSkill.skill_name)
+        matched = func.count(func.distinct(skill_key)).label("matched_skills")
+        query = (
+            select(Resume.id, Resume.user_id, matched)
+            .join(ResumeSkill, ResumeSkill.resume_id == Resume.id)
+            .where(skill_key.in_(normalized), Resume.status == "completed")
+            .group_by(Resume.id, Resume.user_id)
+            .order_by(matched.desc(), Resume.updated_at.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return [(row.id, row.user_id, row.matched_skills) for row in result]
+
+    async def list_skills_updated_after(
+        self,
+        after: Optional[tuple[datetime, Optional[UUID]]],
+        limit: int,
+    ) -> list[Resume]:
+        """List resumes with their skills in (updated_at, id) order.
+
+        ``after`` is the position of the last resume already seen; without
+        an id, every resume updated at that time is included.
+        """
+        query = (
+            select(Resume)
+            .options(selectinload(Resume.skills))
+            .order_by(Resume.updated_at, Resume.id)
+            .limit(limit)
+        )
+        if after is not None:
+            updated_at, resume_id = after
+            if resume_id is None:
+                query = query.where(Resume.updated_at >= updated_at)
+            else:
+                query = query.where(
+                    tuple_(Resume.updated_at, Resume.id) > (updated_at, resume_id)
+                )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
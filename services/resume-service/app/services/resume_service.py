@@ -1,6 +1,7 @@
 """Business logic service for resume operations."""
 
 import math
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
@@ -12,6 +13,11 @@ from app.models.schemas import (
     ResumeCreate,
     ResumeListResponse,
     ResumeResponse,
+    ResumeSkillExportItem,
+    ResumeSkillExportResponse,
+    ResumeSkillSearchRequest,
+    ResumeSkillSearchResponse,
+    ResumeSkillSearchResult,
     ResumeUpdate,
 )
 from app.repositories.resume_repository import ResumeRepository
@@ -116,3 +122,43 @@ class ResumeService:
 
         update_data = ResumeUpdate(status=new_status)
         return await self.update_resume(resume_id, update_data)
+
+    async def search_by_skills(
+        self, request: ResumeSkillSearchRequest
+    ) -> ResumeSkillSearchResponse:
+        """Find candidate resumes by skill overlap."""
+        rows = await self.repository.search_by_skills(request.skills, request.limit)
+        return ResumeSkillSearchResponse(
+            items=[
+                ResumeSkillSearchResult(
+                    resume_id=resume_id,
+                    user_id=user_id,
+                    matched_skills=matched_skills,
+                )
+                for resume_id, user_id, matched_skills in rows
+            ]
+        )
+
+    async def export_skills(
+        self,
+        updated_after: Optional[datetime],
+        after_id: Optional[UUID],
+        limit: int,
+    ) -> ResumeSkillExportResponse:
+        """Export resume skills changed since a position, for search indexes."""
+        after = (updated_after, after_id) if updated_after is not None else None
+        resumes = await self.repository.list_skills_updated_after(after, limit)
+        return ResumeSkillExportResponse(
+            items=[
+                ResumeSkillExportItem(
+                    resume_id=resume.id,
+                    user_id=resume.user_id,
+                    status=resume.status,
+                    skills=[
+                        skill.skill_name for skill in resume.skills if skill.skill_name
+                    ],
+                    updated_at=resume.updated_at,
+                )
+                for resume in resumes
+            ]
+        )
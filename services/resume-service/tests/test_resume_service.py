@@ -305,3 +305,54 @@ class TestUpdateResumeStatus:
             # Just verify no exception is raised for valid values
             # (the actual update would be mocked)
             assert status_value in ["processing", "completed", "failed"]
+
+
+class TestSearchBySkills:
+    """Tests for search_by_skills method."""
+
+    @pytest.mark.asyncio
+    async def test_search_by_skills_success(self, resume_service):
+        """Should return hits in repository order."""
+        from app.models.schemas import ResumeSkillSearchRequest
+
+        rows = [(uuid4(), uuid4(), 3), (uuid4(), uuid4(), 1)]
+
+        with patch.object(
+            resume_service.repository, "search_by_skills", new_callable=AsyncMock
+        ) as mock_search:
+            mock_search.return_value = rows
+
+            result = await resume_service.search_by_skills(
+                ResumeSkillSearchRequest(skills=["Python", "Go", "SQL"], limit=10)
+            )
+
+            mock_search.assert_called_once_with(["Python", "Go", "SQL"], 10)
+            assert [item.resume_id for item in result.items] == [rows[0][0], rows[1][0]]
+            assert result.items[0].matched_skills == 3
+
+
+class TestExportSkills:
+    """Tests for export_skills method."""
+
+    @pytest.mark.asyncio
+    async def test_export_skills_from_position(self, resume_service, sample_resume):
+        """Should page from the given position and list skill names."""
+        skill = MagicMock()
+        skill.skill_name = "Python"
+        sample_resume.skills = [skill]
+        updated_after = datetime(2026, 1, 1)
+        after_id = uuid4()
+
+        with patch.object(
+            resume_service.repository,
+            "list_skills_updated_after",
+            new_callable=AsyncMock,
+        ) as mock_list:
+            mock_list.return_value = [sample_resume]
+
+            result = await resume_service.export_skills(updated_after, after_id, 100)
+
+            mock_list.assert_called_once_with((updated_after, after_id), 100)
+            assert result.items[0].resume_id == sample_resume.id
+            assert result.items[0].skills == ["Python"]
+            assert result.items[0].status == "completed"